@@ -1,5 +1,6 @@
 from logging.config import fileConfig
-from app.db.base import Base
+from os.path import abspath, dirname, join
+import sys
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 
@@ -9,16 +10,52 @@ from decouple import config as config_decouple
 
 config = context.config
 
-DB_URL = config_decouple("DB_URL_ALEMBIC")
+sys.path.append(join(dirname(dirname(abspath(__file__))), "app"))
 
-config.set_main_option('sqlalchemy.url', DB_URL)
+from database.models import (
+    BaseModel,
+    UUIDKey
+)
+
+DB_URL = config_decouple("DB_URL_ALEMBIC", default=config_decouple("DB_URL"))
+
+config.set_main_option('sqlalchemy.url', DB_URL.replace('%', '%%'))
 
 
 if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+
+target_metadata = BaseModel.metadata
+
+
+def process_revision_directives(context, revision, directives) -> None:
+    """
+    Não gera arquivo de migração quando o autogenerate não encontra diferenças entre os modelos e o banco
+    """
+    if getattr(config.cmd_opts, "autogenerate", False) and directives[0].upgrade_ops.is_empty():
+        directives[:] = []
+
+
+def render_item(type_, obj, autogen_context):
+    """
+    Escreve as colunas UUIDKey como sa.Uuid() nas migrações geradas, sem importar código da aplicação
+    """
+    if type_ == "type" and isinstance(obj, UUIDKey):
+        return "sa.Uuid()"
+
+    return False
 
 
-target_metadata = Base.metadata
+CONFIGURE_OPTIONS = {
+    "target_metadata": target_metadata,
+    "compare_type": True,
+    # Cada migração roda na sua própria transação, permitindo blocos em autocommit
+    # (ex: CREATE INDEX CONCURRENTLY, ver database/migration.py)
+    "transaction_per_migration": True,
+    "process_revision_directives": process_revision_directives,
+    "render_item": render_item,
+}
 
 
 def run_migrations_offline() -> None:
@@ -26,9 +63,10 @@ def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
         url=url,
-        target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        render_as_batch=url.startswith("sqlite"),
+        **CONFIGURE_OPTIONS
     )
 
     with context.begin_transaction():
@@ -45,7 +83,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            render_as_batch=connection.dialect.name == "sqlite", # SQLite só altera tabelas recriando-as
+            **CONFIGURE_OPTIONS
         )
 
         with context.begin_transaction():
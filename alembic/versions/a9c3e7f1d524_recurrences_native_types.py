@@ -0,0 +1,106 @@
+"""recurrences native types
+
+Converte as colunas de recorrências de texto para tipos nativos: day_of_week passa a ser um SMALLINT
+(1 = segunda ... 7 = domingo, como em date.isoweekday) e start_time/end_time passam a ser TIME. Cria o
+índice ix_recurrences_day_of_week_start_time, usado na busca de horários sobrepostos.
+
+As colunas novas são criadas ao lado das antigas, preenchidas a partir delas e renomeadas, então a conversão
+é a mesma no PostgreSQL e no SQLite (onde um CAST direto de texto para TIME perderia os valores). A tabela
+é reescrita e fica bloqueada para escrita enquanto a migração roda.
+
+Revision ID: a9c3e7f1d524
+Revises: f2b8d4e6a913
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c3e7f1d524'
+down_revision: Union[str, None] = 'f2b8d4e6a913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Nomes de DaysOfWeek, na ordem de date.isoweekday
+DAYS_OF_WEEK = ["Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado", "Domingo"]
+
+TIME_COLUMNS = ["start_time", "end_time"]
+
+# Conversão de um horário HH:MM em texto para TIME e de volta, em cada banco. O SQLite grava TIME como
+# texto no formato usado pelo SQLAlchemy (HH:MM:SS.ffffff).
+TIME_EXPRESSION = {
+    "postgresql": "CAST(substr({column}, 1, 5) AS TIME)",
+    "sqlite": "time(substr({column}, 1, 5)) || '.000000'",
+}
+
+TEXT_EXPRESSION = {
+    "postgresql": "to_char({column}, 'HH24:MI')",
+    "sqlite": "substr({column}, 1, 5)",
+}
+
+
+def upgrade() -> None:
+    day_of_week = " ".join(
+        f"WHEN '{name}' THEN {number}" for number, name in enumerate(DAYS_OF_WEEK, start=1)
+    )
+
+    _convert(
+        sa.SmallInteger(),
+        sa.Time(),
+        f"CASE day_of_week {day_of_week} END",
+        TIME_EXPRESSION[op.get_bind().dialect.name]
+    )
+
+    op.create_index('ix_recurrences_day_of_week_start_time', 'recurrences', ['day_of_week', 'start_time', 'end_time'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_recurrences_day_of_week_start_time', table_name='recurrences')
+
+    day_of_week = " ".join(
+        f"WHEN {number} THEN '{name}'" for number, name in enumerate(DAYS_OF_WEEK, start=1)
+    )
+
+    _convert(
+        sa.String(),
+        sa.String(),
+        f"CASE day_of_week {day_of_week} END",
+        TEXT_EXPRESSION[op.get_bind().dialect.name]
+    )
+
+
+def _convert(day_type: sa.types.TypeEngine, time_type: sa.types.TypeEngine, day_expression: str, time_expression: str) -> None:
+    """
+    Troca as colunas day_of_week, start_time e end_time por colunas dos tipos informados, preenchidas
+    com as expressões informadas, e recria o índice único das recorrências
+    """
+    op.drop_index('uq_recurrences_event_day_time', table_name='recurrences')
+
+    with op.batch_alter_table('recurrences') as batch_op:
+        batch_op.add_column(sa.Column('new_day_of_week', day_type, nullable=True))
+
+        for column in TIME_COLUMNS:
+            batch_op.add_column(sa.Column(f'new_{column}', time_type, nullable=True))
+
+    assignments = [f"new_day_of_week = {day_expression}"] + [
+        f"new_{column} = {time_expression.format(column=column)}" for column in TIME_COLUMNS
+    ]
+
+    op.execute(f"UPDATE recurrences SET {', '.join(assignments)}")
+
+    with op.batch_alter_table('recurrences') as batch_op:
+
+        for column in ['day_of_week'] + TIME_COLUMNS:
+            batch_op.drop_column(column)
+
+        batch_op.alter_column('new_day_of_week', new_column_name='day_of_week', existing_type=day_type, nullable=False)
+
+        for column in TIME_COLUMNS:
+            batch_op.alter_column(f'new_{column}', new_column_name=column, existing_type=time_type, nullable=False)
+
+    op.create_index('uq_recurrences_event_day_time', 'recurrences', ['class_event_id', 'day_of_week', 'start_time', 'end_time'], unique=True)
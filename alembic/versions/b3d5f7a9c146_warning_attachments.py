@@ -0,0 +1,43 @@
+"""warning attachments
+
+Adiciona ao aviso o nome, o tipo e o tamanho do anexo, e o índice ix_warning_file_path, usado para saber se
+um anexo (compartilhado por avisos com o mesmo conteúdo) ainda é referenciado antes de removê-lo.
+
+Revision ID: b3d5f7a9c146
+Revises: a9c3e7f1d524
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from database.migration import (
+    create_index_online,
+    drop_index_online
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d5f7a9c146'
+down_revision: Union[str, None] = 'a9c3e7f1d524'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('warning', sa.Column('file_name', sa.String(), nullable=True))
+    op.add_column('warning', sa.Column('file_type', sa.String(), nullable=True))
+    op.add_column('warning', sa.Column('file_size', sa.Integer(), nullable=True))
+
+    create_index_online("ix_warning_file_path", "warning", ["file_path"])
+
+
+def downgrade() -> None:
+    drop_index_online("ix_warning_file_path", "warning")
+
+    with op.batch_alter_table('warning') as batch_op:
+        batch_op.drop_column('file_size')
+        batch_op.drop_column('file_type')
+        batch_op.drop_column('file_name')
@@ -0,0 +1,65 @@
+"""indexes and unique constraints
+
+Índices para as consultas mais frequentes (notas por aluno/turma/disciplina, aulas por turma, vínculos
+de professores e responsáveis, presenças por aluno) e índices únicos que substituem as consultas
+de existência feitas antes de cada INSERT. Remove o índice de user.password, que só custava escrita.
+
+No PostgreSQL os índices são criados com CONCURRENTLY, sem bloquear as escritas. Os índices únicos
+falham se já houver registros repetidos; nesse caso, remova as duplicatas e execute a migração de novo.
+
+Revision ID: b7e2c41f9a10
+Revises: a1c3e5f70d21
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from database.migration import (
+    create_index_online,
+    drop_index_online
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2c41f9a10'
+down_revision: Union[str, None] = 'a1c3e5f70d21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    # (nome, tabela, colunas, único)
+    ("ix_warning_parent_cpf_date", "warning", ["parent_cpf", "date"], False),
+    ("uq_child_parents_child_cpf_parent_cpf", "child_parents", ["child_cpf", "parent_cpf"], True),
+    ("ix_child_parents_parent_cpf", "child_parents", ["parent_cpf"], False),
+    ("uq_class_name_section", "class", ["name", "section"], True),
+    ("ix_class_student_child_cpf", "class_Student", ["child_cpf"], False),
+    ("ix_class_student_class_id", "class_Student", ["class_id"], False),
+    ("uq_class_teacher_user_cpf_class_id", "class_teacher", ["user_cpf", "class_id"], True),
+    ("ix_class_teacher_class_id", "class_teacher", ["class_id"], False),
+    ("ix_class_event_class_id", "class_event", ["class_id"], False),
+    ("ix_class_event_teacher_id", "class_event", ["teacher_id"], False),
+    ("uq_recurrences_event_day_time", "recurrences", ["class_event_id", "day_of_week", "start_time", "end_time"], True),
+    ("uq_teacher_disciplines_user_cpf_discipline_id", "teacher_disciplines", ["user_cpf", "discipline_id"], True),
+    ("ix_presence_child_cpf_start_class", "presence", ["child_cpf", "start_class"], False),
+    ("ix_presence_class_event_id_start_class", "presence", ["class_event_id", "start_class"], False),
+    ("uq_note_child_class_discipline_aval", "note", ["child_cpf", "class_id", "discipline_id", "semester", "aval_number"], True),
+    ("ix_note_class_id_discipline_id", "note", ["class_id", "discipline_id"], False),
+]
+
+
+def upgrade() -> None:
+    drop_index_online("ix_user_password", "user")
+
+    for name, table, columns, unique in INDEXES:
+        create_index_online(name, table, columns, unique=unique)
+
+
+def downgrade() -> None:
+    for name, table, _, _ in reversed(INDEXES):
+        drop_index_online(name, table)
+
+    create_index_online("ix_user_password", "user", ["password"])
@@ -0,0 +1,133 @@
+"""uuid keys
+
+Converte os IDs (chaves primárias e as chaves estrangeiras que apontam para eles) de texto para UUID nativo,
+e remove as restrições únicas redundantes das chaves primárias.
+
+No PostgreSQL as chaves estrangeiras são removidas, as colunas convertidas com `USING coluna::uuid` e as
+chaves estrangeiras recriadas. A conversão reescreve as tabelas e bloqueia escritas enquanto roda; em bancos
+grandes, execute em uma janela de manutenção. No SQLite os IDs são gravados sem hífens (CHAR(32)) e as
+tabelas são recriadas (modo batch).
+
+Revision ID: c4d9a2e6f813
+Revises: b7e2c41f9a10
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d9a2e6f813'
+down_revision: Union[str, None] = 'b7e2c41f9a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Colunas convertidas em cada tabela: a chave primária e as chaves estrangeiras para outras chaves UUID
+UUID_COLUMNS = {
+    "class": ["id"],
+    "disciplines": ["id"],
+    "class_Student": ["id", "class_id"],
+    "child_parents": ["id"],
+    "class_teacher": ["id", "class_id"],
+    "class_event": ["id", "class_id", "discipline_id", "teacher_id"],
+    "recurrences": ["id", "class_event_id"],
+    "teacher_disciplines": ["id", "discipline_id"],
+    "presence": ["id", "class_event_id"],
+    "note": ["id", "discipline_id", "class_id"],
+    "warning": ["id"],
+}
+
+# Nome dado às restrições únicas sem nome durante a recriação das tabelas no SQLite
+SQLITE_NAMING = {"uq": "uq_%(table_name)s_%(column_0_name)s"}
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        _convert_postgresql(sa.Uuid(), "uuid", drop_unique=True)
+        return
+
+    for table, columns in UUID_COLUMNS.items():
+
+        _update_sqlite(table, columns, "replace({column}, '-', '')")
+
+        with op.batch_alter_table(table, recreate="always", naming_convention=SQLITE_NAMING) as batch_op:
+
+            batch_op.drop_constraint(f"uq_{table}_id", type_="unique")
+
+            for column in columns:
+                batch_op.alter_column(column, existing_type=sa.String(), type_=sa.Uuid())
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        _convert_postgresql(sa.String(), "text", drop_unique=False)
+        return
+
+    for table, columns in UUID_COLUMNS.items():
+
+        with op.batch_alter_table(table, recreate="always") as batch_op:
+
+            for column in columns:
+                batch_op.alter_column(column, existing_type=sa.Uuid(), type_=sa.String())
+
+            batch_op.create_unique_constraint(f"uq_{table}_id", ["id"])
+
+        _update_sqlite(
+            table,
+            columns,
+            "substr({column}, 1, 8) || '-' || substr({column}, 9, 4) || '-' || substr({column}, 13, 4)"
+            " || '-' || substr({column}, 17, 4) || '-' || substr({column}, 21)"
+        )
+
+
+def _convert_postgresql(type_: sa.types.TypeEngine, cast: str, drop_unique: bool) -> None:
+    """
+    Converte as colunas de UUID_COLUMNS para `type_`, removendo e recriando as chaves estrangeiras entre elas
+    """
+    inspector = sa.inspect(op.get_bind())
+
+    foreign_keys = [
+        (table, fk)
+        for table in UUID_COLUMNS
+        for fk in inspector.get_foreign_keys(table)
+        if fk["referred_table"] in UUID_COLUMNS
+    ]
+
+    for table, fk in foreign_keys:
+        op.drop_constraint(fk["name"], table, type_="foreignkey")
+
+    for table, columns in UUID_COLUMNS.items():
+
+        if drop_unique:
+            for unique in inspector.get_unique_constraints(table):
+                if unique["column_names"] == ["id"]:
+                    op.drop_constraint(unique["name"], table, type_="unique")
+
+        for column in columns:
+            op.alter_column(table, column, type_=type_, postgresql_using=f'"{column}"::{cast}')
+
+        if not drop_unique:
+            op.create_unique_constraint(f"{table}_id_key", table, ["id"])
+
+    for table, fk in foreign_keys:
+        op.create_foreign_key(
+            fk["name"],
+            table,
+            fk["referred_table"],
+            fk["constrained_columns"],
+            fk["referred_columns"],
+            ondelete=fk["options"].get("ondelete")
+        )
+
+
+def _update_sqlite(table: str, columns: list[str], expression: str) -> None:
+    """
+    Reescreve os valores das colunas no SQLite com a expressão informada (ex: removendo os hífens)
+    """
+    assignments = ", ".join(f'"{column}" = {expression.format(column=column)}' for column in columns)
+
+    op.execute(f'UPDATE "{table}" SET {assignments}')
@@ -0,0 +1,48 @@
+"""notification
+
+Cria a tabela notification, com as novidades (avisos, notas e faltas) acumuladas para cada responsável até
+serem enviadas, juntas, em um email de resumo (services/email/digest.py).
+
+Revision ID: d2f4b6c8e071
+Revises: c6e8a0b2d357
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f4b6c8e071'
+down_revision: Union[str, None] = 'c6e8a0b2d357'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'notification',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('parent_cpf', sa.String(), nullable=False),
+        sa.Column('child_cpf', sa.String(), nullable=True),
+        sa.Column('kind', sa.String(), nullable=False),
+        sa.Column('reference', sa.String(), nullable=True),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('outbox_id', sa.Uuid(), nullable=True),
+        sa.ForeignKeyConstraint(['child_cpf'], ['child.cpf'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['outbox_id'], ['outbox.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['parent_cpf'], ['user.cpf'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_notification_outbox_id_parent_cpf', 'notification', ['outbox_id', 'parent_cpf'], unique=False)
+    op.create_index('ix_notification_reference', 'notification', ['reference'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notification_reference', table_name='notification')
+    op.drop_index('ix_notification_outbox_id_parent_cpf', table_name='notification')
+    op.drop_table('notification')
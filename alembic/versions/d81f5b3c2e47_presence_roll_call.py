@@ -0,0 +1,36 @@
+"""presence roll call
+
+Uma presença por aluno em cada ocorrência de aula: o índice único (class_event_id, start_class, child_cpf)
+substitui ix_presence_class_event_id_start_class, que é prefixo dele, e atende às buscas por turma e período.
+
+Revision ID: d81f5b3c2e47
+Revises: c4d9a2e6f813
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from database.migration import (
+    create_index_online,
+    drop_index_online
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd81f5b3c2e47'
+down_revision: Union[str, None] = 'c4d9a2e6f813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_online("uq_presence_class_event_start_child", "presence", ["class_event_id", "start_class", "child_cpf"], unique=True)
+    drop_index_online("ix_presence_class_event_id_start_class", "presence")
+
+
+def downgrade() -> None:
+    create_index_online("ix_presence_class_event_id_start_class", "presence", ["class_event_id", "start_class"])
+    drop_index_online("uq_presence_class_event_start_child", "presence")
@@ -0,0 +1,57 @@
+"""attendance
+
+Cria a tabela attendance (presenças e faltas por aluno, aula e mês), mantida a cada chamada gravada, e a
+preenche a partir das presenças já registradas.
+
+Revision ID: e5a7c9d1f302
+Revises: d81f5b3c2e47
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c9d1f302'
+down_revision: Union[str, None] = 'd81f5b3c2e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Primeiro dia do mês de start_class, em cada banco
+MONTH_EXPRESSION = {
+    "postgresql": "CAST(date_trunc('month', start_class) AS DATE)",
+    "sqlite": "date(start_class, 'start of month')",
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        'attendance',
+        sa.Column('child_cpf', sa.String(), nullable=False),
+        sa.Column('class_event_id', sa.Uuid(), nullable=False),
+        sa.Column('month', sa.Date(), nullable=False),
+        sa.Column('present', sa.Integer(), nullable=False),
+        sa.Column('absent', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['child_cpf'], ['child.cpf'], ),
+        sa.ForeignKeyConstraint(['class_event_id'], ['class_event.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('child_cpf', 'class_event_id', 'month')
+    )
+    op.create_index('ix_attendance_class_event_id_month', 'attendance', ['class_event_id', 'month'], unique=False)
+
+    month = MONTH_EXPRESSION[op.get_bind().dialect.name]
+
+    op.execute(
+        "INSERT INTO attendance (child_cpf, class_event_id, month, present, absent) "
+        f"SELECT child_cpf, class_event_id, {month}, "
+        "SUM(CASE WHEN type = 'P' THEN 1 ELSE 0 END), SUM(CASE WHEN type = 'P' THEN 0 ELSE 1 END) "
+        f"FROM presence GROUP BY child_cpf, class_event_id, {month}"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_attendance_class_event_id_month', table_name='attendance')
+    op.drop_table('attendance')
@@ -5,4 +5,16 @@ ERROR_INVALID_PHONE_OPTIONAL = "Telefone opcional inválido"
 ERROR_INVALID_FORMAT_BIRTH_DATE = "O formato da data deve ser YYYY-MM-DD"
 ERROR_INVALID_FORMAT_GENDER = "Gênero invalido, escolha entre M, F ou Z"
 ERROR_INVALID_FORMAT_SHIFT = "Formato do turno invalido"
-ERROR_SERVER_ERROR = "Erro no servidor: "
\ No newline at end of file
+ERROR_SERVER_ERROR = "Erro no servidor: "
+ERROR_INVALID_CURSOR = "Cursor de paginação inválido"
+PAGINATION_DEFAULT_LIMIT = 50
+PAGINATION_MAX_LIMIT = 200
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ICS_MEDIA_TYPE = "text/calendar; charset=utf-8"
+STREAM_YIELD_PER = 1000
+
+BULK_MAX_ROWS = 5000
+ERROR_BULK_INVALID_BODY = "Envie uma lista de registros em JSON ou um arquivo CSV"
+ERROR_BULK_TOO_MANY_ROWS = f"Envie no máximo {BULK_MAX_ROWS} registros por vez"
+ERROR_BULK_DUPLICATED_ROW = "Registro repetido no mesmo envio"
+ERROR_ACCESS_DENIED = "Acesso Negado"
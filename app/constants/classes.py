@@ -21,6 +21,15 @@ ERROR_CLASSES_INVALID_FIELD_DAY_OF_WEEK = "Dia da semana inválido"
 ERROR_CLASSES_INVALID_FIELD_START_DATE = "Data de início inválida"
 ERROR_CLASSES_INVALID_FIELD_END_DATE = "Data de fim inválida"
 ERROR_CLASSES_INVALID_FIELD_CLASS_EVENTS = "Aulas da turma inválidas, deve ser uma lista"
+ERROR_CLASSES_INVALID_TIME_RANGE = "A hora de fim da aula deve ser depois da hora de início"
+ERROR_CLASSES_TIMETABLE_REQUIRED_FILTER = "Informe a turma ou o CPF do professor"
+ERROR_CLASSES_CALENDAR_REQUIRED_FILTER = "Informe a turma, o CPF do professor ou o CPF do aluno"
+ERROR_CLASSES_CALENDAR_INVALID_RANGE = "A data final do calendário deve ser igual ou posterior à data inicial"
+ERROR_CLASSES_CALENDAR_RANGE_TOO_LONG = "O período do calendário deve ter no máximo 366 dias"
+
+CALENDAR_MAX_RANGE_DAYS = 366
+CALENDAR_DEFAULT_PAST_DAYS = 30 # Janela usada quando o período não é informado (ex: assinatura .ics)
+CALENDAR_DEFAULT_FUTURE_DAYS = 180
 
 ERROR_STUDENT_REQUIRED_FIELD_CPF = "CPF do aluno é obrigatório"
 ERROR_STUDENT_REQUIRED_FIELD_NAME = "Nome do aluno é obrigatório"
@@ -39,6 +48,7 @@ ERROR_CLASSES_EVENTS_DELETE_RECURRENCES_NOT_FOUND = "Recorrências não encontra
 
 ERROR_CLASS_ADD_CONFLICT = "Turma já cadastrada"
 ERROR_CLASSES_EVENTS_ADD_CONFLICT = "Aula já cadastrado"
+ERROR_CLASSES_EVENTS_SCHEDULE_CONFLICT = "Horário em conflito com outra aula da turma ou do professor"
 
 MESSAGE_CLASS_ADD_SUCCESS = "Turma cadastrada com sucesso"
 MESSAGE_CLASS_UPDATE_SUCCESS = "Turma atualizada com sucesso"
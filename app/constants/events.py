@@ -0,0 +1,9 @@
+# Conflitos
+ERROR_EVENTS_FORBIDDEN_LEVEL = "Apenas responsáveis e professores recebem eventos"
+
+# Business Rules
+
+EVENTS_PING_SECONDS = 15 # Intervalo dos comentários de ping, que mantêm a conexão SSE aberta em proxies
+
+EVENTS_TOKEN_SCOPE = "events" # Escopo do token aceito no parâmetro token de GET /events/stream
+EVENTS_TOKEN_SECONDS = 60 # Validade desse token, conferida apenas ao abrir o fluxo
@@ -0,0 +1,10 @@
+# Conflitos
+ERROR_JOB_NOT_FOUND = "Tarefa não encontrada"
+ERROR_JOB_NOT_FINISHED = "A tarefa ainda não foi concluída"
+ERROR_JOB_FAILED = "A tarefa falhou"
+ERROR_JOB_FILE_NOT_FOUND = "Arquivo da tarefa não encontrado"
+
+# Business Rules
+
+JOB_KIND_REPORT_CARDS = "report_cards"
+REPORT_CARDS_CHUNK_SIZE = 50 # Boletins gerados por cada tarefa enviada ao pool de processos
@@ -25,4 +25,10 @@ SUCCESS_NOTE_DELETE = "Nota deletada com sucesso"
 # Business Rules
 
 SEMESTERS = [1, 2, 3]
-AVAL_NUMBERS = [1, 2, 3, 4]
\ No newline at end of file
+AVAL_NUMBERS = [1, 2, 3, 4]
+
+# Peso de cada avaliação na média do semestre (avaliações fora da lista têm peso 1)
+AVAL_WEIGHTS = {1: 1.0, 2: 1.0, 3: 1.0, 4: 1.0}
+
+# Média mínima da disciplina para aprovação
+PASSING_AVERAGE = 6.0
@@ -0,0 +1,9 @@
+# Business Rules
+
+NOTIFICATION_NOTE_TITLE = "Nova nota em {discipline}"
+NOTIFICATION_NOTE_TEXT = "Nota {points} na {aval_number}ª avaliação do {semester}º semestre"
+NOTIFICATION_ABSENCE_TITLE = "Falta em {discipline}"
+NOTIFICATION_ABSENCE_TEXT = "Falta na aula de {date}, às {time}"
+
+NOTIFICATION_DIGEST_SUBJECT = "Resumo da escola: {count} novidades" # Assunto do email com várias notificações
+NOTIFICATION_WARNINGS_SECTION = "Avisos da escola" # Seção do resumo com as notificações sem aluno
@@ -0,0 +1,23 @@
+# Required Fields
+ERROR_PRESENCE_REQUIRED_FIELD_CLASS_EVENT_ID = "ID da aula é obrigatório"
+ERROR_PRESENCE_REQUIRED_FIELD_CHILD_CPF = "CPF do estudante é obrigatório"
+ERROR_PRESENCE_REQUIRED_FIELD_PRESENCES = "Informe a presença de ao menos um estudante"
+
+
+# Invalide Data
+ERROR_PRESENCE_INVALID_PERIOD = "O fim da aula deve ser depois do início"
+ERROR_PRESENCE_INVALID_RANGE = "A data final da busca deve ser igual ou posterior à inicial"
+ERROR_PRESENCE_RANGE_TOO_LONG = "Busque no máximo 366 dias por vez"
+ERROR_PRESENCE_OUTSIDE_CLASS_EVENT = "Data fora do período da aula"
+
+
+# Conflitos
+ERROR_PRESENCE_DUPLICATED_CHILD = "Estudante repetido na chamada"
+ERROR_PRESENCE_CHILD_NOT_IN_CLASS = "Estudante não pertence à turma da aula"
+
+# Success
+SUCCESS_PRESENCE_ROLL_CALL = "Chamada registrada com sucesso"
+
+# Business Rules
+
+PRESENCE_MAX_RANGE_DAYS = 366
@@ -0,0 +1,23 @@
+# Required Fields
+ERROR_WARNING_REQUIRED_FIELD_PARENT_CPF = "Informe o CPF de ao menos um responsável"
+ERROR_WARNING_REQUIRED_FIELD_THEME = "Tema do aviso é obrigatório"
+ERROR_WARNING_REQUIRED_FIELD_TEXT = "Texto do aviso é obrigatório"
+
+
+# Invalide Data
+ERROR_WARNING_FILE_TOO_LARGE = "O anexo excede o tamanho máximo permitido"
+ERROR_WARNING_INVALID_RANGE = "Intervalo de bytes inválido"
+
+
+# Conflitos
+ERROR_WARNING_NOT_FOUND = "Aviso não encontrado"
+ERROR_WARNING_PARENT_NOT_FOUND = "Responsável não encontrado"
+ERROR_WARNING_FILE_NOT_FOUND = "Aviso sem anexo"
+
+# Success
+MESSAGE_WARNING_ADD_SUCCESS = "Aviso enviado com sucesso"
+MESSAGE_WARNING_DELETE_SUCCESS = "Aviso deletado com sucesso"
+
+# Business Rules
+
+WARNING_FILE_CHUNK_SIZE = 1024 * 1024 # Bytes lidos e gravados por vez ao salvar ou enviar um anexo
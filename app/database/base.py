@@ -1,6 +1,60 @@
 from typing import Any, Dict
+from uuid import UUID
+from sqlalchemy import Uuid
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.inspection import inspect
+from sqlalchemy.types import TypeDecorator
+
+
+NIL_UUID = "00000000-0000-0000-0000-000000000000"
+
+
+def normalize_uuid(value: Any) -> str:
+    """
+    Forma canônica de um UUID, a mesma dos IDs lidos do banco (minúsculas e com hífens)
+
+    - Args:
+        - value: UUID em qualquer formato aceito por uuid.UUID (maiúsculas, sem hífens, ...).
+
+    - Returns:
+        - str: O UUID normalizado, ou o UUID nulo (nunca gerado) para valores inválidos.
+    """
+    try:
+        return str(UUID(str(value)))
+
+    except ValueError:
+        return NIL_UUID
+
+
+class UUIDKey(TypeDecorator):
+    """
+    Chave UUID nativa (uuid no PostgreSQL, CHAR(32) nos demais bancos), lida e escrita como str
+
+    Ocupa 16 bytes no PostgreSQL, no lugar dos 36 do texto, em cada chave primária, estrangeira e índice.
+    Valores que não são UUID são recusados (ValueError) ao gravar; nas comparações (ex: IDs digitados
+    errado nas rotas) são enviados como o UUID nulo, que nunca é gerado, para que a busca não encontre nada.
+    """
+    impl = Uuid(as_uuid=False)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+
+        return str(UUID(str(value)))
+
+    def coerce_compared_value(self, op, value):
+        return UUIDLookup()
+
+
+class UUIDLookup(UUIDKey):
+    """
+    UUIDKey usado nos valores comparados com as colunas, que troca valores inválidos pelo UUID nulo
+    """
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else normalize_uuid(value)
 
 
 class BaseModel(DeclarativeBase):
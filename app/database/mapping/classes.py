@@ -6,14 +6,21 @@ from database.models import (
     ClassModel, 
     RecurrencesModel
 )
-from database.queries.get_all import get_all_class_events_from_class
 from schemas.classes import (
     ClassEventResponse, 
     ClassResponse, 
     Recurrences
 )
 from services.generator.ids import id_generate
-from utils.format import format_date
+from utils.format import (
+    format_date,
+    format_time,
+    unformat_time
+)
+from utils.schedule import (
+    weekday_name,
+    weekday_number
+)
 
 
 def map_RecurrencesModel_to_Recurrences(model: RecurrencesModel) -> Recurrences:
@@ -27,9 +34,9 @@ def map_RecurrencesModel_to_Recurrences(model: RecurrencesModel) -> Recurrences:
         - Recurrences: Objeto com os dados da recorrência convertidos.
     """
     return Recurrences(
-        day_of_week=model.day_of_week,
-        start_time=model.start_time,
-        end_time=model.end_time
+        day_of_week=weekday_name(model.day_of_week),
+        start_time=format_time(model.start_time),
+        end_time=format_time(model.end_time)
     )
 
 def map_Recurrence_to_RecurrencesModel(class_event_id: str,recurrence: Recurrences) -> RecurrencesModel:
@@ -46,9 +53,9 @@ def map_Recurrence_to_RecurrencesModel(class_event_id: str,recurrence: Recurrenc
     return RecurrencesModel(
         id=id_generate(),
         class_event_id=class_event_id,
-        day_of_week=recurrence.day_of_week,
-        start_time=recurrence.start_time,
-        end_time=recurrence.end_time
+        day_of_week=weekday_number(recurrence.day_of_week),
+        start_time=unformat_time(recurrence.start_time),
+        end_time=unformat_time(recurrence.end_time)
     )
 
 def map_ClassEventModel_to_ClassEventResponse(model: ClassEventModel) -> ClassEventResponse:
@@ -89,23 +96,15 @@ def map_ClassModel_to_ClassResponse(db_session: Session,model: ClassModel) -> Cl
         Converte um objeto do tipo ClassModel para um objeto do tipo ClassResponse
 
         - Args:
-            - model: Objeto do tipo ClassModel a ser convertido.
+            - model: Objeto do tipo ClassModel a ser convertido. Para listas, carregue antes os relacionamentos com CLASS_RESPONSE_OPTIONS (database/queries/loaders.py).
 
         - Returns:
             - ClassResponse: Objeto com os dados da turma convertidos.
     """
-    class_events = get_all_class_events_from_class(db_session, model.id)
-
-    if not class_events:
-
-        class_events = []
-
-    else:
-
-        class_events = [
-            map_ClassEventModel_to_ClassEventResponse(event) 
-            for event in class_events
-        ]
+    class_events = [
+        map_ClassEventModel_to_ClassEventResponse(event) 
+        for event in model.class_events
+    ]
         
 
     response = ClassResponse(
@@ -12,11 +12,14 @@ from services.generator.matriculation import matriculation_generate
 from utils.format import unformat_date
 
 
-def map_StudentRequest_to_ChildModel(request: StudentRequest) -> ChildModel:
+ADDRESS_FIELDS = ("state", "city", "neighborhood", "street", "house_number", "complement")
+
+
+def map_StudentRequest_to_ChildModel(request: StudentRequest, matriculation: str | None = None) -> ChildModel:
     
     return ChildModel(
         cpf = request.cpf,
-        matriculation = matriculation_generate(),
+        matriculation = matriculation or matriculation_generate(),
         name = request.name,
         birth_date = unformat_date(request.birth_date, False),
         gender = request.gender,
@@ -46,4 +49,21 @@ def map_ChildModel_to_StudentResponse(
         name=model.name,
         class_info = build_class_info(class_),
         shift=class_.shift
-    )
\ No newline at end of file
+    )
+
+
+def map_row_to_StudentRequest(row: dict) -> StudentRequest:
+    """
+    Converte um registro do cadastro em massa para StudentRequest
+
+    Linhas de CSV trazem o endereço em colunas soltas (state, city, ...), que são agrupadas no campo address.
+    """
+    row = dict(row)
+
+    if "address" not in row:
+
+        address = {field: row.pop(field, None) for field in ADDRESS_FIELDS}
+
+        row["address"] = {field: value for field, value in address.items() if value is not None}
+
+    return StudentRequest(**row)
@@ -6,24 +6,28 @@ from database.mapping.classes import map_ClassModel_to_ClassResponse
 from database.mapping.discipline import map_DisciplinesModel_to_DisciplineResponse
 from database.mapping.user import map_UserModel_to_UserResponse
 from database.models import UserModel
-from database.queries.get_all import (
-    get_all_classes_by_teacher, 
-    get_all_disciplines_by_teacher
-)
 from schemas.base import UserLevel
 from schemas.teacher import TeacherResponse
 from utils.messages.error import BadRequest
 
 
 def map_UserModel_to_TeacherResponse(db_session: Session, user: UserModel) -> TeacherResponse:
+    """
+    Converte um professor do banco de dados para um objeto TeacherResponse
 
+    As disciplinas e turmas são lidas pelos relacionamentos do modelo, então listas de professores
+    devem ser buscadas com TEACHER_RESPONSE_OPTIONS (database/queries/loaders.py) para não gerar N+1.
+    """
     if user.level != UserLevel.TEACHER.value:
 
         BadRequest(ERROR_USER_INVALID_TEACHER_LEVEL)
 
-    disciplines = get_all_disciplines_by_teacher(db_session, user.cpf)
+    disciplines = [association.discipline for association in user.teacher_disciplines]
 
-    classes = get_all_classes_by_teacher(db_session, user.cpf)
+    classes = []
+
+    for association in user.class_teacher:
+        classes += association.classes
 
     return TeacherResponse(
         user=map_UserModel_to_UserResponse(user),
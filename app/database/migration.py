@@ -0,0 +1,57 @@
+from alembic import op
+from sqlalchemy import text
+
+
+def create_index_online(name: str, table: str, columns: list[str], unique: bool = False) -> None:
+    """
+    Cria um índice em uma migração sem bloquear as escritas na tabela
+
+    No PostgreSQL usa CREATE INDEX CONCURRENTLY fora da transação da migração (autocommit_block). Um índice
+    válido já existente é mantido; um inválido (pg_index.indisvalid), deixado por uma tentativa anterior que
+    falhou, é removido antes, para que a migração possa ser executada de novo. Nos demais bancos cria o índice
+    normalmente, se ainda não existir.
+
+    - Args:
+        - name: Nome do índice.
+        - table: Tabela do índice.
+        - columns: Colunas do índice, na ordem.
+        - unique: Se o índice é único.
+    """
+    context = op.get_context()
+
+    if context.dialect.name != "postgresql":
+        op.create_index(name, table, columns, unique=unique, if_not_exists=True)
+        return
+
+    with context.autocommit_block():
+
+        valid = op.get_bind().execute(
+            text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(quote_ident(:name))"),
+            {"name": name}
+        ).scalar()
+
+        if valid:
+            return
+
+        if valid is not None:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+        op.create_index(name, table, columns, unique=unique, postgresql_concurrently=True)
+
+
+def drop_index_online(name: str, table: str) -> None:
+    """
+    Remove um índice em uma migração sem bloquear as escritas na tabela (DROP INDEX CONCURRENTLY no PostgreSQL)
+
+    - Args:
+        - name: Nome do índice.
+        - table: Tabela do índice.
+    """
+    context = op.get_context()
+
+    if context.dialect.name != "postgresql":
+        op.drop_index(name, table_name=table, if_exists=True)
+        return
+
+    with context.autocommit_block():
+        op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
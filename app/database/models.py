@@ -1,13 +1,20 @@
-from datetime import datetime
+from datetime import (
+    date,
+    datetime,
+    time
+)
 from sqlalchemy import (
     CHAR,
     Date,
     DateTime, 
     Float, 
     ForeignKey, 
+    Index,
     Integer, 
+    SmallInteger,
     String, 
-    Text
+    Text,
+    Time
 )
 from sqlalchemy.orm import (
     Mapped, 
@@ -21,7 +28,10 @@ import sys
 sys.path.append(dirname(abspath(__file__))) #Garantindo a criação das tabelas
 
 
-from base import BaseModel
+from base import (
+    BaseModel,
+    UUIDKey
+)
 from connection import engine
 
 
@@ -59,7 +69,7 @@ class UserModel(BaseModel):
     phone: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     phone_optional: Mapped[str] = mapped_column(String, unique=False, nullable=True)
     email: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True)
-    password: Mapped[str] = mapped_column(String, unique= False, nullable=False, index=True)
+    password: Mapped[str] = mapped_column(String, unique= False, nullable=False)
     level: Mapped[int] = mapped_column(Integer, unique=False ,nullable=False)
     state: Mapped[str] = mapped_column(String, nullable=False)
     city: Mapped[str] = mapped_column(String, nullable=False)
@@ -95,17 +105,27 @@ class WarningModel(BaseModel):
     - parent_cpf: str
     - theme: str
     - text: str
-    - file_path: str | None
+    - file_path: str | None (caminho do anexo, pelo hash do conteúdo, compartilhado por avisos com o mesmo anexo)
+    - file_name: str | None
+    - file_type: str | None
+    - file_size: int | None
     - date: datetime
     """
 
     __tablename__ = 'warning'
+    __table_args__ = (
+        Index("ix_warning_parent_cpf_date", "parent_cpf", "date"),
+        Index("ix_warning_file_path", "file_path"),
+    )
 
-    id: Mapped[str] = mapped_column(String, unique=True, nullable=False, primary_key=True)
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True)
     parent_cpf: Mapped[str] = mapped_column(String, ForeignKey("user.cpf"), nullable=False)
     theme: Mapped[str] = mapped_column(String, nullable=False)
     text: Mapped[str] = mapped_column(Text, nullable=False)
     file_path: Mapped[str] = mapped_column(String, nullable=True)
+    file_name: Mapped[str] = mapped_column(String, nullable=True)
+    file_type: Mapped[str] = mapped_column(String, nullable=True)
+    file_size: Mapped[int] = mapped_column(Integer, nullable=True)
     date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
 
@@ -182,8 +202,12 @@ class ChildParentsModel(BaseModel):
     - parent: list[UserModel]
     """
     __tablename__ = 'child_parents'
+    __table_args__ = (
+        Index("uq_child_parents_child_cpf_parent_cpf", "child_cpf", "parent_cpf", unique=True),
+        Index("ix_child_parents_parent_cpf", "parent_cpf"),
+    )
 
-    id: Mapped[str] = mapped_column(String, unique=True, nullable=False, primary_key=True)
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True)
     kinship: Mapped[str] = mapped_column(String, unique=False,nullable=False)
     child_cpf: Mapped[str] = mapped_column(String, ForeignKey("child.cpf", ondelete="CASCADE"))
     parent_cpf: Mapped[str] = mapped_column(String, ForeignKey("user.cpf", ondelete="CASCADE"))
@@ -214,11 +238,15 @@ class ClassModel(BaseModel):
     relationships:
     - class_teacher: list[ClassTeacherModel]
     - class_student: list[ClassStudentModel]
+    - class_events: list[ClassEventModel]
     - notes: list[NoteModel]
     """
     __tablename__ = 'class'
+    __table_args__ = (
+        Index("uq_class_name_section", "name", "section", unique=True),
+    )
 
-    id: Mapped[str] = mapped_column(String, unique=True, nullable=False, primary_key=True)
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True)
     education_level: Mapped[str] = mapped_column(String, unique=False, nullable=False)
     name: Mapped[str] = mapped_column(String, unique=False, nullable=False)
     section: Mapped[str] = mapped_column(String, unique=False, nullable=False)
@@ -236,6 +264,12 @@ class ClassModel(BaseModel):
         back_populates="class_",
         uselist=True
     )
+
+    class_events = relationship(
+        "ClassEventModel",
+        uselist=True,
+        viewonly=True
+    )
     
     notes = relationship(
         "NoteModel",
@@ -258,9 +292,13 @@ class ClassStudentModel(BaseModel):
     """
 
     __tablename__ = 'class_Student'
+    __table_args__ = (
+        Index("ix_class_student_child_cpf", "child_cpf"),
+        Index("ix_class_student_class_id", "class_id"),
+    )
 
-    id: Mapped[str] = mapped_column(String, unique=True, nullable=False, primary_key=True)
-    class_id: Mapped[str] = mapped_column(String, ForeignKey("class.id", ondelete="CASCADE"), nullable=False)
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True)
+    class_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("class.id", ondelete="CASCADE"), nullable=False)
     child_cpf: Mapped[str] = mapped_column(String, ForeignKey("child.cpf", ondelete="CASCADE"), nullable=False)
 
     class_ = relationship(
@@ -290,7 +328,7 @@ class DisciplinesModel(BaseModel):
     """
     __tablename__ = 'disciplines'
 
-    id: Mapped[str] = mapped_column(String, unique=True, nullable=False, primary_key=True)
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True)
     name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
 
     class_event = relationship(
@@ -332,10 +370,14 @@ class ClassTeacherModel(BaseModel):
     - user: UserModel
     """
     __tablename__ = 'class_teacher'
+    __table_args__ = (
+        Index("uq_class_teacher_user_cpf_class_id", "user_cpf", "class_id", unique=True),
+        Index("ix_class_teacher_class_id", "class_id"),
+    )
 
-    id: Mapped[str] = mapped_column(String, unique=True, nullable=False, primary_key=True)
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True)
     user_cpf: Mapped[str] = mapped_column(String, ForeignKey("user.cpf", ondelete="CASCADE"), nullable=False)
-    class_id: Mapped[str] = mapped_column(String, ForeignKey("class.id"), nullable=False)
+    class_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("class.id"), nullable=False)
 
 
     classes = relationship(
@@ -375,11 +417,15 @@ class ClassEventModel(BaseModel):
 
     """
     __tablename__ = 'class_event'
+    __table_args__ = (
+        Index("ix_class_event_class_id", "class_id"),
+        Index("ix_class_event_teacher_id", "teacher_id"),
+    )
 
-    id: Mapped[str] = mapped_column(String, unique=True, nullable=False, primary_key=True)
-    class_id: Mapped[str] = mapped_column(String, ForeignKey("class.id"), nullable=False)
-    discipline_id: Mapped[str] = mapped_column(String, ForeignKey("disciplines.id"), nullable=False)
-    teacher_id: Mapped[str] = mapped_column(String, ForeignKey("class_teacher.id"), nullable=False)
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True)
+    class_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("class.id"), nullable=False)
+    discipline_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("disciplines.id"), nullable=False)
+    teacher_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("class_teacher.id"), nullable=False)
     start_date: Mapped[datetime] = mapped_column(Date, nullable=False)
     end_date: Mapped[datetime] = mapped_column(Date, nullable=False)
 
@@ -411,9 +457,9 @@ class RecurrencesModel(BaseModel):
 
     - id: str
     - class_event_id: str
-    - day_of_week: str
-    - start_time: str
-    - end_time: str
+    - day_of_week: int (1 = segunda ... 7 = domingo, como em date.isoweekday)
+    - start_time: time
+    - end_time: time
 
     ### Relationships:
 
@@ -422,12 +468,16 @@ class RecurrencesModel(BaseModel):
     
     """
     __tablename__ = 'recurrences'
+    __table_args__ = (
+        Index("uq_recurrences_event_day_time", "class_event_id", "day_of_week", "start_time", "end_time", unique=True),
+        Index("ix_recurrences_day_of_week_start_time", "day_of_week", "start_time", "end_time"),
+    )
 
-    id: Mapped[str] = mapped_column(String, unique=True, nullable=False, primary_key=True)
-    class_event_id: Mapped[str] = mapped_column(String, ForeignKey("class_event.id", ondelete="CASCADE"), nullable=False)
-    day_of_week: Mapped[str] = mapped_column(String, nullable=False)
-    start_time: Mapped[str] = mapped_column(String, nullable=False)
-    end_time: Mapped[str] = mapped_column(String, nullable=False)
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True)
+    class_event_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("class_event.id", ondelete="CASCADE"), nullable=False)
+    day_of_week: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    start_time: Mapped[time] = mapped_column(Time, nullable=False)
+    end_time: Mapped[time] = mapped_column(Time, nullable=False)
 
     class_event = relationship(
         "ClassEventModel",
@@ -445,9 +495,12 @@ class TeacherDisciplinesModel(BaseModel):
     - user_cpf: str
     """
     __tablename__ = 'teacher_disciplines'
+    __table_args__ = (
+        Index("uq_teacher_disciplines_user_cpf_discipline_id", "user_cpf", "discipline_id", unique=True),
+    )
 
-    id: Mapped[str] = mapped_column(String, unique=True, nullable=False, primary_key=True)
-    discipline_id: Mapped[str] = mapped_column(String, ForeignKey("disciplines.id"), nullable=False)
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True)
+    discipline_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("disciplines.id"), nullable=False)
     user_cpf: Mapped[str] = mapped_column(String, ForeignKey("user.cpf"), nullable=False)
 
     discipline = relationship(
@@ -475,15 +528,44 @@ class PresenceModel(BaseModel):
     - end_class: datetime
     """
     __tablename__ = 'presence'
+    __table_args__ = (
+        Index("ix_presence_child_cpf_start_class", "child_cpf", "start_class"),
+        Index("uq_presence_class_event_start_child", "class_event_id", "start_class", "child_cpf", unique=True),
+    )
 
-    id: Mapped[str] = mapped_column(String, unique=True, nullable=False, primary_key=True)
-    class_event_id: Mapped[str] = mapped_column(String, ForeignKey("class_event.id"), nullable=False)
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True)
+    class_event_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("class_event.id"), nullable=False)
     child_cpf: Mapped[str] = mapped_column(String, ForeignKey("child.cpf"), nullable=False)
     type: Mapped[str] = mapped_column(CHAR(1), nullable=False) # P or F
     start_class: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     end_class: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
 
+class AttendanceModel(BaseModel):
+    """
+    Contagem de presenças e faltas de um aluno em uma aula, por mês
+
+    Mantida de forma incremental a cada chamada gravada (PresenceRepository), para que os percentuais
+    de frequência sejam lidos sem percorrer a tabela presence.
+
+    - child_cpf: str
+    - class_event_id: str
+    - month: date (primeiro dia do mês)
+    - present: int
+    - absent: int
+    """
+    __tablename__ = 'attendance'
+    __table_args__ = (
+        Index("ix_attendance_class_event_id_month", "class_event_id", "month"),
+    )
+
+    child_cpf: Mapped[str] = mapped_column(String, ForeignKey("child.cpf"), primary_key=True)
+    class_event_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("class_event.id", ondelete="CASCADE"), primary_key=True)
+    month: Mapped[date] = mapped_column(Date, primary_key=True)
+    present: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    absent: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
 class NoteModel(BaseModel):
     """
     Dados de notas de um aluno em uma determinada disciplina que acontecerá em uma turma
@@ -503,13 +585,17 @@ class NoteModel(BaseModel):
     - child: ChildModel
     """
     __tablename__ = 'note'
+    __table_args__ = (
+        Index("uq_note_child_class_discipline_aval", "child_cpf", "class_id", "discipline_id", "semester", "aval_number", unique=True),
+        Index("ix_note_class_id_discipline_id", "class_id", "discipline_id"),
+    )
 
-    id: Mapped[str] = mapped_column(String, unique=True, nullable=False, primary_key=True)
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True)
     semester: Mapped[int] = mapped_column(Integer, nullable=False)
     aval_number: Mapped[int] = mapped_column(Integer, nullable=False)
     points: Mapped[float] = mapped_column(Float, nullable=False)
-    discipline_id: Mapped[str] = mapped_column(String, ForeignKey("disciplines.id"), nullable=False)
-    class_id: Mapped[str] = mapped_column(String, ForeignKey("class.id"), nullable=False)
+    discipline_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("disciplines.id"), nullable=False)
+    class_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("class.id"), nullable=False)
     child_cpf: Mapped[str] = mapped_column(String, ForeignKey("child.cpf"), nullable=False)
 
 
@@ -532,9 +618,125 @@ class NoteModel(BaseModel):
     )
 
 
+
+class JobModel(BaseModel):
+    """
+    Tarefa executada em segundo plano (ex: geração dos boletins em PDF)
+
+    - id: str
+    - kind: str
+    - status: str (pending, running, done ou failed)
+    - params: str (JSON)
+    - total: int
+    - done: int
+    - result_path: str | None
+    - error: str | None
+    - created_at: datetime
+    - updated_at: datetime
+    - finished_at: datetime | None
+    """
+    __tablename__ = 'job'
+    __table_args__ = (
+        Index("ix_job_status_created_at", "status", "created_at"),
+    )
+
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True)
+    kind: Mapped[str] = mapped_column(String, nullable=False)
+    status: Mapped[str] = mapped_column(String, nullable=False)
+    params: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    done: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    result_path: Mapped[str] = mapped_column(String, nullable=True)
+    error: Mapped[str] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    finished_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+
+
+class OutboxModel(BaseModel):
+    """
+    Email a enviar, gravado na mesma transação da alteração que o originou e enviado em segundo plano
+
+    - id: str
+    - to_email: str
+    - subject: str
+    - body: str (HTML)
+    - status: str (pending, sending, sent ou failed)
+    - attempts: int
+    - next_attempt_at: datetime
+    - last_error: str | None
+    - created_at: datetime
+    - updated_at: datetime
+    - sent_at: datetime | None
+    """
+    __tablename__ = 'outbox'
+    __table_args__ = (
+        Index("ix_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True)
+    to_email: Mapped[str] = mapped_column(String, nullable=False)
+    subject: Mapped[str] = mapped_column(String, nullable=False)
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[str] = mapped_column(String, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    last_error: Mapped[str] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    sent_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+
+
+class NotificationModel(BaseModel):
+    """
+    Novidade a avisar a um responsável (aviso, nota ou falta de um aluno), acumulada até entrar em um email
+
+    - id: str
+    - parent_cpf: str
+    - child_cpf: str | None
+    - kind: str (warning, note ou absence)
+    - reference: str | None (ocorrência que originou a notificação, ex: aula e início da chamada)
+    - title: str
+    - text: str
+    - created_at: datetime
+    - outbox_id: str | None (email em que a notificação foi enviada; None enquanto pendente)
+    """
+    __tablename__ = 'notification'
+    __table_args__ = (
+        Index("ix_notification_outbox_id_parent_cpf", "outbox_id", "parent_cpf"),
+        Index("ix_notification_reference", "reference"),
+    )
+
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True)
+    parent_cpf: Mapped[str] = mapped_column(String, ForeignKey("user.cpf", ondelete="CASCADE"), nullable=False)
+    child_cpf: Mapped[str] = mapped_column(String, ForeignKey("child.cpf", ondelete="CASCADE"), nullable=True)
+    kind: Mapped[str] = mapped_column(String, nullable=False)
+    reference: Mapped[str] = mapped_column(String, nullable=True)
+    title: Mapped[str] = mapped_column(String, nullable=False)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    outbox_id: Mapped[str] = mapped_column(UUIDKey, ForeignKey("outbox.id", ondelete="CASCADE"), nullable=True)
+
+
+class MatriculationSequenceModel(BaseModel):
+    """
+    Contador de matrículas de cada ano, usado para reservar blocos de números
+
+    - year: int
+    - last_value: int
+    """
+    __tablename__ = 'matriculation_sequence'
+
+    year: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    last_value: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
 def create_tables():
     """
     Cria no banco todas as entidades necessárias para o sistema
+
+    Uso em testes e desenvolvimento local. Nos demais ambientes o esquema é criado e atualizado pelas
+    migrações do Alembic (`make run-migrations`), e o servidor não executa DDL ao iniciar.
     """
     try:
         BaseModel.metadata.create_all(engine)
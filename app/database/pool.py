@@ -0,0 +1,82 @@
+from threading import Lock
+from time import perf_counter
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    QueuePool
+)
+
+
+class MonitoredPoolMixin:
+    """
+    Acumula métricas sobre a obtenção de conexões do pool
+
+    - checkouts: int: Quantidade de conexões entregues
+    - timeouts: int: Quantidade de vezes que o pool esgotou o tempo de espera
+    - wait_total: float: Soma do tempo de espera por conexões, em segundos
+    - wait_max: float: Maior tempo de espera por uma conexão, em segundos
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self._metrics_lock = Lock()
+
+
+    def connect(self):
+
+        start = perf_counter()
+
+        try:
+            connection = super().connect()
+
+        except PoolTimeoutError:
+
+            with self._metrics_lock:
+                self.timeouts += 1
+
+            raise
+
+        elapsed = perf_counter() - start
+
+        with self._metrics_lock:
+            self.checkouts += 1
+            self.wait_total += elapsed
+            self.wait_max = max(self.wait_max, elapsed)
+
+        return connection
+
+
+    def metrics(self) -> dict:
+        """
+        Retorna o estado atual do pool e as métricas acumuladas
+
+        - Returns:
+            - dict: Tamanho, conexões em uso, overflow e tempos de espera (em milissegundos)
+        """
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": (self.wait_total / self.checkouts) * 1000 if self.checkouts else 0.0,
+            "wait_max_ms": self.wait_max * 1000,
+        }
+
+
+class MonitoredQueuePool(MonitoredPoolMixin, QueuePool):
+    """
+    QueuePool com métricas de espera, usado pelo engine síncrono
+    """
+
+
+class MonitoredAsyncQueuePool(MonitoredPoolMixin, AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool com métricas de espera, usado pelo engine assíncrono
+    """
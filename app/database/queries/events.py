@@ -0,0 +1,62 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+
+from database.models import (
+    ChildParentsModel,
+    ClassEventModel,
+    ClassTeacherModel
+)
+
+
+def get_children_parents(db_session: Session, child_cpfs: set[str]) -> dict[str, set[str]]:
+    """
+    Busca, em uma única consulta IN, os responsáveis de cada aluno
+
+    - Returns:
+        - dict[str, set[str]]: CPFs dos responsáveis, por CPF do aluno.
+    """
+    parents: dict[str, set[str]] = {}
+
+    if not child_cpfs:
+        return parents
+
+    for child_cpf, parent_cpf in db_session.execute(
+        select(ChildParentsModel.child_cpf, ChildParentsModel.parent_cpf)
+        .where(ChildParentsModel.child_cpf.in_(child_cpfs))
+    ):
+        parents.setdefault(child_cpf, set()).add(parent_cpf)
+
+    return parents
+
+
+def get_classes_teachers(db_session: Session, class_ids: set[str]) -> dict[str, set[str]]:
+    """
+    Busca, em uma única consulta IN, os professores de cada turma
+
+    - Returns:
+        - dict[str, set[str]]: CPFs dos professores, por ID da turma.
+    """
+    teachers: dict[str, set[str]] = {}
+
+    if not class_ids:
+        return teachers
+
+    for class_id, user_cpf in db_session.execute(
+        select(ClassTeacherModel.class_id, ClassTeacherModel.user_cpf)
+        .where(ClassTeacherModel.class_id.in_(class_ids))
+    ):
+        teachers.setdefault(str(class_id), set()).add(user_cpf)
+
+    return teachers
+
+
+def get_class_event_teacher(db_session: Session, class_event_id: str) -> str | None:
+    """
+    Busca o CPF do professor de uma aula
+    """
+    return db_session.scalar(
+        select(ClassTeacherModel.user_cpf)
+        .join(ClassEventModel, ClassEventModel.teacher_id == ClassTeacherModel.id)
+        .where(ClassEventModel.id == class_event_id)
+    )
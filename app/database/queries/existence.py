@@ -3,6 +3,7 @@ from sqlalchemy import (
     or_,
     select
 )
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 
@@ -16,15 +17,10 @@ from database.models import (
     ChildModel,
     ChildParentsModel,
     ClassEventModel,
-    ClassTeacherModel,
-    DisciplinesModel,
-    RecurrencesModel,
-    TeacherDisciplinesModel,
-    UserModel,
-    ClassModel
+    UserModel
 )
 from schemas.base import UserLevel
-from schemas.classes import ClassEventRequest, Recurrences
+from schemas.classes import ClassEventRequest
 from utils.messages.error import Conflict
 
 
@@ -84,32 +80,6 @@ def teacher_existe(db_session: Session, teacher_cpf: str) -> bool:
     return True if register else False
 
 
-def class_existe(db_session: Session, class_name: str, class_section: str) -> bool:
-    """
-    Busca uma turma pelo nome e seção.
-
-    - Args:
-        - db_session: Sessão do banco de dados.
-        - class_name: Nome da turma.
-        - class_section: Seção da turma.
-
-    - Returns:
-        - bool: True se a turma existe, False caso contrário.
-    """
-
-    filters = (
-        ClassModel.name == class_name,
-        ClassModel.section == class_section,
-    )
-
-    register = db_session.scalar(
-        select(ClassModel).where(
-            and_(*filters))
-    )
-
-    return True if register else False
-
-
 def class_event_existe(db_session: Session, request: ClassEventRequest) -> bool:
     """
     Verifica se um evento de uma turma existe.
@@ -138,126 +108,91 @@ def class_event_existe(db_session: Session, request: ClassEventRequest) -> bool:
     return register_exists(db_session, ClassEventModel, filters)
 
 
-def recurrences_exists(db_session, class_event_id, recurrence: Recurrences) -> bool:
+def child_exists(db_session: Session, cpf: str) -> bool:
     """
-    Verifica se uma recorrência de um evento de turma existe.
+    Verifica se um aluno existe.
 
     - Args:
         - db_session: Sessão do banco de dados.
-        - class_event_id: ID do evento de turma.
-        - recurrence: Recorrência.
+        - cpf: CPF do aluno.
 
     - Returns:
-        - bool: True se a recorrência existe, False caso contrário.
+        - bool: True se o aluno existe, False caso contrário.
     """
 
-    filters = (
-        RecurrencesModel.class_event_id == class_event_id,
-        RecurrencesModel.day_of_week == recurrence.day_of_week,
-        RecurrencesModel.start_time ==  recurrence.start_time,
-        RecurrencesModel.end_time == recurrence.end_time,
-    )
+    child = db_session.query(ChildModel).filter(ChildModel.cpf == cpf).first()
 
-    return register_exists(db_session, RecurrencesModel, filters)
+    return True if child else False
+    
 
+def parent_exists(db_session: Session, cpf: str):
 
-def discipline_exists(db_session, discipline_name) -> bool:
-    """
-    Verifica se uma disciplina existe.
+    parent = db_session.query(UserModel).filter(UserModel.cpf == cpf).first()
 
-    - Args:
-        - db_session: Sessão do banco de dados.
-        - discipline_name: Nome da disciplina.
+    return True if parent else False
 
-    - Returns:
-        - bool: True se a disciplina existe, False caso contrário.
-    """
 
-    filters = (
-        DisciplinesModel.name == discipline_name,
+def child_parent_exists(
+    db_session: Session,
+    child_cpf: str,
+    parent_cpf: str
+) -> bool:
+
+    model = db_session.scalar(
+        select(ChildParentsModel).where(
+            and_(ChildParentsModel.child_cpf == child_cpf, ChildParentsModel.parent_cpf == parent_cpf)
+        )
     )
 
-    return register_exists(db_session, DisciplinesModel, filters)
+    return True if model else False
 
 
-def teacher_classes_exists(db_session: Session, user_cpf: str, classes: list[str]) -> bool:
+def existing_values(db_session: Session, column, values: set, chunk_size: int = 1000) -> set:
     """
-    Verifica se um professor possui cadastro nas turmas.
+    Verifica, em poucas consultas, quais valores de uma coluna já existem no banco
+
+    Os valores são consultados com IN em lotes de `chunk_size`, para não ultrapassar o limite de
+    parâmetros do banco.
 
     - Args:
         - db_session: Sessão do banco de dados.
-        - user_cpf: CPF do professor.
-        - classes: IDs das turmas.
+        - column: Coluna a ser consultada (ex: ChildModel.cpf).
+        - values: Valores procurados.
+        - chunk_size: Quantidade de valores por consulta.
 
     - Returns:
-        - bool: True se o professor possui as turmas, False caso contrário.
+        - set: Valores encontrados no banco.
     """
+    values = list(values)
 
-    assossiation = db_session.scalars(
-        select(ClassTeacherModel).where(
-            and_(ClassTeacherModel.user_cpf == user_cpf, ClassTeacherModel.class_id.in_(classes))
-        )
-    ).all()
-
-    return True if assossiation else False
-
+    found = set()
 
-def teacher_disciplines_exists(db_session: Session, user_cpf: str, disciplines: list[str]) -> bool:
-    """
-    Verifica se um professor possui cadastro nas disciplinas.
+    for start in range(0, len(values), chunk_size):
 
-    - Args:
-        - db_session: Sessão do banco de dados.
-        - user_cpf: CPF do professor.
-        - disciplines: IDs das disciplinas.
-
-    - Returns:
-        - bool: True se o professor possui as disciplinas, False caso contrário.
-    """
-
-    assossiation = db_session.scalars(
-        select(TeacherDisciplinesModel).where(
-            and_(TeacherDisciplinesModel.user_cpf == user_cpf, TeacherDisciplinesModel.discipline_id.in_(disciplines))
+        found.update(
+            db_session.scalars(
+                select(column).where(column.in_(values[start:start + chunk_size]))
+            ).all()
         )
-    ).all()
 
-    return True if assossiation else False
+    return found
 
 
-def child_exists(db_session: Session, cpf: str) -> bool:
+def is_unique_violation(error: IntegrityError) -> bool:
     """
-    Verifica se um aluno existe.
+    Verifica se o erro de integridade foi causado por um índice ou restrição única
+
+    Permite inserir direto e tratar o registro repetido como conflito, no lugar de consultar antes de inserir.
 
     - Args:
-        - db_session: Sessão do banco de dados.
-        - cpf: CPF do aluno.
+        - error: Erro lançado no INSERT/UPDATE.
 
     - Returns:
-        - bool: True se o aluno existe, False caso contrário.
+        - bool: True para violação de unicidade, False para outras violações (ex: chave estrangeira).
     """
+    code = getattr(error.orig, "pgcode", None) or getattr(error.orig, "sqlstate", None)
 
-    child = db_session.query(ChildModel).filter(ChildModel.cpf == cpf).first()
-
-    return True if child else False
-    
-
-def parent_exists(db_session: Session, cpf: str):
-
-    parent = db_session.query(UserModel).filter(UserModel.cpf == cpf).first()
-
-    return True if parent else False
-
-
-def child_parent_exists(
-    db_session: Session,
-    child_cpf: str,
-    parent_cpf: str
-) -> bool:
-
-    model = db_session.scalar(
-        select(ChildParentsModel).where(
-            and_(ChildParentsModel.child_cpf == child_cpf, ChildParentsModel.parent_cpf == parent_cpf)
-        )
-    )
+    if code:
+        return code == "23505" # unique_violation
 
-    return True if model else False
\ No newline at end of file
+    return "UNIQUE constraint failed" in str(error.orig)
@@ -30,11 +30,13 @@ from database.models import(
 )
 from schemas.base import UserLevel
 from schemas.classes import Recurrences
+from utils.format import unformat_time
 from utils.messages.error import (
     BadRequest,
     Conflict, 
     NotFound
 )
+from utils.schedule import weekday_number
 
 
 def get_user_by_cpf(db_session: Session, cpf:str) -> UserModel:
@@ -135,10 +137,10 @@ def get_recurrence_by_attributes(
 
     model = db_session.scalar(
         select(RecurrencesModel).where(
-            RecurrencesModel.class_event_id == class_event_id and
-            RecurrencesModel.day_of_week == recurrence.day_of_week and
-            RecurrencesModel.start_time == recurrence.start_time and
-            RecurrencesModel.end_time == recurrence.end_time
+            RecurrencesModel.class_event_id == class_event_id,
+            RecurrencesModel.day_of_week == weekday_number(recurrence.day_of_week),
+            RecurrencesModel.start_time == unformat_time(recurrence.start_time),
+            RecurrencesModel.end_time == unformat_time(recurrence.end_time)
         )
     )
 
@@ -16,6 +16,13 @@ from database.models import(
     TeacherDisciplinesModel,
     UserModel
 )
+from database.queries.loaders import (
+    CLASS_EVENT_RESPONSE_OPTIONS,
+    CLASS_RESPONSE_OPTIONS,
+    STUDENT_RESPONSE_OPTIONS,
+    TEACHER_RESPONSE_OPTIONS
+)
+from database.queries.pagination import keyset
 from schemas.base import UserLevel
 from utils.messages.error import NotFound
 from constants.classes import (
@@ -23,38 +30,44 @@ from constants.classes import (
 )
 
 
-def get_all_users(db_session: Session) -> list[UserModel]:
+def get_all_users(db_session: Session, limit: int | None = None, cursor: str | None = None) -> list[UserModel]:
     """
     Busca todos os usuários no banco de dados
 
     - Args:
         - db_session: Sessão do banco de dados
+        - limit: Quantidade de itens por página (None busca todos)
+        - cursor: Cursor da página anterior (ver database/queries/pagination.py)
 
     - Returns:
         - list[UserModel]: Lista de usuários encontrados no banco de dados.
     """
-    users = db_session.scalars(select(UserModel)).all()
+    users = db_session.scalars(
+        keyset(select(UserModel), UserModel.cpf, limit, cursor)
+    ).all()
 
-    if not users:
+    if not users and cursor is None:
         raise NotFound(ERROR_USER_NOT_FOUND_USERS)
     
     return users
 
 
-def get_all_classes(db_session: Session) -> list[ClassModel]:
+def get_all_classes(db_session: Session, limit: int | None = None, cursor: str | None = None) -> list[ClassModel]:
     """
     Busca todas as turmas no banco de dados
 
     - Args:
         - db_session: Sessão do banco de dados
+        - limit: Quantidade de itens por página (None busca todos)
+        - cursor: Cursor da página anterior (ver database/queries/pagination.py)
 
     - Returns:
         - list[ClassModel]: Lista de turmas encontradas no banco de dados.
     """
     classes =  db_session.scalars(
-        select(ClassModel)
+        keyset(select(ClassModel).options(*CLASS_RESPONSE_OPTIONS), ClassModel.id, limit, cursor)
     ).all()
-    if not classes:
+    if not classes and cursor is None:
         raise NotFound(ERROR_CLASSES_GET_ALL_NOT_FOUND)
     
 
@@ -77,34 +90,42 @@ def get_all_class_events_from_class(db_session: Session, class_id: str) -> list[
     return events
 
 
-def get_all_class_events(db_session: Session) -> Sequence[ClassEventModel]:
+def get_all_class_events(db_session: Session, limit: int | None = None, cursor: str | None = None) -> Sequence[ClassEventModel]:
     """
     Busca todos os eventos de todas as turmas
 
     - Args:
         - db_session: Sessão do banco de dados
+        - limit: Quantidade de itens por página (None busca todos)
+        - cursor: Cursor da página anterior (ver database/queries/pagination.py)
 
     - Returns:
         - list[str]: Lista de eventos das turmas encontradas no banco de dados.
     """
-    events = db_session.scalars(select(ClassEventModel)).all()
+    events = db_session.scalars(
+        keyset(select(ClassEventModel).options(*CLASS_EVENT_RESPONSE_OPTIONS), ClassEventModel.id, limit, cursor)
+    ).all()
 
     return events
 
 
-def get_all_disciplines(db_session: Session) -> list[DisciplinesModel]:
+def get_all_disciplines(db_session: Session, limit: int | None = None, cursor: str | None = None) -> list[DisciplinesModel]:
     """
     Busca todas as disciplinas no banco de dados
 
     - Args:
         - db_session: Sessão do banco de dados
+        - limit: Quantidade de itens por página (None busca todos)
+        - cursor: Cursor da página anterior (ver database/queries/pagination.py)
 
     - Returns:
         - list[str]: Lista de disciplinas encontradas no banco de dados.
     """
-    disciplines = db_session.scalars(select(DisciplinesModel)).all()
+    disciplines = db_session.scalars(
+        keyset(select(DisciplinesModel), DisciplinesModel.id, limit, cursor)
+    ).all()
 
-    if not disciplines:
+    if not disciplines and cursor is None:
         raise NotFound(ERROR_DISCIPLINES_GET_ALL_NOT_FOUND)
 
     return disciplines
@@ -157,22 +178,30 @@ def get_all_classes_by_teacher(db_session: Session, user_cpf: str) -> list[Class
     return classes
 
 
-def get_all_teachers(db_session: Session) -> list[UserModel]:
+def get_all_teachers(db_session: Session, limit: int | None = None, cursor: str | None = None) -> list[UserModel]:
     """
     Busca todos os professores no banco de dados
 
     - Args:
         - db_session: Sessão do banco de dados
+        - limit: Quantidade de itens por página (None busca todos)
+        - cursor: Cursor da página anterior (ver database/queries/pagination.py)
 
     - Returns:
         - list[UserModel]: Lista de professores encontrados no banco de dados.
     """
     teachers = db_session.scalars(
-        select(UserModel).where(
-            UserModel.level == UserLevel.TEACHER.value
-        )).all()
+        keyset(
+            select(UserModel).where(
+                UserModel.level == UserLevel.TEACHER.value
+            ).options(*TEACHER_RESPONSE_OPTIONS),
+            UserModel.cpf,
+            limit,
+            cursor
+        )
+    ).all()
     
-    if not teachers:
+    if not teachers and cursor is None:
         raise NotFound(ERROR_TEACHER_GET_ALL_NOT_FOUND)
 
     return teachers
@@ -204,19 +233,23 @@ def get_all_teacher_disciplines_by_filter(db_session: Session, user_cpf: str, di
     return disciplines
 
 
-def get_all_children(db_session: Session) -> list[ChildModel]:
+def get_all_children(db_session: Session, limit: int | None = None, cursor: str | None = None) -> list[ChildModel]:
     """
     Busca todos os estudantes no banco de dados
 
     - Args:
         - db_session: Sessão do banco de dados
+        - limit: Quantidade de itens por página (None busca todos)
+        - cursor: Cursor da página anterior (ver database/queries/pagination.py)
 
     - Returns:
-        - list[ChildModel]: Lista de estudantes encontrados no banco de dados.
+        - list[ChildModel]: Lista de estudantes encontrados no banco de dados, com a turma de cada um carregada.
     """
-    children = db_session.scalars(select(ChildModel)).all()
+    children = db_session.scalars(
+        keyset(select(ChildModel).options(*STUDENT_RESPONSE_OPTIONS), ChildModel.cpf, limit, cursor)
+    ).all()
 
-    if not children:
+    if not children and cursor is None:
         raise NotFound(ERROR_CHILD_GET_ALL_NOT_FOUND)
 
     return children
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+## Opções de carregamento antecipado
+
+Conjuntos de `selectinload` que trazem, em um número constante de consultas, todos os relacionamentos
+lidos pelos mapeamentos de resposta (`database/mapping`). Use-os nas consultas de listagem para evitar
+que cada item da lista dispare suas próprias consultas (N+1).
+"""
+from sqlalchemy.orm import selectinload
+
+
+from database.models import (
+    ChildModel,
+    ClassEventModel,
+    ClassModel,
+    ClassStudentModel,
+    ClassTeacherModel,
+    TeacherDisciplinesModel,
+    UserModel
+)
+
+
+# Relacionamentos lidos por map_ClassEventModel_to_ClassEventResponse
+CLASS_EVENT_RESPONSE_OPTIONS = (
+    selectinload(ClassEventModel.teacher).selectinload(ClassTeacherModel.user),
+    selectinload(ClassEventModel.discipline),
+    selectinload(ClassEventModel.recurrences),
+)
+
+# Relacionamentos lidos por map_ClassModel_to_ClassResponse
+CLASS_RESPONSE_OPTIONS = (
+    selectinload(ClassModel.class_events).options(*CLASS_EVENT_RESPONSE_OPTIONS),
+)
+
+# Relacionamentos lidos por map_UserModel_to_TeacherResponse
+TEACHER_RESPONSE_OPTIONS = (
+    selectinload(UserModel.teacher_disciplines).selectinload(TeacherDisciplinesModel.discipline),
+    selectinload(UserModel.class_teacher).selectinload(ClassTeacherModel.classes).options(*CLASS_RESPONSE_OPTIONS),
+)
+
+# Turma lida por map_ChildModel_to_StudentResponse
+STUDENT_RESPONSE_OPTIONS = (
+    selectinload(ChildModel.class_student).selectinload(ClassStudentModel.class_),
+)
@@ -0,0 +1,112 @@
+"""
+## Paginação por cursor (keyset)
+
+As listagens são ordenadas pela chave primária e cada página começa logo após a última chave
+entregue na página anterior (`WHERE pk > :ultima_chave ORDER BY pk LIMIT :limite`). Assim o custo
+de cada página não cresce com a sua posição na tabela, ao contrário de OFFSET.
+
+O cursor entregue ao cliente é opaco: a última chave da página codificada em base64 url-safe.
+"""
+from base64 import (
+    urlsafe_b64decode,
+    urlsafe_b64encode
+)
+from binascii import Error as DecodeError
+from json import (
+    dumps,
+    loads
+)
+from sqlalchemy import Select
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+from constants.base import ERROR_INVALID_CURSOR
+from utils.messages.error import BadRequest
+
+
+def encode_cursor(key: str) -> str:
+    """
+    Gera o cursor opaco que aponta para a próxima página
+
+    - Args:
+        - key: Chave primária do último item entregue.
+
+    - Returns:
+        - str: Cursor a ser devolvido ao cliente.
+    """
+    return urlsafe_b64encode(dumps({"k": key}).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """
+    Recupera a chave primária contida em um cursor
+
+    - Args:
+        - cursor: Cursor recebido do cliente.
+
+    - Returns:
+        - str: Chave primária do último item da página anterior.
+
+    - Raises:
+        - BadRequest: Cursor inválido.
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+
+        key = loads(urlsafe_b64decode(cursor + padding))["k"]
+
+    except (DecodeError, UnicodeDecodeError, ValueError, KeyError, TypeError):
+        raise BadRequest(ERROR_INVALID_CURSOR)
+
+    if not isinstance(key, str):
+        raise BadRequest(ERROR_INVALID_CURSOR)
+
+    return key
+
+
+def keyset(query: Select, key: InstrumentedAttribute, limit: int | None = None, cursor: str | None = None) -> Select:
+    """
+    Aplica a paginação por cursor a uma consulta
+
+    Busca um item a mais do que o limite para que `split_page` saiba se existe uma próxima página.
+
+    - Args:
+        - query: Consulta a ser paginada.
+        - key: Coluna da chave primária usada na ordenação.
+        - limit: Quantidade de itens por página. None mantém a consulta sem limite.
+        - cursor: Cursor da página anterior.
+
+    - Returns:
+        - Select: Consulta ordenada pela chave e restrita à página pedida.
+    """
+    query = query.order_by(key)
+
+    if cursor is not None:
+        query = query.where(key > decode_cursor(cursor))
+
+    if limit is not None:
+        query = query.limit(limit + 1)
+
+    return query
+
+
+def split_page(rows: list, limit: int | None, key: InstrumentedAttribute) -> tuple[list, str | None]:
+    """
+    Separa os itens da página e gera o cursor da próxima, se houver
+
+    - Args:
+        - rows: Resultado de uma consulta paginada com `keyset`.
+        - limit: Quantidade de itens por página.
+        - key: Coluna da chave primária usada na ordenação.
+
+    - Returns:
+        - tuple[list, str | None]: Itens da página e cursor da próxima página (None na última).
+    """
+    rows = list(rows)
+
+    if limit is None or len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+
+    return rows, encode_cursor(getattr(rows[-1], key.key))
@@ -0,0 +1,159 @@
+from datetime import date
+from sqlalchemy import (
+    and_,
+    or_,
+    select
+)
+from sqlalchemy.orm import Session
+
+
+from database.models import (
+    ClassEventModel,
+    ClassModel,
+    ClassStudentModel,
+    ClassTeacherModel,
+    DisciplinesModel,
+    RecurrencesModel,
+    UserModel
+)
+from utils.schedule import Slot
+
+
+def get_overlapping_slots(db_session: Session, slots: list[Slot]) -> list[Slot]:
+    """
+    Busca, em uma única consulta, os horários já cadastrados que se sobrepõem a algum dos slots informados
+    e são da mesma turma ou do mesmo professor
+
+    A sobreposição é resolvida no banco com predicados de intervalo (mesmo dia, início antes do fim do slot
+    e fim depois do início do slot), atendidos pelo índice ix_recurrences_day_of_week_start_time.
+
+    - Args:
+        - slots: Novos horários.
+
+    - Returns:
+        - list[Slot]: Horários cadastrados em conflito com ao menos um dos slots (new=False).
+    """
+    if not slots:
+        return []
+
+    rows = db_session.execute(
+        select(
+            ClassEventModel.id,
+            ClassEventModel.class_id,
+            ClassTeacherModel.user_cpf,
+            RecurrencesModel.day_of_week,
+            RecurrencesModel.start_time,
+            RecurrencesModel.end_time,
+            ClassEventModel.start_date,
+            ClassEventModel.end_date
+        )
+        .join(ClassEventModel, ClassEventModel.id == RecurrencesModel.class_event_id)
+        .join(ClassTeacherModel, ClassTeacherModel.id == ClassEventModel.teacher_id)
+        .where(
+            or_(
+                *[
+                    and_(
+                        RecurrencesModel.day_of_week == slot.day_of_week,
+                        RecurrencesModel.start_time < slot.end,
+                        RecurrencesModel.end_time > slot.start,
+                        ClassEventModel.start_date <= slot.end_date,
+                        ClassEventModel.end_date >= slot.start_date,
+                        or_(ClassEventModel.class_id == slot.class_id, ClassTeacherModel.user_cpf == slot.teacher_cpf)
+                    )
+                    for slot in slots
+                ]
+            )
+        )
+    ).all()
+
+    return [
+        Slot(
+            class_event_id=str(row.id),
+            class_id=str(row.class_id),
+            teacher_cpf=row.user_cpf,
+            day_of_week=row.day_of_week,
+            start=row.start_time,
+            end=row.end_time,
+            start_date=row.start_date,
+            end_date=row.end_date,
+            new=False
+        )
+        for row in rows
+    ]
+
+
+def get_timetable_rows(
+    db_session: Session,
+    class_id: str | None = None,
+    teacher_cpf: str | None = None,
+    on: date | None = None,
+    start: date | None = None,
+    end: date | None = None
+) -> list:
+    """
+    Busca, em uma única consulta, todas as recorrências de aula de uma turma ou de um professor, com os
+    nomes da turma, disciplina e professor
+
+    - Args:
+        - class_id: ID da turma.
+        - teacher_cpf: CPF do professor.
+        - on: Considera apenas as aulas cujo período inclui esta data.
+        - start: Considera apenas as aulas cujo período termina nesta data ou depois.
+        - end: Considera apenas as aulas cujo período começa nesta data ou antes.
+
+    - Returns:
+        - list: Linhas com os dados do horário, em ordem de início.
+    """
+    conditions = []
+
+    if class_id is not None:
+        conditions.append(ClassEventModel.class_id == class_id)
+
+    if teacher_cpf is not None:
+        conditions.append(ClassTeacherModel.user_cpf == teacher_cpf)
+
+    if on is not None:
+        conditions += [ClassEventModel.start_date <= on, ClassEventModel.end_date >= on]
+
+    if start is not None:
+        conditions.append(ClassEventModel.end_date >= start)
+
+    if end is not None:
+        conditions.append(ClassEventModel.start_date <= end)
+
+    return db_session.execute(
+        select(
+            ClassEventModel.id.label("class_event_id"),
+            ClassEventModel.class_id,
+            ClassModel.name.label("class_name"),
+            ClassModel.section.label("class_section"),
+            ClassEventModel.discipline_id,
+            DisciplinesModel.name.label("discipline_name"),
+            ClassTeacherModel.user_cpf.label("teacher_cpf"),
+            UserModel.name.label("teacher_name"),
+            RecurrencesModel.day_of_week,
+            RecurrencesModel.start_time,
+            RecurrencesModel.end_time,
+            ClassEventModel.start_date,
+            ClassEventModel.end_date
+        )
+        .join(ClassEventModel, ClassEventModel.id == RecurrencesModel.class_event_id)
+        .join(ClassTeacherModel, ClassTeacherModel.id == ClassEventModel.teacher_id)
+        .join(UserModel, UserModel.cpf == ClassTeacherModel.user_cpf)
+        .join(ClassModel, ClassModel.id == ClassEventModel.class_id)
+        .join(DisciplinesModel, DisciplinesModel.id == ClassEventModel.discipline_id)
+        .where(*conditions)
+        .order_by(RecurrencesModel.day_of_week, RecurrencesModel.start_time, ClassModel.name, ClassModel.section)
+    ).all()
+
+
+def get_student_class_ids(db_session: Session, child_cpf: str) -> list[str]:
+    """
+    IDs das turmas em que o aluno está matriculado
+    """
+    return [
+        str(class_id)
+        for class_id in db_session.scalars(
+            select(ClassStudentModel.class_id).where(ClassStudentModel.child_cpf == child_cpf)
+        ).all()
+    ]
@@ -0,0 +1,74 @@
+"""
+## Consultas em streaming
+
+Exportações completas de tabelas (ex: sincronização com o data warehouse) não podem materializar
+todas as linhas em memória. As funções deste módulo leem o resultado com `yield_per`, que usa cursor
+do lado do servidor quando o driver suporta, e entregam um objeto por vez.
+
+Cada stream abre a sua própria sessão: o StreamingResponse continua consumindo o gerador depois
+que as dependências da rota já foram encerradas.
+"""
+from typing import AsyncIterator
+from sqlalchemy import Select, select
+from sqlalchemy.orm import joinedload
+
+
+from constants.base import STREAM_YIELD_PER
+from database.connection import AsyncSessionLocal
+from database.models import (
+    ChildModel,
+    ClassStudentModel,
+    NoteModel
+)
+from database.repositories.note import NoteRepository
+from schemas.note import NoteFilters
+
+
+async def stream_scalars(query: Select, yield_per: int = STREAM_YIELD_PER) -> AsyncIterator:
+    """
+    Percorre o resultado de uma consulta em lotes, sem carregar tudo em memória
+
+    - Args:
+        - query: Consulta a ser executada. Só use joinedload em relacionamentos de um item.
+        - yield_per: Quantidade de linhas buscadas do banco por lote.
+
+    - Returns:
+        - AsyncIterator: Objetos do resultado, um por vez.
+    """
+    async with AsyncSessionLocal() as session:
+
+        result = await session.stream_scalars(query.execution_options(yield_per=yield_per))
+
+        async for model in result:
+            yield model
+
+
+def stream_notes(filters: NoteFilters | None = None) -> AsyncIterator[NoteModel]:
+    """
+    Percorre as notas que atendem aos filtros, com aluno, disciplina e turma carregados
+
+    - Args:
+        - filters: Objeto com os filtros para busca.
+
+    - Returns:
+        - AsyncIterator[NoteModel]: Notas ordenadas pelo ID.
+    """
+    return stream_scalars(
+        NoteRepository.build_query(filters).order_by(NoteModel.id)
+    )
+
+
+def stream_children() -> AsyncIterator[ChildModel]:
+    """
+    Percorre todos os estudantes, com a turma de cada um carregada
+
+    - Returns:
+        - AsyncIterator[ChildModel]: Estudantes ordenados pelo CPF.
+    """
+    return stream_scalars(
+        select(ChildModel)
+        .options(
+            joinedload(ChildModel.class_student).joinedload(ClassStudentModel.class_)
+        )
+        .order_by(ChildModel.cpf)
+    )
@@ -0,0 +1,121 @@
+from datetime import datetime
+from sqlalchemy import (
+    select,
+    update
+)
+from sqlalchemy.orm import Session
+
+
+from database.models import JobModel
+from schemas.base import JobStatus
+from schemas.job import JobResponse
+
+
+class JobRepository:
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+
+    def add(self, model: JobModel) -> None:
+
+        self.db_session.add(model)
+        self.db_session.commit()
+
+
+    def get(self, id: str) -> JobModel | None:
+        return self.db_session.scalar(select(JobModel).where(JobModel.id == id)) # ID da rota, talvez inválido
+
+
+    def get_pending_ids(self) -> list[str]:
+        """
+        IDs das tarefas na fila, das mais antigas para as mais novas (índice ix_job_status_created_at)
+        """
+        return list(
+            self.db_session.scalars(
+                select(JobModel.id)
+                .where(JobModel.status == JobStatus.PENDING.value)
+                .order_by(JobModel.created_at)
+            ).all()
+        )
+
+
+    def claim(self, id: str) -> bool:
+        """
+        Marca a tarefa como em execução, se ela ainda estiver na fila
+
+        O UPDATE condicional é atômico: entre processos que tentam a mesma tarefa, só um a executa.
+
+        - Returns:
+            - bool: Se a tarefa foi reservada por este processo.
+        """
+        result = self.db_session.execute(
+            update(JobModel)
+            .where(JobModel.id == id, JobModel.status == JobStatus.PENDING.value)
+            .values(status=JobStatus.RUNNING.value, updated_at=datetime.now())
+        )
+
+        self.db_session.commit()
+
+        return result.rowcount == 1
+
+
+    def set_progress(self, id: str, done: int, total: int | None = None) -> None:
+        """
+        Atualiza o andamento da tarefa; a data de atualização serve de sinal de vida para reset_stale
+        """
+        values = {"done": done, "updated_at": datetime.now()}
+
+        if total is not None:
+            values["total"] = total
+
+        self.db_session.execute(update(JobModel).where(JobModel.id == id).values(**values))
+        self.db_session.commit()
+
+
+    def finish(self, id: str, result_path: str) -> None:
+
+        now = datetime.now()
+
+        self.db_session.execute(
+            update(JobModel)
+            .where(JobModel.id == id)
+            .values(status=JobStatus.DONE.value, result_path=result_path, updated_at=now, finished_at=now)
+        )
+        self.db_session.commit()
+
+
+    def fail(self, id: str, error: str) -> None:
+
+        now = datetime.now()
+
+        self.db_session.execute(
+            update(JobModel)
+            .where(JobModel.id == id)
+            .values(status=JobStatus.FAILED.value, error=error, updated_at=now, finished_at=now)
+        )
+        self.db_session.commit()
+
+
+    def reset_stale(self, before: datetime) -> int:
+        """
+        Devolve à fila as tarefas em execução sem atualização desde `before` (ex: o processo que as
+        executava foi encerrado)
+
+        - Returns:
+            - int: Quantidade de tarefas devolvidas à fila.
+        """
+        result = self.db_session.execute(
+            update(JobModel)
+            .where(JobModel.status == JobStatus.RUNNING.value, JobModel.updated_at < before)
+            .values(status=JobStatus.PENDING.value, done=0, updated_at=datetime.now())
+        )
+
+        self.db_session.commit()
+
+        return result.rowcount
+
+
+    @staticmethod
+    def map_model_to_response(model: JobModel) -> JobResponse:
+
+        return JobResponse(**model.dict(exclude=["params", "result_path"]))
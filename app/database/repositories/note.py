@@ -1,18 +1,28 @@
 from sqlalchemy import (
+    Select,
     and_,
+    case,
+    exists,
+    func,
+    insert,
     select
 )
 from sqlalchemy.exc import (
     IntegrityError,
     InternalError
 )
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import (
+    Session,
+    joinedload
+)
 
 from constants.child import ERROR_CHILD_GET_NOT_FOUND
 from constants.classes import ERROR_CLASSES_GET_NOT_FOUND
 from constants.disciplines import ERROR_DISCIPLINES_GET_NOT_FOUND
 from constants.note import(
-    ERROR_NOTE_ALREADY_ADD
+    AVAL_WEIGHTS,
+    ERROR_NOTE_ALREADY_ADD,
+    PASSING_AVERAGE
 )
 from database.models import (
     ClassModel,
@@ -20,10 +30,16 @@ from database.models import (
     DisciplinesModel,
     NoteModel
 )
+from database.queries.existence import is_unique_violation
+from database.queries.pagination import keyset
 from schemas.note import (
+    DisciplineReport,
+    NoteFilters,
     NoteRequest,
     NoteDB,
-    NoteResponse
+    NoteResponse,
+    ReportCardResponse,
+    SemesterAverage
 )
 from utils.messages.error import (
     Conflict,
@@ -37,10 +53,20 @@ class NoteRepository:
         
         
     def add(self, model: NoteModel) -> None:
+        """
+        Insere uma nota. A nota repetida (mesmo aluno, turma, disciplina, semestre e avaliação) é barrada
+        pelo índice único uq_note_child_class_discipline_aval, sem uma consulta prévia
+        
+        - Raises:
+            - Conflict: Nota já cadastrada.
+        """
         try:
             self.db_session.add(model)
             self.db_session.commit()
         except IntegrityError as e:
+            self.db_session.rollback()
+            if is_unique_violation(e):
+                raise Conflict(ERROR_NOTE_ALREADY_ADD)
             raise Conflict(e.detail)
         
         except InternalError as e:
@@ -49,18 +75,300 @@ class NoteRepository:
         except Exception as e:
             raise Server(e)
         
+        
+    def add_all(self, rows: list[dict]) -> None:
+        """
+        Insere várias notas com um único executemany e confirma a transação
+        
+        - Args:
+            - rows: Notas no formato de NoteDB.dict().
+        """
+        try:
+            self.db_session.execute(insert(NoteModel), rows)
+            self.db_session.commit()
+            
+        except IntegrityError as e:
+            self.db_session.rollback()
+            raise Conflict(e.detail)
+        
     
     def get(self, id: str) -> NoteModel | None:
         return self.db_session.query(NoteModel).filter(NoteModel.id == id).first()
         
             
+    def get_discipline_name(self, discipline_id: str) -> str | None:
+        return self.db_session.scalar(select(DisciplinesModel.name).where(DisciplinesModel.id == discipline_id))
+    
+    
     def get_by_child_cpf(self, child_cpf: str) -> list[NoteModel]:
         return self.db_session.query(NoteModel).filter(NoteModel.child_cpf == child_cpf).all()
     
-    def get_all(self) -> list[NoteModel]:
-        return self.db_session.query(NoteModel).all()
+    def get_all(
+        self, 
+        filters: NoteFilters | None = None, 
+        limit: int | None = None, 
+        cursor: str | None = None
+    ) -> list[NoteModel]:
+        """
+        Busca as notas que atendem aos filtros, já carregando aluno, disciplina e turma na mesma consulta
+        
+        - Args:
+            - filters: Objeto com os filtros para busca. Campos None são ignorados.
+            - limit: Quantidade de notas por página (None busca todas).
+            - cursor: Cursor da página anterior (ver database/queries/pagination.py).
+            
+        - Returns:
+            - list[NoteModel]: Lista de notas encontradas no banco de dados.
+        """
+        query = keyset(self.build_query(filters), NoteModel.id, limit, cursor)
+        
+        return list(self.db_session.scalars(query).all())
+    
+    
+    def exists_any(self) -> bool:
+        """
+        Verifica se existe ao menos uma nota cadastrada, sem carregar a tabela
+        """
+        return self.db_session.scalar(select(NoteModel.id).limit(1)) is not None
+    
+    
+    @staticmethod
+    def build_query(filters: NoteFilters | None = None) -> Select:
+        """
+        Monta a consulta de notas filtradas, com aluno, disciplina e turma carregados via JOIN
+        
+        - Args:
+            - filters: Objeto com os filtros para busca.
+            
+        - Returns:
+            - Select: Consulta sem ordenação nem limite.
+        """
+        return (
+            select(NoteModel)
+            .options(
+                joinedload(NoteModel.child),
+                joinedload(NoteModel.discipline),
+                joinedload(NoteModel.class_)
+            )
+            .where(*NoteRepository.build_conditions(filters))
+        )
+    
+    
+    @staticmethod
+    def build_conditions(filters: NoteFilters | None) -> list:
+        """
+        Converte os filtros informados em condições do WHERE, uma igualdade por campo preenchido
+        
+        - Args:
+            - filters: Objeto com os filtros para busca.
+            
+        - Returns:
+            - list: Lista de condições a serem aplicadas na consulta.
+        """
+        if filters is None:
+            return []
+        
+        return [
+            getattr(NoteModel, key) == value 
+            for key, value in filters.dict().items()
+        ]
     
 
+    def get_related(self, notes: list[NoteRequest], chunk_size: int = 1000) -> tuple[dict, dict, dict]:
+        """
+        Carrega as disciplinas, turmas e alunos referenciados por um lote de notas, com consultas IN
+        
+        - Args:
+            - notes: Notas do lote.
+            - chunk_size: Quantidade de chaves por consulta.
+            
+        - Returns:
+            - tuple[dict, dict, dict]: Disciplinas por ID, turmas por ID e alunos por CPF encontrados no banco.
+        """
+        return (
+            self._get_by_keys(DisciplinesModel.id, {note.discipline_id for note in notes}, chunk_size),
+            self._get_by_keys(ClassModel.id, {note.class_id for note in notes}, chunk_size),
+            self._get_by_keys(ChildModel.cpf, {note.child_cpf for note in notes}, chunk_size)
+        )
+    
+    
+    def _get_by_keys(self, column, keys: set, chunk_size: int) -> dict:
+        
+        keys = list(keys)
+        
+        found = {}
+        
+        for start in range(0, len(keys), chunk_size):
+            
+            for model in self.db_session.scalars(
+                select(column.class_).where(column.in_(keys[start:start + chunk_size]))
+            ).all():
+                found[getattr(model, column.key)] = model
+                
+        return found
+    
+    
+    def existing_keys(self, notes: list[NoteRequest], chunk_size: int = 1000) -> set[tuple]:
+        """
+        Verifica quais notas de um lote já estão cadastradas (mesmo aluno, turma, disciplina, semestre e avaliação)
+        
+        As notas dos alunos do lote são buscadas com IN em lotes de `chunk_size` alunos, trazendo só as colunas da chave.
+        
+        - Args:
+            - notes: Notas do lote.
+            - chunk_size: Quantidade de alunos por consulta.
+            
+        - Returns:
+            - set[tuple]: Chaves (ver note_key) das notas do lote que já existem no banco.
+        """
+        wanted = {self.note_key(note) for note in notes}
+        
+        child_cpfs = list({note.child_cpf for note in notes})
+        class_ids = {note.class_id for note in notes}
+        
+        found = set()
+        
+        for start in range(0, len(child_cpfs), chunk_size):
+            
+            rows = self.db_session.execute(
+                select(
+                    NoteModel.child_cpf,
+                    NoteModel.class_id,
+                    NoteModel.discipline_id,
+                    NoteModel.semester,
+                    NoteModel.aval_number
+                )
+                .where(
+                    NoteModel.child_cpf.in_(child_cpfs[start:start + chunk_size]),
+                    NoteModel.class_id.in_(class_ids)
+                )
+            ).all()
+            
+            found.update(tuple(row) for row in rows)
+            
+        return found & wanted
+    
+    
+    @staticmethod
+    def note_key(note: NoteRequest) -> tuple:
+        """
+        Chave que identifica uma nota: (child_cpf, class_id, discipline_id, semester, aval_number)
+        """
+        return (note.child_cpf, note.class_id, note.discipline_id, note.semester, note.aval_number)
+    
+
+    def get_report_card_rows(self, class_id: str | None = None, child_cpf: str | None = None) -> list:
+        """
+        Calcula no banco, em uma única consulta, as médias dos boletins de turmas inteiras
+
+        Médias ponderadas de cada semestre (pesos de AVAL_WEIGHTS), médias finais das disciplinas, média
+        geral e classificação de cada aluno na turma (rank() por turma) são agregadas em CTEs sobre a
+        tabela note, sem trazer as notas para o Python.
+
+        - Args:
+            - class_id: Restringe à turma. Sem turma, calcula para todas (ou, com child_cpf, para as turmas do aluno).
+            - child_cpf: Retorna apenas as linhas do aluno; a classificação continua considerando a turma toda.
+
+        - Returns:
+            - list: Uma linha por aluno, disciplina e semestre, com class_id, child_cpf, student_name,
+            discipline_id, discipline_name, semester, semester_average, discipline_average, average e
+            ranking; ordenadas por turma, classificação, aluno, disciplina e semestre.
+        """
+        weight = case(AVAL_WEIGHTS, value=NoteModel.aval_number, else_=1.0)
+
+        conditions = []
+
+        if class_id is not None:
+            conditions.append(NoteModel.class_id == class_id)
+
+        elif child_cpf is not None:
+            conditions.append(
+                NoteModel.class_id.in_(select(NoteModel.class_id).where(NoteModel.child_cpf == child_cpf))
+            )
+
+        semester = (
+            select(
+                NoteModel.class_id,
+                NoteModel.child_cpf,
+                NoteModel.discipline_id,
+                NoteModel.semester,
+                (func.sum(NoteModel.points * weight) / func.sum(weight)).label("average")
+            )
+            .where(*conditions)
+            .group_by(NoteModel.class_id, NoteModel.child_cpf, NoteModel.discipline_id, NoteModel.semester)
+            .cte("semester_average")
+        )
+
+        discipline = (
+            select(
+                semester.c.class_id,
+                semester.c.child_cpf,
+                semester.c.discipline_id,
+                func.avg(semester.c.average).label("average")
+            )
+            .group_by(semester.c.class_id, semester.c.child_cpf, semester.c.discipline_id)
+            .cte("discipline_average")
+        )
+
+        student = (
+            select(
+                discipline.c.class_id,
+                discipline.c.child_cpf,
+                func.avg(discipline.c.average).label("average"),
+                func.rank().over(
+                    partition_by=discipline.c.class_id,
+                    order_by=func.avg(discipline.c.average).desc()
+                ).label("ranking")
+            )
+            .group_by(discipline.c.class_id, discipline.c.child_cpf)
+            .cte("student_average")
+        )
+
+        query = (
+            select(
+                semester.c.class_id,
+                semester.c.child_cpf,
+                ChildModel.name.label("student_name"),
+                semester.c.discipline_id,
+                DisciplinesModel.name.label("discipline_name"),
+                semester.c.semester,
+                semester.c.average.label("semester_average"),
+                discipline.c.average.label("discipline_average"),
+                student.c.average,
+                student.c.ranking
+            )
+            .join(
+                discipline,
+                and_(
+                    discipline.c.class_id == semester.c.class_id,
+                    discipline.c.child_cpf == semester.c.child_cpf,
+                    discipline.c.discipline_id == semester.c.discipline_id
+                )
+            )
+            .join(
+                student,
+                and_(
+                    student.c.class_id == semester.c.class_id,
+                    student.c.child_cpf == semester.c.child_cpf
+                )
+            )
+            .join(ChildModel, ChildModel.cpf == semester.c.child_cpf)
+            .join(DisciplinesModel, DisciplinesModel.id == semester.c.discipline_id)
+            .order_by(
+                semester.c.class_id,
+                student.c.ranking,
+                semester.c.child_cpf,
+                DisciplinesModel.name,
+                semester.c.semester
+            )
+        )
+
+        if child_cpf is not None:
+            query = query.where(semester.c.child_cpf == child_cpf)
+
+        return self.db_session.execute(query).all()
+
+
     def update(self, model: NoteModel) -> NoteModel:
         self.db_session.commit()
         self.db_session.refresh(model)
@@ -78,19 +386,100 @@ class NoteRepository:
         return result
     
     
-    def map_model_to_response(self, model: NoteModel):
+    @staticmethod
+    def map_model_to_response(model: NoteModel) -> NoteResponse:
+        
+        return NoteRepository.map_to_response(model.dict(), model.child, model.discipline, model.class_)
+    
+    
+    @staticmethod
+    def map_to_response(
+        note: dict, 
+        child: ChildModel, 
+        discipline: DisciplinesModel, 
+        class_: ClassModel
+    ) -> NoteResponse:
                 
         return NoteResponse(
-            **model.dict(),
-            student_name=model.child.name,
-            matriculation=model.child.matriculation,
-            discipline_name=model.discipline.name,
-            class_name=model.class_.name,
-            class_section=model.class_.section,
-            class_shift=model.class_.shift
+            **note,
+            student_name=child.name,
+            matriculation=child.matriculation,
+            discipline_name=discipline.name,
+            class_name=class_.name,
+            class_section=class_.section,
+            class_shift=class_.shift
         )
     
     
+    @staticmethod
+    def map_rows_to_report_cards(rows: list) -> list[ReportCardResponse]:
+        """
+        Agrupa as linhas de get_report_card_rows em um boletim por aluno e turma, mantendo a ordem das linhas
+        """
+        report_cards: dict[tuple, ReportCardResponse] = {}
+
+        for row in rows:
+
+            key = (str(row.class_id), row.child_cpf)
+
+            report_card = report_cards.get(key)
+
+            if report_card is None:
+                report_card = report_cards[key] = ReportCardResponse(
+                    class_id=str(row.class_id),
+                    child_cpf=row.child_cpf,
+                    student_name=row.student_name,
+                    disciplines=[],
+                    average=round(row.average, 2),
+                    ranking=row.ranking,
+                    approved=True
+                )
+
+            if not report_card.disciplines or report_card.disciplines[-1].discipline_id != str(row.discipline_id):
+
+                approved = row.discipline_average >= PASSING_AVERAGE
+
+                report_card.disciplines.append(
+                    DisciplineReport(
+                        discipline_id=str(row.discipline_id),
+                        discipline_name=row.discipline_name,
+                        semesters=[],
+                        average=round(row.discipline_average, 2),
+                        approved=approved
+                    )
+                )
+
+                report_card.approved = report_card.approved and approved
+
+            report_card.disciplines[-1].semesters.append(
+                SemesterAverage(semester=row.semester, average=round(row.semester_average, 2))
+            )
+
+        return list(report_cards.values())
+
+
+    @staticmethod
+    def map_row_to_request(row: dict) -> NoteRequest:
+        """
+        Converte um registro do cadastro em massa para NoteRequest
+
+        Linhas de CSV trazem todos os valores como texto; semestre, avaliação e nota são convertidos para número.
+        """
+        row = dict(row)
+        
+        for field, cast in (("semester", int), ("aval_number", int), ("points", float)):
+            
+            value = row.get(field)
+            
+            if isinstance(value, str):
+                try:
+                    row[field] = cast(value.replace(",", "."))
+                except ValueError:
+                    pass
+                
+        return NoteRequest(**row)
+    
+    
     def map_request_to_model(self, request: NoteRequest) -> NoteModel:
                 
         to_db = NoteDB(**request.dict())
@@ -132,22 +521,32 @@ class NoteRepository:
                 raise Conflict(ERROR_NOTE_ALREADY_ADD)
         
         else: # Caso seja a primeira nota, precisamos validar se os dados externos existem e estão corretos
+            self.validate_references(note)
+            
+            
+    def validate_references(self, note: NoteRequest) -> None:
+        """
+        Valida, em uma única consulta, se a disciplina, a turma e o aluno da nota existem
+        
+        - Args:
+            - note: Objeto do tipo NoteRequest a ser validado.
+            
+        - Raises:
+            - NotFound: Aluno, turma ou disciplina não encontrados.
+        """
+        discipline_exists, class_exists, child_exists = self.db_session.execute(
+            select(
+                exists().where(DisciplinesModel.id == note.discipline_id),
+                exists().where(ClassModel.id == note.class_id),
+                exists().where(ChildModel.cpf == note.child_cpf)
+            )
+        ).one()
+        
+        if not discipline_exists:
+            raise NotFound(ERROR_DISCIPLINES_GET_NOT_FOUND)
+        
+        if not class_exists:
+            raise NotFound(ERROR_CLASSES_GET_NOT_FOUND)
         
-            if self.db_session.scalar(
-                select(DisciplinesModel)
-                .where(DisciplinesModel.id == note.discipline_id)
-            ) is None:
-                raise NotFound(ERROR_DISCIPLINES_GET_NOT_FOUND)
-            
-            if self.db_session.scalar(
-                select(ClassModel)
-                .where(ClassModel.id == note.class_id)
-            ) is None:
-                raise NotFound(ERROR_CLASSES_GET_NOT_FOUND)
-            
-            if self.db_session.scalar(
-                select(ChildModel)
-                .where(ChildModel.cpf == note.child_cpf)
-            ) is None:
-                raise NotFound(ERROR_CHILD_GET_NOT_FOUND)
-        
\ No newline at end of file
+        if not child_exists:
+            raise NotFound(ERROR_CHILD_GET_NOT_FOUND)
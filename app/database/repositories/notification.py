@@ -0,0 +1,230 @@
+from datetime import datetime
+from sqlalchemy import (
+    Row,
+    delete,
+    func,
+    insert,
+    select,
+    update
+)
+from sqlalchemy.orm import Session
+
+
+from constants.notification import (
+    NOTIFICATION_ABSENCE_TEXT,
+    NOTIFICATION_ABSENCE_TITLE,
+    NOTIFICATION_NOTE_TEXT,
+    NOTIFICATION_NOTE_TITLE
+)
+from database.models import (
+    ChildModel,
+    ChildParentsModel,
+    NotificationModel,
+    UserModel
+)
+from schemas.base import NotificationKind
+from services.generator.ids import id_generate
+
+
+class NotificationRepository:
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+
+    def add_for_parents(
+        self,
+        parent_cpfs: list[str],
+        kind: NotificationKind,
+        title: str,
+        text: str,
+        child_cpf: str | None = None,
+        reference: str | None = None
+    ) -> None:
+        """
+        Registra a mesma notificação para vários responsáveis, sem confirmar a transação (as notificações são
+        gravadas no commit da alteração que as originou)
+        """
+        now = datetime.now()
+
+        rows = [
+            {
+                "id": id_generate(),
+                "parent_cpf": parent_cpf,
+                "child_cpf": child_cpf,
+                "kind": kind.value,
+                "reference": reference,
+                "title": title,
+                "text": text,
+                "created_at": now
+            }
+            for parent_cpf in parent_cpfs
+        ]
+
+        if rows:
+            self.db_session.execute(insert(NotificationModel), rows)
+
+
+    def add_for_children(
+        self,
+        kind: NotificationKind,
+        entries: list[tuple[str, str, str]],
+        reference: str | None = None
+    ) -> int:
+        """
+        Registra cada notificação para todos os responsáveis do aluno, sem confirmar a transação
+
+        Os responsáveis de todos os alunos vêm de uma única consulta IN. Com `reference`, as notificações
+        ainda pendentes da mesma ocorrência são substituídas (ex: uma chamada corrigida não gera uma segunda
+        falta para o mesmo aluno).
+
+        - Args:
+            - kind: Tipo da notificação.
+            - entries: CPF do aluno, título e texto de cada notificação.
+            - reference: Ocorrência que originou as notificações.
+
+        - Returns:
+            - int: Quantidade de notificações registradas.
+        """
+        if reference is not None:
+            self.db_session.execute(
+                delete(NotificationModel)
+                .where(
+                    NotificationModel.reference == reference,
+                    NotificationModel.kind == kind.value,
+                    NotificationModel.outbox_id.is_(None)
+                )
+            )
+
+        if not entries:
+            return 0
+
+        parents: dict[str, list[str]] = {}
+
+        for child_cpf, parent_cpf in self.db_session.execute(
+            select(ChildParentsModel.child_cpf, ChildParentsModel.parent_cpf)
+            .where(ChildParentsModel.child_cpf.in_({child_cpf for child_cpf, _, _ in entries}))
+        ):
+            parents.setdefault(child_cpf, []).append(parent_cpf)
+
+        now = datetime.now()
+
+        rows = [
+            {
+                "id": id_generate(),
+                "parent_cpf": parent_cpf,
+                "child_cpf": child_cpf,
+                "kind": kind.value,
+                "reference": reference,
+                "title": title,
+                "text": text,
+                "created_at": now
+            }
+            for child_cpf, title, text in entries
+            for parent_cpf in parents.get(child_cpf, [])
+        ]
+
+        if rows:
+            self.db_session.execute(insert(NotificationModel), rows)
+
+        return len(rows)
+
+
+    def get_due_parents(self, before: datetime, limit: int) -> list[str]:
+        """
+        Responsáveis cuja notificação pendente mais antiga é anterior a `before`
+
+        Uma só consulta agrupada pelo índice ix_notification_outbox_id_parent_cpf.
+        """
+        return list(
+            self.db_session.scalars(
+                select(NotificationModel.parent_cpf)
+                .where(NotificationModel.outbox_id.is_(None))
+                .group_by(NotificationModel.parent_cpf)
+                .having(func.min(NotificationModel.created_at) <= before)
+                .order_by(func.min(NotificationModel.created_at))
+                .limit(limit)
+            ).all()
+        )
+
+
+    def get_pending(self, parent_cpfs: list[str]) -> list[Row]:
+        """
+        Notificações pendentes dos responsáveis, com o nome e o email do responsável e o nome do aluno,
+        das mais antigas para as mais recentes
+
+        - Returns:
+            - list[Row]: id, parent_cpf, parent_name, email, child_name, kind, title, text e created_at.
+        """
+        if not parent_cpfs:
+            return []
+
+        return self.db_session.execute(
+            select(
+                NotificationModel.id,
+                NotificationModel.parent_cpf,
+                UserModel.name.label("parent_name"),
+                UserModel.email,
+                ChildModel.name.label("child_name"),
+                NotificationModel.kind,
+                NotificationModel.title,
+                NotificationModel.text,
+                NotificationModel.created_at
+            )
+            .join(UserModel, UserModel.cpf == NotificationModel.parent_cpf)
+            .outerjoin(ChildModel, ChildModel.cpf == NotificationModel.child_cpf)
+            .where(NotificationModel.parent_cpf.in_(parent_cpfs), NotificationModel.outbox_id.is_(None))
+            .order_by(NotificationModel.parent_cpf, NotificationModel.created_at)
+        ).all()
+
+
+    def mark_sent(self, ids: list[str], outbox_id: str) -> int:
+        """
+        Associa as notificações ao email que as enviou, se ainda estiverem pendentes
+
+        - Returns:
+            - int: Quantidade de notificações associadas; menor que len(ids) se outro worker já as enviou.
+        """
+        result = self.db_session.execute(
+            update(NotificationModel)
+            .where(NotificationModel.id.in_(ids), NotificationModel.outbox_id.is_(None))
+            .values(outbox_id=outbox_id)
+        )
+
+        return result.rowcount
+
+
+    @staticmethod
+    def map_note_to_notification(note: dict, discipline_name: str) -> tuple[str, str]:
+        """
+        Título e texto da notificação de uma nota (no formato de NoteDB.dict())
+        """
+        return (
+            NOTIFICATION_NOTE_TITLE.format(discipline=discipline_name),
+            NOTIFICATION_NOTE_TEXT.format(
+                points=f"{note['points']:g}",
+                aval_number=note["aval_number"],
+                semester=note["semester"]
+            )
+        )
+
+
+    @staticmethod
+    def map_absence_to_notification(start_class: datetime, discipline_name: str) -> tuple[str, str]:
+        """
+        Título e texto da notificação de uma falta
+        """
+        return (
+            NOTIFICATION_ABSENCE_TITLE.format(discipline=discipline_name),
+            NOTIFICATION_ABSENCE_TEXT.format(
+                date=f"{start_class:%d/%m/%Y}",
+                time=f"{start_class:%H:%M}"
+            )
+        )
+
+
+    @staticmethod
+    def absence_reference(class_event_id: str, start_class: datetime) -> str:
+        """
+        Referência das faltas de uma ocorrência de aula (mesma aula e início da chamada)
+        """
+        return f"absence:{class_event_id}:{start_class:%Y%m%dT%H%M}"
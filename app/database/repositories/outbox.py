@@ -0,0 +1,151 @@
+from datetime import datetime
+from sqlalchemy import (
+    Row,
+    select,
+    update
+)
+from sqlalchemy.orm import Session
+
+
+from database.models import OutboxModel
+from schemas.base import OutboxStatus
+from services.generator.ids import id_generate
+
+
+class OutboxRepository:
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+
+    def enqueue(self, to_email: str, subject: str, body: str) -> OutboxModel:
+        """
+        Adiciona um email à outbox sem confirmar a transação
+
+        O email é gravado junto com a alteração que o originou, no commit de quem chamou: se a alteração for
+        desfeita, o email também é.
+        """
+        now = datetime.now()
+
+        model = OutboxModel(
+            id=id_generate(),
+            to_email=to_email,
+            subject=subject,
+            body=body,
+            status=OutboxStatus.PENDING.value,
+            attempts=0,
+            next_attempt_at=now,
+            created_at=now,
+            updated_at=now
+        )
+
+        self.db_session.add(model)
+
+        return model
+
+
+    def get(self, id: str) -> OutboxModel | None:
+        return self.db_session.get(OutboxModel, id)
+
+
+    def claim_batch(self, limit: int, now: datetime) -> list[Row]:
+        """
+        Reserva para envio até `limit` emails pendentes cuja próxima tentativa já chegou, dos mais atrasados
+        para os mais recentes (índice ix_outbox_status_next_attempt_at)
+
+        No PostgreSQL as linhas escolhidas são travadas com SKIP LOCKED, e o UPDATE só altera as que
+        ainda estão pendentes: entre workers que buscam ao mesmo tempo, cada email é reservado por um só.
+
+        - Returns:
+            - list[Row]: id, to_email, subject, body e attempts dos emails reservados (status sending).
+        """
+        ids = self.db_session.scalars(
+            select(OutboxModel.id)
+            .where(OutboxModel.status == OutboxStatus.PENDING.value, OutboxModel.next_attempt_at <= now)
+            .order_by(OutboxModel.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ).all()
+
+        if not ids:
+            self.db_session.commit()
+            return []
+
+        claimed = self.db_session.execute(
+            update(OutboxModel)
+            .where(OutboxModel.id.in_(ids), OutboxModel.status == OutboxStatus.PENDING.value)
+            .values(status=OutboxStatus.SENDING.value, updated_at=now)
+            .returning(OutboxModel.id, OutboxModel.to_email, OutboxModel.subject, OutboxModel.body, OutboxModel.attempts)
+        ).all()
+
+        self.db_session.commit()
+
+        return claimed
+
+
+    def mark_sent(self, ids: list[str]) -> None:
+
+        if not ids:
+            return
+
+        now = datetime.now()
+
+        self.db_session.execute(
+            update(OutboxModel)
+            .where(OutboxModel.id.in_(ids))
+            .values(status=OutboxStatus.SENT.value, last_error=None, updated_at=now, sent_at=now)
+        )
+        self.db_session.commit()
+
+
+    def mark_retry(self, id: str, error: str, next_attempt_at: datetime) -> None:
+        """
+        Devolve o email à fila para uma nova tentativa em `next_attempt_at`
+        """
+        self.db_session.execute(
+            update(OutboxModel)
+            .where(OutboxModel.id == id)
+            .values(
+                status=OutboxStatus.PENDING.value,
+                attempts=OutboxModel.attempts + 1,
+                last_error=error,
+                next_attempt_at=next_attempt_at,
+                updated_at=datetime.now()
+            )
+        )
+        self.db_session.commit()
+
+
+    def mark_failed(self, id: str, error: str) -> None:
+        """
+        Desiste do email (recusa definitiva do servidor ou tentativas esgotadas)
+        """
+        self.db_session.execute(
+            update(OutboxModel)
+            .where(OutboxModel.id == id)
+            .values(
+                status=OutboxStatus.FAILED.value,
+                attempts=OutboxModel.attempts + 1,
+                last_error=error,
+                updated_at=datetime.now()
+            )
+        )
+        self.db_session.commit()
+
+
+    def reset_stale(self, before: datetime) -> int:
+        """
+        Devolve à fila os emails reservados desde antes de `before` e nunca concluídos (ex: o processo que os
+        enviava foi encerrado)
+
+        - Returns:
+            - int: Quantidade de emails devolvidos à fila.
+        """
+        result = self.db_session.execute(
+            update(OutboxModel)
+            .where(OutboxModel.status == OutboxStatus.SENDING.value, OutboxModel.updated_at < before)
+            .values(status=OutboxStatus.PENDING.value, updated_at=datetime.now())
+        )
+
+        self.db_session.commit()
+
+        return result.rowcount
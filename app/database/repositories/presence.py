@@ -1,64 +1,333 @@
-from datetime import datetime
+from collections import defaultdict
+from datetime import (
+    date,
+    datetime
+)
+from sqlalchemy import (
+    delete,
+    func,
+    insert,
+    select
+)
+from sqlalchemy.dialects import (
+    postgresql,
+    sqlite
+)
 from sqlalchemy.orm import Session
 
 
-from database.models import PresenceModel
+from database.models import (
+    AttendanceModel,
+    ClassEventModel,
+    ClassStudentModel,
+    PresenceModel
+)
+from schemas.base import PresenceType
 from schemas.presence import (
+    AttendanceResponse,
     PresenceRequest,
-    PresenceDB
+    PresenceDB,
+    PresenceResponse
 )
 from services.generator.ids import id_generate
 
+
+def month_of(value: date) -> date:
+    """
+    Primeiro dia do mês da data, usado como chave do mês em AttendanceModel
+    """
+    return date(value.year, value.month, 1)
+
+
 class PresenceRepository:
     def __init__(self, db_session: Session):
         self.db_session = db_session
-        
-        
+
+
     def add(self, model: PresenceModel) -> None:
-        
+
         self.db_session.add(model)
+        self.apply_attendance(self.attendance_deltas(added=[model.dict()]))
         self.db_session.commit()
-        
-    
+
+
+    def replace_roll_call(self, class_event_id: str, start_class: datetime, rows: list[dict]) -> None:
+        """
+        Grava a chamada de uma ocorrência da aula em uma única transação
+
+        A chamada anterior da mesma ocorrência (mesma aula e início) é substituída, então reenviar a
+        chamada corrige as presenças em vez de duplicá-las.
+
+        - Args:
+            - class_event_id: ID da aula.
+            - start_class: Início da ocorrência da aula.
+            - rows: Presenças no formato de PresenceDB.dict().
+
+        A contagem mensal (AttendanceModel) é ajustada na mesma transação, somando a diferença entre a
+        chamada anterior e a nova.
+        """
+        previous = self.db_session.execute(
+            delete(PresenceModel)
+            .where(
+                PresenceModel.class_event_id == class_event_id,
+                PresenceModel.start_class == start_class
+            )
+            .returning(
+                PresenceModel.class_event_id,
+                PresenceModel.child_cpf,
+                PresenceModel.type,
+                PresenceModel.start_class
+            )
+        ).mappings().all()
+
+        self.db_session.execute(insert(PresenceModel), rows)
+
+        self.apply_attendance(self.attendance_deltas(added=rows, removed=previous))
+
+        self.db_session.commit()
+
+
+    @staticmethod
+    def attendance_deltas(added: list[dict] = (), removed: list[dict] = ()) -> dict[tuple, list[int]]:
+        """
+        Calcula quanto cada contagem mensal muda ao incluir `added` e remover `removed`
+
+        - Args:
+            - added: Presenças incluídas (class_event_id, child_cpf, type e start_class).
+            - removed: Presenças removidas, no mesmo formato.
+
+        - Returns:
+            - dict[tuple, list[int]]: (child_cpf, class_event_id, mês) -> [presenças, faltas]. Chaves sem
+            alteração são omitidas, então reenviar a mesma chamada não gera escrita.
+        """
+        deltas = defaultdict(lambda: [0, 0])
+
+        for rows, sign in ((added, 1), (removed, -1)):
+            for row in rows:
+
+                key = (row["child_cpf"], str(row["class_event_id"]), month_of(row["start_class"]))
+
+                presence_type = row["type"].value if isinstance(row["type"], PresenceType) else row["type"]
+
+                deltas[key][0 if presence_type == PresenceType.P.value else 1] += sign
+
+        return {key: delta for key, delta in deltas.items() if any(delta)}
+
+
+    def apply_attendance(self, deltas: dict[tuple, list[int]]) -> None:
+        """
+        Soma as diferenças calculadas em attendance_deltas às contagens mensais, sem confirmar a transação
+
+        Usa um único INSERT ... ON CONFLICT DO UPDATE, atômico mesmo com chamadas simultâneas da mesma aula.
+        """
+        if not deltas:
+            return
+
+        dialect = postgresql if self.db_session.get_bind().dialect.name == "postgresql" else sqlite
+
+        statement = dialect.insert(AttendanceModel)
+
+        self.db_session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[
+                    AttendanceModel.child_cpf,
+                    AttendanceModel.class_event_id,
+                    AttendanceModel.month
+                ],
+                set_={
+                    "present": AttendanceModel.present + statement.excluded.present,
+                    "absent": AttendanceModel.absent + statement.excluded.absent
+                }
+            ),
+            [
+                {
+                    "child_cpf": child_cpf,
+                    "class_event_id": class_event_id,
+                    "month": month,
+                    "present": present,
+                    "absent": absent
+                }
+                for (child_cpf, class_event_id, month), (present, absent) in deltas.items()
+            ]
+        )
+
+
+    def get_class_attendance(self, class_id: str, start: date, end: date) -> list:
+        """
+        Soma as contagens mensais dos alunos em todas as aulas de uma turma, em uma única consulta
+
+        As aulas da turma vêm do índice ix_class_event_class_id e as contagens do índice
+        ix_attendance_class_event_id_month, sem ler a tabela presence.
+
+        - Args:
+            - class_id: ID da turma.
+            - start: Primeiro mês do período.
+            - end: Último mês do período.
+
+        - Returns:
+            - list: Linhas (child_cpf, present, absent), ordenadas por CPF.
+        """
+        return self.db_session.execute(
+            select(
+                AttendanceModel.child_cpf,
+                func.sum(AttendanceModel.present).label("present"),
+                func.sum(AttendanceModel.absent).label("absent")
+            )
+            .join(ClassEventModel, ClassEventModel.id == AttendanceModel.class_event_id)
+            .where(
+                ClassEventModel.class_id == class_id,
+                AttendanceModel.month >= month_of(start),
+                AttendanceModel.month <= month_of(end)
+            )
+            .group_by(AttendanceModel.child_cpf)
+            .order_by(AttendanceModel.child_cpf)
+        ).all()
+
+
     def get(self, id: str) -> PresenceModel | None:
         return self.db_session.query(PresenceModel).filter(PresenceModel.id == id).first()
-        
-            
+
+
     def get_by_child_cpf(self, child_cpf: str) -> list[PresenceModel]:
         return self.db_session.query(PresenceModel).filter(PresenceModel.child_cpf == child_cpf).all()
-    
+
+
+    def get_by_child(self, child_cpf: str, start: datetime, end: datetime) -> list[PresenceModel]:
+        """
+        Busca as presenças de um aluno em um período, com uma leitura do índice (child_cpf, start_class)
+
+        - Args:
+            - child_cpf: CPF do aluno.
+            - start: Início do período (inclusivo).
+            - end: Fim do período (exclusivo).
+
+        - Returns:
+            - list[PresenceModel]: Presenças do período, em ordem cronológica.
+        """
+        return list(
+            self.db_session.scalars(
+                select(PresenceModel)
+                .where(
+                    PresenceModel.child_cpf == child_cpf,
+                    PresenceModel.start_class >= start,
+                    PresenceModel.start_class < end
+                )
+                .order_by(PresenceModel.start_class)
+            ).all()
+        )
+
+
+    def get_by_class(self, class_id: str, start: datetime, end: datetime) -> list[PresenceModel]:
+        """
+        Busca as presenças de todas as aulas de uma turma em um período
+
+        As aulas da turma vêm do índice ix_class_event_class_id e, para cada uma, as presenças do período
+        de uma leitura do índice único (class_event_id, start_class, child_cpf).
+
+        - Args:
+            - class_id: ID da turma.
+            - start: Início do período (inclusivo).
+            - end: Fim do período (exclusivo).
+
+        - Returns:
+            - list[PresenceModel]: Presenças do período, em ordem cronológica e por aluno.
+        """
+        return list(
+            self.db_session.scalars(
+                select(PresenceModel)
+                .join(ClassEventModel, ClassEventModel.id == PresenceModel.class_event_id)
+                .where(
+                    ClassEventModel.class_id == class_id,
+                    PresenceModel.start_class >= start,
+                    PresenceModel.start_class < end
+                )
+                .order_by(PresenceModel.start_class, PresenceModel.child_cpf)
+            ).all()
+        )
+
+
+    def get_class_students(self, class_id: str, child_cpfs: set[str]) -> set[str]:
+        """
+        Retorna, entre os CPFs informados, os dos alunos matriculados na turma
+        """
+        if not child_cpfs:
+            return set()
+
+        return set(
+            self.db_session.scalars(
+                select(ClassStudentModel.child_cpf)
+                .where(
+                    ClassStudentModel.class_id == class_id,
+                    ClassStudentModel.child_cpf.in_(child_cpfs)
+                )
+            ).all()
+        )
+
+
     def get_all(self) -> list[PresenceModel]:
         return self.db_session.query(PresenceModel).all()
-    
+
 
     def update(self, model: PresenceModel) -> PresenceModel:
+        """
+        Confirma as alterações de uma presença, ajustando a contagem mensal (AttendanceModel) na mesma transação
+
+        Os valores anteriores são lidos do banco antes de as alterações serem enviadas, e a contagem recebe a
+        diferença entre eles e os novos (tipo, aluno, aula ou mês).
+        """
+        with self.db_session.no_autoflush:
+            previous = self.db_session.execute(
+                select(
+                    PresenceModel.class_event_id,
+                    PresenceModel.child_cpf,
+                    PresenceModel.type,
+                    PresenceModel.start_class
+                )
+                .where(PresenceModel.id == model.id)
+            ).mappings().all()
+
+        self.apply_attendance(self.attendance_deltas(added=[model.dict()], removed=previous))
         self.db_session.commit()
         self.db_session.refresh(model)
         return model
-    
-    
+
+
     def delete(self, id: str) -> bool:
         model = self.get(id)
         result = False
         if model:
+            self.apply_attendance(self.attendance_deltas(removed=[model.dict()]))
             self.db_session.delete(model)
             self.db_session.commit()
             result = True
-            
+
         return result
-    
-    
-    def map_model_to_response(self, model: PresenceModel):
-        pass
-    
-    
-    def map_request_to_model(self, request: PresenceRequest, file_path: str | None = None):
-        
+
+
+    @staticmethod
+    def map_model_to_response(model: PresenceModel) -> PresenceResponse:
+
+        return PresenceResponse(**model.dict())
+
+
+    @staticmethod
+    def map_attendance_to_response(row) -> AttendanceResponse:
+
+        total = row.present + row.absent
+
+        return AttendanceResponse(
+            child_cpf=row.child_cpf,
+            present=row.present,
+            absent=row.absent,
+            percentage=round(100 * row.present / total, 2) if total else 0.0
+        )
+
+
+    def map_request_to_model(self, request: PresenceRequest) -> PresenceModel:
+
         to_db = PresenceDB(
             id=id_generate(),
-            date=datetime.now(),
-            file_path=file_path,
             **request.dict(),
         )
 
-        return PresenceDB(**to_db.dict())
+        return PresenceModel(**to_db.dict())
@@ -1,42 +1,86 @@
 from datetime import datetime
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 
-from database.models import WarningModel
+from database.models import (
+    UserModel,
+    WarningModel
+)
 from schemas.warning import (
     WarningRequest,
-    WarningDB
+    WarningDB,
+    WarningResponse
 )
 from services.generator.ids import id_generate
+from services.storage.files import StoredFile
 
 class WarningRepository:
     def __init__(self, db_session: Session):
         self.db_session = db_session
-        
-        
+
+
     def add(self, model: WarningModel) -> None:
-        
+
         self.db_session.add(model)
         self.db_session.commit()
-        
-    
+
+
+    def add_all(self, models: list[WarningModel]) -> None:
+        """
+        Grava vários avisos em uma única transação
+        """
+        self.db_session.add_all(models)
+        self.db_session.commit()
+
+
     def get(self, id: str) -> WarningModel | None:
         return self.db_session.query(WarningModel).filter(WarningModel.id == id).first()
-        
-            
+
+
     def get_by_parent_cpf(self, parent_cpf: str) -> list[WarningModel]:
-        return self.db_session.query(WarningModel).filter(WarningModel.parent_cpf == parent_cpf).all()
-    
+        return (
+            self.db_session.query(WarningModel)
+            .filter(WarningModel.parent_cpf == parent_cpf)
+            .order_by(WarningModel.date.desc())
+            .all()
+        )
+
     def get_all(self) -> list[WarningModel]:
         return self.db_session.query(WarningModel).all()
-    
+
+
+    def get_existing_parents(self, parent_cpfs: list[str]) -> set[str]:
+        """
+        Retorna, entre os CPFs informados, os que pertencem a usuários cadastrados
+        """
+        return set(
+            self.db_session.scalars(
+                select(UserModel.cpf).where(UserModel.cpf.in_(parent_cpfs))
+            ).all()
+        )
+
+
+    def get_used_file_paths(self, file_paths: set[str]) -> set[str]:
+        """
+        Dentre os anexos informados, os usados por algum aviso (consulta IN pelo índice ix_warning_file_path)
+        """
+        if not file_paths:
+            return set()
+
+        return set(
+            self.db_session.scalars(
+                select(WarningModel.file_path).where(WarningModel.file_path.in_(file_paths)).distinct()
+            )
+        )
+
 
     def update(self, model: WarningModel) -> WarningModel:
         self.db_session.commit()
         self.db_session.refresh(model)
         return model
-    
-    
+
+
     def delete(self, id: str) -> bool:
         model = self.get(id)
         result = False
@@ -44,21 +88,35 @@ class WarningRepository:
             self.db_session.delete(model)
             self.db_session.commit()
             result = True
-            
+
         return result
-    
-    
-    def map_model_to_response(self, model: WarningModel):
-        pass
-    
-    
-    def map_request_to_model(self, request: WarningRequest, file_path: str | None = None):
-        
+
+
+    @staticmethod
+    def map_model_to_response(model: WarningModel) -> WarningResponse:
+
+        return WarningResponse(
+            id=str(model.id),
+            parent_cpf=model.parent_cpf,
+            theme=model.theme,
+            text=model.text,
+            date=model.date,
+            file_name=model.file_name,
+            file_type=model.file_type,
+            file_size=model.file_size
+        )
+
+
+    def map_request_to_model(self, request: WarningRequest, file: StoredFile | None = None) -> WarningModel:
+
         to_db = WarningDB(
             id=id_generate(),
             date=datetime.now(),
-            file_path=file_path,
+            file_path=file.path if file else None,
+            file_name=file.name if file else None,
+            file_type=file.content_type if file else None,
+            file_size=file.size if file else None,
             **request.dict(),
         )
 
-        return WarningDB(**to_db.dict())
+        return WarningModel(**to_db.dict())
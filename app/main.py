@@ -1,19 +1,45 @@
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
 
-from database.models import create_tables
+from database.connection import async_engine
 from routes.classes import router as classes_router
 from routes.disciplines import router as disciplines_router
+from routes.events import router as events_router
+from routes.job import router as job_router
+from routes.metrics import router as metrics_router
 from routes.note import router as note_router
+from routes.presence import router as presence_router
 from routes.student import router as student_router
 from routes.teacher import router as teacher_router
 from routes.user import router as user_router
+from routes.warning import router as warning_router
+from services.email.outbox import outbox_sender
+from services.events.bus import event_bus
+from services.jobs.runner import job_runner
+from services.security.password import shutdown_password_executor
+from services.storage.sweeper import file_sweeper
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    job_runner.resume()
+    outbox_sender.start()
+    event_bus.start()
+    file_sweeper.start()
+    yield
+    file_sweeper.stop()
+    event_bus.stop()
+    outbox_sender.stop()
+    job_runner.shutdown()
+    shutdown_password_executor()
+    await async_engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 app.add_middleware(
@@ -29,8 +55,13 @@ app.include_router(classes_router)
 app.include_router(disciplines_router)
 app.include_router(teacher_router)
 app.include_router(note_router)
+app.include_router(presence_router)
 app.include_router(user_router)
 app.include_router(student_router)
+app.include_router(metrics_router)
+app.include_router(job_router)
+app.include_router(warning_router)
+app.include_router(events_router)
 
 
 @app.get('/')
@@ -38,10 +69,9 @@ def main():
     return {"detail": "API rodando!"}
 
 # Executando o servidor
+# O esquema do banco é mantido pelas migrações (alembic upgrade head), fora da inicialização do servidor
 if __name__ == "__main__":
 
-    create_tables()
-
     config = uvicorn.Config(
         "main:app", 
         port=5000,
@@ -1,11 +1,20 @@
+from datetime import date
 from fastapi import (
-    APIRouter, 
-    Depends
+    APIRouter,
+    Depends,
+    Header,
+    Query
 )
-from sqlalchemy.orm import Session
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
-from useCases.classes import ClassesUseCases
+from constants.base import (
+    ICS_MEDIA_TYPE,
+    PAGINATION_DEFAULT_LIMIT,
+    PAGINATION_MAX_LIMIT
+)
+from useCases.classes import AsyncClassesUseCases
 from routes.docs.classes import(
     ADD_DESCRIPTION,
     ADD_RESPONSES,
@@ -30,18 +39,33 @@ from routes.docs.classes import(
     DELETE_EVENT_RESPONSES,
     ADD_RECURRENCES_RESPONSES,
     DELETE_RECURRENCES_RESPONSES,
+    CALENDAR_DESCRIPTION,
+    CALENDAR_RESPONSES,
+    TIMETABLE_DESCRIPTION,
+    TIMETABLE_RESPONSES,
     UPDATE_RESPONSES,
 
 )
-from schemas.base import BaseMessage
+from schemas.base import (
+    BaseMessage,
+    CalendarFormat
+)
 from schemas.classes import(
+    CalendarOccurrence,
     ClassEventRequest,
     ClassEventResponse,
     ClassRequest,
     ClassResponse,
     Recurrences,
+    TimetableDay
+)
+from schemas.pagination import Page
+from services.calendar.cache import CALENDAR_CACHE_TTL
+from services.calendar.ics import (
+    calendar_etag,
+    render_ics
 )
-from services.session import db_session
+from services.session import async_db_session
 
 
 router = APIRouter(prefix='/classes', tags=['Classes'])
@@ -50,12 +74,12 @@ router = APIRouter(prefix='/classes', tags=['Classes'])
 @router.post('/add', description=ADD_DESCRIPTION, responses=ADD_RESPONSES, status_code=201)
 async def add_class(
     request: ClassRequest,
-    db_session: Session = Depends(db_session),
+    db_session: AsyncSession = Depends(async_db_session),
 ) -> BaseMessage:    
 
-    uc = ClassesUseCases(db_session)
+    uc = AsyncClassesUseCases(db_session)
 
-    response = uc.add(request)
+    response = await uc.add(request)
 
     return response
 
@@ -63,24 +87,26 @@ async def add_class(
 @router.get("/get", description=GET_DESCRIPTION, responses=GET_RESPONSES)
 async def get_class(
     class_id: str,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> ClassResponse:
 
-    uc = ClassesUseCases(db_session)
+    uc = AsyncClassesUseCases(db_session)
 
-    response = uc.get(class_id)
+    response = await uc.get(class_id)
 
     return response
 
 
 @router.get("/list", description=LIST_DESCRIPTION, responses=LIST_RESPONSES)
 async def list_classes(
-    db_session: Session = Depends(db_session)
-) -> list[ClassResponse]:
+    limit: int = Query(PAGINATION_DEFAULT_LIMIT, ge=1, le=PAGINATION_MAX_LIMIT),
+    cursor: str | None = None,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> Page[ClassResponse]:
 
-    uc = ClassesUseCases(db_session)
+    uc = AsyncClassesUseCases(db_session)
 
-    response = uc.get_all()
+    response = await uc.get_page(limit, cursor)
 
     return response
 
@@ -89,12 +115,12 @@ async def list_classes(
 async def update_class(
     class_id: str,
     update: ClassRequest,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> ClassResponse:
 
-    uc = ClassesUseCases(db_session)
+    uc = AsyncClassesUseCases(db_session)
 
-    response = uc.update(class_id, update)
+    response = await uc.update(class_id, update)
 
     return response
 
@@ -102,25 +128,25 @@ async def update_class(
 @router.delete("/delete", description=DELETE_DESCRIPTION, responses=DELETE_RESPONSES)
 async def delete_class(
     class_id: str,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> BaseMessage:
 
-    uc = ClassesUseCases(db_session)
+    uc = AsyncClassesUseCases(db_session)
 
-    response = uc.delete(class_id)
+    response = await uc.delete(class_id)
 
     return response
 
 
 @router.post("/add-event", description=ADD_EVENT_DESCRIPTION, responses=ADD_EVENT_RESPONSES, status_code=201)
-def add_event(
+async def add_event(
     request: ClassEventRequest,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> BaseMessage:
 
-    uc = ClassesUseCases(db_session)
+    uc = AsyncClassesUseCases(db_session)
 
-    response = uc.add_event(request)
+    response = await uc.add_event(request)
 
     return response
 
@@ -128,24 +154,26 @@ def add_event(
 @router.get("/get-event", description=GET_EVENT_DESCRIPTION, responses=GET_EVENT_RESPONSES)
 async def get_event(
     class_event_id: str,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> ClassEventResponse:
     
-    uc = ClassesUseCases(db_session)
+    uc = AsyncClassesUseCases(db_session)
 
-    response = uc.get_event(class_event_id)
+    response = await uc.get_event(class_event_id)
 
     return response
 
 
 @router.get("/list-events", description=LIST_EVENTS_DESCRIPTION, responses=LIST_EVENTS_RESPONSES)
 async def list_events(
-    db_session: Session = Depends(db_session)
-) -> list[ClassEventResponse]:
+    limit: int = Query(PAGINATION_DEFAULT_LIMIT, ge=1, le=PAGINATION_MAX_LIMIT),
+    cursor: str | None = None,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> Page[ClassEventResponse]:
     
-    uc = ClassesUseCases(db_session)
+    uc = AsyncClassesUseCases(db_session)
 
-    response = uc.get_all_events()
+    response = await uc.get_events_page(limit, cursor)
 
     return response
 
@@ -154,12 +182,12 @@ async def list_events(
 async def update_event(
     class_event_id: str,
     update: ClassEventRequest,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> ClassEventResponse:
         
-    uc = ClassesUseCases(db_session)
+    uc = AsyncClassesUseCases(db_session)
     
-    response = uc.update_event(class_event_id, update)
+    response = await uc.update_event(class_event_id, update)
     
     return response
 
@@ -167,12 +195,12 @@ async def update_event(
 @router.delete("/delete-event", description=DELETE_EVENT_DESCRIPTION, responses=DELETE_EVENT_RESPONSES)
 async def delete_event(
     class_event_id: str,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> BaseMessage:
         
-    uc = ClassesUseCases(db_session)
+    uc = AsyncClassesUseCases(db_session)
     
-    response = uc.delete_event(class_event_id)
+    response = await uc.delete_event(class_event_id)
     
     return response
 
@@ -181,12 +209,12 @@ async def delete_event(
 async def add_recurrences(
     class_event_id: str,
     recurrences: list[Recurrences],
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> BaseMessage:
         
-    uc = ClassesUseCases(db_session)
+    uc = AsyncClassesUseCases(db_session)
     
-    response = uc.add_recurrences(class_event_id, recurrences)
+    response = await uc.add_recurrences(class_event_id, recurrences)
     
     return response
 
@@ -195,11 +223,57 @@ async def add_recurrences(
 async def delete_recurrences(
     class_event_id: str,
     recurrences: list[Recurrences],
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> BaseMessage:
         
-    uc = ClassesUseCases(db_session)
+    uc = AsyncClassesUseCases(db_session)
     
-    response = uc.delete_recurrences(class_event_id, recurrences)
+    response = await uc.delete_recurrences(class_event_id, recurrences)
     
-    return response
\ No newline at end of file
+    return response
+
+
+@router.get("/timetable", description=TIMETABLE_DESCRIPTION, responses=TIMETABLE_RESPONSES)
+async def timetable(
+    class_id: str | None = None,
+    teacher_cpf: str | None = None,
+    on: date | None = None,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> list[TimetableDay]:
+
+    uc = AsyncClassesUseCases(db_session)
+
+    response = await uc.get_timetable(class_id, teacher_cpf, on)
+
+    return response
+
+
+@router.get("/calendar", description=CALENDAR_DESCRIPTION, responses=CALENDAR_RESPONSES)
+async def calendar(
+    class_id: str | None = None,
+    teacher_cpf: str | None = None,
+    child_cpf: str | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    format: CalendarFormat = CalendarFormat.JSON,
+    if_none_match: str | None = Header(default=None),
+    db_session: AsyncSession = Depends(async_db_session)
+) -> list[CalendarOccurrence]:
+
+    uc = AsyncClassesUseCases(db_session)
+
+    response = await uc.get_calendar(class_id, teacher_cpf, child_cpf, start, end)
+
+    if format == CalendarFormat.ICS:
+
+        headers = {
+            "ETag": calendar_etag(response),
+            "Cache-Control": f"private, max-age={CALENDAR_CACHE_TTL}"
+        }
+
+        if if_none_match == headers["ETag"]:
+            return Response(status_code=304, headers=headers)
+
+        return Response(render_ics("Calendário de aulas", response), media_type=ICS_MEDIA_TYPE, headers=headers)
+
+    return response
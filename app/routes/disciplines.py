@@ -1,11 +1,16 @@
 from fastapi import (
     APIRouter,
-    Depends
+    Depends,
+    Query
 )
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
-from useCases.disciplines import DisciplinesUseCases
+from constants.base import (
+    PAGINATION_DEFAULT_LIMIT,
+    PAGINATION_MAX_LIMIT
+)
+from useCases.disciplines import AsyncDisciplinesUseCases
 from routes.docs.disciplines import(
     ADD_DESCRIPTION,
     GET_DESCRIPTION,
@@ -23,7 +28,8 @@ from schemas.disciplines import(
     DisciplineResponse
 )
 from schemas.base import BaseMessage
-from services.session import db_session
+from schemas.pagination import Page
+from services.session import async_db_session
 
 
 router = APIRouter(prefix='/disciplines', tags=['Disciplines'])
@@ -32,12 +38,12 @@ router = APIRouter(prefix='/disciplines', tags=['Disciplines'])
 @router.post('/add', description=ADD_DESCRIPTION, responses=ADD_RESPONSES, status_code=201)
 async def add_discipline(
     request: DisciplineRequest,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> BaseMessage:
     
-    uc = DisciplinesUseCases(db_session)
+    uc = AsyncDisciplinesUseCases(db_session)
 
-    response = uc.add(request)
+    response = await uc.add(request)
 
     return response
 
@@ -45,24 +51,26 @@ async def add_discipline(
 @router.get("/get", description=GET_DESCRIPTION, responses=GET_RESPONSES)
 async def get_discipline(
     discipline_name: str,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> DisciplineResponse:
 
-    uc = DisciplinesUseCases(db_session)
+    uc = AsyncDisciplinesUseCases(db_session)
 
-    response = uc.get(discipline_name)
+    response = await uc.get(discipline_name)
 
     return response
 
 
 @router.get("/list", description=LIST_DESCRIPTION, responses=LIST_RESPONSES)
 async def list_disciplines(
-    db_session: Session = Depends(db_session)
-) -> list[DisciplineResponse]:
+    limit: int = Query(PAGINATION_DEFAULT_LIMIT, ge=1, le=PAGINATION_MAX_LIMIT),
+    cursor: str | None = None,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> Page[DisciplineResponse]:
 
-    uc = DisciplinesUseCases(db_session)
+    uc = AsyncDisciplinesUseCases(db_session)
 
-    response = uc.get_all()
+    response = await uc.get_page(limit, cursor)
 
     return response
 
@@ -71,12 +79,12 @@ async def list_disciplines(
 async def update_discipline(
     name:str,
     request: DisciplineRequest,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> DisciplineResponse:
     
-        uc = DisciplinesUseCases(db_session)
+        uc = AsyncDisciplinesUseCases(db_session)
     
-        response = uc.update(name, request)
+        response = await uc.update(name, request)
     
         return response
 
@@ -84,11 +92,11 @@ async def update_discipline(
 @router.delete("/delete", description=DELETE_DESCRIPTION, responses=DELETE_RESPONSES)
 async def delete_discipline(
     discipline_name: str,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> BaseMessage:
 
-    uc = DisciplinesUseCases(db_session)
+    uc = AsyncDisciplinesUseCases(db_session)
 
-    response = uc.delete(discipline_name)
+    response = await uc.delete(discipline_name)
 
     return response
\ No newline at end of file
@@ -1,4 +1,4 @@
-from constants.base import ERROR_SERVER_ERROR
+from constants.base import ERROR_INVALID_CPF, ERROR_INVALID_CURSOR, ERROR_SERVER_ERROR
 from constants.classes import (
     ERROR_CLASS_ADD_CONFLICT,
     ERROR_CLASSES_EVENTS_ADD_CONFLICT,
@@ -6,6 +6,7 @@ from constants.classes import (
     ERROR_CLASSES_EVENTS_DELETE_RECURRENCES_NOT_FOUND,
     ERROR_CLASSES_EVENTS_GET_ALL_NOT_FOUND,
     ERROR_CLASSES_EVENTS_GET_NOT_FOUND,
+    ERROR_CLASSES_EVENTS_SCHEDULE_CONFLICT,
     ERROR_CLASSES_GET_ALL_NOT_FOUND,
     ERROR_CLASSES_GET_NOT_FOUND,
     ERROR_CLASSES_INVALID_FIELD_DAY_OF_WEEK,
@@ -15,6 +16,7 @@ from constants.classes import (
     ERROR_CLASSES_INVALID_FIELD_MAX_STUDENTS,
     ERROR_CLASSES_INVALID_FIELD_SHIFT,
     ERROR_CLASSES_INVALID_FIELD_START_DATE,
+    ERROR_CLASSES_INVALID_TIME_RANGE,
     ERROR_CLASSES_REQUIRED_FIELD_CLASS_ID,
     ERROR_CLASSES_REQUIRED_FIELD_DAY_OF_WEEK,
     ERROR_CLASSES_REQUIRED_FIELD_DISCIPLINES_ID, 
@@ -27,6 +29,10 @@ from constants.classes import (
     ERROR_CLASSES_REQUIRED_FIELD_SHIFT,
     ERROR_CLASSES_REQUIRED_FIELD_START_DATE,
     ERROR_CLASSES_REQUIRED_FIELD_TEACHER_CPF, 
+    ERROR_CLASSES_CALENDAR_INVALID_RANGE,
+    ERROR_CLASSES_CALENDAR_RANGE_TOO_LONG,
+    ERROR_CLASSES_CALENDAR_REQUIRED_FILTER,
+    ERROR_CLASSES_TIMETABLE_REQUIRED_FILTER,
     MESSAGE_CLASS_ADD_SUCCESS,
     MESSAGE_CLASS_DELETE_SUCCESS,
     MESSAGE_CLASS_EVENT_ADD_SUCCESS,
@@ -34,6 +40,7 @@ from constants.classes import (
     MESSAGE_CLASSES_EVENTS_ADD_RECURRENCES_SUCCESS,
     MESSAGE_CLASSES_EVENTS_DELETE_RECURRENCES_SUCCESS
 )
+from constants.child import ERROR_CHILD_GET_NOT_FOUND
 from constants.disciplines import ERROR_DISCIPLINES_GET_NOT_FOUND
 from constants.teacher import ERROR_TEACHER_GET_NOT_FOUND
 from utils.messages.doc import (
@@ -44,16 +51,18 @@ from utils.messages.doc import (
 
 ADD_DESCRIPTION = "Cadastra uma turma no banco de dados"
 GET_DESCRIPTION = "Retorna uma turma do banco de dados"
-LIST_DESCRIPTION = "Retorna todas as turmas do banco de dados"
+LIST_DESCRIPTION = "Retorna todas as turmas do banco de dados, em páginas ordenadas pela chave primária. Use o next_cursor da resposta como cursor para buscar a próxima página"
 UPDATE_DESCRIPTION = "Atualiza uma turma no banco de dados"
 DELETE_DESCRIPTION = "Deleta uma turma do banco de dados"
 ADD_EVENT_DESCRIPTION = "Cadastra uma aula em uma turma"
 GET_EVENT_DESCRIPTION = "Retorna uma aula com base em seu ID"
-LIST_EVENTS_DESCRIPTION = "Retorna todas as aulas do banco de dados"
+LIST_EVENTS_DESCRIPTION = "Retorna todas as aulas do banco de dados, em páginas ordenadas pela chave primária. Use o next_cursor da resposta como cursor para buscar a próxima página"
 UPDATE_EVENT_DESCRIPTION = "Atualiza uma aula no banco de dados"
 DELETE_EVENT_DESCRIPTION = "Deleta uma aula do banco de dados"
 ADD_RECURRENCES_DESCRIPTION = "Adiciona recorrências a uma aula\n\nAs recorrências são adicionadas a partir da data de início da aula e se repetem de acordo com o intervalo e a quantidade de recorrências"
 DELETE_RECURRENCES_DESCRIPTION = "Deleta as recorrências de uma aula"
+TIMETABLE_DESCRIPTION = "Retorna a grade semanal (segunda a domingo) de uma turma ou de um professor. Com o parâmetro on, considera apenas as aulas cujo período inclui a data"
+CALENDAR_DESCRIPTION = "Retorna as aulas de uma turma, de um professor ou das turmas de um aluno em cada data do período (padrão: de 30 dias atrás até daqui a 180 dias, no máximo 366 dias)\n\nCom format=ics, retorna um calendário iCalendar que pode ser assinado por aplicativos de calendário; a resposta traz um ETag e devolve 304 quando o cabeçalho If-None-Match corresponde a ele"
 
 
 ADD_RESPONSES = generate_responses_documentation(
@@ -83,6 +92,7 @@ GET_RESPONSES = generate_responses_documentation(
 
 LIST_RESPONSES = generate_responses_documentation(
     [
+        generate_response(400, ERROR_INVALID_CURSOR),
         generate_response(404, ERROR_CLASSES_GET_ALL_NOT_FOUND),
         generate_response(500, ERROR_SERVER_ERROR)
     ]
@@ -116,7 +126,9 @@ ADD_EVENT_RESPONSES = generate_responses_documentation(
         generate_response(422, ERROR_CLASSES_REQUIRED_FIELD_END_DATE),
         generate_response(422, ERROR_CLASSES_INVALID_FIELD_END_DATE),
         generate_response(422, ERROR_CLASSES_REQUIRED_FIELD_RECURRENCES),
+        generate_response(422, ERROR_CLASSES_INVALID_TIME_RANGE),
         generate_response(409, ERROR_CLASSES_EVENTS_ADD_CONFLICT),
+        generate_response(409, ERROR_CLASSES_EVENTS_SCHEDULE_CONFLICT),
         
     ]
 )
@@ -130,6 +142,7 @@ GET_EVENT_RESPONSES = generate_responses_documentation(
 
 LIST_EVENTS_RESPONSES = generate_responses_documentation(
     [
+        generate_response(400, ERROR_INVALID_CURSOR),
         generate_response(404, ERROR_CLASSES_EVENTS_GET_ALL_NOT_FOUND),
         generate_response(500, ERROR_SERVER_ERROR)
     ]
@@ -160,6 +173,7 @@ ADD_RECURRENCES_RESPONSES = generate_responses_documentation(
         generate_response(422, ERROR_CLASSES_INVALID_FIELD_START_DATE),
         generate_response(422, ERROR_CLASSES_REQUIRED_FIELD_END_DATE),
         generate_response(422, ERROR_CLASSES_INVALID_FIELD_END_DATE),
+        generate_response(422, ERROR_CLASSES_INVALID_TIME_RANGE),
         generate_response(500, ERROR_SERVER_ERROR)
     ]
 )
@@ -177,4 +191,24 @@ DELETE_RECURRENCES_RESPONSES = generate_responses_documentation(
         generate_response(422, ERROR_CLASSES_INVALID_FIELD_END_DATE),
         generate_response(500, ERROR_SERVER_ERROR)
     ]
-)
\ No newline at end of file
+)
+
+TIMETABLE_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(404, ERROR_CLASSES_GET_NOT_FOUND),
+        generate_response(422, ERROR_CLASSES_TIMETABLE_REQUIRED_FILTER),
+        generate_response(500, ERROR_SERVER_ERROR)
+    ]
+)
+
+CALENDAR_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(404, ERROR_CLASSES_GET_NOT_FOUND),
+        generate_response(404, ERROR_CHILD_GET_NOT_FOUND),
+        generate_response(422, ERROR_CLASSES_CALENDAR_REQUIRED_FILTER),
+        generate_response(422, ERROR_CLASSES_CALENDAR_INVALID_RANGE),
+        generate_response(422, ERROR_CLASSES_CALENDAR_RANGE_TOO_LONG),
+        generate_response(422, ERROR_INVALID_CPF),
+        generate_response(500, ERROR_SERVER_ERROR)
+    ]
+)
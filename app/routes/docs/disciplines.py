@@ -1,4 +1,4 @@
-from constants.base import ERROR_SERVER_ERROR
+from constants.base import ERROR_INVALID_CURSOR, ERROR_SERVER_ERROR
 from constants.disciplines import (
     ERROR_DISCIPLINES_ADD_CONFLICT,
     ERROR_DISCIPLINES_GET_ALL_NOT_FOUND,
@@ -15,7 +15,7 @@ from utils.messages.doc import (
 
 ADD_DESCRIPTION = "Cadastra uma disciplina no banco de dados"
 GET_DESCRIPTION = "Retorna uma disciplina do banco de dados"
-LIST_DESCRIPTION = "Retorna todas as disciplinas do banco de dados"
+LIST_DESCRIPTION = "Retorna todas as disciplinas do banco de dados, em páginas ordenadas pela chave primária. Use o next_cursor da resposta como cursor para buscar a próxima página"
 UPDATE_DESCRIPTION = "Atualiza uma disciplina no banco de dados"
 DELETE_DESCRIPTION = "Deleta uma disciplina do banco de dados"
 
@@ -39,6 +39,7 @@ GET_RESPONSES = generate_responses_documentation(
 
 LIST_RESPONSES = generate_responses_documentation(
     [
+        generate_response(400, ERROR_INVALID_CURSOR),
         generate_response(404, ERROR_DISCIPLINES_GET_ALL_NOT_FOUND),
         generate_response(500, ERROR_SERVER_ERROR)
     ]
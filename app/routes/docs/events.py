@@ -0,0 +1,27 @@
+from constants.base import ERROR_ACCESS_DENIED
+from constants.events import ERROR_EVENTS_FORBIDDEN_LEVEL
+from utils.messages.doc import (
+    generate_response, 
+    generate_responses_documentation
+)
+
+
+STREAM_DESCRIPTION = "Abre um fluxo SSE (text/event-stream) com os eventos do usuário logado: notas (note), avisos (warning) e chamadas (presence) que dizem respeito a ele ou aos seus alunos, enviados assim que são gravados. Cada evento traz a ação (created ou updated) e os IDs para buscar os dados; resync indica que eventos foram descartados e os dados devem ser buscados de novo. Substitui a consulta periódica de /note/list. O token do login vai no cabeçalho Authorization; clientes que não enviam cabeçalhos (EventSource) usam no parâmetro token o token de curta duração de POST /events/token"
+
+TOKEN_DESCRIPTION = "Gera um token restrito a GET /events/stream e válido por um minuto, para ser enviado na URL (parâmetro token) por clientes EventSource no lugar do token do login, que não expira"
+
+
+STREAM_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(401, ERROR_ACCESS_DENIED),
+        generate_response(403, ERROR_EVENTS_FORBIDDEN_LEVEL)
+    ]
+)
+
+
+TOKEN_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(401, ERROR_ACCESS_DENIED),
+        generate_response(403, ERROR_EVENTS_FORBIDDEN_LEVEL)
+    ]
+)
@@ -0,0 +1,42 @@
+from constants.base import ERROR_SERVER_ERROR
+from constants.classes import ERROR_CLASSES_GET_NOT_FOUND
+from constants.job import (
+    ERROR_JOB_FAILED,
+    ERROR_JOB_FILE_NOT_FOUND,
+    ERROR_JOB_NOT_FINISHED,
+    ERROR_JOB_NOT_FOUND
+)
+from utils.messages.doc import (
+    generate_response, 
+    generate_responses_documentation
+)
+
+
+REPORT_CARDS_DESCRIPTION = "Cria uma tarefa em segundo plano que gera os boletins em PDF de uma turma ou, sem turma, de toda a escola. Acompanhe a tarefa em GET /jobs/{id} e baixe o zip com os boletins em GET /jobs/{id}/download"
+GET_DESCRIPTION = "Retorna a situação e o andamento (total e concluídos) de uma tarefa"
+DOWNLOAD_DESCRIPTION = "Baixa o arquivo gerado por uma tarefa concluída"
+
+
+REPORT_CARDS_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(404, ERROR_CLASSES_GET_NOT_FOUND),
+        generate_response(500, ERROR_SERVER_ERROR)
+    ]
+)
+
+GET_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(404, ERROR_JOB_NOT_FOUND),
+        generate_response(500, ERROR_SERVER_ERROR)
+    ]
+)
+
+DOWNLOAD_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(404, ERROR_JOB_NOT_FOUND),
+        generate_response(404, ERROR_JOB_FILE_NOT_FOUND),
+        generate_response(409, ERROR_JOB_NOT_FINISHED),
+        generate_response(409, ERROR_JOB_FAILED),
+        generate_response(500, ERROR_SERVER_ERROR)
+    ]
+)
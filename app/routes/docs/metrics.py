@@ -0,0 +1,15 @@
+from constants.base import ERROR_SERVER_ERROR
+from utils.messages.doc import (
+    generate_response, 
+    generate_responses_documentation
+)
+
+
+POOL_DESCRIPTION = "Retorna o estado dos pools de conexão com o banco de dados deste worker"
+
+
+POOL_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(500, ERROR_SERVER_ERROR)
+    ]
+)
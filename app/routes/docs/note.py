@@ -1,4 +1,10 @@
-from constants.base import ERROR_INVALID_CPF, ERROR_SERVER_ERROR
+from constants.base import (
+    ERROR_BULK_INVALID_BODY,
+    ERROR_BULK_TOO_MANY_ROWS,
+    ERROR_INVALID_CURSOR,
+    ERROR_INVALID_CPF,
+    ERROR_SERVER_ERROR
+)
 from constants.child import ERROR_CHILD_GET_NOT_FOUND
 from constants.classes import ERROR_CLASSES_GET_NOT_FOUND
 from constants.disciplines import ERROR_DISCIPLINES_GET_NOT_FOUND
@@ -18,13 +24,16 @@ from constants.note import (
     SUCCESS_NOTE_DELETE
 )
 from utils.messages.doc import (
+    generate_bulk_body,
     generate_response, 
     generate_responses_documentation
 )
 
 
 ADD_DESCRIPTION = "Cadastra uma nova nota no banco de dados"
-LIST_DESCRIPTION = "Retorna todas as notas do banco de dados, podendo filtrar por critérios via query params"
+BULK_ADD_DESCRIPTION = "Cadastra várias notas de uma vez (ex: as notas de uma turma inteira), a partir de uma lista JSON ou de um arquivo CSV (corpo text/csv ou campo file de um formulário multipart) com as colunas de NoteRequest. Retorna o resultado de cada registro; registros inválidos não impedem o cadastro dos demais"
+LIST_DESCRIPTION = "Retorna todas as notas do banco de dados, podendo filtrar por critérios via query params, em páginas ordenadas pela chave primária. Use o next_cursor da resposta como cursor para buscar a próxima página. Com o cabeçalho Accept: application/x-ndjson, todas as notas filtradas são enviadas em streaming, uma por linha"
+REPORT_CARD_DESCRIPTION = "Retorna os boletins de uma turma (class_id), de um aluno (child_cpf) ou, sem filtros, de toda a escola: médias ponderadas por semestre, média final e situação em cada disciplina, média geral e classificação na turma. As médias são calculadas no banco de dados"
 UPDATE_DESCRIPTION = "Atualiza uma nota no banco de dados"
 DELETE_DESCRIPTION = "Deleta uma nota do banco de dados"
 
@@ -49,8 +58,20 @@ ADD_RESPONSES = generate_responses_documentation(
     ]
 )
 
+
+BULK_ADD_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(422, ERROR_BULK_INVALID_BODY),
+        generate_response(422, ERROR_BULK_TOO_MANY_ROWS),
+        generate_response(500, ERROR_SERVER_ERROR)
+    ]
+)
+
+BULK_ADD_BODY = generate_bulk_body("NoteRequest")
+
 LIST_RESPONSES = generate_responses_documentation(
     [
+        generate_response(400, ERROR_INVALID_CURSOR),
         generate_response(404, ERROR_NOTE_NOT_FOUND_NOTES),
         generate_response(422, ERROR_INVALID_CPF),
         generate_response(500, ERROR_SERVER_ERROR)
@@ -58,6 +79,15 @@ LIST_RESPONSES = generate_responses_documentation(
 )
 
 
+REPORT_CARD_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(404, ERROR_CLASSES_GET_NOT_FOUND),
+        generate_response(404, ERROR_CHILD_GET_NOT_FOUND),
+        generate_response(422, ERROR_INVALID_CPF),
+        generate_response(500, ERROR_SERVER_ERROR)
+    ]
+)
+
 UPDATE_RESPONSES = generate_responses_documentation(
     [
         generate_response(422, ERROR_NOTE_NOT_FOUND),
@@ -0,0 +1,73 @@
+from constants.base import (
+    ERROR_INVALID_CPF,
+    ERROR_SERVER_ERROR
+)
+from constants.child import ERROR_CHILD_GET_NOT_FOUND
+from constants.classes import (
+    ERROR_CLASSES_EVENTS_GET_NOT_FOUND,
+    ERROR_CLASSES_GET_NOT_FOUND
+)
+from constants.presence import (
+    ERROR_PRESENCE_CHILD_NOT_IN_CLASS,
+    ERROR_PRESENCE_DUPLICATED_CHILD,
+    ERROR_PRESENCE_INVALID_PERIOD,
+    ERROR_PRESENCE_INVALID_RANGE,
+    ERROR_PRESENCE_OUTSIDE_CLASS_EVENT,
+    ERROR_PRESENCE_RANGE_TOO_LONG,
+    ERROR_PRESENCE_REQUIRED_FIELD_CHILD_CPF,
+    ERROR_PRESENCE_REQUIRED_FIELD_CLASS_EVENT_ID,
+    ERROR_PRESENCE_REQUIRED_FIELD_PRESENCES
+)
+from utils.messages.doc import (
+    generate_response, 
+    generate_responses_documentation
+)
+
+
+ROLL_CALL_DESCRIPTION = "Registra a chamada de uma turma inteira em uma ocorrência de aula, em uma única transação. Reenviar a chamada da mesma ocorrência (mesma aula e início) substitui a anterior"
+CHILD_DESCRIPTION = "Retorna as presenças e faltas de um aluno entre duas datas (inclusivas), em ordem cronológica"
+ATTENDANCE_DESCRIPTION = "Retorna a frequência (presenças, faltas e percentual) de cada aluno de uma turma nos meses entre as duas datas, somando as contagens mensais mantidas a cada chamada"
+CLASS_DESCRIPTION = "Retorna as presenças e faltas de todos os alunos de uma turma entre duas datas (inclusivas), em ordem cronológica"
+
+
+ROLL_CALL_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(404, ERROR_CLASSES_EVENTS_GET_NOT_FOUND),
+        generate_response(422, ERROR_PRESENCE_REQUIRED_FIELD_CLASS_EVENT_ID),
+        generate_response(422, ERROR_PRESENCE_REQUIRED_FIELD_PRESENCES),
+        generate_response(422, ERROR_PRESENCE_REQUIRED_FIELD_CHILD_CPF),
+        generate_response(422, ERROR_PRESENCE_DUPLICATED_CHILD),
+        generate_response(422, ERROR_PRESENCE_INVALID_PERIOD),
+        generate_response(422, ERROR_PRESENCE_OUTSIDE_CLASS_EVENT),
+        generate_response(422, ERROR_PRESENCE_CHILD_NOT_IN_CLASS),
+        generate_response(422, ERROR_INVALID_CPF),
+        generate_response(500, ERROR_SERVER_ERROR)
+    ]
+)
+
+CHILD_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(404, ERROR_CHILD_GET_NOT_FOUND),
+        generate_response(422, ERROR_INVALID_CPF),
+        generate_response(422, ERROR_PRESENCE_INVALID_RANGE),
+        generate_response(422, ERROR_PRESENCE_RANGE_TOO_LONG),
+        generate_response(500, ERROR_SERVER_ERROR)
+    ]
+)
+
+CLASS_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(404, ERROR_CLASSES_GET_NOT_FOUND),
+        generate_response(422, ERROR_PRESENCE_INVALID_RANGE),
+        generate_response(422, ERROR_PRESENCE_RANGE_TOO_LONG),
+        generate_response(500, ERROR_SERVER_ERROR)
+    ]
+)
+
+ATTENDANCE_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(404, ERROR_CLASSES_GET_NOT_FOUND),
+        generate_response(422, ERROR_PRESENCE_INVALID_RANGE),
+        generate_response(500, ERROR_SERVER_ERROR)
+    ]
+)
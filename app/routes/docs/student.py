@@ -1,4 +1,7 @@
 from constants.base import (
+    ERROR_BULK_INVALID_BODY,
+    ERROR_BULK_TOO_MANY_ROWS,
+    ERROR_INVALID_CURSOR,
     ERROR_INVALID_CPF,
     ERROR_INVALID_FORMAT_BIRTH_DATE,
     ERROR_INVALID_FORMAT_GENDER,
@@ -27,14 +30,16 @@ from constants.child import (
     ERROR_CHILD_REQUIRED_FIELD_PARENT_CPF,
 )
 from utils.messages.doc import(
+    generate_bulk_body,
     generate_response,
     generate_responses_documentation
 )
 
 
 ADD_DESCRIPTION = "Cadastra um estudante no sistema"
+BULK_ADD_DESCRIPTION = "Cadastra vários estudantes de uma vez, a partir de uma lista JSON ou de um arquivo CSV (corpo text/csv ou campo file de um formulário multipart), com as colunas de StudentRequest e o endereço em colunas soltas. Retorna o resultado de cada registro; registros inválidos não impedem o cadastro dos demais"
 GET_DESCRIPTION = "Retorna um estudante do sistema pelo CPF"
-LIST_DESCRIPTION = "Retorna todos os estudantes do sistema"
+LIST_DESCRIPTION = "Retorna todos os estudantes do sistema, em páginas ordenadas pela chave primária. Use o next_cursor da resposta como cursor para buscar a próxima página. Com o cabeçalho Accept: application/x-ndjson, todos os estudantes são enviados em streaming, um por linha"
 UPDATE_DESCRIPTION = "Atualiza um estudante no sistema com base em seu CPF"
 DELETE_DESCRIPTION = "Deleta um estudante do sistema com base em seu CPF"
 CHANGE_CLASS_DESCRIPTION = "Troca um estudante do sistema de turma"
@@ -62,6 +67,15 @@ ADD_RESPONSES = generate_responses_documentation(
     ]
 )
 
+BULK_ADD_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(422, ERROR_BULK_INVALID_BODY),
+        generate_response(422, ERROR_BULK_TOO_MANY_ROWS),
+    ]
+)
+
+BULK_ADD_BODY = generate_bulk_body("StudentRequest")
+
 GET_RESPONSES = generate_responses_documentation(
     [
         generate_response(404, ERROR_CHILD_GET_NOT_FOUND),
@@ -72,6 +86,7 @@ GET_RESPONSES = generate_responses_documentation(
 
 LIST_RESPONSES = generate_responses_documentation(
     [
+        generate_response(400, ERROR_INVALID_CURSOR),
         generate_response(404, ERROR_CHILD_GET_ALL_NOT_FOUND),
         generate_response(404, ERROR_CLASSES_GET_NOT_FOUND),
 
@@ -1,4 +1,4 @@
-from constants.base import ERROR_SERVER_ERROR
+from constants.base import ERROR_INVALID_CURSOR, ERROR_SERVER_ERROR
 from constants.classes import ERROR_CLASSES_GET_ALL_NOT_FOUND
 from constants.disciplines import ERROR_DISCIPLINES_GET_ALL_NOT_FOUND
 from constants.teacher import (
@@ -19,7 +19,7 @@ from utils.messages.doc import (
 ADD_CLASS_DESCRIPTION = "Atribui uma lista de turmas ao um professor"
 ADD_DISCIPLINES_DESCRIPTION = "Atribui uma lista de disciplinas ao um professor"
 GET_TEACHER_DESCRIPTION = "Retorna dados de um professor específico"
-LIST_TEACHER_DESCRIPTION = "Retorna uma lista de professores"
+LIST_TEACHER_DESCRIPTION = "Retorna uma lista de professores, em páginas ordenadas pela chave primária. Use o next_cursor da resposta como cursor para buscar a próxima página"
 DELETE_CLASS_DESCRIPTION = "Remove uma lista de turmas de um professor"
 DELETE_DISCIPLINES_DESCRIPTION = "Remove uma lista de disciplinas de um professor"
 
@@ -47,6 +47,7 @@ GET_TEACHER_RESPONSES = generate_responses_documentation(
 )
 LIST_TEACHER_RESPONSES = generate_responses_documentation(
     [
+        generate_response(400, ERROR_INVALID_CURSOR),
         generate_response(404, ERROR_TEACHER_GET_ALL_NOT_FOUND),
         generate_response(500, ERROR_SERVER_ERROR)
     ]
@@ -6,6 +6,7 @@ from constants.address import (
     ERROR_ADDRESS_REQUIRED_FIELD_CITY
 )
 from constants.base import (
+    ERROR_INVALID_CURSOR,
     ERROR_INVALID_CPF, 
     ERROR_INVALID_EMAIL, 
     ERROR_INVALID_FORMAT_BIRTH_DATE, 
@@ -88,9 +89,10 @@ GET_RESPONSES = generate_responses_documentation(
 )
 
 
-LIST_DESCRIPTION="Busca todos os usuários no banco de dados."
+LIST_DESCRIPTION="Busca todos os usuários no banco de dados, em páginas ordenadas pela chave primária. Use o next_cursor da resposta como cursor para buscar a próxima página"
 LIST_RESPONSES = generate_responses_documentation(
     [
+        generate_response(400, ERROR_INVALID_CURSOR),
         generate_response(404, ERROR_USER_NOT_FOUND_USERS),
         generate_response(500, ERROR_SERVER_ERROR)
     ]
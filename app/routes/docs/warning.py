@@ -0,0 +1,70 @@
+from constants.base import (
+    ERROR_INVALID_CPF,
+    ERROR_SERVER_ERROR
+)
+from constants.warning import (
+    ERROR_WARNING_FILE_NOT_FOUND,
+    ERROR_WARNING_FILE_TOO_LARGE,
+    ERROR_WARNING_INVALID_RANGE,
+    ERROR_WARNING_NOT_FOUND,
+    ERROR_WARNING_PARENT_NOT_FOUND,
+    ERROR_WARNING_REQUIRED_FIELD_PARENT_CPF,
+    ERROR_WARNING_REQUIRED_FIELD_TEXT,
+    ERROR_WARNING_REQUIRED_FIELD_THEME,
+    MESSAGE_WARNING_DELETE_SUCCESS
+)
+from utils.messages.doc import (
+    generate_response, 
+    generate_responses_documentation
+)
+
+
+ADD_DESCRIPTION = "Envia um aviso, com anexo opcional (multipart/form-data), para um ou mais responsáveis. O anexo é gravado em disco em blocos e armazenado uma única vez, pelo hash do conteúdo, mesmo quando enviado a vários responsáveis. Envios cujo Content-Length excede o tamanho máximo são recusados antes do recebimento do corpo"
+GET_DESCRIPTION = "Retorna um aviso com base em seu ID"
+PARENT_DESCRIPTION = "Retorna os avisos de um responsável, do mais recente para o mais antigo"
+FILE_DESCRIPTION = "Baixa o anexo de um aviso. Aceita o cabeçalho Range (um intervalo de bytes), respondendo 206 com apenas o trecho pedido"
+DELETE_DESCRIPTION = "Deleta um aviso. O arquivo do anexo é removido depois, em segundo plano, quando nenhum outro aviso o utiliza"
+
+
+ADD_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(404, ERROR_WARNING_PARENT_NOT_FOUND),
+        generate_response(413, ERROR_WARNING_FILE_TOO_LARGE),
+        generate_response(422, ERROR_WARNING_REQUIRED_FIELD_PARENT_CPF),
+        generate_response(422, ERROR_WARNING_REQUIRED_FIELD_THEME),
+        generate_response(422, ERROR_WARNING_REQUIRED_FIELD_TEXT),
+        generate_response(422, ERROR_INVALID_CPF),
+        generate_response(500, ERROR_SERVER_ERROR)
+    ]
+)
+
+GET_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(404, ERROR_WARNING_NOT_FOUND),
+        generate_response(500, ERROR_SERVER_ERROR)
+    ]
+)
+
+PARENT_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(422, ERROR_INVALID_CPF),
+        generate_response(500, ERROR_SERVER_ERROR)
+    ]
+)
+
+FILE_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(404, ERROR_WARNING_NOT_FOUND),
+        generate_response(404, ERROR_WARNING_FILE_NOT_FOUND),
+        generate_response(416, ERROR_WARNING_INVALID_RANGE),
+        generate_response(500, ERROR_SERVER_ERROR)
+    ]
+)
+
+DELETE_RESPONSES = generate_responses_documentation(
+    [
+        generate_response(200, MESSAGE_WARNING_DELETE_SUCCESS),
+        generate_response(404, ERROR_WARNING_NOT_FOUND),
+        generate_response(500, ERROR_SERVER_ERROR)
+    ]
+)
@@ -0,0 +1,48 @@
+from fastapi import (
+    APIRouter,
+    Depends
+)
+from sse_starlette.sse import EventSourceResponse
+
+
+from constants.events import (
+    EVENTS_PING_SECONDS,
+    EVENTS_TOKEN_SCOPE
+)
+from routes.docs.events import (
+    STREAM_DESCRIPTION,
+    STREAM_RESPONSES,
+    TOKEN_DESCRIPTION,
+    TOKEN_RESPONSES
+)
+from schemas.user import AccessToken
+from services.security.auth import (
+    current_user,
+    scoped_user
+)
+from useCases.events import EventsUseCases
+
+
+router = APIRouter(prefix='/events', tags=['Events'])
+
+
+@router.post('/token', description=TOKEN_DESCRIPTION, responses=TOKEN_RESPONSES)
+async def events_token(
+    user: dict = Depends(current_user)
+) -> AccessToken:
+
+    uc = EventsUseCases()
+
+    return uc.issue_token(user)
+
+
+@router.get('/stream', description=STREAM_DESCRIPTION, responses=STREAM_RESPONSES)
+async def stream_events(
+    user: dict = Depends(scoped_user(EVENTS_TOKEN_SCOPE))
+) -> EventSourceResponse:
+
+    uc = EventsUseCases()
+
+    cpf = uc.authorize(user)
+
+    return EventSourceResponse(uc.stream(cpf), ping=EVENTS_PING_SECONDS)
@@ -0,0 +1,64 @@
+from fastapi import (
+    APIRouter,
+    Depends
+)
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+from routes.docs.job import (
+    DOWNLOAD_DESCRIPTION,
+    DOWNLOAD_RESPONSES,
+    GET_DESCRIPTION,
+    GET_RESPONSES,
+    REPORT_CARDS_DESCRIPTION,
+    REPORT_CARDS_RESPONSES
+)
+from schemas.job import (
+    JobResponse,
+    ReportCardJobRequest
+)
+from services.session import async_db_session
+from useCases.job import AsyncJobUseCases
+
+
+router = APIRouter(prefix='/jobs', tags=['Jobs'])
+
+
+@router.post('/report-cards', description=REPORT_CARDS_DESCRIPTION, responses=REPORT_CARDS_RESPONSES, status_code=202)
+async def add_report_cards_job(
+    request: ReportCardJobRequest,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> JobResponse:
+    
+    uc = AsyncJobUseCases(db_session)
+
+    response = await uc.add_report_cards(request)
+
+    return response
+
+
+@router.get('/{id}', description=GET_DESCRIPTION, responses=GET_RESPONSES)
+async def get_job(
+    id: str,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> JobResponse:
+    
+    uc = AsyncJobUseCases(db_session)
+
+    response = await uc.get(id)
+
+    return response
+
+
+@router.get('/{id}/download', description=DOWNLOAD_DESCRIPTION, responses=DOWNLOAD_RESPONSES)
+async def download_job(
+    id: str,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> FileResponse:
+    
+    uc = AsyncJobUseCases(db_session)
+
+    path = await uc.get_result_path(id)
+
+    return FileResponse(path, media_type="application/zip", filename=f"boletins-{id}.zip")
@@ -0,0 +1,27 @@
+from fastapi import APIRouter
+
+
+from database.connection import (
+    async_engine,
+    engine
+)
+from routes.docs.metrics import (
+    POOL_DESCRIPTION,
+    POOL_RESPONSES
+)
+from schemas.metrics import (
+    PoolMetrics,
+    PoolMetricsResponse
+)
+
+
+router = APIRouter(prefix='/metrics', tags=['Metrics'])
+
+
+@router.get('/pool', description=POOL_DESCRIPTION, responses=POOL_RESPONSES)
+async def pool_metrics() -> PoolMetricsResponse:
+
+    return PoolMetricsResponse(
+        engine=PoolMetrics(**engine.pool.metrics()),
+        async_engine=PoolMetrics(**async_engine.pool.metrics())
+    )
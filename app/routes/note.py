@@ -1,29 +1,51 @@
 from fastapi import (
     APIRouter,
-    Depends
+    Depends,
+    Header,
+    Query,
+    Request
 )
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
+from constants.base import (
+    NDJSON_MEDIA_TYPE,
+    PAGINATION_DEFAULT_LIMIT,
+    PAGINATION_MAX_LIMIT
+)
 from routes.docs.note import(
     ADD_DESCRIPTION,
     ADD_RESPONSES,
+    BULK_ADD_BODY,
+    BULK_ADD_DESCRIPTION,
+    BULK_ADD_RESPONSES,
     DELETE_DESCRIPTION,
     DELETE_RESPONSES,
     LIST_DESCRIPTION,
     LIST_RESPONSES,
+    REPORT_CARD_DESCRIPTION,
+    REPORT_CARD_RESPONSES,
     UPDATE_DESCRIPTION,
     UPDATE_RESPONSES
 )
 from schemas.base import BaseMessage
+from schemas.bulk import BulkResponse
 from schemas.note import(
     NoteFilters,
     NoteRequest,
     NoteResponse,
-    NoteUpdate
+    NoteUpdate,
+    ReportCardResponse
+)
+from schemas.pagination import Page
+from services.session import async_db_session
+from utils.bulk import read_bulk_rows
+from utils.stream import (
+    accepts_ndjson,
+    to_ndjson
 )
-from services.session import db_session
-from useCases.note import NoteUseCases
+from useCases.note import AsyncNoteUseCases
 
 
 router = APIRouter(prefix='/note', tags=['Notes'])
@@ -32,12 +54,27 @@ router = APIRouter(prefix='/note', tags=['Notes'])
 @router.post('/add', description=ADD_DESCRIPTION,responses=ADD_RESPONSES, status_code=201)
 async def add_note(
     request: NoteRequest,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> BaseMessage:
     
-    uc = NoteUseCases(db_session)
+    uc = AsyncNoteUseCases(db_session)
+
+    response = await uc.add(request)
+
+    return response
+
+
+@router.post("/bulk-add", description=BULK_ADD_DESCRIPTION, responses=BULK_ADD_RESPONSES, openapi_extra=BULK_ADD_BODY)
+async def bulk_add_notes(
+    request: Request,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> BulkResponse[NoteResponse]:
+    
+    rows = await read_bulk_rows(request)
 
-    response = uc.add(request)
+    uc = AsyncNoteUseCases(db_session)
+
+    response = await uc.bulk_add(rows)
 
     return response
 
@@ -49,10 +86,13 @@ async def list_notes(
     child_cpf: str | None = None,
     semester: str | None = None,
     aval_number: int | None = None,
-    db_session: Session = Depends(db_session)
-) -> list[NoteResponse]:
+    limit: int = Query(PAGINATION_DEFAULT_LIMIT, ge=1, le=PAGINATION_MAX_LIMIT),
+    cursor: str | None = None,
+    accept: str | None = Header(default=None),
+    db_session: AsyncSession = Depends(async_db_session)
+) -> Page[NoteResponse]:
 
-    uc = NoteUseCases(db_session)
+    uc = AsyncNoteUseCases(db_session)
 
     filters: NoteFilters = NoteFilters(
         class_id=class_id,
@@ -62,7 +102,25 @@ async def list_notes(
         aval_number=aval_number
     )
 
-    response = uc.get_all(filters)
+    if accepts_ndjson(accept):
+
+        return StreamingResponse(to_ndjson(uc.stream(filters)), media_type=NDJSON_MEDIA_TYPE)
+
+    response = await uc.get_page(filters, limit, cursor)
+
+    return response
+
+
+@router.get("/report-card", description=REPORT_CARD_DESCRIPTION, responses=REPORT_CARD_RESPONSES)
+async def report_cards(
+    class_id: str | None = None,
+    child_cpf: str | None = None,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> list[ReportCardResponse]:
+
+    uc = AsyncNoteUseCases(db_session)
+
+    response = await uc.report_cards(class_id, child_cpf)
 
     return response
 
@@ -70,12 +128,12 @@ async def list_notes(
 @router.put('/update', description=UPDATE_DESCRIPTION,responses=UPDATE_RESPONSES)
 async def update_note(
     request: NoteUpdate,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> NoteResponse:
     
-    uc = NoteUseCases(db_session)
+    uc = AsyncNoteUseCases(db_session)
 
-    response = uc.update(request)
+    response = await uc.update(request)
 
     return response
 
@@ -83,11 +141,11 @@ async def update_note(
 @router.delete('/delete', description=DELETE_DESCRIPTION,responses=DELETE_RESPONSES)
 async def delete_note(
     note_id: str,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> BaseMessage:
     
-    uc = NoteUseCases(db_session)
+    uc = AsyncNoteUseCases(db_session)
 
-    response = uc.delete(note_id)
+    response = await uc.delete(note_id)
 
     return response
\ No newline at end of file
@@ -0,0 +1,87 @@
+from datetime import date
+from fastapi import (
+    APIRouter,
+    Depends
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+from routes.docs.presence import (
+    ATTENDANCE_DESCRIPTION,
+    ATTENDANCE_RESPONSES,
+    CHILD_DESCRIPTION,
+    CHILD_RESPONSES,
+    CLASS_DESCRIPTION,
+    CLASS_RESPONSES,
+    ROLL_CALL_DESCRIPTION,
+    ROLL_CALL_RESPONSES
+)
+from schemas.presence import (
+    AttendanceResponse,
+    PresenceResponse,
+    RollCallRequest,
+    RollCallResponse
+)
+from services.session import async_db_session
+from useCases.presence import AsyncPresenceUseCases
+
+
+router = APIRouter(prefix='/presence', tags=['Presence'])
+
+
+@router.post('/roll-call', description=ROLL_CALL_DESCRIPTION, responses=ROLL_CALL_RESPONSES, status_code=201)
+async def roll_call(
+    request: RollCallRequest,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> RollCallResponse:
+    
+    uc = AsyncPresenceUseCases(db_session)
+
+    response = await uc.roll_call(request)
+
+    return response
+
+
+@router.get('/child', description=CHILD_DESCRIPTION, responses=CHILD_RESPONSES)
+async def list_child_presences(
+    child_cpf: str,
+    start: date,
+    end: date,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> list[PresenceResponse]:
+    
+    uc = AsyncPresenceUseCases(db_session)
+
+    response = await uc.get_by_child(child_cpf, start, end)
+
+    return response
+
+
+@router.get('/class', description=CLASS_DESCRIPTION, responses=CLASS_RESPONSES)
+async def list_class_presences(
+    class_id: str,
+    start: date,
+    end: date,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> list[PresenceResponse]:
+    
+    uc = AsyncPresenceUseCases(db_session)
+
+    response = await uc.get_by_class(class_id, start, end)
+
+    return response
+
+
+@router.get('/class/attendance', description=ATTENDANCE_DESCRIPTION, responses=ATTENDANCE_RESPONSES)
+async def class_attendance(
+    class_id: str,
+    start: date,
+    end: date,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> list[AttendanceResponse]:
+    
+    uc = AsyncPresenceUseCases(db_session)
+
+    response = await uc.get_class_attendance(class_id, start, end)
+
+    return response
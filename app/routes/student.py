@@ -1,13 +1,25 @@
 from fastapi import (
     APIRouter,
-    Depends
+    Depends,
+    Header,
+    Query,
+    Request
 )
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
-from useCases.student import StudentUseCases
+from constants.base import (
+    NDJSON_MEDIA_TYPE,
+    PAGINATION_DEFAULT_LIMIT,
+    PAGINATION_MAX_LIMIT
+)
+from useCases.student import AsyncStudentUseCases
 from routes.docs.student import (
     ADD_DESCRIPTION,
+    BULK_ADD_BODY,
+    BULK_ADD_DESCRIPTION,
+    BULK_ADD_RESPONSES,
     GET_DESCRIPTION,
     LIST_DESCRIPTION,
     UPDATE_DESCRIPTION,
@@ -28,12 +40,19 @@ from schemas.base import (
     BaseMessage,
     Kinship
 )
+from schemas.bulk import BulkResponse
 from schemas.child import(
     ChildRequest,
     StudentRequest,
     StudentResponse
 )
-from services.session import db_session
+from schemas.pagination import Page
+from services.session import async_db_session
+from utils.bulk import read_bulk_rows
+from utils.stream import (
+    accepts_ndjson,
+    to_ndjson
+)
 
 
 router = APIRouter(prefix="/student", tags=["student"])
@@ -42,37 +61,59 @@ router = APIRouter(prefix="/student", tags=["student"])
 @router.post("/add", status_code=201, description=ADD_DESCRIPTION, responses=ADD_RESPONSES)
 async def add_student(
     request: StudentRequest,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> StudentResponse:
     
-    uc = StudentUseCases(db_session)
+    uc = AsyncStudentUseCases(db_session)
     
-    response = uc.add(request)
+    response = await uc.add(request)
+    
+    return response
+
+
+@router.post("/bulk-add", description=BULK_ADD_DESCRIPTION, responses=BULK_ADD_RESPONSES, openapi_extra=BULK_ADD_BODY)
+async def bulk_add_students(
+    request: Request,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> BulkResponse[StudentResponse]:
+    
+    rows = await read_bulk_rows(request)
+
+    uc = AsyncStudentUseCases(db_session)
+    
+    response = await uc.bulk_add(rows)
     
     return response
 
 
 @router.get("/get", description=GET_DESCRIPTION, responses=GET_RESPONSES)
-def get_student(
+async def get_student(
     student_cpf: str,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> StudentResponse:
     
-    uc = StudentUseCases(db_session)
+    uc = AsyncStudentUseCases(db_session)
     
-    response = uc.get(student_cpf)
+    response = await uc.get(student_cpf)
     
     return response
 
 
 @router.get("/list", description=LIST_DESCRIPTION, responses=LIST_RESPONSES)
-def list_students(
-    db_session: Session = Depends(db_session)
-) -> list[StudentResponse]:
+async def list_students(
+    limit: int = Query(PAGINATION_DEFAULT_LIMIT, ge=1, le=PAGINATION_MAX_LIMIT),
+    cursor: str | None = None,
+    accept: str | None = Header(default=None),
+    db_session: AsyncSession = Depends(async_db_session)
+) -> Page[StudentResponse]:
     
-    uc = StudentUseCases(db_session)
+    uc = AsyncStudentUseCases(db_session)
     
-    response = uc.get_all()
+    if accepts_ndjson(accept):
+
+        return StreamingResponse(to_ndjson(uc.stream()), media_type=NDJSON_MEDIA_TYPE)
+
+    response = await uc.get_page(limit, cursor)
     
     return response
 
@@ -80,68 +121,68 @@ def list_students(
 @router.put("/update", description=UPDATE_DESCRIPTION, responses=UPDATE_RESPONSES)
 async def update_student(
     request: ChildRequest,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> StudentResponse:
     
-    uc = StudentUseCases(db_session)
+    uc = AsyncStudentUseCases(db_session)
     
-    response = uc.update(request)
+    response = await uc.update(request)
     
     return response
 
 
 @router.delete("/delete", description=DELETE_DESCRIPTION, responses=DELETE_RESPONSES)
-def delete_student(
+async def delete_student(
     student_cpf: str,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> BaseMessage:
     
-    uc = StudentUseCases(db_session)
+    uc = AsyncStudentUseCases(db_session)
     
-    response = uc.delete(student_cpf)
+    response = await uc.delete(student_cpf)
     
     return response
 
 
 @router.put("/change-class", description=CHANGE_CLASS_DESCRIPTION, responses=CHANGE_CLASS_RESPONSES)
-def change_student_class(
+async def change_student_class(
     student_cpf: str,
     to_class_id: str,
     is_transfer: bool = True,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> StudentResponse:
     
-    uc = StudentUseCases(db_session)
+    uc = AsyncStudentUseCases(db_session)
     
-    response = uc.change_class(student_cpf, to_class_id, is_transfer)
+    response = await uc.change_class(student_cpf, to_class_id, is_transfer)
     
     return response
 
 
 @router.put("/add-parent", description=ADD_PARENT_DESCRIPTION, responses=ADD_PARENT_RESPONSES)
-def add_student_parent(
+async def add_student_parent(
     student_cpf: str,
     kinship: Kinship,
     parent_cpf: str,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> BaseMessage:
     
-    uc = StudentUseCases(db_session)
+    uc = AsyncStudentUseCases(db_session)
     
-    response = uc.add_parent(student_cpf, kinship, parent_cpf)
+    response = await uc.add_parent(student_cpf, kinship, parent_cpf)
     
     return response
 
 
 @router.put("/remove-parent", description=REMOVE_PARENT_DESCRIPTION, responses=REMOVE_PARENT_RESPONSES)
-def remove_student_parent(
+async def remove_student_parent(
     student_cpf: str,
     parent_cpf: str,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> BaseMessage:
     
-    uc = StudentUseCases(db_session)
+    uc = AsyncStudentUseCases(db_session)
     
-    response = uc.delete_parent(student_cpf, parent_cpf)
+    response = await uc.delete_parent(student_cpf, parent_cpf)
     
     return response
\ No newline at end of file
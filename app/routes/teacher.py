@@ -1,11 +1,16 @@
 from fastapi import (
     APIRouter,
     Depends,
+    Query
 )
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
-from useCases.teacher import TeacherUseCases
+from constants.base import (
+    PAGINATION_DEFAULT_LIMIT,
+    PAGINATION_MAX_LIMIT
+)
+from useCases.teacher import AsyncTeacherUseCases
 from routes.docs.teacher import (
     ADD_DISCIPLINES_DESCRIPTION,
     ADD_CLASS_RESPONSES,
@@ -25,7 +30,8 @@ from schemas.teacher import (
     TeacherDisciplinesRequest,
     TeacherResponse
 )
-from services.session import db_session
+from schemas.pagination import Page
+from services.session import async_db_session
 
 
 router = APIRouter(prefix='/teacher', tags=['Teacher'])
@@ -34,12 +40,12 @@ router = APIRouter(prefix='/teacher', tags=['Teacher'])
 @router.post('/add-classes', status_code=201, responses=ADD_CLASS_RESPONSES, description=ADD_CLASS_DESCRIPTION)
 async def add_class(
     request: ClassTeacherRequest,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> TeacherResponse:
 
-    uc = TeacherUseCases(db_session)
+    uc = AsyncTeacherUseCases(db_session)
 
-    response = uc.add_classes(request)
+    response = await uc.add_classes(request)
 
     return response
 
@@ -47,12 +53,12 @@ async def add_class(
 @router.post('/add-disciplines', status_code=201, responses=ADD_DISCIPLINES_RESPONSES, description=ADD_DISCIPLINES_DESCRIPTION)
 async def add_disciplines(
     request: TeacherDisciplinesRequest,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> TeacherResponse:
 
-    uc = TeacherUseCases(db_session)
+    uc = AsyncTeacherUseCases(db_session)
 
-    response = uc.add_disciplines(request)
+    response = await uc.add_disciplines(request)
 
     return response
 
@@ -60,49 +66,51 @@ async def add_disciplines(
 @router.get('/get', response_model=list[TeacherResponse], description=GET_TEACHER_DESCRIPTION, responses=GET_TEACHER_RESPONSES)
 async def get_teacher(
     user_cpf: str,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> TeacherResponse:
 
-    uc = TeacherUseCases(db_session)
+    uc = AsyncTeacherUseCases(db_session)
 
-    response = uc.get(user_cpf)
+    response = await uc.get(user_cpf)
 
     return response
 
 
-@router.get('/list', response_model=list[TeacherResponse], description=LIST_TEACHER_DESCRIPTION, responses=LIST_TEACHER_RESPONSES)
+@router.get('/list', response_model=Page[TeacherResponse], description=LIST_TEACHER_DESCRIPTION, responses=LIST_TEACHER_RESPONSES)
 async def list_teachers(
-    db_session: Session = Depends(db_session)
-) -> list[TeacherResponse]:
+    limit: int = Query(PAGINATION_DEFAULT_LIMIT, ge=1, le=PAGINATION_MAX_LIMIT),
+    cursor: str | None = None,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> Page[TeacherResponse]:
 
-    uc = TeacherUseCases(db_session)
+    uc = AsyncTeacherUseCases(db_session)
 
-    response = uc.get_all()
+    response = await uc.get_page(limit, cursor)
 
     return response
 
 
 @router.put('/delete-classes', description=DELETE_CLASS_DESCRIPTION, responses=DELETE_CLASS_RESPONSES)
-def delete_classes(
+async def delete_classes(
     request: ClassTeacherRequest,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> TeacherResponse:
 
-    uc = TeacherUseCases(db_session)
+    uc = AsyncTeacherUseCases(db_session)
 
-    response = uc.delete_classes(request)
+    response = await uc.delete_classes(request)
 
     return response
 
 
 @router.put('/delete-disciplines', description=DELETE_DISCIPLINES_DESCRIPTION, responses=DELETE_DISCIPLINES_RESPONSES)
-def delete_disciplines(
+async def delete_disciplines(
     request: TeacherDisciplinesRequest,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> TeacherResponse:
     
-    uc = TeacherUseCases(db_session)
+    uc = AsyncTeacherUseCases(db_session)
 
-    response = uc.delete_disciplines(request)
+    response = await uc.delete_disciplines(request)
 
     return response
\ No newline at end of file
@@ -1,11 +1,16 @@
 from fastapi import (
-    APIRouter, 
-    Depends
+    APIRouter,
+    Depends,
+    Query
 )
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
-from useCases.user import UserUseCases
+from constants.base import (
+    PAGINATION_DEFAULT_LIMIT,
+    PAGINATION_MAX_LIMIT
+)
+from useCases.user import AsyncUserUseCases
 from schemas.user import(
     AccessToken,
     UserRequest,
@@ -14,7 +19,8 @@ from schemas.user import(
     UserLoginRequest
 )
 from schemas.base import BaseMessage
-from services.session import db_session
+from schemas.pagination import Page
+from services.session import async_db_session
 from routes.docs.user import (
     ADD_DESCRIPTION,
     ADD_RESPONSES,
@@ -36,35 +42,37 @@ router = APIRouter(prefix='/user', tags=['User'])
 @router.post('/add', description=ADD_DESCRIPTION, responses=ADD_RESPONSES)
 async def add_user(
     user: UserRequest,
-    db_session: Session = Depends(db_session),
+    db_session: AsyncSession = Depends(async_db_session),
 ) -> BaseMessage:    
 
-    uc = UserUseCases(db_session)
+    uc = AsyncUserUseCases(db_session)
 
-    response = uc.add(user)
+    response = await uc.add(user)
 
     return response
 
 @router.get("/get", description=GET_DESCRIPTION, responses=GET_RESPONSES)
 async def get_user(
     user_id: str,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> UserResponse:
 
-    uc = UserUseCases(db_session)
+    uc = AsyncUserUseCases(db_session)
 
-    response = uc.get(user_id)
+    response = await uc.get(user_id)
 
     return response
 
 @router.get("/list", description=LIST_DESCRIPTION, responses=LIST_RESPONSES)
 async def list_users(
-    db_session: Session = Depends(db_session)
-) -> list[UserResponse]:
+    limit: int = Query(PAGINATION_DEFAULT_LIMIT, ge=1, le=PAGINATION_MAX_LIMIT),
+    cursor: str | None = None,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> Page[UserResponse]:
 
-    uc = UserUseCases(db_session)
+    uc = AsyncUserUseCases(db_session)
 
-    response = uc.get_all()
+    response = await uc.get_page(limit, cursor)
 
     return response
 
@@ -73,12 +81,12 @@ async def list_users(
 async def update_user(
     user_id: str,
     update: UserUpdateRequest,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> BaseMessage:
 
-    uc = UserUseCases(db_session)
+    uc = AsyncUserUseCases(db_session)
 
-    response = uc.update(user_id, update)
+    response = await uc.update(user_id, update)
 
     return response
 
@@ -86,12 +94,12 @@ async def update_user(
 @router.delete("/delete", description=DELETE_DESCRIPTION, responses=DELETE_RESPONSES)
 async def delete_user(
     user_id: str,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> BaseMessage:
     
-    uc = UserUseCases(db_session)
+    uc = AsyncUserUseCases(db_session)
 
-    response = uc.delete(user_id)
+    response = await uc.delete(user_id)
 
     return response
 
@@ -99,11 +107,11 @@ async def delete_user(
 @router.post("/login", description=LOGIN_DESCRIPTION, responses=LOGIN_RESPONSES)
 async def login(
     user: UserLoginRequest,
-    db_session: Session = Depends(db_session)
+    db_session: AsyncSession = Depends(async_db_session)
 ) -> AccessToken:
 
-    uc = UserUseCases(db_session)
+    uc = AsyncUserUseCases(db_session)
 
-    response = uc.login(user)
+    response = await uc.login(user)
 
     return response
\ No newline at end of file
@@ -0,0 +1,109 @@
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    Header,
+    UploadFile
+)
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+from routes.docs.warning import (
+    ADD_DESCRIPTION,
+    ADD_RESPONSES,
+    DELETE_DESCRIPTION,
+    DELETE_RESPONSES,
+    FILE_DESCRIPTION,
+    FILE_RESPONSES,
+    GET_DESCRIPTION,
+    GET_RESPONSES,
+    PARENT_DESCRIPTION,
+    PARENT_RESPONSES
+)
+from schemas.base import BaseMessage
+from schemas.warning import (
+    WarningResponse,
+    WarningSendRequest
+)
+from services.session import async_db_session
+from services.storage.files import (
+    UploadLimitRoute,
+    file_response
+)
+from useCases.warning import AsyncWarningUseCases
+
+
+router = APIRouter(prefix='/warning', tags=['Warning'], route_class=UploadLimitRoute)
+
+
+@router.post('/add', description=ADD_DESCRIPTION, responses=ADD_RESPONSES, status_code=201)
+async def add_warning(
+    parent_cpfs: list[str] = Form(default=[]),
+    theme: str = Form(default=""),
+    text: str = Form(default=""),
+    file: UploadFile | None = File(default=None),
+    db_session: AsyncSession = Depends(async_db_session)
+) -> list[WarningResponse]:
+
+    request = WarningSendRequest(parent_cpfs=parent_cpfs, theme=theme, text=text)
+
+    uc = AsyncWarningUseCases(db_session)
+
+    response = await uc.add(request, file)
+
+    return response
+
+
+@router.get('/get', description=GET_DESCRIPTION, responses=GET_RESPONSES)
+async def get_warning(
+    warning_id: str,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> WarningResponse:
+
+    uc = AsyncWarningUseCases(db_session)
+
+    response = await uc.get(warning_id)
+
+    return response
+
+
+@router.get('/parent', description=PARENT_DESCRIPTION, responses=PARENT_RESPONSES)
+async def list_parent_warnings(
+    parent_cpf: str,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> list[WarningResponse]:
+
+    uc = AsyncWarningUseCases(db_session)
+
+    response = await uc.get_by_parent(parent_cpf)
+
+    return response
+
+
+@router.get('/file', description=FILE_DESCRIPTION, responses=FILE_RESPONSES, response_class=Response)
+async def download_warning_file(
+    warning_id: str,
+    range_header: str | None = Header(default=None, alias="Range"),
+    db_session: AsyncSession = Depends(async_db_session)
+) -> Response:
+
+    uc = AsyncWarningUseCases(db_session)
+
+    file = await uc.get_file(warning_id)
+
+    return file_response(file.path, file.name, file.content_type, range_header)
+
+
+@router.delete('/delete', description=DELETE_DESCRIPTION, responses=DELETE_RESPONSES)
+async def delete_warning(
+    warning_id: str,
+    db_session: AsyncSession = Depends(async_db_session)
+) -> BaseMessage:
+
+    uc = AsyncWarningUseCases(db_session)
+
+    response = await uc.delete(warning_id)
+
+    return response
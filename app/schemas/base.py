@@ -82,4 +82,41 @@ class Shift(str, Enum):
     
 class PresenceType(str, Enum):
     P = "P"
-    F = "F"
\ No newline at end of file
+    F = "F"
+
+
+class CalendarFormat(str, Enum):
+    JSON = "json"
+    ICS = "ics"
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class OutboxStatus(str, Enum):
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class NotificationKind(str, Enum):
+    WARNING = "warning"
+    NOTE = "note"
+    ABSENCE = "absence"
+
+
+class EventKind(str, Enum):
+    NOTE = "note"
+    WARNING = "warning"
+    PRESENCE = "presence"
+    RESYNC = "resync" # Eventos descartados: o cliente deve buscar os dados de novo
+
+
+class EventAction(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
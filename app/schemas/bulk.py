@@ -0,0 +1,63 @@
+from typing import (
+    Generic,
+    TypeVar
+)
+from pydantic import Field
+
+
+from schemas.base import BaseSchema
+
+
+T = TypeVar("T")
+
+
+class BulkRowResult(BaseSchema, Generic[T]):
+    """
+    - row: int
+    - status_code: int
+    - detail: str | None
+    - item: T | None
+    """
+    row: int = Field(
+        title="Linha",
+        description="Posição do registro no envio, começando em 1",
+        examples=[1]
+    )
+    status_code: int = Field(
+        title="Status",
+        description="Resultado do registro, com a mesma semântica dos códigos HTTP da rota individual",
+        examples=[201, 404, 409, 422]
+    )
+    detail: str | None = Field(
+        title="Detalhe",
+        description="Motivo da falha do registro",
+        examples=["Turma não encontrada"],
+        default=None
+    )
+    item: T | None = Field(
+        title="Item",
+        description="Registro cadastrado, quando houve sucesso",
+        default=None
+    )
+
+
+class BulkResponse(BaseSchema, Generic[T]):
+    """
+    - created: int
+    - failed: int
+    - results: list[BulkRowResult[T]]
+    """
+    created: int = Field(
+        title="Cadastrados",
+        description="Quantidade de registros cadastrados",
+        examples=[998]
+    )
+    failed: int = Field(
+        title="Falhas",
+        description="Quantidade de registros recusados",
+        examples=[2]
+    )
+    results: list[BulkRowResult[T]] = Field(
+        title="Resultados",
+        description="Resultado de cada registro, na ordem do envio"
+    )
@@ -1,6 +1,8 @@
+from datetime import date
 from pydantic import (
     Field,
-    field_validator
+    field_validator,
+    model_validator
 )
 
 
@@ -13,6 +15,7 @@ from constants.classes import (
     ERROR_CLASSES_INVALID_FIELD_MAX_STUDENTS,
     ERROR_CLASSES_INVALID_FIELD_SHIFT,
     ERROR_CLASSES_INVALID_FIELD_START_DATE,
+    ERROR_CLASSES_INVALID_TIME_RANGE,
     ERROR_CLASSES_REQUIRED_FIELD_CLASS_ID,
     ERROR_CLASSES_REQUIRED_FIELD_DAY_OF_WEEK,
     ERROR_CLASSES_REQUIRED_FIELD_DISCIPLINES_ID,
@@ -220,6 +223,15 @@ class Recurrences(BaseSchema):
             raise UnprocessableEntity(ERROR_CLASSES_INVALID_FIELD_END_DATE)
 
         return value
+
+
+    @model_validator(mode="after")
+    def validate_time_range(self):
+
+        if self.end_time <= self.start_time:
+            raise UnprocessableEntity(ERROR_CLASSES_INVALID_TIME_RANGE)
+
+        return self
     
 
 class ClassEventRequest(BaseSchema):
@@ -433,4 +445,156 @@ class ClassResponse(ClassRequest):
             
             raise UnprocessableEntity(ERROR_CLASSES_INVALID_FIELD_CLASS_EVENTS)
         
-        return value
\ No newline at end of file
+        return value
+
+
+class TimetableSlot(BaseSchema):
+    """
+    - class_event_id: str
+    - class_id: str
+    - class_info: str
+    - discipline_id: str
+    - discipline_name: str
+    - teacher_cpf: str
+    - teacher_name: str
+    - start_time: str
+    - end_time: str
+    - start_date: date
+    - end_date: date
+    """
+    class_event_id: str = Field(
+        title="ID da Aula",
+        description="Código da aula",
+        examples=['1', '2', '3']
+    )
+    class_id: str = Field(
+        title="ID da Turma",
+        description="Código da turma",
+        examples=['1', '2', '3']
+    )
+    class_info: str = Field(
+        title="Informações da Turma",
+        description="Nome e identificação da turma",
+        examples=["5° Ano A", "6° Ano B"]
+    )
+    discipline_id: str = Field(
+        title="ID da Disciplina",
+        description="Código da disciplina",
+        examples=['1', '2', '3']
+    )
+    discipline_name: str = Field(
+        title="Nome da Disciplina",
+        description="Nome da disciplina",
+        examples=["Matemática", "Português"]
+    )
+    teacher_cpf: str = Field(
+        title="CPF do Professor",
+        description="CPF do professor que ministra a aula",
+        examples=["12345678901"]
+    )
+    teacher_name: str = Field(
+        title="Nome do Professor",
+        description="Nome do professor que ministra a aula",
+        examples=["Prof. Jane Doe"]
+    )
+    start_time: str = Field(
+        title="Hora de Início",
+        description="Hora de início da aula",
+        examples=["08:00"]
+    )
+    end_time: str = Field(
+        title="Hora de Fim",
+        description="Hora de encerramento da aula",
+        examples=["09:00"]
+    )
+    start_date: date = Field(
+        title="Data de Início",
+        description="Primeiro dia do período da aula",
+        examples=["2024-07-01"]
+    )
+    end_date: date = Field(
+        title="Data de Fim",
+        description="Último dia do período da aula",
+        examples=["2024-11-28"]
+    )
+
+
+class TimetableDay(BaseSchema):
+    """
+    - day_of_week: DaysOfWeek
+    - slots: list[TimetableSlot]
+    """
+    day_of_week: DaysOfWeek = Field(
+        title="Dia da Semana",
+        description="Dia da semana",
+        examples=[DaysOfWeek.MONDAY.value]
+    )
+    slots: list[TimetableSlot] = Field(
+        title="Aulas",
+        description="Aulas do dia, em ordem de início"
+    )
+
+
+class CalendarOccurrence(BaseSchema):
+    """
+    - class_event_id: str
+    - class_id: str
+    - class_info: str
+    - discipline_id: str
+    - discipline_name: str
+    - teacher_cpf: str
+    - teacher_name: str
+    - day: date
+    - start_time: str
+    - end_time: str
+    """
+    class_event_id: str = Field(
+        title="ID da Aula",
+        description="Código da aula",
+        examples=['1', '2', '3']
+    )
+    class_id: str = Field(
+        title="ID da Turma",
+        description="Código da turma",
+        examples=['1', '2', '3']
+    )
+    class_info: str = Field(
+        title="Informações da Turma",
+        description="Nome e identificação da turma",
+        examples=["5° Ano A", "6° Ano B"]
+    )
+    discipline_id: str = Field(
+        title="ID da Disciplina",
+        description="Código da disciplina",
+        examples=['1', '2', '3']
+    )
+    discipline_name: str = Field(
+        title="Nome da Disciplina",
+        description="Nome da disciplina",
+        examples=["Matemática", "Português"]
+    )
+    teacher_cpf: str = Field(
+        title="CPF do Professor",
+        description="CPF do professor que ministra a aula",
+        examples=["12345678901"]
+    )
+    teacher_name: str = Field(
+        title="Nome do Professor",
+        description="Nome do professor que ministra a aula",
+        examples=["Prof. Jane Doe"]
+    )
+    day: date = Field(
+        title="Data",
+        description="Dia em que a aula acontece",
+        examples=["2024-07-03"]
+    )
+    start_time: str = Field(
+        title="Hora de Início",
+        description="Hora de início da aula",
+        examples=["08:00"]
+    )
+    end_time: str = Field(
+        title="Hora de Fim",
+        description="Hora de encerramento da aula",
+        examples=["09:00"]
+    )
@@ -0,0 +1,81 @@
+from datetime import datetime
+from pydantic import Field
+
+
+from schemas.base import (
+    BaseSchema,
+    JobStatus
+)
+
+
+class ReportCardJobRequest(BaseSchema):
+    """
+    - class_id: str | None
+    """
+    class_id: str | None = Field(
+        title="ID da turma",
+        description="Turma dos boletins. Sem turma, são gerados os boletins de toda a escola",
+        examples=["123456"],
+        default=None
+    )
+
+
+class JobResponse(BaseSchema):
+    """
+    - id: str
+    - kind: str
+    - status: JobStatus
+    - total: int
+    - done: int
+    - error: str | None
+    - created_at: datetime
+    - updated_at: datetime
+    - finished_at: datetime | None
+    """
+    id: str = Field(
+        title="ID da tarefa",
+        description="ID usado para acompanhar a tarefa e baixar o resultado",
+        examples=["0192b3c4-5d6e-7f80-9a1b-2c3d4e5f6a7b"]
+    )
+    kind: str = Field(
+        title="Tipo",
+        description="Tipo da tarefa",
+        examples=["report_cards"]
+    )
+    status: JobStatus = Field(
+        title="Situação",
+        description="pending (na fila), running (em execução), done (concluída) ou failed (falhou)",
+        examples=[JobStatus.PENDING.value, JobStatus.DONE.value]
+    )
+    total: int = Field(
+        title="Total",
+        description="Quantidade de itens a gerar (conhecida após o início da execução)",
+        examples=[1200]
+    )
+    done: int = Field(
+        title="Concluídos",
+        description="Quantidade de itens já gerados",
+        examples=[350]
+    )
+    error: str | None = Field(
+        title="Erro",
+        description="Motivo da falha, quando a situação é failed",
+        examples=[None],
+        default=None
+    )
+    created_at: datetime = Field(
+        title="Criada em",
+        description="Data e hora de criação da tarefa",
+        examples=["2024-07-01T12:00:00"]
+    )
+    updated_at: datetime = Field(
+        title="Atualizada em",
+        description="Data e hora da última atualização da tarefa",
+        examples=["2024-07-01T12:01:30"]
+    )
+    finished_at: datetime | None = Field(
+        title="Concluída em",
+        description="Data e hora de conclusão (ou falha) da tarefa",
+        examples=["2024-07-01T12:02:10"],
+        default=None
+    )
@@ -0,0 +1,72 @@
+from pydantic import Field
+
+
+from schemas.base import BaseSchema
+
+
+class PoolMetrics(BaseSchema):
+    """
+    - size: int
+    - checked_in: int
+    - checked_out: int
+    - overflow: int
+    - max_overflow: int
+    - checkouts: int
+    - timeouts: int
+    - wait_avg_ms: float
+    - wait_max_ms: float
+    """
+    size: int = Field(
+        title="Tamanho do pool",
+        description="Número de conexões permanentes configuradas no pool",
+        examples=[5]
+    )
+    checked_in: int = Field(
+        title="Conexões livres",
+        description="Conexões abertas aguardando uso",
+        examples=[3]
+    )
+    checked_out: int = Field(
+        title="Conexões em uso",
+        description="Conexões emprestadas a sessões neste momento",
+        examples=[2]
+    )
+    overflow: int = Field(
+        title="Overflow",
+        description="Conexões abertas além do tamanho do pool",
+        examples=[0]
+    )
+    max_overflow: int = Field(
+        title="Overflow máximo",
+        description="Limite de conexões além do tamanho do pool",
+        examples=[10]
+    )
+    checkouts: int = Field(
+        title="Empréstimos",
+        description="Total de conexões entregues desde o início do processo",
+        examples=[1500]
+    )
+    timeouts: int = Field(
+        title="Timeouts",
+        description="Quantidade de vezes que uma sessão desistiu de esperar por uma conexão",
+        examples=[0]
+    )
+    wait_avg_ms: float = Field(
+        title="Espera média",
+        description="Tempo médio para obter uma conexão, em milissegundos",
+        examples=[0.4]
+    )
+    wait_max_ms: float = Field(
+        title="Espera máxima",
+        description="Maior tempo para obter uma conexão, em milissegundos",
+        examples=[12.5]
+    )
+
+
+class PoolMetricsResponse(BaseSchema):
+    """
+    - engine: PoolMetrics
+    - async_engine: PoolMetrics
+    """
+    engine: PoolMetrics
+    async_engine: PoolMetrics
@@ -312,4 +312,101 @@ class NoteUpdate(BaseSchema):
             if value < 0 or value > 10:
                 raise UnprocessableEntity(ERROR_NOTE_INVALID_FIELD_POINTS)
         
-        return value
\ No newline at end of file
+        return value
+
+
+class SemesterAverage(BaseSchema):
+    """
+    - semester: int
+    - average: float
+    """
+    semester: int = Field(
+        title="Semestre",
+        description="Semestre das avaliações",
+        examples=SEMESTERS
+    )
+    average: float = Field(
+        title="Média do semestre",
+        description="Média ponderada das avaliações do semestre, com os pesos de AVAL_WEIGHTS",
+        examples=[7.5]
+    )
+
+
+class DisciplineReport(BaseSchema):
+    """
+    - discipline_id: str
+    - discipline_name: str
+    - semesters: list[SemesterAverage]
+    - average: float
+    - approved: bool
+    """
+    discipline_id: str = Field(
+        title="ID da disciplina",
+        description="ID da disciplina",
+        examples=["123456"]
+    )
+    discipline_name: str = Field(
+        title="Nome da disciplina",
+        description="Nome da disciplina",
+        examples=["Matemática", "Português"]
+    )
+    semesters: list[SemesterAverage] = Field(
+        title="Médias por semestre",
+        description="Média de cada semestre com notas lançadas, em ordem"
+    )
+    average: float = Field(
+        title="Média final",
+        description="Média das médias dos semestres com notas lançadas",
+        examples=[7.0]
+    )
+    approved: bool = Field(
+        title="Aprovado",
+        description="Se a média final atinge a média mínima de aprovação",
+        examples=[True]
+    )
+
+
+class ReportCardResponse(BaseSchema):
+    """
+    - class_id: str
+    - child_cpf: str
+    - student_name: str
+    - disciplines: list[DisciplineReport]
+    - average: float
+    - ranking: int
+    - approved: bool
+    """
+    class_id: str = Field(
+        title="ID da turma",
+        description="ID da turma do boletim",
+        examples=["123456"]
+    )
+    child_cpf: str = Field(
+        title="CPF do aluno",
+        description="CPF do aluno",
+        examples=["12345678901"]
+    )
+    student_name: str = Field(
+        title="Nome do estudante",
+        description="Nome do estudante",
+        examples=["João da Silva"]
+    )
+    disciplines: list[DisciplineReport] = Field(
+        title="Disciplinas",
+        description="Médias e situação em cada disciplina, em ordem alfabética"
+    )
+    average: float = Field(
+        title="Média geral",
+        description="Média das médias finais das disciplinas",
+        examples=[7.25]
+    )
+    ranking: int = Field(
+        title="Classificação",
+        description="Posição do aluno na turma pela média geral (médias iguais empatam na mesma posição)",
+        examples=[1]
+    )
+    approved: bool = Field(
+        title="Aprovado",
+        description="Se o aluno foi aprovado em todas as disciplinas",
+        examples=[True]
+    )
@@ -0,0 +1,28 @@
+from typing import (
+    Generic,
+    TypeVar
+)
+from pydantic import Field
+
+
+from schemas.base import BaseSchema
+
+
+T = TypeVar("T")
+
+
+class Page(BaseSchema, Generic[T]):
+    """
+    - items: list[T]
+    - next_cursor: str | None
+    """
+    items: list[T] = Field(
+        title="Itens",
+        description="Itens da página atual, ordenados pela chave primária"
+    )
+    next_cursor: str | None = Field(
+        title="Próximo cursor",
+        description="Cursor a ser enviado para buscar a próxima página. Nulo quando esta é a última página",
+        examples=["eyJrIjogIjEyMzQ1NiJ9"],
+        default=None
+    )
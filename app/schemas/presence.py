@@ -1,10 +1,32 @@
 from datetime import datetime
+from pydantic import (
+    Field,
+    field_validator,
+    model_validator
+)
 
 
+from constants.base import ERROR_INVALID_CPF
+from constants.presence import (
+    ERROR_PRESENCE_DUPLICATED_CHILD,
+    ERROR_PRESENCE_INVALID_PERIOD,
+    ERROR_PRESENCE_REQUIRED_FIELD_CHILD_CPF,
+    ERROR_PRESENCE_REQUIRED_FIELD_CLASS_EVENT_ID,
+    ERROR_PRESENCE_REQUIRED_FIELD_PRESENCES
+)
 from schemas.base import (
     BaseSchema,
     PresenceType
 )
+from utils.format import (
+    clean_string_field,
+    unformat_cpf
+)
+from utils.messages.error import UnprocessableEntity
+from utils.validate import (
+    validate_cpf,
+    validate_string
+)
 
 
 class PresenceRequest(BaseSchema):
@@ -18,3 +40,169 @@ class PresenceRequest(BaseSchema):
 
 class PresenceDB(PresenceRequest):
     id: str
+
+
+class RollCallItem(BaseSchema):
+    """
+    - child_cpf: str
+    - type: PresenceType
+    """
+    child_cpf: str = Field(
+        title="CPF do aluno",
+        description="CPF do aluno",
+        examples=["123.456.789-01"]
+    )
+    type: PresenceType = Field(
+        title="Presença",
+        description="P para presente e F para falta",
+        examples=[PresenceType.P.value, PresenceType.F.value]
+    )
+
+
+    @field_validator("child_cpf", mode="before")
+    def validate_child_cpf(cls, value):
+        
+        value = clean_string_field(value)
+
+        if not validate_string(value):
+            raise UnprocessableEntity(ERROR_PRESENCE_REQUIRED_FIELD_CHILD_CPF)
+        
+        if not validate_cpf(value):
+            raise UnprocessableEntity(ERROR_INVALID_CPF)
+        
+        return unformat_cpf(value)
+
+
+class RollCallRequest(BaseSchema):
+    """
+    - class_event_id: str
+    - start_class: datetime
+    - end_class: datetime
+    - presences: list[RollCallItem]
+    """
+    class_event_id: str = Field(
+        title="ID da aula",
+        description="ID da aula (ClassEvent) em que a chamada foi feita",
+        examples=["123456"]
+    )
+    start_class: datetime = Field(
+        title="Início da aula",
+        description="Data e hora de início da ocorrência da aula",
+        examples=["2024-03-04T07:30:00"]
+    )
+    end_class: datetime = Field(
+        title="Fim da aula",
+        description="Data e hora de fim da ocorrência da aula",
+        examples=["2024-03-04T08:20:00"]
+    )
+    presences: list[RollCallItem] = Field(
+        title="Chamada",
+        description="Presença ou falta de cada aluno da turma"
+    )
+
+
+    @field_validator("class_event_id", mode="before")
+    def validate_class_event_id(cls, value):
+        
+        value = clean_string_field(value)
+        
+        if not validate_string(value):
+            raise UnprocessableEntity(ERROR_PRESENCE_REQUIRED_FIELD_CLASS_EVENT_ID)
+        
+        return value
+    
+    
+    @field_validator("presences")
+    def validate_presences(cls, values):
+        
+        if not values:
+            raise UnprocessableEntity(ERROR_PRESENCE_REQUIRED_FIELD_PRESENCES)
+        
+        if len({value.child_cpf for value in values}) != len(values):
+            raise UnprocessableEntity(ERROR_PRESENCE_DUPLICATED_CHILD)
+        
+        return values
+    
+    
+    @model_validator(mode="after")
+    def validate_period(self):
+        
+        if self.end_class <= self.start_class:
+            raise UnprocessableEntity(ERROR_PRESENCE_INVALID_PERIOD)
+        
+        return self
+
+
+class RollCallResponse(BaseSchema):
+    """
+    - class_event_id: str
+    - start_class: datetime
+    - end_class: datetime
+    - present: int
+    - absent: int
+    """
+    class_event_id: str = Field(
+        title="ID da aula",
+        description="ID da aula em que a chamada foi feita",
+        examples=["123456"]
+    )
+    start_class: datetime = Field(
+        title="Início da aula",
+        description="Data e hora de início da ocorrência da aula",
+        examples=["2024-03-04T07:30:00"]
+    )
+    end_class: datetime = Field(
+        title="Fim da aula",
+        description="Data e hora de fim da ocorrência da aula",
+        examples=["2024-03-04T08:20:00"]
+    )
+    present: int = Field(
+        title="Presentes",
+        description="Quantidade de alunos presentes",
+        examples=[25]
+    )
+    absent: int = Field(
+        title="Faltas",
+        description="Quantidade de alunos que faltaram",
+        examples=[2]
+    )
+
+
+class PresenceResponse(PresenceDB):
+    """
+    - id: str
+    - class_event_id: str
+    - child_cpf: str
+    - type: PresenceType
+    - start_class: datetime
+    - end_class: datetime
+    """
+
+
+class AttendanceResponse(BaseSchema):
+    """
+    - child_cpf: str
+    - present: int
+    - absent: int
+    - percentage: float
+    """
+    child_cpf: str = Field(
+        title="CPF do aluno",
+        description="CPF do aluno",
+        examples=["12345678901"]
+    )
+    present: int = Field(
+        title="Presenças",
+        description="Quantidade de presenças no período",
+        examples=[38]
+    )
+    absent: int = Field(
+        title="Faltas",
+        description="Quantidade de faltas no período",
+        examples=[2]
+    )
+    percentage: float = Field(
+        title="Frequência",
+        description="Percentual de presenças no período, de 0 a 100",
+        examples=[95.0]
+    )
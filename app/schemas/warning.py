@@ -1,7 +1,26 @@
 from datetime import datetime
+from pydantic import (
+    Field,
+    field_validator
+)
 
 
+from constants.base import ERROR_INVALID_CPF
+from constants.warning import (
+    ERROR_WARNING_REQUIRED_FIELD_PARENT_CPF,
+    ERROR_WARNING_REQUIRED_FIELD_TEXT,
+    ERROR_WARNING_REQUIRED_FIELD_THEME
+)
 from schemas.base import BaseSchema
+from utils.format import (
+    clean_string_field,
+    unformat_cpf
+)
+from utils.messages.error import UnprocessableEntity
+from utils.validate import (
+    validate_cpf,
+    validate_string
+)
 
 
 class WarningRequest(BaseSchema):
@@ -19,6 +38,9 @@ class WarningDB(WarningRequest):
     """
     - id: str
     - file_path: str | None
+    - file_name: str | None
+    - file_type: str | None
+    - file_size: int | None
     - date: datetime
     - parent_cpf: str
     - theme: str
@@ -26,4 +48,87 @@ class WarningDB(WarningRequest):
     """
     id: str
     file_path: str | None
-    date: datetime
\ No newline at end of file
+    file_name: str | None = None
+    file_type: str | None = None
+    file_size: int | None = None
+    date: datetime
+
+
+class WarningSendRequest(BaseSchema):
+    """
+    - parent_cpfs: list[str]
+    - theme: str
+    - text: str
+    """
+    parent_cpfs: list[str] = Field(
+        title="CPFs dos responsáveis",
+        description="Responsáveis que receberão o aviso (um aviso para cada um, com o mesmo anexo)",
+        examples=[["123.456.789-01", "987.654.321-00"]]
+    )
+    theme: str = Field(
+        title="Tema",
+        description="Tema do aviso",
+        examples=["Reunião de pais"]
+    )
+    text: str = Field(
+        title="Texto",
+        description="Texto do aviso",
+        examples=["A reunião de pais será na sexta-feira, às 18h."]
+    )
+
+
+    @field_validator("parent_cpfs", mode="before")
+    def validate_parent_cpfs(cls, values):
+
+        values = [value for value in map(clean_string_field, values or []) if value]
+
+        if not values:
+            raise UnprocessableEntity(ERROR_WARNING_REQUIRED_FIELD_PARENT_CPF)
+
+        if not all(validate_cpf(value) for value in values):
+            raise UnprocessableEntity(ERROR_INVALID_CPF)
+
+        return list(dict.fromkeys(unformat_cpf(value) for value in values))
+
+
+    @field_validator("theme", mode="before")
+    def validate_theme(cls, value):
+
+        value = clean_string_field(value)
+
+        if not validate_string(value):
+            raise UnprocessableEntity(ERROR_WARNING_REQUIRED_FIELD_THEME)
+
+        return value
+
+
+    @field_validator("text", mode="before")
+    def validate_text(cls, value):
+
+        value = clean_string_field(value)
+
+        if not validate_string(value):
+            raise UnprocessableEntity(ERROR_WARNING_REQUIRED_FIELD_TEXT)
+
+        return value
+
+
+class WarningResponse(BaseSchema):
+    """
+    - id: str
+    - parent_cpf: str
+    - theme: str
+    - text: str
+    - date: datetime
+    - file_name: str | None
+    - file_type: str | None
+    - file_size: int | None
+    """
+    id: str
+    parent_cpf: str
+    theme: str
+    text: str
+    date: datetime
+    file_name: str | None = None
+    file_type: str | None = None
+    file_size: int | None = None
@@ -0,0 +1,124 @@
+from collections import OrderedDict
+from datetime import (
+    date,
+    timedelta
+)
+from threading import Lock
+from time import monotonic
+from decouple import config
+
+
+# Quantidade máxima de semanas guardadas (as menos usadas são descartadas primeiro)
+CALENDAR_CACHE_MAX_WEEKS = config('CALENDAR_CACHE_MAX_WEEKS', default=4096, cast=int)
+
+# Tempo máximo que uma semana fica em cache, cobrindo mudanças de outros workers que não chegaram pelo barramento
+# (services/events/bus.py)
+CALENDAR_CACHE_TTL = config('CALENDAR_CACHE_TTL', default=300, cast=int)
+
+
+def week_of(day: date) -> date:
+    """
+    Segunda-feira da semana da data, usada como chave da semana no cache
+    """
+    return day - timedelta(days=day.weekday())
+
+
+class CalendarCache:
+    """
+    Cache em memória das aulas expandidas do calendário, por entidade (turma ou professor) e semana
+
+    Cada entrada é a lista de ocorrências de uma entidade em uma semana (segunda a domingo). As alterações
+    de aulas e recorrências invalidam as semanas afetadas da turma e do professor da aula; um contador de
+    geração por entidade impede que uma consulta iniciada antes da invalidação grave dados antigos.
+    """
+    def __init__(self, max_weeks: int = CALENDAR_CACHE_MAX_WEEKS, ttl: int = CALENDAR_CACHE_TTL):
+        self.max_weeks = max_weeks
+        self.ttl = ttl
+        self._lock = Lock()
+        self._weeks: OrderedDict[tuple, tuple[float, list]] = OrderedDict()
+        self._generations: dict[tuple[str, str], int] = {}
+        self._epoch = 0 # Incrementado por clear()
+
+
+    def generation(self, kind: str, entity_id: str) -> tuple[int, int]:
+        """
+        Geração atual da entidade, lida antes de consultar o banco e repassada a set()
+        """
+        with self._lock:
+            return self._epoch, self._generations.get((kind, entity_id), 0)
+
+
+    def get(self, kind: str, entity_id: str, week: date) -> list | None:
+        """
+        Ocorrências da entidade na semana, ou None se a semana não estiver em cache ou tiver expirado
+        """
+        key = (kind, entity_id, week)
+
+        with self._lock:
+
+            entry = self._weeks.get(key)
+
+            if entry is None:
+                return None
+
+            stored_at, occurrences = entry
+
+            if monotonic() - stored_at > self.ttl:
+                del self._weeks[key]
+                return None
+
+            self._weeks.move_to_end(key)
+
+            return occurrences
+
+
+    def set(self, kind: str, entity_id: str, weeks: dict[date, list], generation: tuple[int, int]) -> None:
+        """
+        Guarda as ocorrências de várias semanas da entidade, se ela não foi invalidada desde `generation`
+        """
+        with self._lock:
+
+            if (self._epoch, self._generations.get((kind, entity_id), 0)) != generation:
+                return
+
+            now = monotonic()
+
+            for week, occurrences in weeks.items():
+                self._weeks[(kind, entity_id, week)] = (now, occurrences)
+                self._weeks.move_to_end((kind, entity_id, week))
+
+            while len(self._weeks) > self.max_weeks:
+                self._weeks.popitem(last=False)
+
+
+    def invalidate(self, kind: str, entity_id: str, start: date | None = None, end: date | None = None) -> None:
+        """
+        Descarta as semanas da entidade que tocam o período informado (todas, se o período não for informado)
+        """
+        with self._lock:
+
+            self._generations[(kind, entity_id)] = self._generations.get((kind, entity_id), 0) + 1
+
+            first = week_of(start) if start else None
+            last = week_of(end) if end else None
+
+            for key in [
+                key for key in self._weeks
+                if key[:2] == (kind, entity_id)
+                and (first is None or key[2] >= first)
+                and (last is None or key[2] <= last)
+            ]:
+                del self._weeks[key]
+
+
+    def clear(self) -> None:
+        """
+        Descarta todo o cache (ex: mudança no nome de uma turma, que aparece no calendário de vários professores)
+        """
+        with self._lock:
+
+            self._weeks.clear()
+            self._epoch += 1
+
+
+calendar_cache = CalendarCache()
@@ -0,0 +1,117 @@
+"""
+Geração de calendários no formato iCalendar (RFC 5545), assinados pelos aplicativos de calendário
+
+Os horários são gravados sem fuso (horário local flutuante), como são cadastrados nas recorrências.
+"""
+from datetime import (
+    datetime,
+    timezone
+)
+from hashlib import sha256
+
+
+from schemas.classes import CalendarOccurrence
+
+
+PRODID = "-//SMEIF//Calendario de Aulas//PT"
+
+# Tamanho máximo de uma linha, em octetos, antes da quebra (RFC 5545, seção 3.1)
+LINE_LIMIT = 75
+
+
+def escape_text(value: str) -> str:
+    """
+    Escapa um valor de texto (barra invertida, ponto e vírgula, vírgula e quebras de linha)
+    """
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str) -> str:
+    """
+    Quebra uma linha com mais de 75 octetos em linhas de continuação iniciadas por espaço, sem dividir
+    caracteres UTF-8
+    """
+    parts = []
+    current = ""
+    size = 0
+
+    for char in line:
+
+        char_size = len(char.encode("utf-8"))
+
+        if size + char_size > LINE_LIMIT:
+            parts.append(current)
+            current = " "
+            size = 1
+
+        current += char
+        size += char_size
+
+    parts.append(current)
+
+    return "\r\n".join(parts)
+
+
+def occurrence_uid(occurrence: CalendarOccurrence) -> str:
+    """
+    Identificador estável da ocorrência, para que os aplicativos atualizem o evento em vez de duplicá-lo
+    """
+    return f"{occurrence.class_event_id}-{occurrence.day:%Y%m%d}-{occurrence.start_time.replace(':', '')}@smeif"
+
+
+def render_ics(name: str, occurrences: list[CalendarOccurrence]) -> str:
+    """
+    Monta um calendário iCalendar com um evento por ocorrência de aula
+
+    - Args:
+        - name: Nome do calendário exibido pelos aplicativos.
+        - occurrences: Ocorrências das aulas.
+
+    - Returns:
+        - str: Conteúdo do arquivo .ics, com quebras de linha CRLF.
+    """
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(name)}",
+    ]
+
+    for occurrence in occurrences:
+
+        day = f"{occurrence.day:%Y%m%d}"
+
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{occurrence_uid(occurrence)}",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{day}T{occurrence.start_time.replace(':', '')}00",
+            f"DTEND:{day}T{occurrence.end_time.replace(':', '')}00",
+            f"SUMMARY:{escape_text(f'{occurrence.discipline_name} - {occurrence.class_info}')}",
+            f"DESCRIPTION:{escape_text(f'Professor: {occurrence.teacher_name}')}",
+            "END:VEVENT",
+        ]
+
+    lines.append("END:VCALENDAR")
+
+    return "".join(fold_line(line) + "\r\n" for line in lines)
+
+
+def calendar_etag(occurrences: list[CalendarOccurrence]) -> str:
+    """
+    ETag do calendário, calculada a partir das ocorrências (e não do arquivo, cujo DTSTAMP muda a cada
+    geração), para que os aplicativos que assinam o calendário recebam 304 enquanto nada mudar
+    """
+    digest = sha256("\n".join(occurrence.model_dump_json() for occurrence in occurrences).encode("utf-8"))
+
+    return f'"{digest.hexdigest()[:32]}"'
@@ -0,0 +1,123 @@
+"""
+Resumo das notificações de cada responsável
+
+Avisos, notas e faltas geram notificações (tabela notification) para cada responsável, em vez de um email cada.
+Quando a notificação pendente mais antiga de um responsável completa a janela do resumo (um dia, por padrão),
+todas as pendentes dele viram um único email na outbox, agrupado por aluno: um responsável com vários filhos
+recebe um resumo diário, e não um email por nota ou falta. Com o resumo desligado, cada notificação vira o seu
+próprio email.
+"""
+from datetime import (
+    datetime,
+    timedelta
+)
+from itertools import groupby
+from decouple import config
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+
+from constants.notification import (
+    NOTIFICATION_DIGEST_SUBJECT,
+    NOTIFICATION_WARNINGS_SECTION
+)
+from database.repositories.notification import NotificationRepository
+from database.repositories.outbox import OutboxRepository
+from services.email.generate import (
+    generate_email_body_with_digest,
+    generate_email_body_with_notification
+)
+
+
+# Junta as notificações de cada responsável em um email por janela (False: um email por notificação)
+NOTIFICATION_DIGEST = config('NOTIFICATION_DIGEST', default=True, cast=bool)
+
+# Tempo máximo que uma notificação espera pelas próximas antes de o resumo ser enviado (padrão: resumo diário)
+NOTIFICATION_DIGEST_WINDOW_SECONDS = config('NOTIFICATION_DIGEST_WINDOW_SECONDS', default=24 * 60 * 60, cast=int)
+
+# Responsáveis resumidos por vez
+NOTIFICATION_DIGEST_BATCH_SIZE = config('NOTIFICATION_DIGEST_BATCH_SIZE', default=100, cast=int)
+
+
+def render_digest(notifications: list[Row]) -> tuple[str, str]:
+    """
+    Assunto e corpo do email com as notificações de um responsável
+
+    Uma única notificação é enviada como ela mesma; várias, como um resumo agrupado por aluno, com os avisos
+    da escola (sem aluno) em uma seção própria.
+    """
+    if len(notifications) == 1:
+        return notifications[0].title, generate_email_body_with_notification(notifications[0].title, notifications[0].text)
+
+    sections: dict[str, list[tuple[str, str]]] = {}
+
+    for notification in notifications:
+        sections.setdefault(notification.child_name or NOTIFICATION_WARNINGS_SECTION, []).append(
+            (notification.title, notification.text)
+        )
+
+    return (
+        NOTIFICATION_DIGEST_SUBJECT.format(count=len(notifications)),
+        generate_email_body_with_digest(notifications[0].parent_name, sections)
+    )
+
+
+def compose_digests(
+    session: Session,
+    now: datetime | None = None,
+    digest: bool = NOTIFICATION_DIGEST,
+    window_seconds: int = NOTIFICATION_DIGEST_WINDOW_SECONDS,
+    batch_size: int = NOTIFICATION_DIGEST_BATCH_SIZE
+) -> int:
+    """
+    Transforma as notificações pendentes dos responsáveis cuja janela terminou em emails na outbox
+
+    Os emails de cada responsável e a marcação das notificações são gravados na mesma transação; se outro
+    worker enviou as mesmas notificações antes, a transação é desfeita.
+
+    - Args:
+        - session: Sessão do banco.
+        - now: Momento de referência (padrão: agora).
+        - digest: Se as notificações de cada responsável são juntadas em um único email.
+        - window_seconds: Janela do resumo, em segundos.
+        - batch_size: Quantidade máxima de responsáveis.
+
+    - Returns:
+        - int: Quantidade de emails gravados na outbox.
+    """
+    now = now or datetime.now()
+
+    repository = NotificationRepository(session)
+    outbox = OutboxRepository(session)
+
+    parent_cpfs = repository.get_due_parents(now - timedelta(seconds=window_seconds) if digest else now, batch_size)
+
+    emails = 0
+
+    for _, notifications in groupby(repository.get_pending(parent_cpfs), key=lambda row: row.parent_cpf):
+
+        notifications = list(notifications)
+
+        groups = [notifications] if digest else [[notification] for notification in notifications]
+
+        claimed = True
+
+        for group in groups:
+
+            subject, body = render_digest(group)
+
+            model = outbox.enqueue(group[0].email, subject, body)
+
+            session.flush()
+
+            if repository.mark_sent([notification.id for notification in group], model.id) != len(group):
+                claimed = False # Enviadas por outro worker
+                break
+
+        if claimed:
+            session.commit()
+            emails += len(groups)
+        else:
+            session.rollback()
+
+    return emails
@@ -1,8 +1,9 @@
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from html import escape
 
 from decouple import config
-EMAIL_USERNAME = config("EMAIL_USERNAME")
+EMAIL_USERNAME = config("EMAIL_USERNAME", default="")
 
 
 def generate_email_body_with_password(password: str) -> str:
@@ -28,6 +29,63 @@ def generate_email_body_with_password(password: str) -> str:
     return html
 
 
+def generate_email_body_with_notification(title: str, text: str) -> str:
+    """
+    Gera o corpo do email de uma única notificação (aviso, nota ou falta)
+
+    - Args:
+        - title (str): Título da notificação
+        - text (str): Texto da notificação
+
+    - Returns:
+        - str: Corpo do email
+    """
+    paragraphs = "".join(f"<p>{escape(line)}</p>" for line in text.splitlines() if line.strip())
+
+    html = f"""
+    <html>
+    <body>
+        <p>Há uma novidade da escola para você.</p>
+        <h3>{escape(title)}</h3>
+        {paragraphs}
+    </body>
+    </html>
+    """
+
+    return html
+
+
+def generate_email_body_with_digest(parent_name: str, sections: dict[str, list[tuple[str, str]]]) -> str:
+    """
+    Gera o corpo do email de resumo, com todas as notificações pendentes de um responsável
+
+    - Args:
+        - parent_name (str): Nome do responsável
+        - sections (dict[str, list[tuple[str, str]]]): Título e texto das notificações, por seção (nome do
+        aluno ou avisos da escola)
+
+    - Returns:
+        - str: Corpo do email
+    """
+    content = "".join(
+        f"<h3>{escape(section)}</h3><ul>"
+        + "".join(f"<li><strong>{escape(title)}</strong>: {escape(text)}</li>" for title, text in items)
+        + "</ul>"
+        for section, items in sections.items()
+    )
+
+    html = f"""
+    <html>
+    <body>
+        <p>Olá, {escape(parent_name)}. Estas são as novidades da escola desde o último resumo.</p>
+        {content}
+    </body>
+    </html>
+    """
+
+    return html
+
+
 def generate_email(to_email: str, subject: str, body: str) -> MIMEMultipart:
     """
     Formata conteúdo para formar um email
@@ -0,0 +1,228 @@
+"""
+Envio em segundo plano dos emails gravados na tabela outbox
+
+As requisições só gravam os emails (OutboxRepository.enqueue), ou as notificações que viram emails de resumo
+(services/email/digest.py), na mesma transação da alteração que os originou; uma thread monta os resumos,
+busca os emails em lotes e os envia pelas conexões do pool SMTP, em paralelo. Falhas temporárias voltam à
+fila com espera exponencial; recusas definitivas do servidor (5xx) e emails que esgotaram as tentativas
+ficam como failed, com o último erro.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import (
+    datetime,
+    timedelta
+)
+from logging import getLogger
+from smtplib import (
+    SMTPAuthenticationError,
+    SMTPRecipientsRefused,
+    SMTPResponseException
+)
+from threading import (
+    Event,
+    Lock,
+    Thread
+)
+from decouple import config
+from sqlalchemy import Row
+from sqlalchemy.orm import sessionmaker
+
+
+from database.connection import Session as SessionLocal
+from database.repositories.outbox import OutboxRepository
+from services.email.digest import compose_digests
+from services.email.generate import generate_email
+from services.email.send import (
+    SMTPPool,
+    smtp_pool
+)
+
+
+# Emails reservados e enviados por vez
+OUTBOX_BATCH_SIZE = config('OUTBOX_BATCH_SIZE', default=50, cast=int)
+
+# Intervalo entre as buscas quando a fila está vazia (enqueue + notify antecipam a busca)
+OUTBOX_POLL_SECONDS = config('OUTBOX_POLL_SECONDS', default=5, cast=float)
+
+# Tentativas antes de desistir do email, e espera antes da segunda tentativa (dobra a cada falha, até o máximo)
+OUTBOX_MAX_ATTEMPTS = config('OUTBOX_MAX_ATTEMPTS', default=6, cast=int)
+OUTBOX_BACKOFF_SECONDS = config('OUTBOX_BACKOFF_SECONDS', default=30, cast=int)
+OUTBOX_BACKOFF_MAX_SECONDS = config('OUTBOX_BACKOFF_MAX_SECONDS', default=3600, cast=int)
+
+# Emails reservados há mais tempo que isso voltam para a fila ao iniciar o envio
+OUTBOX_STALE_SECONDS = config('OUTBOX_STALE_SECONDS', default=600, cast=int)
+
+
+logger = getLogger(__name__)
+
+
+def backoff(attempts: int) -> timedelta:
+    """
+    Espera antes da próxima tentativa, depois de `attempts` falhas
+    """
+    return timedelta(seconds=min(OUTBOX_BACKOFF_SECONDS * 2 ** (attempts - 1), OUTBOX_BACKOFF_MAX_SECONDS))
+
+
+def is_permanent(error: Exception) -> bool:
+    """
+    Se o servidor recusou o email de forma definitiva (código 5xx), caso em que novas tentativas não adiantam
+
+    Falhas de autenticação são de configuração e não do email: continuam sendo tentadas de novo.
+    """
+    if isinstance(error, SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in error.recipients.values())
+
+    if isinstance(error, SMTPResponseException) and not isinstance(error, SMTPAuthenticationError):
+        return error.smtp_code >= 500
+
+    return False
+
+
+class OutboxSender:
+    """
+    Envia os emails da outbox em segundo plano, dentro do próprio processo da API
+
+    Cada worker da API tem o seu; a reserva dos lotes (OutboxRepository.claim_batch) garante que um email
+    é enviado por um só.
+    """
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        pool: SMTPPool = smtp_pool,
+        batch_size: int = OUTBOX_BATCH_SIZE,
+        poll_seconds: float = OUTBOX_POLL_SECONDS,
+        max_attempts: int = OUTBOX_MAX_ATTEMPTS
+    ):
+        self.session_factory = session_factory
+        self.pool = pool
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.max_attempts = max_attempts
+        self._lock = Lock()
+        self._wake = Event()
+        self._stop = Event()
+        self._thread: Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+
+    def start(self) -> None:
+        """
+        Devolve à fila os emails interrompidos e inicia a thread de envio
+        """
+        with self._lock:
+
+            if self._thread is not None:
+                return
+
+            with self.session_factory() as session:
+                OutboxRepository(session).reset_stale(datetime.now() - timedelta(seconds=OUTBOX_STALE_SECONDS))
+
+            self._stop.clear()
+            self._executor = ThreadPoolExecutor(max_workers=self.pool.size, thread_name_prefix="outbox-smtp")
+            self._thread = Thread(target=self._loop, name="outbox", daemon=True)
+            self._thread.start()
+
+
+    def notify(self) -> None:
+        """
+        Antecipa a próxima busca (chamado depois do commit que gravou emails ou notificações)
+        """
+        self._wake.set()
+
+
+    def _loop(self) -> None:
+
+        while not self._stop.is_set():
+
+            try:
+                with self.session_factory() as session:
+                    compose_digests(session)
+
+                sent = self.run_once()
+
+            except Exception:
+                logger.exception("Falha ao enviar os emails da outbox")
+                sent = 0
+
+            if sent < self.batch_size: # Fila vazia: espera a próxima busca ou um notify()
+                self._wake.wait(self.poll_seconds)
+                self._wake.clear()
+
+
+    def run_once(self) -> int:
+        """
+        Reserva um lote de emails, envia-os em paralelo pelas conexões do pool e registra o resultado de cada um
+
+        - Returns:
+            - int: Quantidade de emails processados (enviados ou não).
+        """
+        with self.session_factory() as session:
+
+            repository = OutboxRepository(session)
+
+            messages = repository.claim_batch(self.batch_size, datetime.now())
+
+            if not messages:
+                return 0
+
+            if self._executor is not None:
+                errors = list(self._executor.map(self.send, messages))
+            else:
+                errors = [self.send(message) for message in messages]
+
+            repository.mark_sent([message.id for message, error in zip(messages, errors) if error is None])
+
+            for message, error in zip(messages, errors):
+
+                if error is None:
+                    continue
+
+                description = str(error) or error.__class__.__name__
+
+                if is_permanent(error) or message.attempts + 1 >= self.max_attempts:
+                    repository.mark_failed(message.id, description)
+                else:
+                    repository.mark_retry(message.id, description, datetime.now() + backoff(message.attempts + 1))
+
+            return len(messages)
+
+
+    def send(self, message: Row) -> Exception | None:
+        """
+        Envia um email reservado
+
+        - Returns:
+            - Exception | None: O erro do envio, ou None se o email foi enviado.
+        """
+        try:
+            self.pool.send(message.to_email, generate_email(message.to_email, message.subject, message.body))
+
+        except Exception as e:
+            return e
+
+        return None
+
+
+    def stop(self) -> None:
+        """
+        Encerra a thread de envio e fecha as conexões do pool. Emails reservados e não concluídos voltam
+        à fila no próximo start()
+        """
+        with self._lock:
+
+            self._stop.set()
+            self._wake.set()
+
+            if self._thread is not None:
+                self._thread.join(timeout=self.pool.timeout)
+
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+
+            self._thread = None
+            self._executor = None
+
+        self.pool.close()
+
+
+outbox_sender = OutboxSender(SessionLocal)
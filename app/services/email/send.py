@@ -1,54 +1,212 @@
-from decouple import config
+from contextlib import contextmanager
 from email.mime.multipart import MIMEMultipart
-from smtplib import SMTP
+from smtplib import (
+    SMTP,
+    SMTPDataError,
+    SMTPRecipientsRefused,
+    SMTPSenderRefused,
+    SMTPServerDisconnected
+)
+from threading import (
+    BoundedSemaphore,
+    Lock
+)
+from time import monotonic
+from typing import Iterator
+from decouple import config
 
 
-SMTP_SERVER = config("SMTP_SERVER")
-SMTP_PORT = config("SMTP_PORT")
-EMAIL_USERNAME = config("EMAIL_USERNAME")
-EMAIL_PASSWORD = config("EMAIL_PASSWORD")
+SMTP_SERVER = config("SMTP_SERVER", default="localhost")
+SMTP_PORT = config("SMTP_PORT", default=587, cast=int)
+SMTP_STARTTLS = config("SMTP_STARTTLS", default=True, cast=bool)
+SMTP_TIMEOUT = config("SMTP_TIMEOUT", default=30, cast=int)
+EMAIL_USERNAME = config("EMAIL_USERNAME", default="")
+EMAIL_PASSWORD = config("EMAIL_PASSWORD", default="")
 
+# Conexões autenticadas mantidas abertas e reutilizadas entre os envios
+SMTP_POOL_SIZE = config("SMTP_POOL_SIZE", default=3, cast=int)
 
-def send_email(to_email: str, msg: MIMEMultipart) -> str:
-    """
-    Envia um email para um email de destino
+# Conexões paradas por mais tempo que isso são fechadas em vez de reutilizadas (os servidores encerram as ociosas)
+SMTP_MAX_IDLE_SECONDS = config("SMTP_MAX_IDLE_SECONDS", default=60, cast=int)
 
-    - Args:
-        - to_email (str): Email do destinatário
-        - msg (MIMEMultipart): Email formatado para envio
+# Recusas após as quais o smtplib já desfez a transação (RSET) e a conexão continua utilizável
+KEEP_CONNECTION_ERRORS = (SMTPRecipientsRefused, SMTPSenderRefused, SMTPDataError)
 
-    - Returns:
-        - None
+
+class SMTPPool:
     """
-    try:
+    Pool de conexões SMTP autenticadas
+
+    Abrir a conexão, negociar o TLS e autenticar custam mais que enviar o email; o pool faz isso uma vez por
+    conexão e mantém até `size` conexões, que podem ser usadas em paralelo por threads diferentes.
+    """
+    def __init__(
+        self,
+        host: str = SMTP_SERVER,
+        port: int = SMTP_PORT,
+        username: str = EMAIL_USERNAME,
+        password: str = EMAIL_PASSWORD,
+        starttls: bool = SMTP_STARTTLS,
+        size: int = SMTP_POOL_SIZE,
+        timeout: int = SMTP_TIMEOUT,
+        max_idle_seconds: int = SMTP_MAX_IDLE_SECONDS
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.size = size
+        self.timeout = timeout
+        self.max_idle_seconds = max_idle_seconds
+        self._slots = BoundedSemaphore(size)
+        self._lock = Lock()
+        self._idle: list[tuple[SMTP, float]] = []
+
+
+    def connect(self) -> SMTP:
+        """
+        Abre uma conexão, negocia o TLS (se configurado) e autentica (se houver usuário)
+        """
+        server = SMTP(self.host, self.port, timeout=self.timeout)
+
+        try:
+            if self.starttls:
+                server.starttls()
+
+            if self.username:
+                server.login(self.username, self.password)
+
+        except BaseException:
+            self.discard(server)
+            raise
+
+        return server
+
+
+    @contextmanager
+    def connection(self) -> Iterator[tuple[SMTP, bool]]:
         """
-        Cria uma instância do objeto SMTP e conecta ao servidor SMTP especificado pelo endereço (smtp_server) e porta (smtp_port).
+        Empresta uma conexão do pool, esperando enquanto as `size` conexões estiverem em uso
+
+        - Returns:
+            - tuple[SMTP, bool]: A conexão e se ela foi reutilizada (e não aberta agora).
         """
-        server = SMTP(SMTP_SERVER, SMTP_PORT)
+        with self._slots:
+
+            server, reused = self._take_idle(), True
+
+            if server is None:
+                server, reused = self.connect(), False
+
+            try:
+                yield server, reused
+
+            except KEEP_CONNECTION_ERRORS:
+                self._give_back(server)
+                raise
+
+            except BaseException:
+                self.discard(server)
+                raise
+
+            self._give_back(server)
+
+
+    def send(self, to_email: str, msg: MIMEMultipart) -> None:
         """
-        Inicia a comunicação TLS (Transport Layer Security) para criptografar a conexão ao servidor SMTP, garantindo a segurança dos dados transmitidos.
+        Envia um email por uma conexão do pool
+
+        Uma conexão reutilizada pode ter sido encerrada pelo servidor enquanto estava parada; nesse caso o
+        envio é repetido uma vez, por uma conexão nova.
         """
-        server.starttls()
+        content = msg.as_string().encode('utf-8')
+
+        for attempt in range(2):
+
+            reused = False
 
-        server.login(EMAIL_USERNAME, EMAIL_PASSWORD)
+            try:
+                with self.connection() as (server, reused):
+                    server.sendmail(self.username or msg['From'], to_email, content)
 
+                return
+
+            except SMTPServerDisconnected:
+                if not reused or attempt:
+                    raise
+
+
+    def close(self) -> None:
         """
-        Envia o email usando o método sendmail do objeto SMTP.
-            from_email: O endereço de email do remetente.
-            to_email: O endereço de email do destinatário.
-            msg.as_string(): Converte o objeto de mensagem (msg) para uma string f
+        Fecha as conexões paradas no pool
         """
-        server.sendmail(EMAIL_USERNAME, to_email, msg.as_string().encode('utf-8'))
+        with self._lock:
+            idle, self._idle = self._idle, []
+
+        for server, _ in idle:
+            self.discard(server)
+
+
+    def _take_idle(self) -> SMTP | None:
+
+        with self._lock:
+
+            while self._idle:
+
+                server, since = self._idle.pop()
+
+                if monotonic() - since <= self.max_idle_seconds:
+                    return server
+
+                self.discard(server)
+
+        return None
+
+
+    def _give_back(self, server: SMTP) -> None:
+
+        with self._lock:
+            self._idle.append((server, monotonic()))
+
+
+    @staticmethod
+    def discard(server: SMTP) -> None:
         """
-        Encerra a conexão com o servidor SMTP.
+        Encerra a conexão sem propagar erros (ela pode já ter sido fechada pelo servidor)
         """
-        server.quit()
+        try:
+            server.quit()
+
+        except Exception:
+            server.close()
+
+
+smtp_pool = SMTPPool()
+
+
+def send_email(to_email: str, msg: MIMEMultipart) -> str:
+    """
+    Envia um email para um email de destino, por uma conexão do pool
+
+    Para avisar usuários a partir de uma requisição, prefira gravar o email na outbox
+    (OutboxRepository.enqueue), que é enviada em segundo plano com novas tentativas.
+
+    - Args:
+        - to_email (str): Email do destinatário
+        - msg (MIMEMultipart): Email formatado para envio
+
+    - Returns:
+        - str: Mensagem de sucesso
+
+    - Raises:
+        - Exception: Falha no envio
+    """
+    try:
+        smtp_pool.send(to_email, msg)
 
-        msg = f"Email enviado com sucesso para {to_email}"
+        return f"Email enviado com sucesso para {to_email}"
 
-        return msg
     except Exception as e:
-        
-        msg = f"Falha ao enviar email: {e}"
 
-        raise Exception(msg)
\ No newline at end of file
+        raise Exception(f"Falha ao enviar email: {e}")
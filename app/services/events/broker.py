@@ -0,0 +1,116 @@
+"""
+Pub/sub em memória dos eventos enviados por SSE (GET /events/stream)
+
+Cada conexão SSE é uma assinatura do usuário logado, com uma fila própria e limitada: um cliente lento perde
+os eventos mais antigos (e é avisado para buscar os dados de novo) em vez de acumular memória ou atrasar os
+demais. Os eventos são publicados pelos casos de uso depois do commit, com os CPFs dos usuários a que dizem
+respeito; publish() pode ser chamado de qualquer thread.
+"""
+from asyncio import (
+    AbstractEventLoop,
+    Queue,
+    get_running_loop
+)
+from threading import Lock
+from typing import NamedTuple
+from decouple import config
+
+
+from utils.format import unformat_cpf
+
+
+# Eventos guardados por assinatura enquanto o cliente não os lê
+EVENTS_QUEUE_SIZE = config('EVENTS_QUEUE_SIZE', default=100, cast=int)
+
+
+class Event(NamedTuple):
+    kind: str # EventKind
+    action: str # EventAction
+    data: dict
+    recipients: frozenset[str] # CPFs (sem formatação) dos usuários que recebem o evento
+
+
+class Subscription:
+    """
+    Assinatura de um usuário, ligada ao loop de eventos da conexão SSE
+    """
+    def __init__(self, cpf: str, loop: AbstractEventLoop, queue_size: int):
+        self.cpf = cpf
+        self.loop = loop
+        self.queue: Queue[Event] = Queue(queue_size)
+        self.dropped = 0
+
+
+    def deliver(self, event: Event) -> None:
+        """
+        Coloca o evento na fila, descartando o mais antigo se ela estiver cheia (executado no loop da assinatura)
+        """
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+
+        self.queue.put_nowait(event)
+
+
+    async def get(self) -> Event:
+        return await self.queue.get()
+
+
+class EventBroker:
+    def __init__(self, queue_size: int = EVENTS_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._lock = Lock()
+        self._subscriptions: dict[str, set[Subscription]] = {}
+
+
+    def subscribe(self, cpf: str) -> Subscription:
+        """
+        Cria a assinatura de um usuário no loop de eventos atual
+        """
+        subscription = Subscription(unformat_cpf(cpf), get_running_loop(), self.queue_size)
+
+        with self._lock:
+            self._subscriptions.setdefault(subscription.cpf, set()).add(subscription)
+
+        return subscription
+
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+
+        with self._lock:
+
+            subscriptions = self._subscriptions.get(subscription.cpf, set())
+            subscriptions.discard(subscription)
+
+            if not subscriptions:
+                self._subscriptions.pop(subscription.cpf, None)
+
+
+    def has_subscribers(self) -> bool:
+        """
+        Se há alguma assinatura; sem nenhuma, os casos de uso nem buscam os destinatários dos eventos
+        """
+        return bool(self._subscriptions)
+
+
+    def publish(self, event: Event) -> None:
+        """
+        Entrega o evento às assinaturas dos seus destinatários, sem esperar que elas o leiam
+        """
+        with self._lock:
+            subscriptions = [
+                subscription
+                for cpf in {unformat_cpf(cpf) for cpf in event.recipients}
+                for subscription in self._subscriptions.get(cpf, ())
+            ]
+
+        for subscription in subscriptions:
+
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+
+            except RuntimeError: # Loop da conexão já encerrado
+                self.unsubscribe(subscription)
+
+
+event_broker = EventBroker()
@@ -0,0 +1,387 @@
+"""
+Barramento de notificações entre os workers da API
+
+O estado em memória de cada worker (assinaturas SSE em services/events/broker.py e o cache do calendário
+em services/calendar/cache.py) só enxerga as alterações feitas no próprio worker. Os casos de uso publicam,
+depois do commit, as mudanças por este barramento: elas são aplicadas na hora no worker que as fez e, no
+PostgreSQL, enviadas por NOTIFY aos demais, que as recebem por uma conexão dedicada (LISTEN) por worker.
+No SQLite (e nos testes) há um só processo, e o barramento local apenas aplica as mudanças no próprio worker.
+"""
+from collections import deque
+from datetime import date
+from json import (
+    dumps,
+    loads
+)
+from logging import getLogger
+from select import select
+from socket import socketpair
+from threading import (
+    Event as ThreadEvent,
+    Lock,
+    Thread
+)
+from typing import Callable
+from uuid import uuid4
+from decouple import config
+from sqlalchemy import Engine
+
+
+from database.connection import engine
+from services.calendar.cache import calendar_cache
+from services.events.broker import (
+    Event,
+    event_broker
+)
+
+
+# Canal do LISTEN/NOTIFY compartilhado pelos workers
+EVENTS_BUS_CHANNEL = config('EVENTS_BUS_CHANNEL', default='smeif_events')
+
+# Intervalo máximo de espera por notificações (e de verificação do encerramento), e espera antes de reconectar
+EVENTS_BUS_POLL_SECONDS = config('EVENTS_BUS_POLL_SECONDS', default=5, cast=float)
+EVENTS_BUS_RETRY_SECONDS = config('EVENTS_BUS_RETRY_SECONDS', default=5, cast=float)
+
+# Máximo de mudanças à espera de envio aos demais workers (as mais antigas são descartadas)
+EVENTS_BUS_QUEUE_SIZE = config('EVENTS_BUS_QUEUE_SIZE', default=10000, cast=int)
+
+# Tamanho máximo do payload do NOTIFY no PostgreSQL (8000 bytes, menos uma folga)
+NOTIFY_PAYLOAD_LIMIT = 7900
+
+TOPIC_EVENT = "event"
+TOPIC_CALENDAR = "calendar"
+
+
+logger = getLogger(__name__)
+
+
+def apply_event(payload: dict) -> None:
+    """
+    Entrega às assinaturas SSE do worker um evento publicado pelo barramento
+    """
+    event_broker.publish(Event(payload["kind"], payload["action"], payload["data"], frozenset(payload["recipients"])))
+
+
+def apply_calendar(payload: dict) -> None:
+    """
+    Invalida, no cache do calendário do worker, as semanas de uma entidade (ou todo o cache, sem entidade)
+    """
+    if payload.get("kind") is None:
+        calendar_cache.clear()
+        return
+
+    calendar_cache.invalidate(
+        payload["kind"],
+        payload["entity_id"],
+        date.fromisoformat(payload["start"]) if payload.get("start") else None,
+        date.fromisoformat(payload["end"]) if payload.get("end") else None
+    )
+
+
+HANDLERS: dict[str, Callable[[dict], None]] = {
+    TOPIC_EVENT: apply_event,
+    TOPIC_CALENDAR: apply_calendar,
+}
+
+
+class LocalBus:
+    """
+    Barramento de um só processo: aplica as mudanças diretamente no worker atual
+    """
+    def __init__(self, handlers: dict[str, Callable[[dict], None]] = HANDLERS):
+        self.handlers = handlers
+
+
+    def start(self) -> None:
+        pass
+
+
+    def stop(self) -> None:
+        pass
+
+
+    def has_subscribers(self) -> bool:
+        """
+        Se algum worker pode ter assinaturas SSE; sem nenhuma, os casos de uso nem buscam os destinatários
+        """
+        return event_broker.has_subscribers()
+
+
+    def publish(self, topic: str, payloads: list[dict]) -> None:
+        """
+        Aplica as mudanças no worker atual (chamado depois do commit)
+
+        - Args:
+            - topic: TOPIC_EVENT ou TOPIC_CALENDAR.
+            - payloads: Mudanças, em dicionários serializáveis em JSON.
+        """
+        self.dispatch(topic, payloads)
+
+
+    def dispatch(self, topic: str, payloads: list[dict]) -> None:
+
+        handler = self.handlers[topic]
+
+        for payload in payloads:
+
+            try:
+                handler(payload)
+
+            except Exception:
+                logger.exception("Falha ao aplicar a mudança %s do barramento", topic)
+
+
+    def publish_events(self, events: list[Event]) -> None:
+        """
+        Publica eventos para as assinaturas SSE dos seus destinatários, em qualquer worker
+        """
+        if events:
+            self.publish(TOPIC_EVENT, [
+                {"kind": event.kind, "action": event.action, "data": event.data, "recipients": sorted(event.recipients)}
+                for event in events
+            ])
+
+
+    def invalidate_calendar(self, entities: list[tuple[str, str]], start: date | None = None, end: date | None = None) -> None:
+        """
+        Invalida, em todos os workers, as semanas do calendário das entidades (kind, entity_id) no período
+        """
+        self.publish(TOPIC_CALENDAR, [
+            {
+                "kind": kind,
+                "entity_id": str(entity_id),
+                "start": start.isoformat() if start else None,
+                "end": end.isoformat() if end else None
+            }
+            for kind, entity_id in entities
+        ])
+
+
+    def clear_calendar(self) -> None:
+        """
+        Descarta, em todos os workers, todo o cache do calendário
+        """
+        self.publish(TOPIC_CALENDAR, [{}])
+
+
+class PostgresBus(LocalBus):
+    """
+    Barramento entre workers por LISTEN/NOTIFY do PostgreSQL (driver psycopg2)
+
+    As mudanças são aplicadas na hora no worker que as publicou (o próximo GET no mesmo worker já as vê) e
+    enfileiradas para os demais. Cada worker escuta o canal por uma conexão própria, fora do pool, em uma
+    thread, que também envia as mudanças enfileiradas com pg_notify: a publicação, chamada pelos casos de uso
+    no loop do servidor, não faz I/O nem ocupa conexões do pool. As notificações do próprio worker são
+    ignoradas pela origem. Após perder a conexão o cache do calendário é descartado, já que notificações
+    podem ter se perdido; as mudanças ainda na fila são enviadas após reconectar.
+    """
+    def __init__(
+        self,
+        engine: Engine,
+        channel: str = EVENTS_BUS_CHANNEL,
+        handlers: dict[str, Callable[[dict], None]] = HANDLERS,
+        poll_seconds: float = EVENTS_BUS_POLL_SECONDS,
+        retry_seconds: float = EVENTS_BUS_RETRY_SECONDS,
+        queue_size: int = EVENTS_BUS_QUEUE_SIZE
+    ):
+        super().__init__(handlers)
+        self.engine = engine
+        self.channel = channel
+        self.poll_seconds = poll_seconds
+        self.retry_seconds = retry_seconds
+        self.origin = uuid4().hex
+        self._lock = Lock()
+        self._stop = ThreadEvent()
+        self._thread: Thread | None = None
+        self._pending: deque[str] = deque(maxlen=queue_size)
+        self._pending_lock = Lock()
+        self._wakeup, self._waker = socketpair() # Acorda a thread, parada no select, quando há envios
+
+        self._wakeup.setblocking(False)
+        self._waker.setblocking(False)
+
+
+    def start(self) -> None:
+        """
+        Inicia a thread que escuta as notificações dos demais workers
+        """
+        with self._lock:
+
+            if self._thread is not None:
+                return
+
+            self._stop.clear()
+            self._thread = Thread(target=self._listen, name="events-bus", daemon=True)
+            self._thread.start()
+
+
+    def stop(self) -> None:
+
+        with self._lock:
+
+            self._stop.set()
+            self._wake()
+
+            if self._thread is not None:
+                self._thread.join(timeout=self.poll_seconds + 1)
+
+            self._thread = None
+
+
+    def has_subscribers(self) -> bool:
+        return True # As assinaturas podem estar em outros workers
+
+
+    def publish(self, topic: str, payloads: list[dict]) -> None:
+        """
+        Aplica as mudanças no worker atual e as enfileira para o envio aos demais por NOTIFY
+
+        Mudanças que não cabem no limite do NOTIFY ficam só no worker atual (os demais as veem pelo TTL do
+        cache ou pela próxima busca dos clientes). O envio é feito pela thread do barramento, e suas falhas
+        não afetam a alteração já confirmada.
+        """
+        self.dispatch(topic, payloads)
+
+        messages = []
+
+        for payload in payloads:
+
+            message = dumps({"origin": self.origin, "topic": topic, "payload": payload}, separators=(",", ":"))
+
+            if len(message.encode()) > NOTIFY_PAYLOAD_LIMIT:
+                logger.warning("Mudança %s grande demais para o NOTIFY, aplicada só neste worker", topic)
+                continue
+
+            messages.append(message)
+
+        if not messages:
+            return
+
+        with self._pending_lock:
+
+            if len(self._pending) + len(messages) > self._pending.maxlen:
+                logger.warning("Fila do barramento cheia, mudanças mais antigas descartadas")
+
+            self._pending.extend(messages)
+
+        self._wake()
+
+
+    def receive(self, message: str) -> None:
+        """
+        Aplica uma mudança recebida de outro worker
+        """
+        try:
+            message = loads(message)
+
+        except ValueError:
+            logger.warning("Notificação inválida no canal %s", self.channel)
+            return
+
+        if message.get("origin") == self.origin or message.get("topic") not in self.handlers:
+            return
+
+        self.dispatch(message["topic"], [message.get("payload", {})])
+
+
+    def _wake(self) -> None:
+
+        try:
+            self._waker.send(b"\0")
+
+        except OSError:
+            pass # Buffer cheio: a thread já tem um aviso pendente
+
+
+    def _send_pending(self, listener) -> None:
+        """
+        Envia aos demais workers as mudanças enfileiradas, pela conexão dedicada (em autocommit)
+        """
+        with listener.cursor() as cursor:
+
+            while True:
+
+                with self._pending_lock:
+
+                    if not self._pending:
+                        return
+
+                    message = self._pending.popleft()
+
+                try:
+                    cursor.execute("SELECT pg_notify(%s, %s)", (self.channel, message))
+
+                except Exception:
+                    with self._pending_lock:
+                        self._pending.appendleft(message) # Reenviada após reconectar
+
+                    raise
+
+
+    def _listen(self) -> None:
+
+        reconnecting = False
+
+        while not self._stop.is_set():
+
+            connection = None
+
+            try:
+                connection = self.engine.raw_connection()
+                connection.detach() # Conexão dedicada, fora do pool
+
+                listener = connection.driver_connection
+                listener.autocommit = True
+
+                with listener.cursor() as cursor:
+                    cursor.execute(f'LISTEN "{self.channel}"')
+
+                if reconnecting:
+                    calendar_cache.clear()
+
+                while not self._stop.is_set():
+
+                    self._send_pending(listener)
+
+                    ready, _, _ = select([listener, self._wakeup], [], [], self.poll_seconds)
+
+                    if self._wakeup in ready:
+                        try:
+                            while self._wakeup.recv(4096):
+                                pass
+                        except BlockingIOError:
+                            pass
+
+                    if listener not in ready:
+                        continue
+
+                    listener.poll()
+
+                    while listener.notifies:
+                        self.receive(listener.notifies.pop(0).payload)
+
+            except Exception:
+                logger.exception("Falha na conexão do barramento de notificações")
+                self._stop.wait(self.retry_seconds)
+
+            finally:
+                reconnecting = True
+
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+
+
+def create_bus(engine: Engine) -> LocalBus:
+    """
+    Barramento adequado ao banco: NOTIFY no PostgreSQL, local nos demais (SQLite e testes)
+    """
+    if engine.dialect.name == "postgresql":
+        return PostgresBus(engine)
+
+    return LocalBus()
+
+
+event_bus = create_bus(engine)
@@ -1,8 +1,24 @@
-from uuid import uuid4
+from os import urandom
+from time import time_ns
+from uuid import UUID
+
+
+def uuid7() -> UUID:
+    """
+    Gera um UUID versão 7 (RFC 9562): 48 bits de timestamp em milissegundos seguidos de 74 bits aleatórios
+
+    Por começarem pelo horário de criação, IDs novos entram no fim dos índices, em vez de em páginas aleatórias.
+    """
+    value = (time_ns() // 1_000_000 & (1 << 48) - 1) << 80 | int.from_bytes(urandom(10), "big")
+
+    value = value & ~(0xF << 76) | 0x7 << 76 # Versão 7
+    value = value & ~(0x3 << 62) | 0x2 << 62 # Variante RFC 4122
+
+    return UUID(int=value)
 
 
 def id_generate() -> str:
     """
-    Generate a random ID
+    Generate a random, time-ordered ID (UUIDv7)
     """
-    return str(uuid4())
\ No newline at end of file
+    return str(uuid7())
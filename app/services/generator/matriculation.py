@@ -1,55 +1,188 @@
+from asyncio import get_running_loop
 from datetime import datetime
-from os.path import (
-    abspath,
-    dirname,
-    join
+from threading import Lock
+from decouple import config
+from sqlalchemy import (
+    Engine,
+    func,
+    insert,
+    select,
+    update
+)
+from sqlalchemy.exc import IntegrityError
+
+
+from database.connection import engine
+from database.models import (
+    ChildModel,
+    MatriculationSequenceModel
 )
 
 
-FILE = "sequence.txt"
-FILE_PATH = join(dirname(abspath(__file__)), FILE) 
 MATRICULATION_LENGTH = 11
+MATRICULATION_BLOCK_SIZE = config('MATRICULATION_BLOCK_SIZE', default=50, cast=int)
 
 
-def matriculation_generate() -> str:
+def format_matriculation(year: int, number: int) -> str:
     """
-    Gera uma matrícula aleatória.
+    Monta a matrícula a partir do ano e do número de sequência
 
-    A matrícula é composta por Ano e número de sequência de tamanho 7
+    Exemplo: (2024, 1) -> 20240000001
+    """
+    year = str(year)
 
-    Exemplo: 20240000001
+    return f"{year}{str(number).zfill(MATRICULATION_LENGTH - len(year))}"
+
+
+class MatriculationAllocator:
     """
-    # Gera 6 dígitos aleatórios
+    Distribui números de matrícula reservando blocos no banco de dados
+
+    Cada processo reserva `block_size` números de uma vez, com um UPDATE atômico no contador do ano
+    (tabela matriculation_sequence), e entrega os números do bloco sem voltar ao banco. Processos
+    diferentes nunca recebem o mesmo número; números de um bloco não usado até o fim (ex: reinício
+    do worker) são descartados, gerando lacunas na sequência.
+
+    A sequência recomeça a cada ano.
+
+    A reserva é feita em uma transação própria, e não na da requisição: o bloco fica em cache e é usado por
+    outras requisições, então não pode ser desfeito por um rollback. Nas rotas assíncronas as matrículas são
+    geradas por allocate_async, em uma thread, antes de a requisição abrir a sua transação, para que a
+    reserva no banco não bloqueie o event loop.
+    """
+    def __init__(self, engine: Engine, block_size: int = MATRICULATION_BLOCK_SIZE):
+        self.engine = engine
+        self.block_size = block_size
+        self._lock = Lock()
+        self._year = None
+        self._next = 1
+        self._end = 0
+
+
+    def allocate(self, n: int = 1, year: int | None = None) -> list[str]:
+        """
+        Gera `n` matrículas novas
+
+        - Args:
+            - n: Quantidade de matrículas.
+            - year: Ano das matrículas. Por padrão, o ano atual.
+
+        - Returns:
+            - list[str]: Matrículas em ordem crescente.
+        """
+        if n < 1:
+            return []
+
+        year = year or datetime.now().year
+
+        with self._lock:
+
+            if year != self._year: # Virada de ano: o bloco em cache pertence ao ano anterior
+                self._year = year
+                self._next = 1
+                self._end = 0
+
+            taken = min(self._end - self._next + 1, n)
+
+            numbers = list(range(self._next, self._next + taken))
+
+            self._next += taken
+
+            missing = n - taken
+
+            if missing:
+
+                size = max(self.block_size, missing)
+
+                last = self._reserve(year, size)
 
-    try:
-        with open(FILE_PATH, 'r') as f:
-            last_sequence = f.read().strip()
-            if len(last_sequence) > 0:
-                last_sequence = last_sequence
-            else:
-                last_sequence = '0'
+                first = last - size + 1
 
-    except FileNotFoundError:
+                numbers += range(first, first + missing)
 
-        last_sequence = '0'
+                self._next = first + missing
+                self._end = last
 
-        
-    year = str(datetime.now().year)
+        return [format_matriculation(year, number) for number in numbers]
 
-    matriculation = year
 
-    idx = int(last_sequence) + 1
+    async def allocate_async(self, n: int = 1, year: int | None = None) -> list[str]:
+        """
+        Versão de allocate executada em uma thread, sem bloquear o event loop quando um bloco é reservado
+        """
+        return await get_running_loop().run_in_executor(None, self.allocate, n, year)
 
-    last_sequence = str(idx)
 
-    while (len(matriculation) + len(last_sequence)) < MATRICULATION_LENGTH:
+    def _reserve(self, year: int, size: int) -> int:
+        """
+        Reserva `size` números no contador do ano e retorna o último número reservado
+        """
+        for _ in range(2):
 
-        last_sequence = f"0{last_sequence}"
+            with self.engine.begin() as connection:
 
-    matriculation = f"{matriculation}{last_sequence}"
+                last = connection.scalar(
+                    update(MatriculationSequenceModel)
+                    .where(MatriculationSequenceModel.year == year)
+                    .values(last_value=MatriculationSequenceModel.last_value + size)
+                    .returning(MatriculationSequenceModel.last_value)
+                )
 
+            if last is not None:
+                return last
 
-    with open(FILE_PATH, 'w') as f:
-        f.write(str(idx))
+            self._create_year(year)
 
-    return matriculation
\ No newline at end of file
+        raise RuntimeError(f"Não foi possível reservar matrículas para {year}")
+
+
+    def _create_year(self, year: int) -> None:
+        """
+        Cria o contador do ano, partindo da maior matrícula já cadastrada nele
+        """
+        try:
+            with self.engine.begin() as connection:
+
+                last_matriculation = connection.scalar(
+                    select(func.max(ChildModel.matriculation))
+                    .where(ChildModel.matriculation.like(f"{year}%"))
+                )
+
+                start = int(last_matriculation[len(str(year)):]) if last_matriculation else 0
+
+                connection.execute(
+                    insert(MatriculationSequenceModel).values(year=year, last_value=start)
+                )
+
+        except IntegrityError: # Outro processo criou o contador primeiro
+            pass
+
+
+allocator = MatriculationAllocator(engine)
+
+
+def matriculation_generate() -> str:
+    """
+    Gera uma nova matrícula.
+
+    A matrícula é composta por Ano e número de sequência de tamanho 7
+
+    Exemplo: 20240000001
+    """
+    return allocator.allocate(1)[0]
+
+
+def matriculation_allocate(n: int) -> list[str]:
+    """
+    Gera `n` matrículas de uma vez, para matrículas em massa
+    """
+    return allocator.allocate(n)
+
+
+async def matriculation_allocate_async(n: int) -> list[str]:
+    """
+    Versão de matriculation_allocate para as rotas assíncronas, gerada fora do event loop
+
+    Matrículas geradas e não usadas (ex: registro recusado) são descartadas, como as de um bloco não usado.
+    """
+    return await allocator.allocate_async(n)
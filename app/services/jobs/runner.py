@@ -0,0 +1,231 @@
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed
+)
+from datetime import (
+    datetime,
+    timedelta
+)
+from json import loads
+from multiprocessing import get_context
+from os import (
+    cpu_count,
+    makedirs,
+    replace
+)
+from os.path import join
+from shutil import rmtree
+from tempfile import gettempdir
+from threading import Lock
+from zipfile import (
+    ZIP_DEFLATED,
+    ZipFile
+)
+from decouple import config
+from sqlalchemy import select
+from sqlalchemy.orm import (
+    Session,
+    sessionmaker
+)
+
+
+from constants.job import (
+    JOB_KIND_REPORT_CARDS,
+    REPORT_CARDS_CHUNK_SIZE
+)
+from database.connection import Session as SessionLocal
+from database.models import ClassModel
+from database.repositories.job import JobRepository
+from database.repositories.note import NoteRepository
+from services.report.report_card import (
+    render_report_cards,
+    report_card_filename
+)
+
+
+# Diretório onde ficam os arquivos gerados pelas tarefas
+JOBS_DIR = config('JOBS_DIR', default=join(gettempdir(), 'smeif-jobs'))
+
+# Pool onde os arquivos são gerados, fora do processo da API
+JOB_POOL = config('JOB_POOL', default='process')  # process | thread
+JOB_POOL_WORKERS = config('JOB_POOL_WORKERS', default=cpu_count() or 1, cast=int)
+
+# Tarefas em execução sem atualização por mais tempo que isso voltam para a fila ao iniciar a API
+JOB_STALE_SECONDS = config('JOB_STALE_SECONDS', default=600, cast=int)
+
+
+class JobRunner:
+    """
+    Executa as tarefas da tabela job em segundo plano, dentro do próprio processo da API
+
+    Uma thread despacha as tarefas, uma por vez e na ordem de criação; cada tarefa divide o trabalho em
+    lotes executados em paralelo no pool de processos. A situação e o andamento ficam no banco, então
+    qualquer worker da API responde às consultas e uma tarefa interrompida é retomada por resume().
+    """
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        directory: str = JOBS_DIR,
+        pool: str = JOB_POOL,
+        workers: int = JOB_POOL_WORKERS
+    ):
+        self.session_factory = session_factory
+        self.directory = directory
+        self.pool = pool
+        self.workers = workers
+        self._lock = Lock()
+        self._dispatcher: ThreadPoolExecutor | None = None
+        self._executor: Executor | None = None
+
+
+    def submit(self, job_id: str) -> Future:
+        """
+        Coloca a tarefa na fila de execução deste processo
+        """
+        with self._lock:
+
+            if self._dispatcher is None:
+                self._dispatcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jobs")
+
+            return self._dispatcher.submit(self.run, job_id)
+
+
+    def resume(self) -> None:
+        """
+        Devolve à fila as tarefas interrompidas e agenda todas as tarefas pendentes
+        """
+        with self.session_factory() as session:
+
+            repository = JobRepository(session)
+
+            repository.reset_stale(datetime.now() - timedelta(seconds=JOB_STALE_SECONDS))
+
+            job_ids = repository.get_pending_ids()
+
+        for job_id in job_ids:
+            self.submit(job_id)
+
+
+    def run(self, job_id: str) -> None:
+        """
+        Executa a tarefa, se nenhum outro processo a tiver reservado, registrando o resultado ou a falha
+        """
+        with self.session_factory() as session:
+
+            repository = JobRepository(session)
+
+            if not repository.claim(job_id):
+                return
+
+            job = repository.get(job_id)
+
+            try:
+                handler = self.HANDLERS[job.kind]
+
+                result_path = handler(self, session, job_id, loads(job.params))
+
+                repository.finish(job_id, result_path)
+
+            except Exception as e:
+                session.rollback()
+                repository.fail(job_id, str(e) or e.__class__.__name__)
+
+
+    def run_report_cards(self, session: Session, job_id: str, params: dict) -> str:
+        """
+        Gera os boletins em PDF (um por aluno e turma) e os reúne em um arquivo zip
+
+        As médias vêm de uma única consulta agregada (NoteRepository.get_report_card_rows) e os PDFs são
+        gerados em lotes de REPORT_CARDS_CHUNK_SIZE nos processos do pool.
+
+        - Returns:
+            - str: Caminho do arquivo zip com os boletins.
+        """
+        repository = JobRepository(session)
+        note_repository = NoteRepository(session)
+
+        cards = note_repository.map_rows_to_report_cards(
+            note_repository.get_report_card_rows(params.get("class_id"))
+        )
+
+        class_names = {
+            str(id): f"{name} {section}"
+            for id, name, section in session.execute(
+                select(ClassModel.id, ClassModel.name, ClassModel.section)
+                .where(ClassModel.id.in_({card.class_id for card in cards}))
+            )
+        }
+
+        cards = [dict(card.model_dump(), class_name=class_names[card.class_id]) for card in cards]
+
+        repository.set_progress(job_id, 0, total=len(cards))
+
+        directory = join(self.directory, str(job_id))
+
+        makedirs(directory, exist_ok=True)
+
+        chunks = [cards[i:i + REPORT_CARDS_CHUNK_SIZE] for i in range(0, len(cards), REPORT_CARDS_CHUNK_SIZE)]
+
+        futures = [self.get_executor().submit(render_report_cards, directory, chunk) for chunk in chunks]
+
+        done = 0
+
+        for future in as_completed(futures):
+            done += future.result()
+            repository.set_progress(job_id, done)
+
+        result_path = join(self.directory, f"{job_id}.zip")
+
+        with ZipFile(f"{result_path}.tmp", "w", ZIP_DEFLATED) as archive:
+            for card in cards:
+                filename = report_card_filename(card)
+                archive.write(join(directory, filename), filename)
+
+        replace(f"{result_path}.tmp", result_path)
+
+        rmtree(directory, ignore_errors=True)
+
+        return result_path
+
+
+    HANDLERS = {
+        JOB_KIND_REPORT_CARDS: run_report_cards,
+    }
+
+
+    def get_executor(self) -> Executor:
+        """
+        Retorna o pool onde os lotes são executados, criando-o no primeiro uso
+        """
+        with self._lock:
+
+            if self._executor is None:
+
+                if self.pool == 'thread':
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="jobs-worker")
+
+                else:
+                    # spawn: o processo da API já tem threads (barramento, envios, limpeza) e conexões abertas
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=get_context("spawn"))
+
+            return self._executor
+
+
+    def shutdown(self) -> None:
+        """
+        Encerra a thread de despacho e o pool. Tarefas interrompidas voltam à fila no próximo resume()
+        """
+        with self._lock:
+
+            for executor in (self._dispatcher, self._executor):
+                if executor is not None:
+                    executor.shutdown(wait=False, cancel_futures=True)
+
+            self._dispatcher = None
+            self._executor = None
+
+
+job_runner = JobRunner(SessionLocal)
@@ -0,0 +1,80 @@
+"""
+Gerador mínimo de PDFs de texto (A4, fonte Courier), sem dependências externas
+
+Suficiente para documentos tabulares simples como os boletins: a fonte monoespaçada mantém as colunas
+alinhadas com espaços. Textos em português são gravados com a
+codificação WinAnsi (cp1252), que cobre a acentuação do idioma.
+"""
+PAGE_WIDTH = 595
+PAGE_HEIGHT = 842
+MARGIN = 50
+FONT_SIZE = 10
+LEADING = 14
+LINES_PER_PAGE = (PAGE_HEIGHT - 2 * MARGIN) // LEADING
+
+
+def escape_text(text: str) -> bytes:
+    """
+    Codifica uma linha como string literal de PDF
+    """
+    text = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    return text.encode("cp1252", errors="replace")
+
+
+def page_content(lines: list[str]) -> bytes:
+    """
+    Monta o fluxo de conteúdo de uma página com as linhas informadas, de cima para baixo
+    """
+    content = b"BT /F1 %d Tf %d TL %d %d Td " % (FONT_SIZE, LEADING, MARGIN, PAGE_HEIGHT - MARGIN)
+
+    content += b"".join(b"(" + escape_text(line) + b") Tj T* " for line in lines)
+
+    return content + b"ET"
+
+
+def render_pdf(lines: list[str]) -> bytes:
+    """
+    Gera um PDF com as linhas de texto, quebrando as páginas a cada LINES_PER_PAGE linhas
+
+    - Args:
+        - lines: Linhas do documento.
+
+    - Returns:
+        - bytes: Conteúdo do arquivo PDF.
+    """
+    pages = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+
+    # 1: catálogo, 2: árvore de páginas, 3: fonte e, para cada página, o objeto da página e o seu conteúdo
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % id for id in page_ids), len(pages)),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier /Encoding /WinAnsiEncoding >>",
+    ]
+
+    for page_id, page in zip(page_ids, pages):
+
+        content = page_content(page)
+
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+            % (PAGE_WIDTH, PAGE_HEIGHT, page_id + 1)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+
+    output = b"%PDF-1.4\n"
+    offsets = []
+
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+    xref = len(output)
+
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+    return output
@@ -0,0 +1,78 @@
+from os.path import join
+
+
+from constants.note import SEMESTERS
+from services.report.pdf import render_pdf
+from utils.format import format_cpf
+
+
+def report_card_filename(card: dict) -> str:
+    """
+    Nome do arquivo do boletim dentro do pacote da tarefa (turma e CPF identificam o boletim)
+    """
+    return f"{card['class_id']}_{card['child_cpf']}.pdf"
+
+
+def report_card_lines(card: dict) -> list[str]:
+    """
+    Monta as linhas do boletim impresso a partir de um ReportCardResponse (em dicionário) e do nome da turma
+
+    - Args:
+        - card: ReportCardResponse.model_dump() com a chave extra class_name.
+
+    - Returns:
+        - list[str]: Linhas do documento, com as colunas alinhadas para fonte monoespaçada.
+    """
+    header = f"{'Disciplina':<28}" + "".join(f"{f'{semester}º Sem':>9}" for semester in SEMESTERS) + f"{'Média':>8}  Situação"
+
+    lines = [
+        "BOLETIM ESCOLAR",
+        "",
+        f"Aluno: {card['student_name']}",
+        f"CPF: {format_cpf(card['child_cpf'])}",
+        f"Turma: {card['class_name']}",
+        "",
+        header,
+        "-" * len(header),
+    ]
+
+    for discipline in card["disciplines"]:
+
+        averages = {semester["semester"]: semester["average"] for semester in discipline["semesters"]}
+
+        lines.append(
+            f"{discipline['discipline_name'][:27]:<28}"
+            + "".join(f"{averages[semester]:>9.2f}" if semester in averages else f"{'-':>9}" for semester in SEMESTERS)
+            + f"{discipline['average']:>8.2f}  {'Aprovado' if discipline['approved'] else 'Reprovado'}"
+        )
+
+    lines += [
+        "-" * len(header),
+        f"Média geral: {card['average']:.2f}",
+        f"Classificação na turma: {card['ranking']}º",
+        f"Situação: {'Aprovado' if card['approved'] else 'Reprovado'}",
+    ]
+
+    return lines
+
+
+def render_report_cards(directory: str, cards: list[dict]) -> int:
+    """
+    Gera os PDFs de um lote de boletins no diretório informado
+
+    Executada nos processos do pool de tarefas: recebe apenas dados simples e grava os arquivos
+    diretamente, sem devolver o conteúdo ao processo principal.
+
+    - Args:
+        - directory: Diretório de saída.
+        - cards: Boletins, no formato de report_card_lines.
+
+    - Returns:
+        - int: Quantidade de boletins gerados.
+    """
+    for card in cards:
+
+        with open(join(directory, report_card_filename(card)), "wb") as file:
+            file.write(render_pdf(report_card_lines(card)))
+
+    return len(cards)
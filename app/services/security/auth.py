@@ -0,0 +1,64 @@
+from typing import Callable
+from fastapi import (
+    Depends,
+    Query
+)
+from fastapi.security import (
+    HTTPAuthorizationCredentials,
+    HTTPBearer
+)
+
+
+from constants.base import ERROR_ACCESS_DENIED
+from services.security.tokens import decode_token
+from utils.messages.error import Unauthorized
+
+
+bearer = HTTPBearer(auto_error=False)
+
+
+def current_user(credentials: HTTPAuthorizationCredentials | None = Depends(bearer)) -> dict:
+    """
+    Dados do usuário logado, lidos do token gerado no login (cabeçalho Authorization: Bearer)
+
+    - Returns:
+        - dict: Conteúdo do token (cpf, name, email, level, ...).
+
+    - Raises:
+        - Unauthorized: Token ausente, inválido ou de uso restrito (encode_scoped_token).
+    """
+    if not credentials:
+        raise Unauthorized(ERROR_ACCESS_DENIED)
+
+    user = decode_token(credentials.credentials)
+
+    if "scope" in user:
+        raise Unauthorized(ERROR_ACCESS_DENIED)
+
+    return user
+
+
+def scoped_user(scope: str) -> Callable[..., dict]:
+    """
+    Dependência que aceita o token do login no cabeçalho ou, no parâmetro token, apenas um token de uso
+    restrito ao escopo informado e com validade (encode_scoped_token)
+    """
+    def dependency(
+        credentials: HTTPAuthorizationCredentials | None = Depends(bearer),
+        token: str | None = Query(
+            default=None,
+            description="Token de uso restrito e curta duração, para clientes que não enviam o cabeçalho Authorization (ex: EventSource)"
+        )
+    ) -> dict:
+
+        if credentials or not token:
+            return current_user(credentials)
+
+        user = decode_token(token) # Tokens expirados são recusados aqui
+
+        if user.get("scope") != scope or "exp" not in user:
+            raise Unauthorized(ERROR_ACCESS_DENIED)
+
+        return user
+
+    return dependency
@@ -1,16 +1,70 @@
+from asyncio import get_running_loop
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor
+)
+from multiprocessing import get_context
+from os import cpu_count
+from decouple import config
 from passlib.context import CryptContext
+from passlib.registry import get_crypt_handler
 
 
-crypt_context = CryptContext(schemes=['sha256_crypt'])
+# Esquema e custo do hash. Hashes antigos continuam válidos e são refeitos no próximo login
+PASSWORD_SCHEME = config('PASSWORD_SCHEME', default='sha256_crypt')
+PASSWORD_ROUNDS = config('PASSWORD_ROUNDS', default=0, cast=int)  # 0 usa o padrão do passlib
+
+# Pool onde os hashes são calculados, fora do event loop (por worker da API). Processos (criados com spawn, sem
+# herdar as threads do worker) por padrão: o sha256_crypt usa o crypt do sistema, que segura o GIL. Threads só
+# valem para esquemas que liberam o GIL, como bcrypt e argon2
+PASSWORD_POOL = config('PASSWORD_POOL', default='process')  # process | thread
+PASSWORD_POOL_WORKERS = config('PASSWORD_POOL_WORKERS', default=min(4, cpu_count() or 1), cast=int)
+
+
+def build_crypt_context(scheme: str, rounds: int = 0) -> CryptContext:
+    """
+    Cria o contexto de hash com o esquema padrão e os esquemas antigos marcados como obsoletos
+
+    - Args:
+        - scheme: Esquema usado nos novos hashes (ex: sha256_crypt, bcrypt, argon2).
+        - rounds: Quantidade de rounds do esquema. 0 usa o padrão do passlib.
+
+    - Returns:
+        - CryptContext: Contexto que aponta como obsoleto todo hash fora do esquema e custo atuais.
+    """
+    schemes = list(dict.fromkeys([scheme, 'sha256_crypt']))
+
+    handler = get_crypt_handler(scheme)
+
+    settings = {}
+
+    if "rounds" in handler.setting_kwds:
+
+        rounds = rounds or handler.default_rounds
+
+        # Fixar mínimo e máximo faz qualquer hash com outro custo ser refeito no login
+        settings = {
+            f"{scheme}__default_rounds": rounds,
+            f"{scheme}__min_rounds": rounds,
+            f"{scheme}__max_rounds": rounds,
+        }
+
+    return CryptContext(schemes=schemes, deprecated="auto", **settings)
+
+
+crypt_context = build_crypt_context(PASSWORD_SCHEME, PASSWORD_ROUNDS)
+
+_executor: Executor | None = None
 
 
 def protect(value: str) -> str:
     """
     Codifica (hashea) um valor
-    
+
     - Args:
         - value: O valor a ser hasheado.
-    
+
     - Returns:
         - str: O valor hasheado.
     """
@@ -19,12 +73,68 @@ def protect(value: str) -> str:
 def verify(value: str, hashed_value: str) -> bool:
     """
     Verifica se um valor corresponde ao hash fornecido.
-    
+
     - Args:
         - value: O valor original.
         - hashed_value: O valor hasheado.
-    
+
     - Returns:
         - bool: True se o valor corresponder ao hash, False caso contrário.
     """
-    return crypt_context.verify(value, hashed_value)
\ No newline at end of file
+    return crypt_context.verify(value, hashed_value)
+
+
+def verify_and_update(value: str, hashed_value: str) -> tuple[bool, str | None]:
+    """
+    Verifica um valor e, se o hash estiver com esquema ou custo antigos, gera um novo hash
+
+    - Args:
+        - value: O valor original.
+        - hashed_value: O valor hasheado.
+
+    - Returns:
+        - tuple[bool, str | None]: Se o valor confere e o novo hash a ser salvo (None quando o atual segue válido).
+    """
+    return crypt_context.verify_and_update(value, hashed_value)
+
+
+def get_password_executor() -> Executor:
+    """
+    Retorna o pool limitado usado para calcular hashes, criando-o no primeiro uso
+    """
+    global _executor
+
+    if _executor is None:
+
+        if PASSWORD_POOL == 'thread':
+            _executor = ThreadPoolExecutor(max_workers=PASSWORD_POOL_WORKERS, thread_name_prefix="password")
+
+        else:
+            _executor = ProcessPoolExecutor(max_workers=PASSWORD_POOL_WORKERS, mp_context=get_context("spawn"))
+
+    return _executor
+
+
+def shutdown_password_executor() -> None:
+    """
+    Encerra o pool de hashes, se ele tiver sido criado
+    """
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def protect_async(value: str) -> str:
+    """
+    Versão de protect que calcula o hash no pool, sem bloquear o event loop
+    """
+    return await get_running_loop().run_in_executor(get_password_executor(), protect, value)
+
+
+async def verify_and_update_async(value: str, hashed_value: str) -> tuple[bool, str | None]:
+    """
+    Versão de verify_and_update que verifica o hash no pool, sem bloquear o event loop
+    """
+    return await get_running_loop().run_in_executor(get_password_executor(), verify_and_update, value, hashed_value)
@@ -1,3 +1,8 @@
+from datetime import (
+    datetime,
+    timedelta,
+    timezone
+)
 from decouple import config
 from fastapi.exceptions import HTTPException
 from jose import jwt, JWTError
@@ -24,6 +29,17 @@ def encode_token(data_token: dict) -> str:
     """
     return jwt.encode(data_token, SECRET_KEY, algorithm=ALGORITHM)
 
+
+def encode_scoped_token(data_token: dict, scope: str, seconds: int) -> str:
+    """
+    Codifica um token de uso restrito (claim scope), que expira em `seconds` segundos
+
+    Usado onde o token precisa ir na URL (ex: EventSource, que não envia o cabeçalho Authorization), para
+    que um token exposto em logs ou proxies não valha como o do login nem por muito tempo.
+    """
+    return encode_token({**data_token, "scope": scope, "exp": datetime.now(timezone.utc) + timedelta(seconds=seconds)})
+
+
     # Funções abaixo foram usadas para teste. Não sei se iremos precisar decodificar o token ainda no backend, mas caso precisemos, teremos a função a baixo
 def decode_token(token: str) -> dict:
     """
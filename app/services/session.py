@@ -1,4 +1,7 @@
-from database.connection import Session
+from database.connection import (
+    AsyncSessionLocal,
+    Session
+)
 
 def db_session():
     try:
@@ -6,4 +9,12 @@ def db_session():
         yield session
 
     finally:
-        session.close()
\ No newline at end of file
+        session.close()
+
+
+async def async_db_session():
+    """
+    Fornece uma AsyncSession por requisição, liberando a conexão ao final sem bloquear o event loop
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
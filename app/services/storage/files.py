@@ -0,0 +1,315 @@
+"""
+Armazenamento dos anexos dos avisos, endereçado pelo conteúdo
+
+Cada arquivo é gravado uma única vez, em `<diretório>/<2 primeiros caracteres do sha256>/<sha256>`: o mesmo anexo
+enviado a vários responsáveis (ou reenviado depois) ocupa o espaço de um arquivo só. O arquivo é copiado em
+blocos para um temporário no mesmo diretório, calculando o hash durante a cópia, e movido para o caminho final
+com uma troca atômica.
+
+Os arquivos não são removidos pelas requisições: um anexo sem avisos pode estar sendo reenviado por outra
+requisição ainda não confirmada. services/storage/sweeper.py remove, em segundo plano, os que nenhum aviso
+usa e que não foram gravados nem reaproveitados (store_file atualiza a data de modificação) há algum tempo.
+"""
+from hashlib import sha256
+from os import (
+    makedirs,
+    remove,
+    replace,
+    utime,
+    walk
+)
+from os.path import (
+    basename,
+    dirname,
+    getmtime,
+    getsize,
+    isfile,
+    join,
+    relpath
+)
+from tempfile import (
+    gettempdir,
+    mkstemp
+)
+from typing import (
+    BinaryIO,
+    Callable,
+    Coroutine,
+    Iterator,
+    NamedTuple
+)
+from urllib.parse import quote
+from decouple import config
+from fastapi import Request
+from fastapi.responses import (
+    FileResponse,
+    Response,
+    StreamingResponse
+)
+from fastapi.routing import APIRoute
+
+
+from constants.warning import (
+    ERROR_WARNING_FILE_TOO_LARGE,
+    ERROR_WARNING_INVALID_RANGE,
+    WARNING_FILE_CHUNK_SIZE
+)
+from utils.messages.error import (
+    PayloadTooLarge,
+    RangeNotSatisfiable
+)
+
+
+# Diretório dos anexos
+WARNING_FILES_DIR = config('WARNING_FILES_DIR', default=join(gettempdir(), 'smeif-files'))
+
+# Tamanho máximo de um anexo, em bytes
+WARNING_MAX_FILE_SIZE = config('WARNING_MAX_FILE_SIZE', default=20 * 1024 * 1024, cast=int)
+
+# Folga, em bytes, para os demais campos e cabeçalhos do formulário no limite do corpo da requisição
+WARNING_FORM_OVERHEAD = config('WARNING_FORM_OVERHEAD', default=64 * 1024, cast=int)
+
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+
+class StoredFile(NamedTuple):
+    path: str # Caminho relativo ao diretório dos anexos
+    name: str
+    content_type: str
+    size: int
+
+
+def clean_file_name(name: str | None) -> str:
+    """
+    Nome do arquivo sem diretórios nem caracteres de controle, usado apenas para exibição e download
+    """
+    name = basename((name or "").replace("\\", "/"))
+
+    name = "".join(char for char in name if char.isprintable()).strip()
+
+    return name[:255] or "anexo"
+
+
+class UploadLimitRoute(APIRoute):
+    """
+    Rota que recusa pelo Content-Length, antes de receber o corpo, envios maiores que o anexo permitido
+
+    O FastAPI lê todo o formulário (e grava o anexo em um temporário) antes de resolver as dependências da
+    rota, por isso a verificação fica no handler. Envios sem Content-Length (chunked) são limitados por store_file.
+    """
+    def get_route_handler(self) -> Callable[[Request], Coroutine[None, None, Response]]:
+
+        handler = super().get_route_handler()
+
+        async def limited_handler(request: Request) -> Response:
+
+            length = request.headers.get("content-length", "")
+
+            if length.isdigit() and int(length) > WARNING_MAX_FILE_SIZE + WARNING_FORM_OVERHEAD:
+                raise PayloadTooLarge(ERROR_WARNING_FILE_TOO_LARGE)
+
+            return await handler(request)
+
+        return limited_handler
+
+
+def store_file(
+    source: BinaryIO,
+    name: str | None,
+    content_type: str | None,
+    directory: str = WARNING_FILES_DIR,
+    max_size: int = WARNING_MAX_FILE_SIZE
+) -> StoredFile:
+    """
+    Grava um anexo lendo-o em blocos de WARNING_FILE_CHUNK_SIZE bytes, sem carregá-lo inteiro na memória
+
+    - Args:
+        - source: Arquivo aberto para leitura binária.
+        - name: Nome original do arquivo.
+        - content_type: Tipo do conteúdo informado pelo cliente.
+        - directory: Diretório dos anexos.
+        - max_size: Tamanho máximo, em bytes.
+
+    - Returns:
+        - StoredFile: Caminho relativo (pelo hash do conteúdo), nome, tipo e tamanho do anexo.
+
+    - Raises:
+        - PayloadTooLarge: Anexo maior que max_size.
+    """
+    temporary_dir = join(directory, "tmp")
+
+    makedirs(temporary_dir, exist_ok=True)
+
+    descriptor, temporary_path = mkstemp(dir=temporary_dir)
+
+    try:
+        digest = sha256()
+        size = 0
+
+        with open(descriptor, "wb") as target:
+
+            while chunk := source.read(WARNING_FILE_CHUNK_SIZE):
+
+                size += len(chunk)
+
+                if size > max_size:
+                    raise PayloadTooLarge(ERROR_WARNING_FILE_TOO_LARGE)
+
+                digest.update(chunk)
+                target.write(chunk)
+
+        path = join(digest.hexdigest()[:2], digest.hexdigest())
+
+        if isfile(join(directory, path)):
+            remove(temporary_path) # Conteúdo já armazenado
+            utime(join(directory, path)) # Reaproveitado agora: fica fora da limpeza pelo período de carência
+        else:
+            makedirs(dirname(join(directory, path)), exist_ok=True)
+            replace(temporary_path, join(directory, path))
+
+    except BaseException:
+
+        if isfile(temporary_path):
+            remove(temporary_path)
+
+        raise
+
+    return StoredFile(path, clean_file_name(name), content_type or DEFAULT_CONTENT_TYPE, size)
+
+
+def stale_files(before: float, directory: str = WARNING_FILES_DIR) -> Iterator[str]:
+    """
+    Caminhos relativos dos anexos armazenados que não foram modificados desde `before` (timestamp)
+
+    Os temporários das gravações em andamento (diretório tmp) ficam de fora.
+    """
+    for root, directories, files in walk(directory):
+
+        if root == directory and "tmp" in directories:
+            directories.remove("tmp")
+
+        for name in files:
+
+            try:
+                if getmtime(join(root, name)) < before:
+                    yield relpath(join(root, name), directory)
+
+            except FileNotFoundError:
+                continue
+
+
+def remove_file(path: str, before: float | None = None, directory: str = WARNING_FILES_DIR) -> bool:
+    """
+    Remove um anexo armazenado, se ele existir e (com `before`) não tiver sido modificado desde então
+
+    - Returns:
+        - bool: Se o arquivo foi removido.
+    """
+    try:
+        if before is not None and getmtime(join(directory, path)) >= before: # Reaproveitado por um novo envio
+            return False
+
+        remove(join(directory, path))
+
+    except FileNotFoundError:
+        return False
+
+    return True
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    Interpreta o cabeçalho Range (um único intervalo de bytes)
+
+    - Args:
+        - header: Valor do cabeçalho (ex: "bytes=0-1023", "bytes=1024-" ou "bytes=-512").
+        - size: Tamanho do arquivo.
+
+    - Returns:
+        - tuple[int, int] | None: Primeiro e último byte (inclusivos), ou None para enviar o arquivo inteiro
+        (sem cabeçalho, unidade diferente de bytes ou vários intervalos).
+
+    - Raises:
+        - RangeNotSatisfiable: Intervalo fora do arquivo ou mal formado.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+
+    start, _, end = header[len("bytes="):].strip().partition("-")
+
+    try:
+        if not start:
+            first, last = max(size - int(end), 0), size - 1
+        else:
+            first, last = int(start), min(int(end), size - 1) if end else size - 1
+
+    except ValueError:
+        raise RangeNotSatisfiable(ERROR_WARNING_INVALID_RANGE, size)
+
+    if first < 0 or first > last:
+        raise RangeNotSatisfiable(ERROR_WARNING_INVALID_RANGE, size)
+
+    return first, last
+
+
+def read_range(path: str, first: int, last: int) -> Iterator[bytes]:
+    """
+    Lê em blocos apenas os bytes de `first` a `last` (inclusivos) do arquivo
+    """
+    with open(path, "rb") as source:
+
+        source.seek(first)
+        remaining = last - first + 1
+
+        while remaining > 0 and (chunk := source.read(min(WARNING_FILE_CHUNK_SIZE, remaining))):
+            remaining -= len(chunk)
+            yield chunk
+
+
+def file_response(
+    path: str,
+    name: str,
+    content_type: str,
+    range_header: str | None = None,
+    directory: str = WARNING_FILES_DIR
+) -> Response:
+    """
+    Resposta de download de um anexo, com suporte a Range
+
+    O arquivo inteiro é enviado por FileResponse, que usa a extensão pathsend do servidor ASGI quando
+    disponível (o servidor envia o arquivo direto do disco). Com Range, apenas o intervalo pedido é lido,
+    em blocos, e a resposta é 206. O ETag é o hash do conteúdo, que nunca muda para o mesmo caminho.
+
+    - Args:
+        - path: Caminho relativo do anexo.
+        - name: Nome do arquivo no download.
+        - content_type: Tipo do conteúdo.
+        - range_header: Valor do cabeçalho Range da requisição.
+        - directory: Diretório dos anexos.
+
+    - Returns:
+        - Response: 200 com o arquivo inteiro ou 206 com o intervalo pedido.
+
+    - Raises:
+        - RangeNotSatisfiable: Intervalo fora do arquivo.
+    """
+    full_path = join(directory, path)
+    size = getsize(full_path)
+
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": f'"{basename(path)}"',
+        "Content-Disposition": f"attachment; filename*=utf-8''{quote(name)}"
+    }
+
+    byte_range = parse_range(range_header, size)
+
+    if byte_range is None:
+        return FileResponse(full_path, media_type=content_type, headers=headers)
+
+    first, last = byte_range
+
+    headers["Content-Range"] = f"bytes {first}-{last}/{size}"
+    headers["Content-Length"] = str(last - first + 1)
+
+    return StreamingResponse(read_range(full_path, first, last), status_code=206, media_type=content_type, headers=headers)
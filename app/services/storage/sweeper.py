@@ -0,0 +1,122 @@
+"""
+Limpeza em segundo plano dos anexos que nenhum aviso usa
+
+Avisos excluídos, ou recusados depois de o anexo ser gravado, deixam o arquivo no disco. Remover o arquivo na
+própria requisição disputaria com um envio do mesmo conteúdo ainda não confirmado (store_file encontra o
+arquivo e descarta a sua cópia), que ficaria apontando para um arquivo inexistente. Por isso cada worker da
+API verifica de tempos em tempos os arquivos não modificados dentro do período de carência e remove os que
+não são usados por nenhum aviso, conferindo de novo a data de modificação logo antes de removê-los.
+"""
+from logging import getLogger
+from threading import (
+    Event,
+    Lock,
+    Thread
+)
+from time import time
+from decouple import config
+from sqlalchemy.orm import sessionmaker
+
+
+from database.connection import Session as SessionLocal
+from database.repositories.warning import WarningRepository
+from services.storage.files import (
+    WARNING_FILES_DIR,
+    remove_file,
+    stale_files
+)
+
+
+# Tempo mínimo desde a gravação (ou o último reaproveitamento) de um anexo antes de ele poder ser removido
+WARNING_FILES_GRACE_SECONDS = config('WARNING_FILES_GRACE_SECONDS', default=3600, cast=int)
+
+# Intervalo entre as limpezas
+WARNING_FILES_SWEEP_SECONDS = config('WARNING_FILES_SWEEP_SECONDS', default=3600, cast=float)
+
+# Arquivos verificados por consulta
+WARNING_FILES_SWEEP_BATCH_SIZE = 500
+
+
+logger = getLogger(__name__)
+
+
+class FileSweeper:
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        directory: str = WARNING_FILES_DIR,
+        grace_seconds: int = WARNING_FILES_GRACE_SECONDS,
+        interval_seconds: float = WARNING_FILES_SWEEP_SECONDS
+    ):
+        self.session_factory = session_factory
+        self.directory = directory
+        self.grace_seconds = grace_seconds
+        self.interval_seconds = interval_seconds
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Thread | None = None
+
+
+    def start(self) -> None:
+
+        with self._lock:
+
+            if self._thread is not None:
+                return
+
+            self._stop.clear()
+            self._thread = Thread(target=self._loop, name="warning-files", daemon=True)
+            self._thread.start()
+
+
+    def _loop(self) -> None:
+
+        while not self._stop.wait(self.interval_seconds):
+
+            try:
+                self.sweep()
+
+            except Exception:
+                logger.exception("Falha ao remover os anexos sem avisos")
+
+
+    def sweep(self) -> int:
+        """
+        Remove os anexos sem avisos que não foram modificados dentro do período de carência
+
+        - Returns:
+            - int: Quantidade de arquivos removidos.
+        """
+        before = time() - self.grace_seconds
+
+        candidates = list(stale_files(before, self.directory))
+
+        removed = 0
+
+        with self.session_factory() as session:
+
+            repository = WarningRepository(session)
+
+            for start in range(0, len(candidates), WARNING_FILES_SWEEP_BATCH_SIZE):
+
+                paths = set(candidates[start:start + WARNING_FILES_SWEEP_BATCH_SIZE])
+
+                for path in paths - repository.get_used_file_paths(paths):
+                    removed += remove_file(path, before, self.directory)
+
+        return removed
+
+
+    def stop(self) -> None:
+
+        with self._lock:
+
+            self._stop.set()
+
+            if self._thread is not None:
+                self._thread.join(timeout=5)
+
+            self._thread = None
+
+
+file_sweeper = FileSweeper(SessionLocal)
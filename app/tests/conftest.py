@@ -1,4 +1,7 @@
-from datetime import datetime
+from datetime import (
+    datetime,
+    time
+)
 from fastapi.testclient import TestClient
 from pytest import fixture
 
@@ -6,6 +9,7 @@ from pytest import fixture
 from database.connection import Session
 from database.mapping.student import map_StudentRequest_to_ChildModel
 from database.models import (
+    AttendanceModel, 
     ChildModel, 
     ChildParentsModel, 
     ClassEventModel, 
@@ -13,7 +17,10 @@ from database.models import (
     ClassStudentModel, 
     ClassTeacherModel, 
     DisciplinesModel, 
+    JobModel, 
     NoteModel, 
+    NotificationModel, 
+    OutboxModel, 
     PresenceModel, 
     RecurrencesModel, 
     TeacherDisciplinesModel, 
@@ -59,10 +66,24 @@ from schemas.user import (
     UserRequest, 
     UserUpdateRequest
 )
+from services.calendar.cache import calendar_cache
 from services.generator.ids import id_generate
+from services.security import password
 from services.security.password import protect
-from utils.format import unformat_date
+from utils.format import (
+    unformat_date,
+    unformat_time
+)
+from utils.schedule import weekday_number
+
+
 
+@fixture(autouse=True, scope="session")
+def password_thread_pool():
+    # Processos criados com spawn herdam o sys.path do pytest, onde tests/inspect.py esconde o módulo inspect
+    password.PASSWORD_POOL = 'thread'
+    yield
+    password.shutdown_password_executor()
 
 
 @fixture
@@ -75,10 +96,14 @@ def db_session():
         session = Session()
 
         session.query(NoteModel).delete()
+        session.query(NotificationModel).delete()
         session.query(WarningModel).delete()
         session.query(ClassStudentModel).delete()
         session.query(ChildParentsModel).delete()
         session.query(ChildModel).delete()
+        session.query(AttendanceModel).delete()
+        session.query(JobModel).delete()
+        session.query(OutboxModel).delete()
         session.query(PresenceModel).delete()
         session.query(ClassEventModel).delete()
         session.query(ClassTeacherModel).delete()
@@ -89,15 +114,21 @@ def db_session():
 
         session.commit()
 
+        calendar_cache.clear()
+
         yield session
 
     finally:
 
         session.query(NoteModel).delete()
+        session.query(NotificationModel).delete()
         session.query(WarningModel).delete()
         session.query(ClassStudentModel).delete()
         session.query(ChildParentsModel).delete()
         session.query(ChildModel).delete()
+        session.query(AttendanceModel).delete()
+        session.query(JobModel).delete()
+        session.query(OutboxModel).delete()
         session.query(PresenceModel).delete()
         session.query(ClassEventModel).delete()
         session.query(ClassTeacherModel).delete()
@@ -108,6 +139,8 @@ def db_session():
 
         session.commit()
 
+        calendar_cache.clear()
+
         session.close()
 
 
@@ -609,7 +642,7 @@ def mock_new_class_on_db(db_session):
         id = id_generate(),
         education_level=EducationLevel.ELEMENTARY.value,
         name="5° Ano",
-        section="A",
+        section="B",
         shift=Shift.MORNING.value,
         max_students=20
     )
@@ -740,9 +773,9 @@ def mock_class_event_on_db(
     recurrence = RecurrencesModel(
         id=id_generate(),
         class_event_id=to_db.id,
-        day_of_week=request.recurrences[0].day_of_week,
-        start_time=request.recurrences[0].start_time,
-        end_time=request.recurrences[0].end_time
+        day_of_week=weekday_number(request.recurrences[0].day_of_week),
+        start_time=unformat_time(request.recurrences[0].start_time),
+        end_time=unformat_time(request.recurrences[0].end_time)
     )
 
     db_session.add(to_db)
@@ -763,9 +796,9 @@ def mock_recurrence_on_db(
     recurrence = RecurrencesModel(
         id=id_generate(),
         class_event_id=mock_class_event_on_db.id,
-        day_of_week=DaysOfWeek.WEDNESDAY.value,
-        start_time="13:00",
-        end_time="14:00"
+        day_of_week=weekday_number(DaysOfWeek.WEDNESDAY),
+        start_time=time(13, 0),
+        end_time=time(14, 0)
     )
 
     db_session.add(recurrence)
@@ -0,0 +1,93 @@
+from os.path import abspath, dirname, join
+from alembic import command
+from alembic.config import Config
+from pytest import fixture
+from sqlalchemy import (
+    create_engine,
+    inspect
+)
+
+
+from database.models import BaseModel
+
+
+ROOT = dirname(dirname(dirname(dirname(abspath(__file__)))))
+
+
+@fixture
+def alembic_config(tmp_path, monkeypatch) -> Config:
+    monkeypatch.setenv("DB_URL_ALEMBIC", f"sqlite:///{tmp_path / 'migrations.db'}")
+
+    config = Config(join(ROOT, "alembic.ini"))
+    config.set_main_option("script_location", join(ROOT, "alembic"))
+
+    return config
+
+
+def test_migrations_upgrade_matches_models(alembic_config, tmp_path):
+    command.upgrade(alembic_config, "head")
+
+    command.check(alembic_config) # Falha se os modelos tiverem mudanças sem migração
+
+    tables = inspect(create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")).get_table_names()
+
+    assert set(BaseModel.metadata.tables) <= set(tables)
+
+
+def test_migrations_downgrade(alembic_config, tmp_path):
+    command.upgrade(alembic_config, "head")
+    command.downgrade(alembic_config, "base")
+
+    tables = inspect(create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")).get_table_names()
+
+    assert tables == ["alembic_version"]
+
+
+def test_migrations_recurrences_native_types(alembic_config, tmp_path):
+    command.upgrade(alembic_config, "f2b8d4e6a913")
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT INTO recurrences (id, class_event_id, day_of_week, start_time, end_time) "
+            "VALUES ('0' || hex(randomblob(15)) || '0', hex(randomblob(16)), 'Quarta', '14:00', '15:30')"
+        )
+
+    command.upgrade(alembic_config, "a9c3e7f1d524")
+
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql(
+            "SELECT day_of_week, start_time, end_time FROM recurrences"
+        ).one() == (3, "14:00:00.000000", "15:30:00.000000")
+
+    command.downgrade(alembic_config, "f2b8d4e6a913")
+
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql(
+            "SELECT day_of_week, start_time, end_time FROM recurrences"
+        ).one() == ("Quarta", "14:00", "15:30")
+
+
+def test_migrations_adopt_create_tables_database(alembic_config, tmp_path):
+    command.upgrade(alembic_config, "a1c3e5f70d21")
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+
+    # Mesmo formato de um banco criado por create_tables() antes das migrações: sem histórico do alembic,
+    # sem o contador de matrículas e já com dados
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP TABLE alembic_version")
+        connection.exec_driver_sql("DROP TABLE matriculation_sequence")
+        connection.exec_driver_sql(
+            "INSERT INTO disciplines (id, name) VALUES ('9b7d5c1e-0f2a-4c3b-8d6e-1a2b3c4d5e6f', 'Matemática')"
+        )
+
+    command.upgrade(alembic_config, "head")
+
+    command.check(alembic_config)
+
+    assert {"matriculation_sequence", "user"} <= set(inspect(engine).get_table_names())
+
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql("SELECT name FROM disciplines").scalar_one() == "Matemática"
@@ -11,6 +11,7 @@ from constants.note import (
 )
 from database.models import NoteModel
 from database.repositories.note import NoteRepository
+from schemas.note import NoteFilters
 from tests.inspect import inspect_notes_model
 
 
@@ -32,6 +33,23 @@ def test_NoteRepository_add_success(
     inspect_notes_model(model, on_db)
 
 
+def test_NoteRepository_add_conflict(
+    db_session: Session,
+    mock_note_on_db,
+    mock_NoteRequest
+):
+    
+    repository = NoteRepository(db_session)
+
+    model = repository.map_request_to_model(mock_NoteRequest)
+
+    with raises(HTTPException) as e:
+        repository.add(model)
+
+    assert e.value.status_code == 409
+    assert e.value.detail == ERROR_NOTE_ALREADY_ADD
+
+
 def test_NoteRepository_get_success(
     db_session: Session,
     mock_note_on_db
@@ -100,6 +118,22 @@ def test_NoteRepository_get_all_success(
     inspect_notes_model(model, on_db[0])
 
 
+def test_NoteRepository_get_all_with_filters(
+    db_session: Session,
+    mock_note_on_db_list
+):
+    repository = NoteRepository(db_session)
+
+    on_db = repository.get_all(NoteFilters(semester=1, aval_number=2))
+
+    assert len(on_db) == 1
+    assert on_db[0].semester == 1
+    assert on_db[0].aval_number == 2
+    assert "child" in on_db[0].__dict__
+    assert "discipline" in on_db[0].__dict__
+    assert "class_" in on_db[0].__dict__
+
+
 
 def test_NoteRepository_update_success(
     db_session: Session,
@@ -0,0 +1,54 @@
+from datetime import datetime
+from sqlalchemy import select
+
+
+from database.models import (
+    AttendanceModel,
+    PresenceModel
+)
+from database.repositories.presence import PresenceRepository
+from schemas.base import PresenceType
+from services.generator.ids import id_generate
+
+
+def attendance(db_session) -> list[tuple]:
+    db_session.expire_all()
+
+    return db_session.execute(
+        select(AttendanceModel.month, AttendanceModel.present, AttendanceModel.absent).order_by(AttendanceModel.month)
+    ).all()
+
+
+def test_PresenceRepository_update_adjusts_attendance(db_session, mock_class_event_on_db, mock_student_on_db):
+
+    repository = PresenceRepository(db_session)
+
+    model = PresenceModel(
+        id=id_generate(),
+        class_event_id=mock_class_event_on_db.id,
+        child_cpf=mock_student_on_db.cpf,
+        type=PresenceType.P.value,
+        start_class=datetime(2021, 3, 1, 8),
+        end_class=datetime(2021, 3, 1, 9)
+    )
+
+    repository.add(model)
+
+    assert [(present, absent) for _, present, absent in attendance(db_session)] == [(1, 0)]
+
+    model.type = PresenceType.F.value
+
+    repository.update(model)
+
+    assert [(present, absent) for _, present, absent in attendance(db_session)] == [(0, 1)]
+
+    model.start_class = datetime(2021, 4, 5, 8) # Muda de mês
+    model.end_class = datetime(2021, 4, 5, 9)
+
+    repository.update(model)
+
+    assert [(present, absent) for _, present, absent in attendance(db_session)] == [(0, 0), (0, 1)]
+
+    repository.update(model) # Sem alterações
+
+    assert [(present, absent) for _, present, absent in attendance(db_session)] == [(0, 0), (0, 1)]
@@ -1,4 +1,12 @@
+from sqlalchemy import select
+
+
 from constants.classes import (
+    ERROR_CLASSES_CALENDAR_INVALID_RANGE,
+    ERROR_CLASSES_CALENDAR_REQUIRED_FILTER,
+    ERROR_CLASSES_EVENTS_ADD_RECURRENCES_CONFLICT,
+    ERROR_CLASSES_EVENTS_SCHEDULE_CONFLICT,
+    ERROR_CLASSES_TIMETABLE_REQUIRED_FILTER,
     MESSAGE_CLASS_ADD_SUCCESS,
     MESSAGE_CLASS_DELETE_SUCCESS,
     MESSAGE_CLASS_EVENT_ADD_SUCCESS,
@@ -6,11 +14,16 @@ from constants.classes import (
     MESSAGE_CLASSES_EVENTS_ADD_RECURRENCES_SUCCESS,
     MESSAGE_CLASSES_EVENTS_DELETE_RECURRENCES_SUCCESS
 )
+from database.mapping.classes import map_RecurrencesModel_to_Recurrences
+from database.models import (
+    ClassEventModel,
+    ClassTeacherModel
+)
 from schemas.classes import (
     ClassEventResponse, 
-    ClassResponse,
-    Recurrences
+    ClassResponse
 )
+from services.generator.ids import id_generate
 from utils.format import format_date
 
 
@@ -43,7 +56,7 @@ def test_route_classes_list(api, mock_class_on_db):
     
         response = api.get("/classes/list")
     
-        data = [ClassResponse(**item) for item in response.json()]
+        data = [ClassResponse(**item) for item in response.json()["items"]]
     
         assert response.status_code == 200
         assert len(data) == 1
@@ -112,7 +125,7 @@ def test_route_classes_list_events(api, mock_class_event_on_db):
     
     response = api.get("/classes/list-events")
     
-    data = [ClassEventResponse(**item) for item in response.json()]
+    data = [ClassEventResponse(**item) for item in response.json()["items"]]
     
     assert response.status_code == 200
     assert len(data) == 1
@@ -159,9 +172,180 @@ def test_route_classes_add_recurrences(api, mock_class_event_on_db, mock_Recurre
 
 def test_route_classes_delete_recurrences(api, mock_class_event_on_db, mock_recurrence_on_db):
 
-    request = [Recurrences(**mock_recurrence_on_db.dict()).dict()]
+    request = [map_RecurrencesModel_to_Recurrences(mock_recurrence_on_db).dict()]
              
     response = api.put(f"/classes/delete-recurrences?class_event_id={mock_class_event_on_db.id}", json=request)
     
     assert response.status_code == 200
-    assert response.json() == {"detail": MESSAGE_CLASSES_EVENTS_DELETE_RECURRENCES_SUCCESS}
\ No newline at end of file
+    assert response.json() == {"detail": MESSAGE_CLASSES_EVENTS_DELETE_RECURRENCES_SUCCESS}
+
+
+def test_route_classes_add_recurrences_overlap(api, mock_class_event_on_db):
+
+    overlapping = [{"day_of_week": "Segunda", "start_time": "08:30", "end_time": "09:30"}]
+
+    response = api.post(f"/classes/add-recurrences?class_event_id={mock_class_event_on_db.id}", json=overlapping)
+
+    assert response.status_code == 409
+    assert response.json() == {"detail": ERROR_CLASSES_EVENTS_ADD_RECURRENCES_CONFLICT}
+
+    adjacent = [{"day_of_week": "Segunda", "start_time": "09:00", "end_time": "10:00"}]
+
+    response = api.post(f"/classes/add-recurrences?class_event_id={mock_class_event_on_db.id}", json=adjacent)
+
+    assert response.status_code == 201
+
+
+def test_route_classes_add_event_teacher_conflict(
+    api,
+    db_session,
+    mock_class_event_on_db,
+    mock_new_class_on_db,
+    mock_teacher_on_db,
+    mock_discipline_on_db
+):
+    teacher = ClassTeacherModel(id=id_generate(), user_cpf=mock_teacher_on_db.cpf, class_id=mock_new_class_on_db.id)
+
+    db_session.add(teacher)
+    db_session.commit()
+
+    request = {
+        "class_id": mock_new_class_on_db.id,
+        "disciplines_id": [mock_discipline_on_db.id],
+        "teacher_id": teacher.id,
+        "start_date": "2021-05-01",
+        "end_date": "2021-12-01",
+        "recurrences": [{"day_of_week": "Segunda", "start_time": "07:30", "end_time": "08:30"}]
+    }
+
+    response = api.post("/classes/add-event", json=request)
+
+    assert response.status_code == 409
+    assert response.json() == {"detail": ERROR_CLASSES_EVENTS_SCHEDULE_CONFLICT}
+
+    request["start_date"] = "2021-07-01" # Depois do fim da aula já cadastrada
+
+    response = api.post("/classes/add-event", json=request)
+
+    assert response.status_code == 201
+
+
+def test_route_classes_update_event_teacher_conflict(
+    api,
+    db_session,
+    mock_class_event_on_db,
+    mock_new_class_on_db,
+    mock_teacher_on_db,
+    mock_discipline_on_db
+):
+    teacher = ClassTeacherModel(id=id_generate(), user_cpf=mock_teacher_on_db.cpf, class_id=mock_new_class_on_db.id)
+
+    db_session.add(teacher)
+    db_session.commit()
+
+    request = {
+        "class_id": mock_new_class_on_db.id,
+        "disciplines_id": [mock_discipline_on_db.id],
+        "teacher_id": teacher.id,
+        "start_date": "2021-07-01", # Depois do fim da aula já cadastrada
+        "end_date": "2021-12-01",
+        "recurrences": [{"day_of_week": "Segunda", "start_time": "07:30", "end_time": "08:30"}]
+    }
+
+    assert api.post("/classes/add-event", json=request).status_code == 201
+
+    class_event_id = db_session.scalar(select(ClassEventModel.id).where(ClassEventModel.teacher_id == teacher.id))
+
+    request["start_date"] = "2021-05-01"
+
+    response = api.put(f"/classes/update-event?class_event_id={class_event_id}", json=request)
+
+    assert response.status_code == 409
+    assert response.json() == {"detail": ERROR_CLASSES_EVENTS_SCHEDULE_CONFLICT}
+
+    request["start_date"] = "2021-08-01" # Os próprios horários da aula não contam como conflito
+
+    response = api.put(f"/classes/update-event?class_event_id={class_event_id}", json=request)
+
+    assert response.status_code == 200
+    assert response.json()["start_date"] == "2021-08-01"
+
+
+def test_route_classes_timetable(api, mock_class_event_on_db, mock_teacher_on_db):
+
+    by_class = api.get(f"/classes/timetable?class_id={mock_class_event_on_db.class_id}").json()
+    by_teacher = api.get(f"/classes/timetable?teacher_cpf={mock_teacher_on_db.cpf}").json()
+
+    assert [day["day_of_week"] for day in by_class][:2] == ["Segunda", "Terça"]
+    assert len(by_class) == 7
+    assert [(slot["start_time"], slot["end_time"]) for slot in by_class[0]["slots"]] == [("08:00", "09:00")]
+    assert by_teacher == by_class
+
+    outside = api.get(f"/classes/timetable?class_id={mock_class_event_on_db.class_id}&on=2022-01-01").json()
+
+    assert outside[0]["slots"] == []
+
+
+def test_route_classes_timetable_required_filter(api):
+
+    response = api.get("/classes/timetable")
+
+    assert response.status_code == 422
+    assert response.json() == {"detail": ERROR_CLASSES_TIMETABLE_REQUIRED_FILTER}
+
+
+def test_route_classes_calendar(api, mock_class_event_on_db, mock_teacher_on_db):
+
+    url = f"/classes/calendar?class_id={mock_class_event_on_db.class_id}&start=2021-03-01&end=2021-03-14"
+
+    response = api.get(url)
+
+    assert response.status_code == 200
+    assert [(item["day"], item["start_time"]) for item in response.json()] == [("2021-03-01", "08:00"), ("2021-03-08", "08:00")]
+    assert api.get(f"/classes/calendar?teacher_cpf={mock_teacher_on_db.cpf}&start=2021-03-01&end=2021-03-14").json() == response.json()
+
+    recurrence = [{"day_of_week": "Quarta", "start_time": "10:00", "end_time": "11:00"}]
+
+    assert api.post(f"/classes/add-recurrences?class_event_id={mock_class_event_on_db.id}", json=recurrence).status_code == 201
+
+    days = [item["day"] for item in api.get(url).json()] # A semana em cache foi invalidada pela nova recorrência
+
+    assert days == ["2021-03-01", "2021-03-03", "2021-03-08", "2021-03-10"]
+
+
+def test_route_classes_calendar_student(api, mock_class_event_on_db, mock_student_on_db):
+
+    response = api.get(f"/classes/calendar?child_cpf={mock_student_on_db.cpf}&start=2021-05-24&end=2021-06-30")
+
+    assert response.status_code == 200
+    assert [item["day"] for item in response.json()] == ["2021-05-24", "2021-05-31"] # A aula termina em 2021-06-01
+
+
+def test_route_classes_calendar_ics(api, mock_class_event_on_db):
+
+    url = f"/classes/calendar?class_id={mock_class_event_on_db.class_id}&start=2021-03-01&end=2021-03-14&format=ics"
+
+    response = api.get(url)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/calendar")
+    assert response.text.startswith("BEGIN:VCALENDAR\r\n")
+    assert response.text.count("BEGIN:VEVENT") == 2
+    assert "DTSTART:20210301T080000\r\n" in response.text
+
+    cached = api.get(url, headers={"If-None-Match": response.headers["ETag"]})
+
+    assert cached.status_code == 304
+
+
+def test_route_classes_calendar_invalid(api):
+
+    response = api.get("/classes/calendar")
+
+    assert response.status_code == 422
+    assert response.json() == {"detail": ERROR_CLASSES_CALENDAR_REQUIRED_FILTER}
+
+    response = api.get("/classes/calendar?teacher_cpf=12345678901&start=2021-03-14&end=2021-03-01")
+
+    assert response.status_code == 422
+    assert response.json() == {"detail": ERROR_CLASSES_CALENDAR_INVALID_RANGE}
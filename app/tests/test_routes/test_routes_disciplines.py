@@ -30,7 +30,8 @@ def test_route_disciplines_list(api, mock_discipline_on_db):
     response = api.get("/disciplines/list")
 
     assert response.status_code == 200
-    assert response.json() == [DisciplineResponse(**mock_discipline_on_db.dict()).dict()]
+    assert response.json()["items"] == [DisciplineResponse(**mock_discipline_on_db.dict()).dict()]
+    assert response.json()["next_cursor"] is None
 
 
 def test_route_disciplines_update(api, mock_discipline_on_db, mock_DisciplineRequest):
@@ -0,0 +1,145 @@
+from asyncio import (
+    create_task,
+    run,
+    sleep,
+    to_thread,
+    wait_for
+)
+from json import loads
+from threading import Thread
+
+
+from constants.base import ERROR_ACCESS_DENIED
+from constants.events import (
+    ERROR_EVENTS_FORBIDDEN_LEVEL,
+    EVENTS_TOKEN_SCOPE
+)
+from schemas.base import (
+    EventAction,
+    EventKind,
+    UserLevel
+)
+from services.events.broker import (
+    Event,
+    EventBroker
+)
+from services.events.bus import event_bus
+from services.security.auth import scoped_user
+from services.security.tokens import (
+    decode_token,
+    encode_scoped_token,
+    encode_token
+)
+from useCases.events import EventsUseCases
+
+
+def test_route_events_stream_requires_token(api):
+    assert api.get('/events/stream').json() == {"detail": ERROR_ACCESS_DENIED}
+    assert api.get('/events/stream', headers={"Authorization": "Bearer invalido"}).status_code == 401
+
+
+def test_route_events_stream_forbidden_level(api):
+    token = encode_token({"cpf": "12345678978", "level": UserLevel.COORDINATION.value})
+
+    for response in (
+        api.get('/events/stream', headers={"Authorization": f"Bearer {token}"}),
+        api.post('/events/token', headers={"Authorization": f"Bearer {token}"})
+    ):
+        assert response.status_code == 403
+        assert response.json() == {"detail": ERROR_EVENTS_FORBIDDEN_LEVEL}
+
+
+def test_route_events_token_only_in_query(api):
+    login = encode_token({"cpf": "12345678901", "level": UserLevel.PARENT.value})
+
+    assert api.get('/events/stream', params={"token": login}).status_code == 401 # Token do login não vai na URL
+
+    response = api.post('/events/token', headers={"Authorization": f"Bearer {login}"})
+
+    assert response.status_code == 200
+
+    token = response.json()["token"]
+
+    assert decode_token(token)["scope"] == EVENTS_TOKEN_SCOPE
+    assert scoped_user(EVENTS_TOKEN_SCOPE)(None, token)["cpf"] == "12345678901"
+
+    assert api.post('/events/token', headers={"Authorization": f"Bearer {token}"}).status_code == 401 # Nem vale como login
+
+    expired = encode_scoped_token({"cpf": "12345678901", "level": UserLevel.PARENT.value}, EVENTS_TOKEN_SCOPE, -1)
+
+    assert api.get('/events/stream', params={"token": expired}).status_code == 401
+
+
+def test_events_note_pushed_to_parent(api, mock_NoteRequest, mock_parent_on_db):
+
+    async def receive():
+        stream = EventsUseCases().stream(mock_parent_on_db.cpf)
+
+        first = create_task(anext(stream))
+
+        await sleep(0.1) # Assinatura criada
+
+        response = await to_thread(api.post, '/note/add', json=mock_NoteRequest.dict())
+
+        try:
+            return response, await wait_for(first, 5)
+        finally:
+            await stream.aclose()
+
+    response, event = run(receive())
+
+    assert response.status_code == 201
+    assert event["event"] == EventKind.NOTE.value
+    assert loads(event["data"])["action"] == EventAction.CREATED.value
+    assert loads(event["data"])["child_cpf"] == mock_NoteRequest.child_cpf
+
+
+def test_events_bounded_queue_resync():
+    broker = EventBroker(queue_size=2)
+
+    async def receive():
+        stream = EventsUseCases(broker).stream("123.456.789-01")
+
+        first = create_task(anext(stream))
+
+        await sleep(0.1)
+
+        def publish():
+            for number in range(3):
+                broker.publish(Event(EventKind.WARNING.value, EventAction.CREATED.value, {"id": str(number)}, frozenset({"12345678901"})))
+
+        publisher = Thread(target=publish) # Publicado por outra thread, como nas requisições
+        publisher.start()
+        publisher.join()
+
+        await sleep(0.1)
+
+        events = [await wait_for(first, 5)] + [await wait_for(anext(stream), 5) for _ in range(2)]
+
+        await stream.aclose()
+
+        return events
+
+    events = run(receive())
+
+    # O evento mais antigo foi descartado para caber o mais novo, e o cliente é avisado antes dos demais
+    assert [(event["event"], loads(event["data"]).get("id")) for event in events] == [
+        (EventKind.RESYNC.value, None),
+        (EventKind.WARNING.value, "1"),
+        (EventKind.WARNING.value, "2")
+    ]
+    assert not broker.has_subscribers()
+
+
+def test_events_publish_failure_keeps_response(api, monkeypatch, mock_NoteRequest, mock_parent_on_db):
+
+    def fail(*args):
+        raise RuntimeError("falha ao buscar os destinatários")
+
+    monkeypatch.setattr(event_bus, "has_subscribers", lambda: True)
+    monkeypatch.setattr("useCases.note.get_children_parents", fail)
+
+    response = api.post('/note/add', json=mock_NoteRequest.dict())
+
+    assert response.status_code == 201 # A nota foi confirmada antes da publicação
+    assert api.get('/note/list', params={"child_cpf": mock_NoteRequest.child_cpf}).json()["items"]
@@ -0,0 +1,92 @@
+from datetime import datetime
+from io import BytesIO
+from time import (
+    monotonic,
+    sleep
+)
+from zipfile import ZipFile
+
+
+from constants.classes import ERROR_CLASSES_GET_NOT_FOUND
+from constants.job import (
+    ERROR_JOB_NOT_FINISHED,
+    ERROR_JOB_NOT_FOUND
+)
+from database.models import JobModel
+from schemas.base import JobStatus
+from services.generator.ids import id_generate
+
+
+def wait_job(api, id: str, timeout: float = 30) -> dict:
+    deadline = monotonic() + timeout
+
+    while True:
+        job = api.get(f'/jobs/{id}').json()
+
+        if job["status"] in (JobStatus.DONE.value, JobStatus.FAILED.value) or monotonic() > deadline:
+            return job
+
+        sleep(0.1)
+
+
+def test_route_job_report_cards(api, mock_NoteRequest):
+    note = mock_NoteRequest.dict()
+
+    api.post('/note/bulk-add', json=[note, dict(note, semester=2, points=5.5)])
+
+    response = api.post('/jobs/report-cards', json={"class_id": note["class_id"]})
+
+    assert response.status_code == 202
+    assert response.json()["status"] in (JobStatus.PENDING.value, JobStatus.RUNNING.value, JobStatus.DONE.value)
+
+    job = wait_job(api, response.json()["id"])
+
+    assert job["status"] == JobStatus.DONE.value
+    assert (job["total"], job["done"]) == (1, 1)
+
+    download = api.get(f'/jobs/{job["id"]}/download')
+
+    assert download.status_code == 200
+
+    with ZipFile(BytesIO(download.content)) as archive:
+        names = archive.namelist()
+        content = archive.read(names[0])
+
+    assert names == [f'{note["class_id"]}_{note["child_cpf"]}.pdf']
+    assert content.startswith(b"%PDF-")
+    assert b"(Situa\xe7\xe3o: Aprovado) Tj" in content
+
+
+def test_route_job_report_cards_class_not_found(api):
+    response = api.post('/jobs/report-cards', json={"class_id": "inexistente"})
+
+    assert response.status_code == 404
+    assert response.json() == {'detail': ERROR_CLASSES_GET_NOT_FOUND}
+
+
+def test_route_job_download_not_finished(api, db_session):
+    job = JobModel(
+        id=id_generate(),
+        kind="report_cards",
+        status=JobStatus.RUNNING.value,
+        params="{}",
+        total=10,
+        done=3,
+        created_at=datetime.now(),
+        updated_at=datetime.now()
+    )
+
+    db_session.add(job)
+    db_session.commit()
+
+    response = api.get(f'/jobs/{job.id}/download')
+
+    assert response.status_code == 409
+    assert response.json() == {'detail': ERROR_JOB_NOT_FINISHED}
+
+
+def test_route_job_not_found(api):
+    response = api.get(f'/jobs/{id_generate()}')
+
+    assert response.status_code == 404
+    assert response.json() == {'detail': ERROR_JOB_NOT_FOUND}
@@ -0,0 +1,16 @@
+from schemas.metrics import PoolMetricsResponse
+
+
+def test_route_metrics_pool(api, mock_discipline_on_db):
+
+    api.get("/disciplines/list")
+
+    response = api.get("/metrics/pool")
+
+    assert response.status_code == 200
+
+    metrics = PoolMetricsResponse(**response.json())
+
+    assert metrics.async_engine.checkouts >= 1
+    assert metrics.async_engine.checked_out == 0
+    assert metrics.engine.size >= 0
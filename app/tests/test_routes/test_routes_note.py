@@ -1,24 +1,92 @@
 
-from database.models import NoteModel
+from json import loads
+
+
+from constants.base import (
+    ERROR_BULK_DUPLICATED_ROW,
+    ERROR_INVALID_CURSOR,
+    NDJSON_MEDIA_TYPE
+)
+from database.mapping.student import map_StudentRequest_to_ChildModel
+from database.models import (
+    NoteModel,
+    NotificationModel
+)
+from constants.classes import ERROR_CLASSES_GET_NOT_FOUND
 from constants.note import (
+    ERROR_NOTE_ALREADY_ADD,
     SUCCESS_NOTE_ADD, 
     SUCCESS_NOTE_DELETE
 )
+from schemas.base import NotificationKind
 from schemas.note import NoteResponse
 from tests.inspect import inspect_note_response_model
 
 
-def test_route_note_add(api, mock_NoteRequest):
+def test_route_note_add(api, db_session, mock_NoteRequest, mock_discipline_on_db):
     response = api.post('/note/add', json=mock_NoteRequest.dict())
 
     assert response.status_code == 201
     assert response.json() == {'detail': SUCCESS_NOTE_ADD}
 
+    notification, = db_session.query(NotificationModel).all() # Uma para o responsável do aluno
+
+    assert (notification.kind, notification.child_cpf) == (NotificationKind.NOTE.value, mock_NoteRequest.child_cpf)
+    assert notification.title == f"Nova nota em {mock_discipline_on_db.name}"
+    assert notification.text == "Nota 7.5 na 1ª avaliação do 1º semestre"
+
+
+def test_route_note_bulk_add(api, mock_NoteRequest, db_session):
+    valid = mock_NoteRequest.dict()
+
+    second = dict(valid, aval_number=2)
+
+    missing_class = dict(valid, class_id="inexistente")
+
+    invalid_points = dict(valid, aval_number=3, points=11)
+
+    rows = [valid, second, dict(valid), missing_class, invalid_points]
+
+    response = api.post('/note/bulk-add', json=rows)
+
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data["created"] == 2
+    assert data["failed"] == 3
+    assert [result["status_code"] for result in data["results"]] == [201, 201, 409, 404, 422]
+    assert data["results"][0]["item"]["points"] == valid["points"]
+    assert data["results"][2]["detail"] == ERROR_BULK_DUPLICATED_ROW
+    assert data["results"][3]["detail"] == ERROR_CLASSES_GET_NOT_FOUND
+    assert db_session.query(NoteModel).count() == 2
+    assert db_session.query(NotificationModel).count() == 2 # Uma por nota cadastrada
+
+    response = api.post('/note/bulk-add', json=[valid])
+
+    assert response.json()["results"][0]["status_code"] == 409
+    assert response.json()["results"][0]["detail"] == ERROR_NOTE_ALREADY_ADD
+
+
+def test_route_note_bulk_add_csv(api, mock_NoteRequest):
+    row = mock_NoteRequest.dict()
+
+    columns = list(row.keys())
+
+    content = ",".join(columns) + "\n" + ",".join(str(row[column]) for column in columns) + "\n"
+
+    response = api.post('/note/bulk-add', content=content, headers={"content-type": "text/csv"})
+
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data["created"] == 1
+    assert data["results"][0]["item"]["semester"] == row["semester"]
+
 
 def test_route_note_get_all(api, mock_note_on_db, db_session):
     response = api.get('/note/list')
 
-    note = NoteResponse(**response.json()[0])
+    note = NoteResponse(**response.json()["items"][0])
 
     assert response.status_code == 200
     inspect_note_response_model(db_session,note, mock_note_on_db)
@@ -28,7 +96,52 @@ def test_route_note_get_all_with_filters(api, mock_note_on_db_list, db_session):
     response = api.get('/note/list?semester=1&aval_number=1')
 
     assert response.status_code == 200
-    assert len(response.json()) == 1
+    assert len(response.json()["items"]) == 1
+
+
+def test_route_note_get_all_paginated(api, mock_note_on_db_list):
+    
+    ids = []
+    cursor = None
+
+    while True:
+
+        url = '/note/list?limit=2' + (f'&cursor={cursor}' if cursor else '')
+
+        response = api.get(url)
+
+        assert response.status_code == 200
+
+        data = response.json()
+
+        assert len(data["items"]) <= 2
+
+        ids += [item["id"] for item in data["items"]]
+
+        cursor = data["next_cursor"]
+
+        if cursor is None:
+            break
+
+    assert ids == sorted(note.id for note in mock_note_on_db_list)
+
+
+def test_route_note_get_all_ndjson(api, mock_note_on_db_list):
+    response = api.get('/note/list?semester=1', headers={'Accept': NDJSON_MEDIA_TYPE})
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith(NDJSON_MEDIA_TYPE)
+
+    notes = [NoteResponse(**loads(line)) for line in response.text.splitlines()]
+
+    assert [note.id for note in notes] == sorted(note.id for note in mock_note_on_db_list if note.semester == 1)
+
+
+def test_route_note_get_all_invalid_cursor(api, mock_note_on_db):
+    response = api.get('/note/list?cursor=invalido')
+
+    assert response.status_code == 400
+    assert response.json() == {'detail': ERROR_INVALID_CURSOR}
 
 
 def test_route_note_update(api, mock_note_on_db, mock_NoteUpdate_points_and_aval_number, db_session):
@@ -46,4 +159,45 @@ def test_route_note_delete(api, mock_note_on_db):
     response = api.delete('/note/delete', params={'note_id': mock_note_on_db.id})
 
     assert response.status_code == 200
-    assert response.json() == {'detail': SUCCESS_NOTE_DELETE}
\ No newline at end of file
+    assert response.json() == {'detail': SUCCESS_NOTE_DELETE}
+
+def test_route_note_report_card(api, db_session, mock_NoteRequest, mock_StudentRequest):
+    db_session.add(map_StudentRequest_to_ChildModel(mock_StudentRequest.model_copy(update={"cpf": "12345678900", "name": "Ana"})))
+    db_session.commit()
+
+    first = mock_NoteRequest.dict()
+
+    rows = [
+        first,
+        dict(first, aval_number=2, points=4.5),
+        dict(first, semester=2, points=3.0),
+        dict(first, child_cpf="12345678900", points=9.0)
+    ]
+
+    api.post('/note/bulk-add', json=rows)
+
+    response = api.get('/note/report-card', params={"class_id": first["class_id"]})
+
+    data = response.json()
+
+    assert response.status_code == 200
+    assert [(card["child_cpf"], card["ranking"], card["approved"]) for card in data] == [
+        ("12345678900", 1, True),
+        (first["child_cpf"], 2, False)
+    ]
+    assert data[1]["average"] == 4.5
+    assert data[1]["disciplines"][0]["semesters"] == [
+        {"semester": 1, "average": 6.0},
+        {"semester": 2, "average": 3.0}
+    ]
+
+    child = api.get('/note/report-card', params={"child_cpf": first["child_cpf"]})
+
+    assert [card["ranking"] for card in child.json()] == [2]
+
+
+def test_route_note_report_card_class_not_found(api):
+    response = api.get('/note/report-card', params={"class_id": "inexistente"})
+
+    assert response.status_code == 404
+    assert response.json() == {'detail': ERROR_CLASSES_GET_NOT_FOUND}
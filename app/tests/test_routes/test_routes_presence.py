@@ -0,0 +1,130 @@
+from constants.classes import ERROR_CLASSES_EVENTS_GET_NOT_FOUND
+from constants.presence import (
+    ERROR_PRESENCE_CHILD_NOT_IN_CLASS,
+    ERROR_PRESENCE_INVALID_RANGE,
+    ERROR_PRESENCE_OUTSIDE_CLASS_EVENT
+)
+from database.models import (
+    AttendanceModel,
+    NotificationModel,
+    PresenceModel
+)
+from schemas.base import NotificationKind
+
+
+def roll_call_data(class_event_id: str, child_cpf: str, type: str = "P", day: str = "2021-03-01") -> dict:
+    return {
+        "class_event_id": class_event_id,
+        "start_class": f"{day}T08:00:00",
+        "end_class": f"{day}T09:00:00",
+        "presences": [{"child_cpf": child_cpf, "type": type}]
+    }
+
+
+def test_route_presence_roll_call(api, db_session, mock_class_event_on_db, mock_student_on_db):
+    data = roll_call_data(mock_class_event_on_db.id, mock_student_on_db.cpf)
+
+    response = api.post('/presence/roll-call', json=data)
+
+    assert response.status_code == 201
+    assert response.json()["present"] == 1
+    assert response.json()["absent"] == 0
+    assert db_session.query(PresenceModel).count() == 1
+
+
+def test_route_presence_roll_call_replace(api, db_session, mock_class_event_on_db, mock_student_on_db, mock_parent_on_db):
+    api.post('/presence/roll-call', json=roll_call_data(mock_class_event_on_db.id, mock_student_on_db.cpf))
+
+    response = api.post('/presence/roll-call', json=roll_call_data(mock_class_event_on_db.id, mock_student_on_db.cpf, type="F"))
+
+    assert response.status_code == 201
+    assert response.json()["absent"] == 1
+    assert [presence.type for presence in db_session.query(PresenceModel).all()] == ["F"]
+
+    api.post('/presence/roll-call', json=roll_call_data(mock_class_event_on_db.id, mock_student_on_db.cpf, type="F"))
+
+    # A chamada corrigida substitui a falta ainda não enviada ao responsável, em vez de repeti-la
+    assert [(model.kind, model.parent_cpf) for model in db_session.query(NotificationModel)] == [
+        (NotificationKind.ABSENCE.value, mock_parent_on_db.cpf)
+    ]
+
+    api.post('/presence/roll-call', json=roll_call_data(mock_class_event_on_db.id, mock_student_on_db.cpf))
+
+    assert db_session.query(NotificationModel).count() == 0
+
+
+def test_route_presence_roll_call_child_not_in_class(api, mock_class_event_on_db, mock_parent_on_db):
+    data = roll_call_data(mock_class_event_on_db.id, mock_parent_on_db.cpf)
+
+    response = api.post('/presence/roll-call', json=data)
+
+    assert response.status_code == 422
+    assert response.json() == {'detail': ERROR_PRESENCE_CHILD_NOT_IN_CLASS}
+
+
+def test_route_presence_roll_call_outside_class_event(api, mock_class_event_on_db, mock_student_on_db):
+    data = roll_call_data(mock_class_event_on_db.id, mock_student_on_db.cpf, day="2022-03-01")
+
+    response = api.post('/presence/roll-call', json=data)
+
+    assert response.status_code == 422
+    assert response.json() == {'detail': ERROR_PRESENCE_OUTSIDE_CLASS_EVENT}
+
+
+def test_route_presence_roll_call_class_event_not_found(api, mock_student_on_db):
+    data = roll_call_data("inexistente", mock_student_on_db.cpf)
+
+    response = api.post('/presence/roll-call', json=data)
+
+    assert response.status_code == 404
+    assert response.json() == {'detail': ERROR_CLASSES_EVENTS_GET_NOT_FOUND}
+
+
+def test_route_presence_child(api, mock_class_event_on_db, mock_student_on_db):
+    api.post('/presence/roll-call', json=roll_call_data(mock_class_event_on_db.id, mock_student_on_db.cpf))
+    api.post('/presence/roll-call', json=roll_call_data(mock_class_event_on_db.id, mock_student_on_db.cpf, type="F", day="2021-04-01"))
+
+    response = api.get('/presence/child', params={"child_cpf": mock_student_on_db.cpf, "start": "2021-03-01", "end": "2021-03-31"})
+
+    assert response.status_code == 200
+    assert [presence["type"] for presence in response.json()] == ["P"]
+
+
+def test_route_presence_child_invalid_range(api, mock_student_on_db):
+    response = api.get('/presence/child', params={"child_cpf": mock_student_on_db.cpf, "start": "2021-03-31", "end": "2021-03-01"})
+
+    assert response.status_code == 422
+    assert response.json() == {'detail': ERROR_PRESENCE_INVALID_RANGE}
+
+
+def test_route_presence_class(api, mock_class_event_on_db, mock_student_on_db):
+    api.post('/presence/roll-call', json=roll_call_data(mock_class_event_on_db.id, mock_student_on_db.cpf))
+    api.post('/presence/roll-call', json=roll_call_data(mock_class_event_on_db.id, mock_student_on_db.cpf, type="F", day="2021-04-01"))
+
+    response = api.get('/presence/class', params={"class_id": mock_class_event_on_db.class_id, "start": "2021-01-01", "end": "2021-06-01"})
+
+    assert response.status_code == 200
+    assert [presence["type"] for presence in response.json()] == ["P", "F"]
+
+
+def test_route_presence_class_attendance(api, db_session, mock_class_event_on_db, mock_student_on_db):
+    api.post('/presence/roll-call', json=roll_call_data(mock_class_event_on_db.id, mock_student_on_db.cpf))
+    api.post('/presence/roll-call', json=roll_call_data(mock_class_event_on_db.id, mock_student_on_db.cpf, day="2021-03-02"))
+    api.post('/presence/roll-call', json=roll_call_data(mock_class_event_on_db.id, mock_student_on_db.cpf, day="2021-03-03"))
+    api.post('/presence/roll-call', json=roll_call_data(mock_class_event_on_db.id, mock_student_on_db.cpf, type="F", day="2021-04-01"))
+
+    # Corrige a chamada de 03/03: a contagem mensal é ajustada, não duplicada
+    api.post('/presence/roll-call', json=roll_call_data(mock_class_event_on_db.id, mock_student_on_db.cpf, type="F", day="2021-03-03"))
+
+    response = api.get('/presence/class/attendance', params={"class_id": mock_class_event_on_db.class_id, "start": "2021-03-15", "end": "2021-04-15"})
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"child_cpf": mock_student_on_db.cpf, "present": 2, "absent": 2, "percentage": 50.0}
+    ]
+    assert db_session.query(AttendanceModel).count() == 2
+
+    march_only = api.get('/presence/class/attendance', params={"class_id": mock_class_event_on_db.class_id, "start": "2021-03-01", "end": "2021-03-31"})
+
+    assert march_only.json()[0]["present"] == 2
+    assert march_only.json()[0]["absent"] == 1
@@ -1,8 +1,20 @@
+from json import loads
+from uuid import UUID
+
+
+from constants.base import (
+    ERROR_BULK_DUPLICATED_ROW,
+    ERROR_BULK_INVALID_BODY,
+    NDJSON_MEDIA_TYPE
+)
 from constants.child import (
+    ERROR_CHILD_ADD_CONFLICT_FIELD_CPF,
+    ERROR_CHILD_ADD_NOT_FOUND_PARENT,
     MESSAGE_CHILD_ASSOCIATE_PARENT_SUCCESS,
     MESSAGE_CHILD_DELETE_PARENT_SUCCESS,
     MESSAGE_CHILD_DELETE_SUCCESS
 )
+from constants.classes import ERROR_CLASSES_GET_NOT_FOUND
 from schemas.base import Kinship
 
 from schemas.child import (
@@ -23,9 +35,97 @@ def test_routes_student_add(
 
     assert response.status_code == 201
     assert student.name == request["name"]
+
+
+def test_routes_student_add_invalid_class_id(
+    api,
+    mock_StudentRequest
+):
+
+    request = dict(mock_StudentRequest.dict(), class_id="id-invalido")
+
+    response = api.post("/student/add", json=request)
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": ERROR_CLASSES_GET_NOT_FOUND}
     
     
 
+def test_routes_student_bulk_add(
+    api,
+    mock_StudentRequest
+):
+    
+    valid = mock_StudentRequest.dict()
+
+    second = dict(valid, cpf="111.222.333-44", name="Maria Vital")
+
+    missing_parent = dict(valid, cpf="555.666.777-88", parent_cpf="999.999.999-99")
+
+    invalid_cpf = dict(valid, cpf="123")
+
+    rows = [valid, second, dict(valid), missing_parent, invalid_cpf]
+
+    response = api.post("/student/bulk-add", json=rows)
+
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data["created"] == 2
+    assert data["failed"] == 3
+    assert [result["status_code"] for result in data["results"]] == [201, 201, 409, 404, 422]
+    assert data["results"][0]["item"]["name"] == valid["name"]
+    assert data["results"][1]["item"]["matriculation"] != data["results"][0]["item"]["matriculation"]
+    assert data["results"][2]["detail"] == ERROR_BULK_DUPLICATED_ROW
+    assert data["results"][3]["detail"] == ERROR_CHILD_ADD_NOT_FOUND_PARENT
+
+    response = api.post("/student/bulk-add", json=[valid])
+
+    assert response.json()["results"][0]["status_code"] == 409
+    assert response.json()["results"][0]["detail"] == ERROR_CHILD_ADD_CONFLICT_FIELD_CPF
+
+    other_format = dict(valid, cpf="222.333.444-55", class_id=UUID(valid["class_id"]).hex.upper())
+
+    response = api.post("/student/bulk-add", json=[other_format])
+
+    assert response.json()["results"][0]["status_code"] == 201
+
+
+def test_routes_student_bulk_add_csv(
+    api,
+    mock_StudentRequest
+):
+    
+    request = mock_StudentRequest.model_dump(mode="json")
+
+    address = request.pop("address")
+
+    row = {**request, **address}
+
+    columns = list(row.keys())
+
+    content = ",".join(columns) + "\n" + ",".join(str(row[column] or "") for column in columns) + "\n"
+
+    response = api.post(
+        "/student/bulk-add",
+        files={"file": ("students.csv", content.encode(), "text/csv")}
+    )
+
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data["created"] == 1
+    assert data["results"][0]["item"]["name"] == request["name"]
+
+
+def test_routes_student_bulk_add_invalid_body(api):
+    
+    response = api.post("/student/bulk-add", json={"cpf": "123"})
+
+    assert response.status_code == 422
+    assert response.json() == {"detail": ERROR_BULK_INVALID_BODY}
+
+
 def test_routes_student_get(
     api,
     mock_student_on_db
@@ -50,7 +150,21 @@ def test_routes_student_list(
     
     response = api.get("/student/list")
     
-    students = [StudentResponse(**item) for item in response.json()]
+    students = [StudentResponse(**item) for item in response.json()["items"]]
+    
+    assert response.status_code == 200
+    assert len(students) == 1
+    assert students[0].name == mock_student_on_db.name
+    
+
+def test_routes_student_list_ndjson(
+    api,
+    mock_student_on_db,
+):
+    
+    response = api.get("/student/list", headers={"Accept": NDJSON_MEDIA_TYPE})
+    
+    students = [StudentResponse(**loads(line)) for line in response.text.splitlines()]
     
     assert response.status_code == 200
     assert len(students) == 1
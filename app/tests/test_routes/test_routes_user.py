@@ -48,9 +48,10 @@ def test_router_user_list(mock_user_on_db, api):
     assert response.status_code == 200
     data = response.json()
 
-    assert len(data) == 1
+    assert len(data["items"]) == 1
+    assert data["next_cursor"] is None
 
-    UserResponse(**data[0])
+    UserResponse(**data["items"][0])
 
 
 def test_router_user_login_success(api,mock_user_on_db, mock_UserLoginRequest):
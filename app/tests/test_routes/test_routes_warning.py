@@ -0,0 +1,169 @@
+from hashlib import sha256
+from io import BytesIO
+from os import utime
+from os.path import (
+    isfile,
+    join
+)
+
+
+from constants.warning import (
+    ERROR_WARNING_FILE_TOO_LARGE,
+    ERROR_WARNING_PARENT_NOT_FOUND,
+    ERROR_WARNING_REQUIRED_FIELD_THEME,
+    MESSAGE_WARNING_DELETE_SUCCESS
+)
+from database.connection import Session
+from database.models import (
+    NotificationModel,
+    UserModel
+)
+from schemas.base import NotificationKind
+from services.storage import files
+from services.storage.files import (
+    WARNING_FILES_DIR,
+    store_file
+)
+from services.storage.sweeper import FileSweeper
+
+
+CONTENT = b"Reuniao de pais na sexta-feira. " * 100
+
+
+def stored_path(content: bytes) -> str:
+    digest = sha256(content).hexdigest()
+
+    return join(WARNING_FILES_DIR, digest[:2], digest)
+
+
+def send_warning(api, parent_cpfs: list[str], content: bytes = CONTENT, theme: str = "Reunião"):
+    return api.post(
+        '/warning/add',
+        data={"parent_cpfs": parent_cpfs, "theme": theme, "text": "Compareçam à reunião"},
+        files={"file": ("reunião.txt", content, "text/plain")}
+    )
+
+
+def test_route_warning_add_shares_file(api, db_session, mock_parent_on_db):
+
+    second_parent = UserModel(**dict(mock_parent_on_db.dict(), cpf="12332112332", email="josemaria@gmail.com", phone="89912344322"))
+
+    db_session.add(second_parent)
+    db_session.commit()
+
+    response = send_warning(api, [mock_parent_on_db.cpf, second_parent.cpf])
+
+    assert response.status_code == 201
+
+    warnings = response.json()
+
+    assert sorted(warning["parent_cpf"] for warning in warnings) == sorted([mock_parent_on_db.cpf, second_parent.cpf])
+    assert {(warning["file_name"], warning["file_size"]) for warning in warnings} == {("reunião.txt", len(CONTENT))}
+    assert isfile(stored_path(CONTENT))
+
+    notifications = db_session.query(NotificationModel).all() # Gravadas no mesmo commit dos avisos
+
+    assert sorted(model.parent_cpf for model in notifications) == sorted([mock_parent_on_db.cpf, second_parent.cpf])
+    assert {(model.kind, model.title) for model in notifications} == {(NotificationKind.WARNING.value, "Reunião")}
+
+    listed = api.get(f'/warning/parent?parent_cpf={mock_parent_on_db.cpf}').json()
+
+    assert [warning["id"] for warning in listed] == [warnings[0]["id"]]
+
+    sweeper = FileSweeper(Session, grace_seconds=0)
+
+    for warning in warnings:
+        assert api.delete(f'/warning/delete?warning_id={warning["id"]}').json() == {"detail": MESSAGE_WARNING_DELETE_SUCCESS}
+
+        sweeper.sweep()
+
+        assert isfile(stored_path(CONTENT)) == (warning is not warnings[-1]) # Removido depois do último aviso
+
+
+def test_route_warning_file_range(api, mock_parent_on_db):
+
+    warning = send_warning(api, [mock_parent_on_db.cpf]).json()[0]
+
+    url = f'/warning/file?warning_id={warning["id"]}'
+
+    response = api.get(url)
+
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers["accept-ranges"] == "bytes"
+
+    partial = api.get(url, headers={"Range": "bytes=10-19"})
+
+    assert partial.status_code == 206
+    assert partial.content == CONTENT[10:20]
+    assert partial.headers["content-range"] == f"bytes 10-19/{len(CONTENT)}"
+
+    suffix = api.get(url, headers={"Range": "bytes=-5"})
+
+    assert suffix.content == CONTENT[-5:]
+
+    outside = api.get(url, headers={"Range": f"bytes={len(CONTENT)}-"})
+
+    assert outside.status_code == 416
+    assert outside.headers["content-range"] == f"bytes */{len(CONTENT)}"
+
+    api.delete(f'/warning/delete?warning_id={warning["id"]}')
+
+
+def test_route_warning_add_invalid(api, db_session, mock_parent_on_db):
+
+    content = b"anexo de um aviso recusado"
+
+    response = send_warning(api, [mock_parent_on_db.cpf, "123.321.123-32"], content)
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": ERROR_WARNING_PARENT_NOT_FOUND}
+    assert isfile(stored_path(content)) # Mantido até a limpeza em segundo plano
+    assert db_session.query(NotificationModel).count() == 0
+
+    FileSweeper(Session, grace_seconds=0).sweep()
+
+    assert not isfile(stored_path(content)) # Anexo sem avisos é descartado
+
+    response = send_warning(api, [mock_parent_on_db.cpf], theme=" ")
+
+    assert response.status_code == 422
+    assert response.json() == {"detail": ERROR_WARNING_REQUIRED_FIELD_THEME}
+
+
+def test_route_warning_add_rejects_content_length(api, monkeypatch, mock_parent_on_db):
+
+    content = b"anexo maior que o permitido" * 100
+
+    monkeypatch.setattr(files, "WARNING_MAX_FILE_SIZE", 1024)
+    monkeypatch.setattr(files, "WARNING_FORM_OVERHEAD", 0)
+    monkeypatch.setattr("useCases.warning.store_file", None) # Recusado antes de ler o formulário
+
+    response = send_warning(api, [mock_parent_on_db.cpf], content)
+
+    assert response.status_code == 413
+    assert response.json() == {"detail": ERROR_WARNING_FILE_TOO_LARGE}
+    assert not isfile(stored_path(content))
+
+
+def test_warning_files_sweep_keeps_reused_file(api, mock_parent_on_db):
+
+    warning = send_warning(api, [mock_parent_on_db.cpf]).json()[0]
+
+    api.delete(f'/warning/delete?warning_id={warning["id"]}')
+
+    path = stored_path(CONTENT)
+
+    utime(path, (0, 0)) # Sem avisos e gravado há muito tempo
+
+    store_file(BytesIO(CONTENT), "reunião.txt", "text/plain") # Reenvio ainda não confirmado
+
+    sweeper = FileSweeper(Session)
+
+    assert sweeper.sweep() == 0
+    assert isfile(path)
+
+    utime(path, (0, 0))
+
+    assert sweeper.sweep() == 1
+    assert not isfile(path)
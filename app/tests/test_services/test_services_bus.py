@@ -0,0 +1,70 @@
+from datetime import date
+from json import (
+    dumps,
+    loads
+)
+
+
+from database.connection import engine
+from services.calendar.cache import (
+    calendar_cache,
+    week_of
+)
+from services.events.bus import (
+    TOPIC_CALENDAR,
+    LocalBus,
+    PostgresBus
+)
+
+
+WEEK = week_of(date(2021, 3, 1))
+
+
+def cache_week(kind: str, entity_id: str) -> None:
+    calendar_cache.set(kind, entity_id, {WEEK: ["aula"]}, calendar_cache.generation(kind, entity_id))
+
+
+def test_local_bus_invalidates_calendar():
+    bus = LocalBus()
+
+    cache_week("class", "1")
+    cache_week("teacher", "12345678901")
+
+    bus.invalidate_calendar([("class", "1")], WEEK, WEEK)
+
+    assert calendar_cache.get("class", "1", WEEK) is None
+    assert calendar_cache.get("teacher", "12345678901", WEEK) == ["aula"]
+
+    bus.clear_calendar()
+
+    assert calendar_cache.get("teacher", "12345678901", WEEK) is None
+
+
+def test_postgres_bus_applies_changes_from_other_workers():
+    bus = PostgresBus(engine)
+
+    cache_week("class", "1")
+
+    message = {"topic": TOPIC_CALENDAR, "payload": {"kind": "class", "entity_id": "1", "start": None, "end": None}}
+
+    bus.receive(dumps({"origin": bus.origin, **message})) # Já aplicada ao publicar
+
+    assert calendar_cache.get("class", "1", WEEK) == ["aula"]
+
+    bus.receive("invalida")
+    bus.receive(dumps({"origin": "outro", **message}))
+
+    assert calendar_cache.get("class", "1", WEEK) is None
+
+
+def test_postgres_bus_publish_queues_without_database_io():
+    bus = PostgresBus(None) # Sem engine: a publicação não pode usar o banco
+
+    cache_week("class", "1")
+
+    bus.invalidate_calendar([("class", "1")], WEEK, WEEK)
+    bus.publish(TOPIC_CALENDAR, [{"kind": "class", "entity_id": "x" * 8000}])
+
+    assert calendar_cache.get("class", "1", WEEK) is None
+    assert len(bus._pending) == 1
+    assert loads(bus._pending[0])["origin"] == bus.origin
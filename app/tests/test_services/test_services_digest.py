@@ -0,0 +1,85 @@
+from datetime import (
+    datetime,
+    timedelta
+)
+
+
+from database.models import (
+    NotificationModel,
+    OutboxModel
+)
+from database.repositories.notification import NotificationRepository
+from schemas.base import NotificationKind
+from services.email.digest import compose_digests
+
+
+WINDOW = 3600
+
+
+def add_notifications(db_session, parent, student) -> None:
+    repository = NotificationRepository(db_session)
+
+    repository.add_for_parents([parent.cpf], NotificationKind.WARNING, "Reunião", "Reunião de pais na sexta")
+    repository.add_for_children(
+        NotificationKind.NOTE,
+        [
+            (student.cpf, "Nova nota em Matemática", "Nota 7.5 na 1ª avaliação do 1º semestre"),
+            (student.cpf, "Nova nota em Português", "Nota 9 na 1ª avaliação do 1º semestre")
+        ]
+    )
+    repository.add_for_children(
+        NotificationKind.ABSENCE,
+        [(student.cpf, "Falta em Matemática", "Falta na aula de 01/03/2021, às 08:00")],
+        reference="absence:1:202103010800"
+    )
+
+    db_session.commit()
+
+
+def test_digest_one_email_per_parent_after_window(db_session, mock_parent_on_db, mock_student_on_db):
+    add_notifications(db_session, mock_parent_on_db, mock_student_on_db)
+
+    assert compose_digests(db_session, window_seconds=WINDOW) == 0 # A janela ainda não terminou
+
+    later = datetime.now() + timedelta(seconds=WINDOW + 1)
+
+    assert compose_digests(db_session, now=later, window_seconds=WINDOW) == 1
+    assert compose_digests(db_session, now=later, window_seconds=WINDOW) == 0
+
+    email, = db_session.query(OutboxModel).all()
+
+    assert email.to_email == mock_parent_on_db.email
+    assert email.subject == "Resumo da escola: 4 novidades"
+    assert mock_student_on_db.name in email.body
+    assert "Avisos da escola" in email.body
+    assert "Nova nota em Português" in email.body
+
+    assert {model.outbox_id for model in db_session.query(NotificationModel)} == {email.id}
+
+
+def test_digest_disabled_sends_each_notification(db_session, mock_parent_on_db, mock_student_on_db):
+    add_notifications(db_session, mock_parent_on_db, mock_student_on_db)
+
+    assert compose_digests(db_session, digest=False) == 4
+
+    assert sorted(model.subject for model in db_session.query(OutboxModel)) == [
+        "Falta em Matemática",
+        "Nova nota em Matemática",
+        "Nova nota em Português",
+        "Reunião"
+    ]
+
+
+def test_digest_single_notification_and_reference_replacement(db_session, mock_parent_on_db, mock_student_on_db):
+    repository = NotificationRepository(db_session)
+
+    for text in ("Falta na aula de 01/03/2021, às 08:00", "Falta corrigida"):
+        repository.add_for_children(NotificationKind.ABSENCE, [(mock_student_on_db.cpf, "Falta em Matemática", text)], reference="absence:1")
+        db_session.commit()
+
+    assert compose_digests(db_session, now=datetime.now() + timedelta(seconds=WINDOW + 1), window_seconds=WINDOW) == 1
+
+    email, = db_session.query(OutboxModel).all()
+
+    assert email.subject == "Falta em Matemática"
+    assert "Falta corrigida" in email.body
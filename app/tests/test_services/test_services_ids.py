@@ -0,0 +1,59 @@
+from time import sleep
+from uuid import UUID
+from pytest import raises
+from sqlalchemy import select
+from sqlalchemy.exc import StatementError
+
+
+from database.models import DisciplinesModel
+from services.generator.ids import (
+    id_generate,
+    uuid7
+)
+
+
+def test_uuid7_version():
+
+    value = uuid7()
+
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+
+def test_id_generate_time_ordered():
+
+    first = id_generate()
+
+    sleep(0.002)
+
+    second = id_generate()
+
+    assert UUID(first).version == 7
+    assert first < second
+
+
+def test_uuid_key_round_trip(db_session):
+
+    model = DisciplinesModel(id=id_generate(), name="Robótica")
+
+    db_session.add(model)
+    db_session.commit()
+
+    id = model.id
+
+    db_session.expire_all()
+
+    assert db_session.get(DisciplinesModel, id).id == id
+    assert db_session.scalar(select(DisciplinesModel).where(DisciplinesModel.id == "id-invalido")) is None
+
+
+def test_uuid_key_rejects_invalid_writes(db_session):
+
+    db_session.add(DisciplinesModel(id="id-invalido", name="Robótica"))
+
+    with raises(StatementError) as error:
+        db_session.commit()
+
+    assert isinstance(error.value.orig, ValueError)
+
+    db_session.rollback()
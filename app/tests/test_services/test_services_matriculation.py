@@ -0,0 +1,94 @@
+from asyncio import run
+from threading import Thread
+
+
+from database.connection import engine
+from database.models import MatriculationSequenceModel
+from services.generator.matriculation import (
+    MatriculationAllocator,
+    format_matriculation
+)
+
+
+YEAR = 1999
+
+
+def clean_sequence(db_session, year: int = YEAR):
+
+    db_session.query(MatriculationSequenceModel).filter(
+        MatriculationSequenceModel.year == year
+    ).delete()
+    db_session.commit()
+
+
+def test_format_matriculation():
+
+    assert format_matriculation(2024, 1) == "20240000001"
+    assert format_matriculation(2024, 1234567) == "20241234567"
+
+
+def test_allocator_allocate_sequential(db_session):
+
+    clean_sequence(db_session)
+
+    allocator = MatriculationAllocator(engine, block_size=3)
+
+    first = allocator.allocate(2, year=YEAR)
+    second = allocator.allocate(5, year=YEAR)
+
+    assert first == [format_matriculation(YEAR, n) for n in (1, 2)]
+    assert second == [format_matriculation(YEAR, n) for n in (3, 4, 5, 6, 7)]
+
+    clean_sequence(db_session)
+
+
+def test_allocator_workers_never_repeat(db_session):
+
+    clean_sequence(db_session)
+
+    allocators = [MatriculationAllocator(engine, block_size=4) for _ in range(3)]
+
+    results = []
+
+    def run(allocator):
+        for _ in range(10):
+            results.extend(allocator.allocate(1, year=YEAR))
+
+    threads = [Thread(target=run, args=(allocator,)) for allocator in allocators]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 30
+    assert len(set(results)) == 30
+
+    clean_sequence(db_session)
+
+
+def test_allocator_resets_each_year(db_session):
+
+    clean_sequence(db_session, YEAR)
+    clean_sequence(db_session, YEAR + 1)
+
+    allocator = MatriculationAllocator(engine, block_size=10)
+
+    assert allocator.allocate(1, year=YEAR) == [format_matriculation(YEAR, 1)]
+    assert allocator.allocate(1, year=YEAR + 1) == [format_matriculation(YEAR + 1, 1)]
+
+    clean_sequence(db_session, YEAR)
+    clean_sequence(db_session, YEAR + 1)
+
+
+def test_allocator_allocate_async_continues_sequence(db_session):
+
+    clean_sequence(db_session)
+
+    allocator = MatriculationAllocator(engine, block_size=2)
+
+    assert allocator.allocate(1, year=YEAR) == [format_matriculation(YEAR, 1)]
+    assert run(allocator.allocate_async(3, year=YEAR)) == [format_matriculation(YEAR, n) for n in (2, 3, 4)]
+
+    clean_sequence(db_session)
@@ -0,0 +1,184 @@
+from datetime import datetime
+from email import message_from_string
+from socketserver import (
+    StreamRequestHandler,
+    ThreadingTCPServer
+)
+from threading import Thread
+from pytest import fixture
+
+
+from database.connection import Session
+from database.models import OutboxModel
+from database.repositories.outbox import OutboxRepository
+from schemas.base import OutboxStatus
+from services.email.outbox import (
+    OutboxSender,
+    backoff
+)
+from services.email.send import SMTPPool
+
+
+class SMTPStandIn(ThreadingTCPServer):
+    """
+    Servidor SMTP mínimo, local, que guarda as mensagens recebidas
+
+    Destinatários que começam com "recusado" são recusados de forma definitiva (550) e os que começam com
+    "ocupado", de forma temporária (451).
+    """
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SMTPHandler)
+        self.connections = 0
+        self.messages: list[tuple[str, str]] = []
+
+
+class SMTPHandler(StreamRequestHandler):
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        self.server.connections += 1
+        recipients = []
+
+        self.reply("220 stand-in")
+
+        while line := self.rfile.readline().decode().strip():
+
+            command = line.split(" ", 1)[0].upper()
+
+            if command in ("EHLO", "HELO"):
+                self.reply("250 stand-in")
+
+            elif command == "RCPT":
+                address = line.split(":", 1)[1].strip("<> ")
+
+                if address.startswith("recusado"):
+                    self.reply("550 mailbox unavailable")
+                elif address.startswith("ocupado"):
+                    self.reply("451 try again later")
+                else:
+                    recipients.append(address)
+                    self.reply("250 ok")
+
+            elif command == "DATA":
+                self.reply("354 end with .")
+
+                data = []
+
+                while (data_line := self.rfile.readline().decode()) not in (".\r\n", ""):
+                    data.append(data_line)
+
+                self.server.messages += [(recipient, "".join(data)) for recipient in recipients]
+                recipients = []
+
+                self.reply("250 queued")
+
+            elif command == "QUIT":
+                self.reply("221 bye")
+                return
+
+            else: # MAIL, RSET, NOOP
+                recipients = [] if command == "RSET" else recipients
+                self.reply("250 ok")
+
+
+@fixture
+def smtp_server():
+    server = SMTPStandIn()
+
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+@fixture
+def sender(smtp_server):
+    pool = SMTPPool(host="127.0.0.1", port=smtp_server.server_address[1], username="", starttls=False, size=2, timeout=5)
+
+    yield OutboxSender(Session, pool, batch_size=10)
+
+    pool.close()
+
+
+def enqueue(db_session, *to_emails: str) -> list[str]:
+    repository = OutboxRepository(db_session)
+
+    ids = [str(repository.enqueue(to_email, "Novo aviso: Reunião", "<p>Reunião na sexta</p>").id) for to_email in to_emails]
+
+    db_session.commit()
+
+    return ids
+
+
+def test_outbox_sends_batch_reusing_connection(db_session, smtp_server, sender):
+    enqueue(db_session, "ana@gmail.com", "bia@gmail.com", "caio@gmail.com")
+
+    assert sender.run_once() == 3
+    assert sender.run_once() == 0
+
+    assert sorted(recipient for recipient, _ in smtp_server.messages) == ["ana@gmail.com", "bia@gmail.com", "caio@gmail.com"]
+    assert all(message_from_string(data)["To"] == recipient for recipient, data in smtp_server.messages)
+    assert smtp_server.connections == 1 # Os três emails pela mesma conexão do pool
+
+    db_session.expire_all()
+
+    assert {(model.status, model.attempts) for model in db_session.query(OutboxModel)} == {(OutboxStatus.SENT.value, 0)}
+
+
+def test_outbox_retries_temporary_and_fails_permanent(db_session, smtp_server, sender):
+    ok, temporary, permanent = enqueue(db_session, "ana@gmail.com", "ocupado@gmail.com", "recusado@gmail.com")
+
+    before = datetime.now()
+
+    assert sender.run_once() == 3
+    assert sender.run_once() == 0 # A nova tentativa só vem depois da espera
+
+    db_session.expire_all()
+    repository = OutboxRepository(db_session)
+
+    assert repository.get(ok).status == OutboxStatus.SENT.value
+
+    retry = repository.get(temporary)
+
+    assert (retry.status, retry.attempts) == (OutboxStatus.PENDING.value, 1)
+    assert retry.next_attempt_at >= before + backoff(1)
+    assert "451" in retry.last_error
+
+    failed = repository.get(permanent)
+
+    assert (failed.status, failed.attempts) == (OutboxStatus.FAILED.value, 1)
+    assert "550" in failed.last_error
+
+
+def test_outbox_gives_up_after_max_attempts(db_session, smtp_server, sender):
+    sender.max_attempts = 2
+    outbox_id, = enqueue(db_session, "ocupado@gmail.com")
+
+    assert sender.run_once() == 1
+
+    db_session.query(OutboxModel).update({"next_attempt_at": datetime.now()})
+    db_session.commit()
+
+    assert sender.run_once() == 1
+
+    db_session.expire_all()
+    model = OutboxRepository(db_session).get(outbox_id)
+
+    assert (model.status, model.attempts) == (OutboxStatus.FAILED.value, 2)
+    assert smtp_server.messages == []
+
+
+def test_outbox_rollback_discards_email(db_session, sender):
+    OutboxRepository(db_session).enqueue("ana@gmail.com", "Novo aviso", "<p>Aviso</p>")
+
+    db_session.rollback() # A alteração que originou o email foi desfeita
+
+    assert sender.run_once() == 0
+    assert db_session.query(OutboxModel).count() == 0
@@ -0,0 +1,68 @@
+from datetime import date
+
+
+from schemas.base import DaysOfWeek
+from utils.format import unformat_time
+from utils.schedule import (
+    Slot,
+    expand_weekly,
+    find_conflicts,
+    weekday_name,
+    weekday_number
+)
+
+
+def slot(start: str, end: str, class_id: str = "A", teacher_cpf: str = "1", day: str = "Segunda", new: bool = True, start_date: date = date(2024, 1, 1)) -> Slot:
+    return Slot(None, class_id, teacher_cpf, weekday_number(day), unformat_time(start), unformat_time(end), start_date, date(2024, 6, 30), new)
+
+
+def test_schedule_find_conflicts_overlap():
+    existing = slot("08:00", "09:00", new=False)
+    candidate = slot("08:30", "09:30")
+
+    assert find_conflicts([existing, candidate]) == [(existing, candidate)]
+
+
+def test_schedule_find_conflicts_adjacent_and_other_day():
+    slots = [
+        slot("08:00", "09:00", new=False),
+        slot("09:00", "10:00"),
+        slot("08:00", "09:00", day="Terça")
+    ]
+
+    assert find_conflicts(slots) == []
+
+
+def test_schedule_find_conflicts_by_teacher_and_class():
+    teacher = slot("08:00", "09:00", class_id="B")
+    class_ = slot("08:30", "09:30", teacher_cpf="2")
+
+    assert len(find_conflicts([slot("08:15", "08:45", new=False), teacher, class_])) == 2
+
+
+def test_schedule_find_conflicts_ignores_existing_pairs_and_other_periods():
+    slots = [
+        slot("08:00", "09:00", new=False),
+        slot("08:00", "09:00", new=False),
+        slot("08:00", "09:00", start_date=date(2024, 7, 1))
+    ]
+
+    assert find_conflicts(slots) == []
+
+
+def test_schedule_weekday_number_round_trip():
+    assert weekday_number("Segunda") == 1
+    assert weekday_number(DaysOfWeek.SUNDAY) == 7
+    assert [weekday_name(number) for number in range(1, 8)] == list(DaysOfWeek)
+
+
+def test_schedule_expand_weekly():
+    # Quartas-feiras de uma aula de 2024-01-01 (segunda) a 2024-01-31, na janela de 2024-01-05 a 2024-02-29
+    assert expand_weekly(3, date(2024, 1, 1), date(2024, 1, 31), date(2024, 1, 5), date(2024, 2, 29)) == [
+        date(2024, 1, 10),
+        date(2024, 1, 17),
+        date(2024, 1, 24),
+        date(2024, 1, 31)
+    ]
+
+    assert expand_weekly(3, date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 1), date(2024, 1, 31)) == []
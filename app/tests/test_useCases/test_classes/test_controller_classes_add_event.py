@@ -1,17 +1,23 @@
+from uuid import UUID
 from fastapi import HTTPException
 from pytest import raises
 
 
 from constants.classes import(
     ERROR_CLASSES_EVENTS_ADD_CONFLICT,
+    ERROR_CLASSES_EVENTS_SCHEDULE_CONFLICT,
     ERROR_CLASSES_GET_NOT_FOUND,
     MESSAGE_CLASS_EVENT_ADD_SUCCESS
 )
 from constants.disciplines import ERROR_DISCIPLINES_GET_NOT_FOUND
 from constants.teacher import ERROR_TEACHER_GET_NOT_FOUND
 from useCases.classes import ClassesUseCases
-from database.models import ClassEventModel
+from database.models import (
+    ClassEventModel,
+    ClassTeacherModel
+)
 from schemas.classes import ClassEventRequest
+from services.generator.ids import id_generate
 
 
 def test_uc_classes_add_event_success(db_session, mock_ClassEventRequest):
@@ -50,6 +56,31 @@ def test_uc_classes_add_event_fail_conflict(
     assert exception.value.detail == ERROR_CLASSES_EVENTS_ADD_CONFLICT
 
 
+def test_uc_classes_add_event_fail_conflict_class_id_format(
+        db_session,
+        mock_ClassEventRequest,
+        mock_class_event_on_db,
+        mock_user_on_db
+):
+    teacher = ClassTeacherModel(id=id_generate(), user_cpf=mock_user_on_db.cpf, class_id=mock_class_event_on_db.class_id)
+
+    db_session.add(teacher)
+    db_session.commit()
+
+    uc = ClassesUseCases(db_session)
+
+    request = ClassEventRequest(**mock_ClassEventRequest.dict())
+
+    request.class_id = UUID(request.class_id).hex.upper() # Mesma turma, outro formato e outro professor
+    request.teacher_id = teacher.id
+
+    with raises(HTTPException) as exception:
+        uc.add_event(request)
+
+    assert exception.value.status_code == 409
+    assert exception.value.detail == ERROR_CLASSES_EVENTS_SCHEDULE_CONFLICT
+
+
 def test_uc_classes_add_event_fail_class_not_found(
         db_session, 
         mock_ClassEventRequest
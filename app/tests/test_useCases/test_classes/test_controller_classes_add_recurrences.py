@@ -9,6 +9,8 @@ from constants.classes import (
 )
 from useCases.classes import ClassesUseCases
 from database.models import RecurrencesModel
+from utils.format import unformat_time
+from utils.schedule import weekday_number
 
 
 def test_uc_classes_add_recurrences_success_two(
@@ -35,7 +37,7 @@ def test_uc_classes_add_recurrences_success_two(
     for recurrence in mock_Recurrences_list:
         
         for model in models:
-            if model.day_of_week == recurrence.day_of_week and model.start_time == recurrence.start_time:
+            if model.day_of_week == weekday_number(recurrence.day_of_week) and model.start_time == unformat_time(recurrence.start_time):
                 add -= 1
 
             else:
@@ -69,7 +71,7 @@ def test_uc_classes_add_recurrences_success_one(
     for recurrence in mock_Recurrences_list:
         
         for model in models:
-            if model.day_of_week == recurrence.day_of_week and model.start_time == recurrence.start_time:
+            if model.day_of_week == weekday_number(recurrence.day_of_week) and model.start_time == unformat_time(recurrence.start_time):
                 add -= 1
 
             else:
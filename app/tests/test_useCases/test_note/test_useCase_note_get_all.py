@@ -149,4 +149,25 @@ def test_NoteUseCases_get_all_with_filters_success_1_aval_number_1_semester(
         assert note.aval_number == 1
 
 
+def test_NoteUseCases_get_all_with_filters_no_match(
+    db_session: Session,
+    mock_note_on_db_list: list[NoteModel]
+):
+    
+    # Arrange
+    use_case = NoteUseCases(db_session)
+
+    filters = NoteFilters(
+        semester=3
+    )
+
+    # Act
+
+    response = use_case.get_all(filters=filters)
+
+    # Assert
+
+    assert response == []
+
+
 # TODO: Seria bom testar todos os casos de filtros, mas por hora foi so dois mesmo
\ No newline at end of file
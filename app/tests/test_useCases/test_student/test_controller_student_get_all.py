@@ -1,9 +1,15 @@
 from fastapi import HTTPException
 from pytest import raises
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 
 from constants.child import ERROR_CHILD_GET_ALL_NOT_FOUND
+from database.connection import engine
+from database.mapping.student import map_StudentRequest_to_ChildModel
+from database.models import ClassStudentModel
+from schemas.child import StudentRequest
+from services.generator.ids import id_generate
 from useCases.student import StudentUseCases
 
 
@@ -40,4 +46,41 @@ def test_StudentUseCases_get_all_fail_empty(
 
     # Assert
     assert exception.value.status_code == 404
-    assert exception.value.detail == ERROR_CHILD_GET_ALL_NOT_FOUND
\ No newline at end of file
+    assert exception.value.detail == ERROR_CHILD_GET_ALL_NOT_FOUND
+
+
+def test_StudentUseCases_get_page_constant_queries(
+    db_session: Session,
+    mock_StudentRequest,
+    mock_student_on_db,
+    mock_new_class_on_db
+):
+    # Arrange
+    for index in range(5):
+
+        request = StudentRequest(**dict(mock_StudentRequest.dict(), cpf=f"987.654.321-0{index}"))
+
+        db_session.add(map_StudentRequest_to_ChildModel(request, f"2099000010{index}"))
+        db_session.add(ClassStudentModel(id=id_generate(), class_id=mock_new_class_on_db.id, child_cpf=request.cpf))
+
+    db_session.commit()
+    db_session.expire_all()
+
+    statements = []
+
+    def count_statement(*args):
+        statements.append(args[2])
+
+    # Act
+    event.listen(engine, "before_cursor_execute", count_statement)
+
+    try:
+        page = StudentUseCases(db_session).get_page(limit=10)
+
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    # Assert
+    assert len(page.items) == 6
+    assert {student.class_info for student in page.items} == {"5° Ano A", "5° Ano B"}
+    assert len(statements) == 3 # Estudantes, vínculos com as turmas e turmas
@@ -1,10 +1,21 @@
+from datetime import datetime
 from fastapi import HTTPException
 from pytest import raises
+from sqlalchemy import event
 
 
 from constants.teacher import ERROR_TEACHER_GET_ALL_NOT_FOUND
+from database.connection import engine
+from database.models import (
+    ClassTeacherModel,
+    UserModel
+)
+from services.generator.ids import id_generate
 from useCases.teacher import TeacherUseCases
-from schemas.base import UserLevel
+from schemas.base import (
+    Gender,
+    UserLevel
+)
 from utils.format import format_cpf, format_phone
 
 
@@ -41,4 +52,93 @@ def test_uc_teacher_get_all_with_no_teacher(db_session, mock_user_on_db):
 
     
     assert e.value.status_code == 404
-    assert e.value.detail == ERROR_TEACHER_GET_ALL_NOT_FOUND
\ No newline at end of file
+    assert e.value.detail == ERROR_TEACHER_GET_ALL_NOT_FOUND
+
+
+def test_uc_teacher_get_all_with_relationships(
+    db_session,
+    mock_class_event_on_db,
+    mock_teacher_discipline_on_db
+):
+    
+    uc = TeacherUseCases(db_session)
+
+    response = uc.get_all()
+
+    assert len(response) == 1
+
+    response = response[0]
+
+    assert len(response.disciplines) == 1
+    assert response.disciplines[0].id == mock_teacher_discipline_on_db.discipline_id
+    assert len(response.classes) == 1
+    assert response.classes[0].id == mock_class_event_on_db.class_id
+    assert len(response.classes[0].class_events) == 1
+    assert response.classes[0].class_events[0].id == mock_class_event_on_db.id
+
+
+def test_uc_teacher_get_all_constant_queries(
+    db_session,
+    mock_class_event_on_db,
+    mock_teacher_discipline_on_db
+):
+
+    statements = []
+
+    def count_statement(*args):
+        statements.append(args[2])
+
+
+    def run_get_all() -> int:
+
+        db_session.expire_all()
+        statements.clear()
+
+        event.listen(engine, "before_cursor_execute", count_statement)
+
+        try:
+            response = TeacherUseCases(db_session).get_all()
+
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        return len(response), len(statements)
+
+
+    teachers, queries = run_get_all()
+
+    assert teachers == 1
+
+    for index in range(5):
+
+        teacher = UserModel(
+            cpf=f"9876543210{index}",
+            name=f"Teacher {index}",
+            birth_date=datetime(1990, 1, 1),
+            gender=Gender.MALE.value,
+            phone=f"8991234500{index}",
+            email=f"teacher{index}@professor.com",
+            password="123456",
+            level=UserLevel.TEACHER.value,
+            state="PI",
+            city="Picos",
+            neighborhood="Junco",
+            street="Rua A",
+            house_number="123",
+        )
+
+        db_session.add(teacher)
+        db_session.add(
+            ClassTeacherModel(
+                id=id_generate(),
+                user_cpf=teacher.cpf,
+                class_id=mock_class_event_on_db.class_id
+            )
+        )
+
+    db_session.commit()
+
+    teachers, new_queries = run_get_all()
+
+    assert teachers == 6
+    assert new_queries == queries
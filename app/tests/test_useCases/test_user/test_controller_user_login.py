@@ -8,6 +8,11 @@ from constants.user import (
 )
 from useCases.user import UserUseCases
 from schemas.user import AccessToken, UserLoginRequest, UserResponse
+from services.security.password import (
+    build_crypt_context,
+    crypt_context,
+    verify
+)
 from services.security.tokens import decode_token
 from utils.format import (
     format_cpf,
@@ -65,4 +70,25 @@ def test_login_user_fail_password_wrong(db_session, mock_user_on_db, mock_UserLo
         uc.login(login)
 
     assert e.value.status_code == 401
-    assert e.value.detail == ERROR_USER_PASSWORD_WRONG
\ No newline at end of file
+    assert e.value.detail == ERROR_USER_PASSWORD_WRONG
+
+
+def test_login_user_rehash_outdated_password(db_session, mock_user_on_db, mock_UserLoginRequest):
+
+    old_context = build_crypt_context("sha256_crypt", 1000)
+
+    mock_user_on_db.password = old_context.hash(mock_UserLoginRequest.password)
+    db_session.commit()
+
+    assert crypt_context.needs_update(mock_user_on_db.password)
+
+    uc = UserUseCases(db_session)
+
+    response = uc.login(mock_UserLoginRequest)
+
+    assert isinstance(response, AccessToken)
+
+    db_session.refresh(mock_user_on_db)
+
+    assert not crypt_context.needs_update(mock_user_on_db.password)
+    assert verify(mock_UserLoginRequest.password, mock_user_on_db.password)
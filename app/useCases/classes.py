@@ -1,12 +1,27 @@
+from datetime import (
+    date,
+    timedelta
+)
 from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
+from constants.base import ERROR_INVALID_CPF
 from constants.classes import(
+    CALENDAR_DEFAULT_FUTURE_DAYS,
+    CALENDAR_DEFAULT_PAST_DAYS,
+    CALENDAR_MAX_RANGE_DAYS,
     ERROR_CLASS_ADD_CONFLICT,
+    ERROR_CLASSES_CALENDAR_INVALID_RANGE,
+    ERROR_CLASSES_CALENDAR_RANGE_TOO_LONG,
+    ERROR_CLASSES_CALENDAR_REQUIRED_FILTER,
     ERROR_CLASSES_EVENTS_ADD_CONFLICT,
     ERROR_CLASSES_EVENTS_ADD_RECURRENCES_CONFLICT,
     ERROR_CLASSES_EVENTS_GET_ALL_NOT_FOUND,
+    ERROR_CLASSES_EVENTS_SCHEDULE_CONFLICT,
+    ERROR_CLASSES_TIMETABLE_REQUIRED_FILTER,
     MESSAGE_CLASS_ADD_SUCCESS,
     MESSAGE_CLASS_DELETE_SUCCESS,
     MESSAGE_CLASS_EVENT_ADD_SUCCESS,
@@ -14,6 +29,7 @@ from constants.classes import(
     MESSAGE_CLASSES_EVENTS_ADD_RECURRENCES_SUCCESS,
     MESSAGE_CLASSES_EVENTS_DELETE_RECURRENCES_SUCCESS,
 )
+from database.base import normalize_uuid
 from database.mapping.classes import (
     build_class_info, 
     map_ClassEventModel_to_ClassEventResponse, 
@@ -24,14 +40,15 @@ from database.mapping.classes import (
 from database.models import(
     ClassModel,
     ClassEventModel,
+    ClassTeacherModel,
     RecurrencesModel
 )
 from database.queries.existence import (
     class_event_existe,
-    class_existe,
-    recurrences_exists,
+    is_unique_violation
 )
 from database.queries.get import (
+    get_child_by_cpf,
     get_class_by_id,
     get_class_event_by_id,
     get_recurrence_by_attributes
@@ -40,21 +57,53 @@ from database.queries.get_all import (
     get_all_class_events,
     get_all_classes, 
 )
+from database.queries.pagination import split_page
+from database.queries.schedule import (
+    get_overlapping_slots,
+    get_student_class_ids,
+    get_timetable_rows
+)
 from database.queries.validate_foreignkey import validate_class_events
-from schemas.base import BaseMessage
+from schemas.base import (
+    BaseMessage,
+    DaysOfWeek
+)
 from schemas.classes import (
+    CalendarOccurrence,
     ClassEventResponse,
     ClassRequest,
     ClassEventRequest,
     ClassResponse,
     Recurrences,
+    TimetableDay,
+    TimetableSlot
+)
+from schemas.pagination import Page
+from services.calendar.cache import (
+    calendar_cache,
+    week_of
 )
+from services.events.bus import event_bus
 from services.generator.ids import id_generate
+from utils.format import (
+    format_time,
+    unformat_cpf,
+    unformat_time
+)
 from utils.messages.success import Success
 from utils.messages.error import(
     Conflict,
     NotFound,
     Server,
+    UnprocessableEntity
+)
+from utils.validate import validate_cpf
+from utils.schedule import (
+    Slot,
+    expand_weekly,
+    find_conflicts,
+    weekday_name,
+    weekday_number
 )
 
 
@@ -79,10 +128,6 @@ class ClassesUseCases():
             - Exception: Erro no servidor.
         """
         try:
-            
-            if class_existe(self.db_session, request.name, request.section):
-               raise Conflict(ERROR_CLASS_ADD_CONFLICT)
-
 
             model = ClassModel(
                 id=id_generate(),
@@ -90,7 +135,7 @@ class ClassesUseCases():
             )
 
             self.db_session.add(model)
-            self.db_session.commit()
+            self.db_session.commit() # Turmas repetidas (mesmo nome e seção) são barradas por uq_class_name_section
             self.db_session.refresh(model)
 
             return Success(MESSAGE_CLASS_ADD_SUCCESS)
@@ -98,6 +143,14 @@ class ClassesUseCases():
         except HTTPException:
             raise
 
+        except IntegrityError as e:
+            self.db_session.rollback()
+
+            if is_unique_violation(e):
+                raise Conflict(ERROR_CLASS_ADD_CONFLICT)
+
+            raise Server(e)
+
         except Exception as e:
             raise Server(e)
 
@@ -157,6 +210,40 @@ class ClassesUseCases():
             raise Server(e)
         
 
+    def get_page(self, limit: int, cursor: str | None = None) -> Page[ClassResponse]:
+        """
+        Busca uma página de turmas, ordenada pela chave primária
+
+        - Args:
+            - limit: Quantidade de itens por página.
+            - cursor: Cursor devolvido pela página anterior (None para a primeira página).
+
+        - Returns:
+            - Page[ClassResponse]: Itens da página e cursor da próxima página.
+
+        - Raises:
+            - HTTPException: 400 - Cursor inválido.
+            - HTTPException: 404 - Nenhuma turma encontrada.
+            - Exception: Erro no servidor.
+        """
+        try:
+
+            classes = get_all_classes(self.db_session, limit, cursor)
+
+            classes, next_cursor = split_page(classes, limit, ClassModel.id)
+
+            return Page(
+                items=[self._Model_to_Response(model) for model in classes],
+                next_cursor=next_cursor
+            )
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+        
+
     def update(self, class_id: str, request: ClassRequest) -> ClassResponse:
         """
         Atualiza os dados de uma turma no sistema
@@ -182,6 +269,8 @@ class ClassesUseCases():
             self.db_session.commit()
             self.db_session.refresh(model)
 
+            event_bus.clear_calendar() # O nome da turma aparece também no calendário dos professores
+
             return self._Model_to_Response(model)
 
         except HTTPException:
@@ -213,6 +302,8 @@ class ClassesUseCases():
 
             self.db_session.commit()
 
+            event_bus.clear_calendar()
+
             return Success(MESSAGE_CLASS_DELETE_SUCCESS)
 
         except HTTPException:
@@ -234,7 +325,7 @@ class ClassesUseCases():
             - BaseMessage: Mensagem de sucesso ou erro.
 
         - Raises:
-            - HTTPException: 409 - Aula já cadastrada.
+            - HTTPException: 409 - Aula já cadastrada ou horário em conflito com outra aula da turma ou do professor.
             - Exception: Erro no servidor.
         """
         try:
@@ -245,6 +336,20 @@ class ClassesUseCases():
             
             validate_class_events(self.db_session, request.class_id, request.disciplines_id, request.teacher_id)
 
+            teacher = self.db_session.get(ClassTeacherModel, request.teacher_id)
+
+            start_date = date.fromisoformat(request.start_date)
+            end_date = date.fromisoformat(request.end_date)
+
+            self.validate_schedule(
+                request.class_id,
+                teacher.user_cpf,
+                start_date,
+                end_date,
+                request.recurrences,
+                ERROR_CLASSES_EVENTS_SCHEDULE_CONFLICT
+            )
+
             for discipline_id in request.disciplines_id:
 
                 model  = ClassEventModel(
@@ -252,8 +357,8 @@ class ClassesUseCases():
                     class_id=request.class_id,
                     discipline_id=discipline_id,
                     teacher_id=request.teacher_id,
-                    start_date=request.start_date,
-                    end_date=request.end_date
+                    start_date=start_date,
+                    end_date=end_date
                 )
 
                 self.db_session.add(model)
@@ -266,6 +371,8 @@ class ClassesUseCases():
 
             self.db_session.commit()
 
+            self._invalidate_calendar(request.class_id, teacher.user_cpf, start_date, end_date)
+
             return Success(MESSAGE_CLASS_EVENT_ADD_SUCCESS)
             
         except HTTPException:
@@ -328,6 +435,42 @@ class ClassesUseCases():
         except Exception as e:
             raise Server(e)
 
+    def get_events_page(self, limit: int, cursor: str | None = None) -> Page[ClassEventResponse]:
+        """
+        Busca uma página de aulas, ordenada pela chave primária
+
+        - Args:
+            - limit: Quantidade de itens por página.
+            - cursor: Cursor devolvido pela página anterior (None para a primeira página).
+
+        - Returns:
+            - Page[ClassEventResponse]: Itens da página e cursor da próxima página.
+
+        - Raises:
+            - HTTPException: 400 - Cursor inválido.
+            - HTTPException: 404 - Nenhuma aula encontrada.
+            - Exception: Erro no servidor.
+        """
+        try:
+
+            models = get_all_class_events(self.db_session, limit, cursor)
+
+            if not models and cursor is None:
+                raise NotFound(ERROR_CLASSES_EVENTS_GET_ALL_NOT_FOUND)
+
+            models, next_cursor = split_page(models, limit, ClassEventModel.id)
+
+            return Page(
+                items=[self._Model_to_ClassEventResponse(model) for model in models],
+                next_cursor=next_cursor
+            )
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+
     def update_event(self, class_event_id: str, request: ClassEventRequest) -> ClassEventResponse:
         """
         Atualiza uma aula cadastrada no sistema
@@ -340,23 +483,45 @@ class ClassesUseCases():
             - ClassEventResponse: Objeto com os dados da aula atualizada.
 
         - Raises:
-            - HTTPException: 404 - Aula não encontrada.
+            - HTTPException: 404 - Aula, turma, disciplina ou professor não encontrado.
+            - HTTPException: 409 - Horário em conflito com outra aula da turma ou do professor.
             - Exception: Erro no servidor.
         """
         try:
 
-            print(type(request))
-
             model = get_class_event_by_id(self.db_session,class_event_id)
 
-            for key, value in request.dict().items():
-                if key == "recurrences":
-                    continue
-                setattr(model, key, value)
+            validate_class_events(self.db_session, request.class_id, request.disciplines_id, request.teacher_id)
+
+            teacher = self.db_session.get(ClassTeacherModel, request.teacher_id)
+
+            start_date = date.fromisoformat(request.start_date)
+            end_date = date.fromisoformat(request.end_date)
+
+            # As recorrências da aula passam para a nova turma, professor e período
+            self.validate_schedule(
+                request.class_id,
+                teacher.user_cpf,
+                start_date,
+                end_date,
+                [self._Model_to_Recurrence(recurrence) for recurrence in model.recurrences],
+                ERROR_CLASSES_EVENTS_SCHEDULE_CONFLICT,
+                ignore_class_event_id=str(model.id)
+            )
+
+            previous = (model.class_id, model.teacher.user_cpf)
+
+            model.class_id = request.class_id
+            model.teacher_id = request.teacher_id
+            model.start_date = start_date
+            model.end_date = end_date
 
             self.db_session.commit()
             self.db_session.refresh(model)
 
+            self._invalidate_calendar(*previous)
+            self._invalidate_calendar(model.class_id, model.teacher.user_cpf)
+
             return self._Model_to_ClassEventResponse(model)
 
         except HTTPException:
@@ -383,10 +548,14 @@ class ClassesUseCases():
 
             model = get_class_event_by_id(self.db_session,class_event_id)
 
+            affected = (model.class_id, model.teacher.user_cpf, model.start_date, model.end_date)
+
             self.db_session.delete(model)
 
             self.db_session.commit()
 
+            self._invalidate_calendar(*affected)
+
             return Success(MESSAGE_CLASS_EVENT_DELETE_SUCCESS)
 
         except HTTPException:
@@ -408,33 +577,320 @@ class ClassesUseCases():
             - BaseMessage: Mensagem de sucesso.
 
         - Raises:
-            - HTTPException: 409 - Recorrências conflitantes durante o cadastro.
+            - HTTPException: 409 - Recorrências repetidas ou em conflito com outra aula da turma ou do professor.
             - Exception: Erro no servidor.
         """
         try:
 
             model = get_class_event_by_id(self.db_session,class_event_id)
 
-            for recurrence in recurrences:
-
-                if recurrences_exists(self.db_session, model.id, recurrence):
+            self.validate_schedule(
+                model.class_id,
+                model.teacher.user_cpf,
+                model.start_date,
+                model.end_date,
+                recurrences,
+                ERROR_CLASSES_EVENTS_ADD_RECURRENCES_CONFLICT
+            )
 
-                    raise Conflict(ERROR_CLASSES_EVENTS_ADD_RECURRENCES_CONFLICT)
+            for recurrence in recurrences:
 
                 recurrence_model = self._Recurrence_to_Model(model.id, recurrence)
 
                 self.db_session.add(recurrence_model)
 
-            self.db_session.commit()
+            self.db_session.commit() # Recorrências repetidas são barradas por uq_recurrences_event_day_time
+
+            self._invalidate_calendar(model.class_id, model.teacher.user_cpf, model.start_date, model.end_date)
 
             return Success(MESSAGE_CLASSES_EVENTS_ADD_RECURRENCES_SUCCESS)
 
         except HTTPException:
             raise
 
+        except IntegrityError as e:
+            self.db_session.rollback()
+
+            if is_unique_violation(e):
+                raise Conflict(ERROR_CLASSES_EVENTS_ADD_RECURRENCES_CONFLICT)
+
+            raise Server(e)
+
+        except Exception as e:
+            raise Server(e)
+
+    def validate_schedule(
+        self,
+        class_id: str,
+        teacher_cpf: str,
+        start_date: date,
+        end_date: date,
+        recurrences: list[Recurrences],
+        message: str,
+        ignore_class_event_id: str | None = None
+    ) -> None:
+        """
+        Valida de uma vez um conjunto de novas recorrências contra os horários já cadastrados da turma e do
+        professor e entre si
+
+        Os horários cadastrados que se sobrepõem às novas recorrências vêm de uma única consulta
+        (get_overlapping_slots) e find_conflicts confirma os conflitos, incluindo os entre as novas recorrências.
+
+        - Args:
+            - class_id: Turma das novas recorrências.
+            - teacher_cpf: CPF do professor das novas recorrências.
+            - start_date: Início do período da aula.
+            - end_date: Fim do período da aula.
+            - recurrences: Novas recorrências.
+            - message: Mensagem do erro de conflito.
+            - ignore_class_event_id: Aula cujos horários cadastrados não entram na comparação (a aula sendo alterada).
+
+        - Raises:
+            - HTTPException: 409 - Horário em conflito.
+        """
+        # IDs na forma dos lidos do banco, para que os horários cadastrados e os novos sejam comparáveis
+        class_id = normalize_uuid(class_id)
+        ignore_class_event_id = normalize_uuid(ignore_class_event_id) if ignore_class_event_id else None
+
+        candidates = [
+            Slot(
+                class_event_id=None,
+                class_id=class_id,
+                teacher_cpf=teacher_cpf,
+                day_of_week=weekday_number(recurrence.day_of_week),
+                start=unformat_time(recurrence.start_time),
+                end=unformat_time(recurrence.end_time),
+                start_date=start_date,
+                end_date=end_date,
+                new=True
+            )
+            for recurrence in recurrences
+        ]
+
+        existing = [
+            slot for slot in get_overlapping_slots(self.db_session, candidates)
+            if slot.class_event_id != ignore_class_event_id
+        ]
+
+        if find_conflicts(existing + candidates):
+            raise Conflict(message)
+
+
+    def get_timetable(self, class_id: str | None = None, teacher_cpf: str | None = None, on: date | None = None) -> list[TimetableDay]:
+        """
+        Monta a grade semanal de uma turma ou de um professor a partir de uma única consulta
+
+        - Args:
+            - class_id: ID da turma.
+            - teacher_cpf: CPF do professor.
+            - on: Considera apenas as aulas cujo período inclui esta data.
+
+        - Returns:
+            - list[TimetableDay]: Os sete dias da semana, de segunda a domingo, com as aulas em ordem de início.
+
+        - Raises:
+            - HTTPException: 404 - Turma não encontrada.
+            - HTTPException: 422 - Nenhum filtro informado.
+            - Exception: Erro no servidor.
+        """
+        try:
+
+            if class_id is None and teacher_cpf is None:
+                raise UnprocessableEntity(ERROR_CLASSES_TIMETABLE_REQUIRED_FILTER)
+
+            if class_id is not None:
+                class_id = get_class_by_id(self.db_session, class_id).id
+
+            if teacher_cpf is not None:
+                teacher_cpf = unformat_cpf(teacher_cpf)
+
+            rows = get_timetable_rows(self.db_session, class_id, teacher_cpf, on)
+
+            days = {day.value: TimetableDay(day_of_week=day, slots=[]) for day in DaysOfWeek}
+
+            for row in rows:
+                days[weekday_name(row.day_of_week).value].slots.append(
+                    TimetableSlot(
+                        class_event_id=str(row.class_event_id),
+                        class_id=str(row.class_id),
+                        class_info=f"{row.class_name} {row.class_section}",
+                        discipline_id=str(row.discipline_id),
+                        discipline_name=row.discipline_name,
+                        teacher_cpf=row.teacher_cpf,
+                        teacher_name=row.teacher_name,
+                        start_time=format_time(row.start_time),
+                        end_time=format_time(row.end_time),
+                        start_date=row.start_date,
+                        end_date=row.end_date
+                    )
+                )
+
+            return list(days.values())
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+
+
+    def get_calendar(
+        self,
+        class_id: str | None = None,
+        teacher_cpf: str | None = None,
+        child_cpf: str | None = None,
+        start: date | None = None,
+        end: date | None = None
+    ) -> list[CalendarOccurrence]:
+        """
+        Expande as recorrências das aulas de uma turma, de um professor ou das turmas de um aluno nas datas
+        em que acontecem dentro do período
+
+        As ocorrências de cada turma e professor ficam em cache por semana (calendar_cache); apenas as
+        semanas ausentes são buscadas, em uma única consulta por turma ou professor.
+
+        - Args:
+            - class_id: ID da turma.
+            - teacher_cpf: CPF do professor.
+            - child_cpf: CPF do aluno.
+            - start: Primeiro dia do período (padrão: CALENDAR_DEFAULT_PAST_DAYS dias atrás).
+            - end: Último dia do período (padrão: daqui a CALENDAR_DEFAULT_FUTURE_DAYS dias).
+
+        - Returns:
+            - list[CalendarOccurrence]: Ocorrências do período, em ordem de data e horário.
+
+        - Raises:
+            - HTTPException: 404 - Turma ou aluno não encontrado.
+            - HTTPException: 422 - Nenhum filtro informado, CPF inválido ou período inválido.
+            - Exception: Erro no servidor.
+        """
+        try:
+
+            if class_id is None and teacher_cpf is None and child_cpf is None:
+                raise UnprocessableEntity(ERROR_CLASSES_CALENDAR_REQUIRED_FILTER)
+
+            today = date.today()
+
+            start = start or today - timedelta(days=CALENDAR_DEFAULT_PAST_DAYS)
+            end = end or today + timedelta(days=CALENDAR_DEFAULT_FUTURE_DAYS)
+
+            if end < start:
+                raise UnprocessableEntity(ERROR_CLASSES_CALENDAR_INVALID_RANGE)
+
+            if (end - start).days >= CALENDAR_MAX_RANGE_DAYS:
+                raise UnprocessableEntity(ERROR_CLASSES_CALENDAR_RANGE_TOO_LONG)
+
+            entities = []
+
+            if class_id is not None:
+                entities.append(("class", str(get_class_by_id(self.db_session, class_id).id)))
+
+            if teacher_cpf is not None:
+                entities.append(("teacher", unformat_cpf(teacher_cpf)))
+
+            if child_cpf is not None:
+
+                if not validate_cpf(child_cpf):
+                    raise UnprocessableEntity(ERROR_INVALID_CPF)
+
+                child = get_child_by_cpf(self.db_session, unformat_cpf(child_cpf))
+
+                entities += [("class", student_class_id) for student_class_id in get_student_class_ids(self.db_session, child.cpf)]
+
+            occurrences = {}
+
+            for kind, entity_id in dict.fromkeys(entities):
+                for occurrence in self._calendar_weeks(kind, entity_id, start, end):
+                    if start <= occurrence.day <= end:
+                        occurrences[(occurrence.class_event_id, occurrence.day, occurrence.start_time)] = occurrence
+
+            return sorted(occurrences.values(), key=lambda occurrence: (occurrence.day, occurrence.start_time, occurrence.class_info))
+
+        except HTTPException:
+            raise
+
         except Exception as e:
             raise Server(e)
 
+
+    def _calendar_weeks(self, kind: str, entity_id: str, start: date, end: date) -> list[CalendarOccurrence]:
+        """
+        Ocorrências de uma turma ou professor nas semanas que cobrem o período, lidas do cache ou, para as
+        semanas ausentes, calculadas com expand_weekly e guardadas no cache
+
+        - Args:
+            - kind: "class" ou "teacher".
+            - entity_id: ID da turma ou CPF do professor.
+            - start: Primeiro dia do período.
+            - end: Último dia do período.
+
+        - Returns:
+            - list[CalendarOccurrence]: Ocorrências das semanas (segunda a domingo) que tocam o período.
+        """
+        first_week = week_of(start)
+
+        weeks = {
+            week: calendar_cache.get(kind, entity_id, week)
+            for week in (
+                first_week + timedelta(weeks=number)
+                for number in range((week_of(end) - first_week).days // 7 + 1)
+            )
+        }
+
+        missing = [week for week, occurrences in weeks.items() if occurrences is None]
+
+        if missing:
+
+            generation = calendar_cache.generation(kind, entity_id)
+
+            window_start, window_end = missing[0], missing[-1] + timedelta(days=6)
+
+            rows = get_timetable_rows(
+                self.db_session,
+                class_id=entity_id if kind == "class" else None,
+                teacher_cpf=entity_id if kind == "teacher" else None,
+                start=window_start,
+                end=window_end
+            )
+
+            computed = {week: [] for week in missing}
+
+            for row in rows:
+                for day in expand_weekly(row.day_of_week, row.start_date, row.end_date, window_start, window_end):
+
+                    if week_of(day) not in computed:
+                        continue
+
+                    computed[week_of(day)].append(
+                        CalendarOccurrence(
+                            class_event_id=str(row.class_event_id),
+                            class_id=str(row.class_id),
+                            class_info=f"{row.class_name} {row.class_section}",
+                            discipline_id=str(row.discipline_id),
+                            discipline_name=row.discipline_name,
+                            teacher_cpf=row.teacher_cpf,
+                            teacher_name=row.teacher_name,
+                            day=day,
+                            start_time=format_time(row.start_time),
+                            end_time=format_time(row.end_time)
+                        )
+                    )
+
+            calendar_cache.set(kind, entity_id, computed, generation)
+
+            weeks.update(computed)
+
+        return [occurrence for occurrences in weeks.values() for occurrence in occurrences]
+
+
+    def _invalidate_calendar(self, class_id: str, teacher_cpf: str, start_date: date | None = None, end_date: date | None = None) -> None:
+        """
+        Descarta do cache do calendário as semanas da turma e do professor afetadas por uma mudança em uma
+        aula ou em suas recorrências (todas as semanas, se o período não for informado)
+        """
+        event_bus.invalidate_calendar([("class", str(class_id)), ("teacher", teacher_cpf)], start_date, end_date)
+
+
     def delete_recurrences(self, class_event_id: str, recurrences: list[Recurrences]) -> BaseMessage:
         """
         Remove uma lista de recorrências de uma aula
@@ -447,19 +903,23 @@ class ClassesUseCases():
             - BaseMessage: Mensagem de sucesso
 
         - Raises:
-            - HTTPException: 404 - Recorrência não encontrada.
+            - HTTPException: 404 - Aula ou recorrência não encontrada.
             - Exception: Erro no servidor.
         """
         try:
 
+            model = get_class_event_by_id(self.db_session, class_event_id)
+
             for recurrence in recurrences:
 
-                recurrence_model = get_recurrence_by_attributes(self.db_session, class_event_id ,recurrence)
+                recurrence_model = get_recurrence_by_attributes(self.db_session, model.id, recurrence)
 
                 self.db_session.delete(recurrence_model)
 
             self.db_session.commit()
 
+            self._invalidate_calendar(model.class_id, model.teacher.user_cpf, model.start_date, model.end_date)
+
             return Success(MESSAGE_CLASSES_EVENTS_DELETE_RECURRENCES_SUCCESS)
 
         except HTTPException:
@@ -524,4 +984,115 @@ class ClassesUseCases():
         - Returns:
             - ClassEventResponse: Objeto com os dados da aula convertidos.
         """
-        return map_ClassEventModel_to_ClassEventResponse(model)
\ No newline at end of file
+        return map_ClassEventModel_to_ClassEventResponse(model)
+
+
+class AsyncClassesUseCases:
+    """
+    Versão assíncrona de ClassesUseCases, executando as mesmas regras de negócio sobre uma AsyncSession
+    """
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+
+    async def add(self, request: ClassRequest) -> BaseMessage:
+        return await self.db_session.run_sync(
+            lambda session: ClassesUseCases(session).add(request)
+        )
+
+
+    async def get(self, class_id: str) -> ClassResponse:
+        return await self.db_session.run_sync(
+            lambda session: ClassesUseCases(session).get(class_id)
+        )
+
+
+    async def get_all(self) -> list[ClassResponse]:
+        return await self.db_session.run_sync(
+            lambda session: ClassesUseCases(session).get_all()
+        )
+
+
+    async def get_page(self, limit: int, cursor: str | None = None) -> Page[ClassResponse]:
+        return await self.db_session.run_sync(
+            lambda session: ClassesUseCases(session).get_page(limit, cursor)
+        )
+
+
+    async def update(self, class_id: str, request: ClassRequest) -> ClassResponse:
+        return await self.db_session.run_sync(
+            lambda session: ClassesUseCases(session).update(class_id, request)
+        )
+
+
+    async def delete(self, class_id: str) -> BaseMessage:
+        return await self.db_session.run_sync(
+            lambda session: ClassesUseCases(session).delete(class_id)
+        )
+
+
+    async def add_event(self, request: ClassEventRequest) -> BaseMessage:
+        return await self.db_session.run_sync(
+            lambda session: ClassesUseCases(session).add_event(request)
+        )
+
+
+    async def get_event(self, class_event_id: str) -> ClassEventResponse:
+        return await self.db_session.run_sync(
+            lambda session: ClassesUseCases(session).get_event(class_event_id)
+        )
+
+
+    async def get_all_events(self) -> list[ClassEventResponse]:
+        return await self.db_session.run_sync(
+            lambda session: ClassesUseCases(session).get_all_events()
+        )
+
+
+    async def get_events_page(self, limit: int, cursor: str | None = None) -> Page[ClassEventResponse]:
+        return await self.db_session.run_sync(
+            lambda session: ClassesUseCases(session).get_events_page(limit, cursor)
+        )
+
+
+    async def update_event(self, class_event_id: str, request: ClassEventRequest) -> ClassEventResponse:
+        return await self.db_session.run_sync(
+            lambda session: ClassesUseCases(session).update_event(class_event_id, request)
+        )
+
+
+    async def delete_event(self, class_event_id: str) -> BaseMessage:
+        return await self.db_session.run_sync(
+            lambda session: ClassesUseCases(session).delete_event(class_event_id)
+        )
+
+
+    async def add_recurrences(self, class_event_id: str, recurrences: list[Recurrences]) -> BaseMessage:
+        return await self.db_session.run_sync(
+            lambda session: ClassesUseCases(session).add_recurrences(class_event_id, recurrences)
+        )
+
+
+    async def get_timetable(self, class_id: str | None = None, teacher_cpf: str | None = None, on: date | None = None) -> list[TimetableDay]:
+        return await self.db_session.run_sync(
+            lambda session: ClassesUseCases(session).get_timetable(class_id, teacher_cpf, on)
+        )
+
+
+    async def get_calendar(
+        self,
+        class_id: str | None = None,
+        teacher_cpf: str | None = None,
+        child_cpf: str | None = None,
+        start: date | None = None,
+        end: date | None = None
+    ) -> list[CalendarOccurrence]:
+        return await self.db_session.run_sync(
+            lambda session: ClassesUseCases(session).get_calendar(class_id, teacher_cpf, child_cpf, start, end)
+        )
+
+
+    async def delete_recurrences(self, class_event_id: str, recurrences: list[Recurrences]) -> BaseMessage:
+        return await self.db_session.run_sync(
+            lambda session: ClassesUseCases(session).delete_recurrences(class_event_id, recurrences)
+        )
@@ -1,4 +1,6 @@
 from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
@@ -8,14 +10,16 @@ from constants.disciplines import (
     MESSAGE_DISCIPLINE_DELETE_SUCCESS
 )
 from database.models import DisciplinesModel
-from database.queries.existence import discipline_exists
+from database.queries.existence import is_unique_violation
 from database.queries.get import get_discipline_by_name
 from database.queries.get_all import get_all_disciplines
+from database.queries.pagination import split_page
 from schemas.base import BaseMessage
 from schemas.disciplines import(
     DisciplineRequest,
     DisciplineResponse
 )
+from schemas.pagination import Page
 from services.generator.ids import id_generate
 from utils.messages.error import (
     Conflict, 
@@ -44,25 +48,27 @@ class DisciplinesUseCases:
             - Exception: Erro no servidor.
         """
         try:
-            if discipline_exists(
-                self.db_session, 
-                request.name
-            ):
-                raise Conflict(ERROR_DISCIPLINES_ADD_CONFLICT)
-
             discipline = DisciplinesModel(
                 id=id_generate(),
                 name=request.name
             )
 
             self.db_session.add(discipline)
-            self.db_session.commit()
+            self.db_session.commit() # Nomes repetidos são barrados pela restrição única de disciplines.name
 
             return Success(MESSAGE_DISCIPLINE_ADD_SUCCESS)
         
         except HTTPException:
             raise
 
+        except IntegrityError as e:
+            self.db_session.rollback()
+
+            if is_unique_violation(e):
+                raise Conflict(ERROR_DISCIPLINES_ADD_CONFLICT)
+
+            raise Server(e)
+
         except Exception as e:
             raise Server(e)
 
@@ -106,6 +112,40 @@ class DisciplinesUseCases:
         return [self._Model_to_Response(discipline) for discipline in disciplines]
     
 
+    def get_page(self, limit: int, cursor: str | None = None) -> Page[DisciplineResponse]:
+        """
+        Busca uma página de disciplinas, ordenada pela chave primária
+
+        - Args:
+            - limit: Quantidade de itens por página.
+            - cursor: Cursor devolvido pela página anterior (None para a primeira página).
+
+        - Returns:
+            - Page[DisciplineResponse]: Itens da página e cursor da próxima página.
+
+        - Raises:
+            - BadRequest: Cursor inválido.
+            - NotFound: Nenhuma disciplina encontrada.
+            - Exception: Erro no servidor.
+        """
+        try:
+
+            disciplines = get_all_disciplines(self.db_session, limit, cursor)
+
+            disciplines, next_cursor = split_page(disciplines, limit, DisciplinesModel.id)
+
+            return Page(
+                items=[self._Model_to_Response(discipline) for discipline in disciplines],
+                next_cursor=next_cursor
+            )
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+    
+
     def update(self, name: str, request: DisciplineRequest) -> DisciplineResponse:
 
         """
@@ -173,4 +213,48 @@ class DisciplinesUseCases:
 
         return DisciplineResponse(
             **model.dict()
-        )
\ No newline at end of file
+        )
+
+
+class AsyncDisciplinesUseCases:
+    """
+    Versão assíncrona de DisciplinesUseCases, executando as mesmas regras de negócio sobre uma AsyncSession
+    """
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+
+    async def add(self, request: DisciplineRequest) -> BaseMessage:
+        return await self.db_session.run_sync(
+            lambda session: DisciplinesUseCases(session).add(request)
+        )
+
+
+    async def get(self, discipline_name: str) -> DisciplineResponse:
+        return await self.db_session.run_sync(
+            lambda session: DisciplinesUseCases(session).get(discipline_name)
+        )
+
+
+    async def get_all(self) -> list[DisciplineResponse]:
+        return await self.db_session.run_sync(
+            lambda session: DisciplinesUseCases(session).get_all()
+        )
+
+
+    async def get_page(self, limit: int, cursor: str | None = None) -> Page[DisciplineResponse]:
+        return await self.db_session.run_sync(
+            lambda session: DisciplinesUseCases(session).get_page(limit, cursor)
+        )
+
+
+    async def update(self, name: str, request: DisciplineRequest) -> DisciplineResponse:
+        return await self.db_session.run_sync(
+            lambda session: DisciplinesUseCases(session).update(name, request)
+        )
+
+
+    async def delete(self, discipline_name: str) -> BaseMessage:
+        return await self.db_session.run_sync(
+            lambda session: DisciplinesUseCases(session).delete(discipline_name)
+        )
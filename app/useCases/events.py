@@ -0,0 +1,88 @@
+from json import dumps
+from typing import AsyncIterator
+
+
+from constants.events import (
+    ERROR_EVENTS_FORBIDDEN_LEVEL,
+    EVENTS_TOKEN_SCOPE,
+    EVENTS_TOKEN_SECONDS
+)
+from schemas.base import (
+    EventKind,
+    UserLevel
+)
+from schemas.user import AccessToken
+from services.events.broker import (
+    EventBroker,
+    event_broker
+)
+from services.security.tokens import encode_scoped_token
+from utils.messages.error import Forbidden
+
+
+class EventsUseCases:
+    def __init__(self, broker: EventBroker = event_broker):
+        self.broker = broker
+
+
+    def authorize(self, user: dict) -> str:
+        """
+        Verifica se o usuário logado pode receber eventos
+
+        - Args:
+            - user: Conteúdo do token do usuário.
+
+        - Returns:
+            - str: CPF do usuário.
+
+        - Raises:
+            - Forbidden: Usuário que não é responsável nem professor.
+        """
+        if user.get("level") not in (UserLevel.PARENT.value, UserLevel.TEACHER.value):
+            raise Forbidden(ERROR_EVENTS_FORBIDDEN_LEVEL)
+
+        return user["cpf"]
+
+
+    def issue_token(self, user: dict) -> AccessToken:
+        """
+        Gera o token de curta duração aceito no parâmetro token de GET /events/stream
+
+        - Args:
+            - user: Conteúdo do token do login.
+
+        - Returns:
+            - AccessToken: Token restrito ao fluxo de eventos, válido por EVENTS_TOKEN_SECONDS segundos.
+
+        - Raises:
+            - Forbidden: Usuário que não é responsável nem professor.
+        """
+        cpf = self.authorize(user)
+
+        return AccessToken(
+            token=encode_scoped_token({"cpf": cpf, "level": user["level"]}, EVENTS_TOKEN_SCOPE, EVENTS_TOKEN_SECONDS)
+        )
+
+
+    async def stream(self, cpf: str) -> AsyncIterator[dict]:
+        """
+        Assina os eventos do usuário e os entrega no formato do EventSourceResponse, até o cliente desconectar
+
+        A assinatura só existe enquanto o fluxo está aberto. Se a fila encheu e eventos foram descartados, um
+        evento resync avisa o cliente para buscar os dados de novo antes de continuar.
+        """
+        subscription = self.broker.subscribe(cpf)
+
+        try:
+            while True:
+
+                event = await subscription.get()
+
+                if subscription.dropped:
+                    yield {"event": EventKind.RESYNC.value, "data": dumps({"dropped": subscription.dropped})}
+                    subscription.dropped = 0
+
+                yield {"event": event.kind, "data": dumps({"action": event.action, **event.data})}
+
+        finally:
+            self.broker.unsubscribe(subscription)
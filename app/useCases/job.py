@@ -0,0 +1,168 @@
+from datetime import datetime
+from json import dumps
+from os.path import isfile
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+from constants.job import (
+    ERROR_JOB_FAILED,
+    ERROR_JOB_FILE_NOT_FOUND,
+    ERROR_JOB_NOT_FINISHED,
+    ERROR_JOB_NOT_FOUND,
+    JOB_KIND_REPORT_CARDS
+)
+from database.models import JobModel
+from database.queries.get import get_class_by_id
+from database.repositories.job import JobRepository
+from schemas.base import JobStatus
+from schemas.job import (
+    JobResponse,
+    ReportCardJobRequest
+)
+from services.generator.ids import id_generate
+from services.jobs.runner import job_runner
+from utils.messages.error import (
+    Conflict,
+    NotFound,
+    Server
+)
+
+
+class JobUseCases:
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+        self.repository = JobRepository(db_session)
+
+
+    def add_report_cards(self, request: ReportCardJobRequest) -> JobResponse:
+        """
+        Cria a tarefa que gera os boletins em PDF e a coloca na fila de execução em segundo plano
+
+        - Args:
+            - request: Turma dos boletins (ou toda a escola).
+
+        - Returns:
+            - JobResponse: Tarefa criada, para acompanhar em GET /jobs/{id}.
+
+        - Raises:
+            - NotFound: Turma não encontrada.
+            - Server: Erro no servidor.
+        """
+        try:
+
+            params = {}
+
+            if request.class_id is not None:
+                params["class_id"] = str(get_class_by_id(self.db_session, request.class_id).id)
+
+            now = datetime.now()
+
+            model = JobModel(
+                id=id_generate(),
+                kind=JOB_KIND_REPORT_CARDS,
+                status=JobStatus.PENDING.value,
+                params=dumps(params),
+                total=0,
+                done=0,
+                created_at=now,
+                updated_at=now
+            )
+
+            self.repository.add(model)
+
+            job_runner.submit(model.id)
+
+            return self.repository.map_model_to_response(model)
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            self.db_session.rollback()
+            raise Server(e)
+
+
+    def get(self, id: str) -> JobResponse:
+        """
+        Busca a situação e o andamento de uma tarefa
+
+        - Raises:
+            - NotFound: Tarefa não encontrada.
+            - Server: Erro no servidor.
+        """
+        try:
+
+            model = self.repository.get(id)
+
+            if not model:
+                raise NotFound(ERROR_JOB_NOT_FOUND)
+
+            return self.repository.map_model_to_response(model)
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+
+
+    def get_result_path(self, id: str) -> str:
+        """
+        Retorna o caminho do arquivo gerado por uma tarefa concluída
+
+        - Raises:
+            - NotFound: Tarefa ou arquivo não encontrados.
+            - Conflict: Tarefa ainda em execução ou com falha.
+            - Server: Erro no servidor.
+        """
+        try:
+
+            model = self.repository.get(id)
+
+            if not model:
+                raise NotFound(ERROR_JOB_NOT_FOUND)
+
+            if model.status == JobStatus.FAILED.value:
+                raise Conflict(f"{ERROR_JOB_FAILED}: {model.error}")
+
+            if model.status != JobStatus.DONE.value:
+                raise Conflict(ERROR_JOB_NOT_FINISHED)
+
+            if not isfile(model.result_path):
+                raise NotFound(ERROR_JOB_FILE_NOT_FOUND)
+
+            return model.result_path
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+
+
+class AsyncJobUseCases:
+    """
+    Versão assíncrona de JobUseCases, executando as mesmas regras de negócio sobre uma AsyncSession
+    """
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+
+    async def add_report_cards(self, request: ReportCardJobRequest) -> JobResponse:
+        return await self.db_session.run_sync(
+            lambda session: JobUseCases(session).add_report_cards(request)
+        )
+
+
+    async def get(self, id: str) -> JobResponse:
+        return await self.db_session.run_sync(
+            lambda session: JobUseCases(session).get(id)
+        )
+
+
+    async def get_result_path(self, id: str) -> str:
+        return await self.db_session.run_sync(
+            lambda session: JobUseCases(session).get_result_path(id)
+        )
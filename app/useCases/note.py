@@ -1,31 +1,78 @@
+from logging import getLogger
 from fastapi import HTTPException
+from pydantic import ValidationError
+from typing import AsyncIterator
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
+from constants.base import (
+    ERROR_BULK_DUPLICATED_ROW,
+    ERROR_INVALID_CPF
+)
+from constants.child import ERROR_CHILD_GET_NOT_FOUND
+from constants.classes import ERROR_CLASSES_GET_NOT_FOUND
+from constants.disciplines import ERROR_DISCIPLINES_GET_NOT_FOUND
 from constants.note import (
+    ERROR_NOTE_ALREADY_ADD,
     ERROR_NOTE_NOT_FOUND,
     ERROR_NOTE_NOT_FOUND_NOTES,
     SUCCESS_NOTE_ADD,
     SUCCESS_NOTE_DELETE
 )
+from database.models import NoteModel
+from database.queries.events import (
+    get_children_parents,
+    get_classes_teachers
+)
+from database.queries.get import (
+    get_child_by_cpf,
+    get_class_by_id
+)
+from database.queries.pagination import split_page
+from database.queries.stream import stream_notes
 from database.repositories.note import NoteRepository
-from schemas.base import BaseMessage
+from database.repositories.notification import NotificationRepository
+from schemas.base import (
+    BaseMessage,
+    EventAction,
+    EventKind,
+    NotificationKind
+)
+from schemas.bulk import (
+    BulkResponse,
+    BulkRowResult
+)
 from schemas.note import (
+    NoteDB,
     NoteFilters,
     NoteRequest,
     NoteResponse,
-    NoteUpdate
+    NoteUpdate,
+    ReportCardResponse
 )
+from schemas.pagination import Page
+from services.email.outbox import outbox_sender
+from services.events.broker import Event
+from services.events.bus import event_bus
+from utils.bulk import validation_detail
+from utils.format import unformat_cpf
 from utils.messages.error import(
     NotFound,
-    Server
+    Server,
+    UnprocessableEntity
 )
 from utils.messages.success import Success
+from utils.validate import validate_cpf
+
+
+logger = getLogger(__name__)
 
 
 class NoteUseCases:
     def __init__(self, db_session: Session):
         self.repository = NoteRepository(db_session)
+        self.notification_repository = NotificationRepository(db_session)
         
     
     def add(self, request: NoteRequest) -> BaseMessage:
@@ -40,13 +87,27 @@ class NoteUseCases:
         """
         try:
             
-            self.repository.validate_note(request)
+            self.repository.validate_references(request)
             
             model = self.repository.map_request_to_model(request)
             
-            self.repository.add(model)
+            note = dict(request.dict(), id=model.id)
+            
+            self.notification_repository.add_for_children(
+                NotificationKind.NOTE,
+                [
+                    (
+                        request.child_cpf,
+                        *self.notification_repository.map_note_to_notification(
+                            note, self.repository.get_discipline_name(request.discipline_id)
+                        )
+                    )
+                ]
+            )
+            
+            self.repository.add(model) # Confirma a nota e as notificações dos responsáveis juntas
             
-            return Success(SUCCESS_NOTE_ADD)
+            outbox_sender.notify()
             
         except HTTPException:
             
@@ -56,6 +117,138 @@ class NoteUseCases:
             
             raise Server(e)
         
+        self.publish_events(EventAction.CREATED, [note])
+        
+        return Success(SUCCESS_NOTE_ADD)
+        
+        
+    def bulk_add(self, rows: list[dict]) -> BulkResponse[NoteResponse]:
+        """
+        Cadastra várias notas de uma vez (ex: as notas de uma turma inteira), informando o resultado de cada registro
+        
+        A existência de disciplinas, turmas e alunos e as notas já cadastradas são verificadas com poucas
+        consultas IN para o lote todo, e as notas válidas são inseridas com executemany em uma única transação,
+        junto com as notificações dos responsáveis.
+        Registros inválidos são recusados sem impedir os demais.
+        
+        - Args:
+            - rows: Registros com os mesmos campos de NoteRequest.
+            
+        - Returns:
+            - BulkResponse[NoteResponse]: Quantidade de cadastros, de falhas e o resultado de cada registro.
+            
+        - Raises:
+            - Server: Caso ocorra algum erro no servidor. Nesse caso nenhuma nota é cadastrada.
+        """
+        try:
+            
+            results: list[BulkRowResult[NoteResponse] | None] = [None] * len(rows)
+            
+            requests: dict[int, NoteRequest] = {}
+            
+            seen_keys = set()
+            
+            for index, row in enumerate(rows):
+                
+                try:
+                    request = self.repository.map_row_to_request(row)
+                    
+                except HTTPException as e:
+                    results[index] = BulkRowResult(row=index + 1, status_code=e.status_code, detail=e.detail)
+                    continue
+                
+                except (ValidationError, TypeError) as e:
+                    detail = validation_detail(e) if isinstance(e, ValidationError) else str(e)
+                    results[index] = BulkRowResult(row=index + 1, status_code=422, detail=detail)
+                    continue
+                
+                key = self.repository.note_key(request)
+                
+                if key in seen_keys:
+                    results[index] = BulkRowResult(row=index + 1, status_code=409, detail=ERROR_BULK_DUPLICATED_ROW)
+                    continue
+                
+                seen_keys.add(key)
+                requests[index] = request
+                
+            existing_notes = self.repository.existing_keys(list(requests.values()))
+            
+            disciplines, classes, children = self.repository.get_related(list(requests.values()))
+            
+            notes = []
+            
+            for index, request in requests.items():
+                
+                if self.repository.note_key(request) in existing_notes:
+                    error = (409, ERROR_NOTE_ALREADY_ADD)
+                    
+                elif request.discipline_id not in disciplines:
+                    error = (404, ERROR_DISCIPLINES_GET_NOT_FOUND)
+                    
+                elif request.class_id not in classes:
+                    error = (404, ERROR_CLASSES_GET_NOT_FOUND)
+                    
+                elif request.child_cpf not in children:
+                    error = (404, ERROR_CHILD_GET_NOT_FOUND)
+                    
+                else:
+                    error = None
+                    
+                if error:
+                    results[index] = BulkRowResult(row=index + 1, status_code=error[0], detail=error[1])
+                    continue
+                
+                note = NoteDB(**request.dict()).dict()
+                
+                notes.append(note)
+                
+                results[index] = BulkRowResult(
+                    row=index + 1,
+                    status_code=201,
+                    item=self.repository.map_to_response(
+                        note,
+                        children[request.child_cpf],
+                        disciplines[request.discipline_id],
+                        classes[request.class_id]
+                    )
+                )
+                
+            if notes:
+                self.notification_repository.add_for_children(
+                    NotificationKind.NOTE,
+                    [
+                        (
+                            note["child_cpf"],
+                            *self.notification_repository.map_note_to_notification(
+                                note, disciplines[note["discipline_id"]].name
+                            )
+                        )
+                        for note in notes
+                    ]
+                )
+                
+                self.repository.add_all(notes)
+                
+                outbox_sender.notify()
+                
+        except HTTPException:
+            
+            raise
+        
+        except Exception as e:
+            
+            self.repository.db_session.rollback()
+            
+            raise Server(e)
+        
+        self.publish_events(EventAction.CREATED, notes)
+        
+        return BulkResponse(
+            created=len(notes),
+            failed=len(rows) - len(notes),
+            results=results
+        )
+        
         
     def get_all(self, filters: NoteFilters = NoteFilters()) -> list[NoteResponse]:
         """
@@ -69,16 +262,12 @@ class NoteUseCases:
         """
         try:
             
-            models = self.repository.get_all()
+            models = self.repository.get_all(filters)
 
-            if not models:
+            if not models and not self.repository.exists_any():
                 
                 raise NotFound(ERROR_NOTE_NOT_FOUND_NOTES)
             
-            for key, value in filters.dict().items():
-                
-                models = [model for model in models if getattr(model, key) == value]
-            
             response = [self.repository.map_model_to_response(model) for model in models]
             
             return response
@@ -92,6 +281,85 @@ class NoteUseCases:
             raise Server(e)
         
         
+    def get_page(self, filters: NoteFilters, limit: int, cursor: str | None = None) -> Page[NoteResponse]:
+        """
+        Busca uma página de notas que atendem aos filtros, ordenada pela chave primária
+
+        - Args:
+            - limit: Quantidade de itens por página.
+            - cursor: Cursor devolvido pela página anterior (None para a primeira página).
+            - filters: Objeto com os filtros para busca.
+
+        - Returns:
+            - Page[NoteResponse]: Itens da página e cursor da próxima página.
+
+        - Raises:
+            - BadRequest: Cursor inválido.
+            - NotFound: Nenhuma nota cadastrada.
+            - Server: Erro no servidor.
+        """
+        try:
+
+            models = self.repository.get_all(filters, limit, cursor)
+
+            if not models and cursor is None and not self.repository.exists_any():
+                
+                raise NotFound(ERROR_NOTE_NOT_FOUND_NOTES)
+            
+            models, next_cursor = split_page(models, limit, NoteModel.id)
+            
+            return Page(
+                items=[self.repository.map_model_to_response(model) for model in models],
+                next_cursor=next_cursor
+            )
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+        
+        
+    def report_cards(self, class_id: str | None = None, child_cpf: str | None = None) -> list[ReportCardResponse]:
+        """
+        Gera os boletins (médias por semestre e disciplina, média geral, classificação e situação) de uma
+        turma, de um aluno ou, sem filtros, de toda a escola, com as médias agregadas no banco
+
+        - Args:
+            - class_id: ID da turma.
+            - child_cpf: CPF do aluno.
+
+        - Returns:
+            - list[ReportCardResponse]: Um boletim por aluno e turma, em ordem de classificação na turma.
+
+        - Raises:
+            - NotFound: Turma ou aluno não encontrados.
+            - UnprocessableEntity: CPF inválido.
+            - Server: Erro no servidor.
+        """
+        try:
+
+            if class_id is not None:
+                class_id = get_class_by_id(self.repository.db_session, class_id).id
+
+            if child_cpf is not None:
+
+                if not validate_cpf(child_cpf):
+                    raise UnprocessableEntity(ERROR_INVALID_CPF)
+
+                child_cpf = get_child_by_cpf(self.repository.db_session, unformat_cpf(child_cpf)).cpf
+
+            rows = self.repository.get_report_card_rows(class_id, child_cpf)
+
+            return self.repository.map_rows_to_report_cards(rows)
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+
+
     def update(self, request: NoteUpdate) -> NoteResponse:
         """
         Atualiza uma nota no banco de dados
@@ -115,9 +383,9 @@ class NoteUseCases:
                         
             updated_model = self.repository.update(model)
             
-            response = self.repository.map_model_to_response(updated_model)
+            note = updated_model.dict()
             
-            return response
+            response = self.repository.map_model_to_response(updated_model)
             
         except HTTPException:
             
@@ -127,6 +395,10 @@ class NoteUseCases:
             
             raise Server(e)
         
+        self.publish_events(EventAction.UPDATED, [note])
+        
+        return response
+        
         
     def delete(self, id: str) -> BaseMessage:
         """
@@ -153,4 +425,104 @@ class NoteUseCases:
         
         except Exception as e:
             
-            raise Server(e)
\ No newline at end of file
+            raise Server(e)
+
+
+    def publish_events(self, action: EventAction, notes: list[dict]) -> None:
+        """
+        Publica, depois do commit, um evento por nota para os responsáveis do aluno e os professores da turma
+        
+        Sem assinaturas abertas (GET /events/stream) em nenhum worker, os destinatários nem são buscados. A
+        entrega é feita na medida do possível: falhas são registradas no log e não afetam a resposta, já que
+        as notas foram confirmadas.
+        
+        - Args:
+            - action: Se as notas foram criadas ou atualizadas.
+            - notes: Notas no formato de NoteDB.dict().
+        """
+        try:
+            
+            if not notes or not event_bus.has_subscribers():
+                return
+        
+            parents = get_children_parents(self.repository.db_session, {note["child_cpf"] for note in notes})
+            teachers = get_classes_teachers(self.repository.db_session, {str(note["class_id"]) for note in notes})
+        
+            event_bus.publish_events([
+                Event(
+                    kind=EventKind.NOTE.value,
+                    action=action.value,
+                    data={
+                        "id": str(note["id"]),
+                        "child_cpf": note["child_cpf"],
+                        "class_id": str(note["class_id"]),
+                        "discipline_id": str(note["discipline_id"])
+                    },
+                    recipients=frozenset(
+                        parents.get(note["child_cpf"], set()) | teachers.get(str(note["class_id"]), set())
+                    )
+                )
+                for note in notes
+            ])
+
+        except Exception:
+            self.repository.db_session.rollback()
+            logger.exception("Falha ao publicar os eventos das notas")
+
+
+class AsyncNoteUseCases:
+    """
+    Versão assíncrona de NoteUseCases, executando as mesmas regras de negócio sobre uma AsyncSession
+    """
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+
+    async def add(self, request: NoteRequest) -> BaseMessage:
+        return await self.db_session.run_sync(
+            lambda session: NoteUseCases(session).add(request)
+        )
+
+
+    async def bulk_add(self, rows: list[dict]) -> BulkResponse[NoteResponse]:
+        return await self.db_session.run_sync(
+            lambda session: NoteUseCases(session).bulk_add(rows)
+        )
+
+
+    async def get_all(self, filters: NoteFilters = NoteFilters()) -> list[NoteResponse]:
+        return await self.db_session.run_sync(
+            lambda session: NoteUseCases(session).get_all(filters)
+        )
+
+
+    async def get_page(self, filters: NoteFilters, limit: int, cursor: str | None = None) -> Page[NoteResponse]:
+        return await self.db_session.run_sync(
+            lambda session: NoteUseCases(session).get_page(filters, limit, cursor)
+        )
+
+
+    async def stream(self, filters: NoteFilters = NoteFilters()) -> AsyncIterator[NoteResponse]:
+        """
+        Percorre todas as notas que atendem aos filtros, convertendo uma por vez, para exportações
+        """
+        async for model in stream_notes(filters):
+            yield NoteRepository.map_model_to_response(model)
+
+
+    async def report_cards(self, class_id: str | None = None, child_cpf: str | None = None) -> list[ReportCardResponse]:
+        return await self.db_session.run_sync(
+            lambda session: NoteUseCases(session).report_cards(class_id, child_cpf)
+        )
+
+
+    async def update(self, request: NoteUpdate) -> NoteResponse:
+        return await self.db_session.run_sync(
+            lambda session: NoteUseCases(session).update(request)
+        )
+
+
+    async def delete(self, id: str) -> BaseMessage:
+        return await self.db_session.run_sync(
+            lambda session: NoteUseCases(session).delete(id)
+        )
@@ -0,0 +1,360 @@
+from datetime import (
+    date,
+    datetime,
+    time,
+    timedelta
+)
+from logging import getLogger
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+from constants.base import ERROR_INVALID_CPF
+from constants.presence import (
+    ERROR_PRESENCE_CHILD_NOT_IN_CLASS,
+    ERROR_PRESENCE_INVALID_RANGE,
+    ERROR_PRESENCE_OUTSIDE_CLASS_EVENT,
+    ERROR_PRESENCE_RANGE_TOO_LONG,
+    PRESENCE_MAX_RANGE_DAYS
+)
+from database.queries.events import (
+    get_children_parents,
+    get_class_event_teacher
+)
+from database.queries.get import (
+    get_child_by_cpf,
+    get_class_by_id,
+    get_class_event_by_id
+)
+from database.repositories.notification import NotificationRepository
+from database.repositories.presence import PresenceRepository
+from schemas.base import (
+    EventAction,
+    EventKind,
+    NotificationKind,
+    PresenceType
+)
+from schemas.presence import (
+    AttendanceResponse,
+    PresenceResponse,
+    RollCallRequest,
+    RollCallResponse
+)
+from services.email.outbox import outbox_sender
+from services.events.broker import Event
+from services.events.bus import event_bus
+from services.generator.ids import id_generate
+from utils.format import unformat_cpf
+from utils.messages.error import (
+    Server,
+    UnprocessableEntity
+)
+from utils.validate import validate_cpf
+
+
+logger = getLogger(__name__)
+
+
+def build_period(start: date, end: date) -> tuple[datetime, datetime]:
+    """
+    Converte um intervalo de datas (inclusivo) para o intervalo de datas e horas usado nas consultas
+
+    - Args:
+        - start: Primeiro dia do período.
+        - end: Último dia do período.
+
+    - Returns:
+        - tuple[datetime, datetime]: Início do primeiro dia (inclusivo) e início do dia seguinte ao último (exclusivo).
+
+    - Raises:
+        - UnprocessableEntity: Período invertido ou maior que PRESENCE_MAX_RANGE_DAYS.
+    """
+    if end < start:
+        raise UnprocessableEntity(ERROR_PRESENCE_INVALID_RANGE)
+
+    if (end - start).days >= PRESENCE_MAX_RANGE_DAYS:
+        raise UnprocessableEntity(ERROR_PRESENCE_RANGE_TOO_LONG)
+
+    return datetime.combine(start, time.min), datetime.combine(end + timedelta(days=1), time.min)
+
+
+class PresenceUseCases:
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+        self.repository = PresenceRepository(db_session)
+        self.notification_repository = NotificationRepository(db_session)
+
+
+    def roll_call(self, request: RollCallRequest) -> RollCallResponse:
+        """
+        Registra a chamada de uma turma inteira em uma ocorrência de aula, em uma única transação
+
+        Os alunos são validados com uma única consulta IN na turma da aula. Uma chamada já registrada para
+        a mesma ocorrência (mesma aula e início) é substituída, assim como as notificações de falta ainda
+        não enviadas aos responsáveis.
+
+        - Args:
+            - request: Aula, horário da ocorrência e presença de cada aluno.
+
+        - Returns:
+            - RollCallResponse: Ocorrência registrada e quantidade de presenças e faltas.
+
+        - Raises:
+            - NotFound: Aula não encontrada.
+            - UnprocessableEntity: Data fora do período da aula ou aluno fora da turma.
+            - Server: Erro no servidor.
+        """
+        try:
+
+            class_event = get_class_event_by_id(self.db_session, request.class_event_id)
+
+            if not class_event.start_date <= request.start_class.date() <= class_event.end_date:
+                raise UnprocessableEntity(ERROR_PRESENCE_OUTSIDE_CLASS_EVENT)
+
+            child_cpfs = {presence.child_cpf for presence in request.presences}
+
+            if self.repository.get_class_students(class_event.class_id, child_cpfs) != child_cpfs:
+                raise UnprocessableEntity(ERROR_PRESENCE_CHILD_NOT_IN_CLASS)
+
+            rows = [
+                {
+                    "id": id_generate(),
+                    "class_event_id": class_event.id,
+                    "child_cpf": presence.child_cpf,
+                    "type": presence.type.value,
+                    "start_class": request.start_class,
+                    "end_class": request.end_class
+                }
+                for presence in request.presences
+            ]
+
+            absence = self.notification_repository.map_absence_to_notification(
+                request.start_class, class_event.discipline.name
+            )
+
+            self.notification_repository.add_for_children(
+                NotificationKind.ABSENCE,
+                [
+                    (presence.child_cpf, *absence)
+                    for presence in request.presences
+                    if presence.type == PresenceType.F
+                ],
+                reference=self.notification_repository.absence_reference(class_event.id, request.start_class)
+            )
+
+            self.repository.replace_roll_call(class_event.id, request.start_class, rows)
+
+            outbox_sender.notify()
+
+            present = sum(1 for presence in request.presences if presence.type == PresenceType.P)
+
+            response = RollCallResponse(
+                class_event_id=class_event.id,
+                start_class=request.start_class,
+                end_class=request.end_class,
+                present=present,
+                absent=len(request.presences) - present
+            )
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            self.db_session.rollback()
+            raise Server(e)
+
+        self.publish_events(request, present)
+
+        return response
+
+
+    def publish_events(self, request: RollCallRequest, present: int) -> None:
+        """
+        Publica, depois do commit, a presença de cada aluno para os seus responsáveis e o resumo da chamada
+        para o professor da aula
+
+        Sem assinaturas abertas (GET /events/stream) em nenhum worker, os destinatários nem são buscados. A
+        entrega é feita na medida do possível: falhas são registradas no log e não afetam a resposta, já que
+        a chamada foi confirmada.
+        """
+        try:
+
+            if not event_bus.has_subscribers():
+                return
+
+            start_class = request.start_class.isoformat()
+
+            parents = get_children_parents(self.db_session, {presence.child_cpf for presence in request.presences})
+
+            events = [
+                Event(
+                    kind=EventKind.PRESENCE.value,
+                    action=EventAction.CREATED.value,
+                    data={
+                        "class_event_id": request.class_event_id,
+                        "start_class": start_class,
+                        "child_cpf": presence.child_cpf,
+                        "type": presence.type.value
+                    },
+                    recipients=frozenset(parents.get(presence.child_cpf, set()))
+                )
+                for presence in request.presences
+            ]
+
+            teacher_cpf = get_class_event_teacher(self.db_session, request.class_event_id)
+
+            if teacher_cpf:
+                events.append(
+                    Event(
+                        kind=EventKind.PRESENCE.value,
+                        action=EventAction.CREATED.value,
+                        data={
+                            "class_event_id": request.class_event_id,
+                            "start_class": start_class,
+                            "present": present,
+                            "absent": len(request.presences) - present
+                        },
+                        recipients=frozenset({teacher_cpf})
+                    )
+                )
+
+            event_bus.publish_events(events)
+
+        except Exception:
+            self.db_session.rollback()
+            logger.exception("Falha ao publicar os eventos da chamada")
+
+
+    def get_by_child(self, child_cpf: str, start: date, end: date) -> list[PresenceResponse]:
+        """
+        Busca as presenças de um aluno em um período
+
+        - Args:
+            - child_cpf: CPF do aluno.
+            - start: Primeiro dia do período.
+            - end: Último dia do período.
+
+        - Returns:
+            - list[PresenceResponse]: Presenças do período, em ordem cronológica.
+
+        - Raises:
+            - NotFound: Aluno não encontrado.
+            - UnprocessableEntity: CPF ou período inválidos.
+            - Server: Erro no servidor.
+        """
+        try:
+
+            if not validate_cpf(child_cpf):
+                raise UnprocessableEntity(ERROR_INVALID_CPF)
+
+            child = get_child_by_cpf(self.db_session, unformat_cpf(child_cpf))
+
+            models = self.repository.get_by_child(child.cpf, *build_period(start, end))
+
+            return [self.repository.map_model_to_response(model) for model in models]
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+
+
+    def get_by_class(self, class_id: str, start: date, end: date) -> list[PresenceResponse]:
+        """
+        Busca as presenças de todos os alunos de uma turma em um período
+
+        - Args:
+            - class_id: ID da turma.
+            - start: Primeiro dia do período.
+            - end: Último dia do período.
+
+        - Returns:
+            - list[PresenceResponse]: Presenças do período, em ordem cronológica e por aluno.
+
+        - Raises:
+            - NotFound: Turma não encontrada.
+            - UnprocessableEntity: Período inválido.
+            - Server: Erro no servidor.
+        """
+        try:
+
+            class_ = get_class_by_id(self.db_session, class_id)
+
+            models = self.repository.get_by_class(class_.id, *build_period(start, end))
+
+            return [self.repository.map_model_to_response(model) for model in models]
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+
+
+    def get_class_attendance(self, class_id: str, start: date, end: date) -> list[AttendanceResponse]:
+        """
+        Calcula a frequência de cada aluno de uma turma nos meses do período, a partir das contagens mensais
+
+        - Args:
+            - class_id: ID da turma.
+            - start: Data no primeiro mês do período.
+            - end: Data no último mês do período.
+
+        - Returns:
+            - list[AttendanceResponse]: Presenças, faltas e percentual de cada aluno com chamada no período.
+
+        - Raises:
+            - NotFound: Turma não encontrada.
+            - UnprocessableEntity: Período inválido.
+            - Server: Erro no servidor.
+        """
+        try:
+
+            if end < start:
+                raise UnprocessableEntity(ERROR_PRESENCE_INVALID_RANGE)
+
+            class_ = get_class_by_id(self.db_session, class_id)
+
+            rows = self.repository.get_class_attendance(class_.id, start, end)
+
+            return [self.repository.map_attendance_to_response(row) for row in rows]
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+
+
+class AsyncPresenceUseCases:
+    """
+    Versão assíncrona de PresenceUseCases, executando as mesmas regras de negócio sobre uma AsyncSession
+    """
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+
+    async def roll_call(self, request: RollCallRequest) -> RollCallResponse:
+        return await self.db_session.run_sync(
+            lambda session: PresenceUseCases(session).roll_call(request)
+        )
+
+
+    async def get_by_child(self, child_cpf: str, start: date, end: date) -> list[PresenceResponse]:
+        return await self.db_session.run_sync(
+            lambda session: PresenceUseCases(session).get_by_child(child_cpf, start, end)
+        )
+
+
+    async def get_by_class(self, class_id: str, start: date, end: date) -> list[PresenceResponse]:
+        return await self.db_session.run_sync(
+            lambda session: PresenceUseCases(session).get_by_class(class_id, start, end)
+        )
+
+
+    async def get_class_attendance(self, class_id: str, start: date, end: date) -> list[AttendanceResponse]:
+        return await self.db_session.run_sync(
+            lambda session: PresenceUseCases(session).get_class_attendance(class_id, start, end)
+        )
@@ -1,9 +1,18 @@
 from fastapi import HTTPException
-from sqlalchemy import select
+from typing import AsyncIterator
+from pydantic import ValidationError
+from sqlalchemy import (
+    insert,
+    select
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
-from constants.base import ERROR_INVALID_CPF
+from constants.base import (
+    ERROR_BULK_DUPLICATED_ROW,
+    ERROR_INVALID_CPF
+)
 from constants.child import (
     ERROR_CHILD_ADD_CONFLICT_FIELD_CPF,
     ERROR_CHILD_ADD_NOT_FOUND_PARENT,
@@ -21,8 +30,11 @@ from constants.child import (
     MESSAGE_CHILD_DELETE_SUCCESS,
     MIN_PARENT
 )
+from constants.classes import ERROR_CLASSES_GET_NOT_FOUND
+from database.base import normalize_uuid
 from database.queries.existence import(
     child_exists,
+    existing_values,
     parent_exists
 )
 from database.queries.get import (
@@ -30,21 +42,38 @@ from database.queries.get import (
     get_class_by_id, get_class_student_by_child_cpf
 )
 from database.queries.get_all import get_all_children
+from database.queries.pagination import split_page
+from database.queries.stream import stream_children
+from database.mapping.classes import build_class_info
 from database.mapping.student import (
     map_ChildModel_to_StudentResponse,
+    map_row_to_StudentRequest,
     map_StudentRequest_to_ChildModel
 )
 from database.models import(
+    ChildModel,
     ChildParentsModel,
-    ClassStudentModel
+    ClassModel,
+    ClassStudentModel,
+    UserModel
 )
 from schemas.base import BaseMessage, Kinship
+from schemas.bulk import (
+    BulkResponse,
+    BulkRowResult
+)
 from schemas.child import(
     ChildRequest,
     StudentRequest,
     StudentResponse
 )
+from schemas.pagination import Page
 from services.generator.ids import id_generate
+from services.generator.matriculation import (
+    matriculation_allocate,
+    matriculation_allocate_async
+)
+from utils.bulk import validation_detail
 from utils.format import (
     unformat_cpf, 
     unformat_date
@@ -65,12 +94,13 @@ class StudentUseCases:
         self.db_session = db_session
 
 
-    def add(self, request: StudentRequest) -> StudentResponse:
+    def add(self, request: StudentRequest, matriculation: str | None = None) -> StudentResponse:
         """
         Cadastra um estudante no sistema, adicionando o mesmo a uma turma e o vinculando a um responsável.
 
         - Args:
             - request: Objeto com os dados do estudante a ser cadastrado.
+            - matriculation: Matrícula já gerada. Por padrão, uma nova é gerada.
 
         - Returns:
             - Objeto com os dados do estudante cadastrado
@@ -90,8 +120,10 @@ class StudentUseCases:
             
             if not parent_exists(self.db_session, request.parent_cpf):
                 raise NotFound(ERROR_CHILD_ADD_NOT_FOUND_PARENT)
+
+            class_model = get_class_by_id(self.db_session, request.class_id)
             
-            child = map_StudentRequest_to_ChildModel(request)
+            child = map_StudentRequest_to_ChildModel(request, matriculation)
 
             self.db_session.add(child)
 
@@ -115,7 +147,7 @@ class StudentUseCases:
             response =  map_ChildModel_to_StudentResponse(
                 self.db_session,
                 child,
-                request.class_id
+                class_model
             )
 
             self.db_session.commit()
@@ -132,6 +164,137 @@ class StudentUseCases:
             raise Server(e)
 
 
+    def bulk_add(self, rows: list[dict], matriculations: list[str] | None = None) -> BulkResponse[StudentResponse]:
+        """
+        Cadastra vários estudantes de uma vez, informando o resultado de cada registro
+
+        A validação de CPFs, responsáveis e turmas é feita com poucas consultas IN para o lote todo, as
+        matrículas são reservadas de uma vez e estudantes, turmas e responsáveis são inseridos com
+        executemany em uma única transação. Registros inválidos são recusados sem impedir os demais.
+
+        - Args:
+            - rows: Registros com os mesmos campos de StudentRequest (endereço aninhado ou em colunas).
+            - matriculations: Matrículas já geradas, ao menos uma por registro. Por padrão, são geradas aqui.
+
+        - Returns:
+            - BulkResponse[StudentResponse]: Quantidade de cadastros, de falhas e o resultado de cada registro.
+
+        - Raises:
+            - Server: Caso ocorra algum erro no servidor. Nesse caso nenhum registro é cadastrado.
+        """
+        try:
+
+            results: list[BulkRowResult[StudentResponse] | None] = [None] * len(rows)
+
+            requests: dict[int, StudentRequest] = {}
+
+            seen_cpfs = set()
+
+            for index, row in enumerate(rows):
+
+                try:
+                    request = map_row_to_StudentRequest(row)
+
+                except HTTPException as e:
+                    results[index] = BulkRowResult(row=index + 1, status_code=e.status_code, detail=e.detail)
+                    continue
+
+                except (ValidationError, TypeError) as e:
+                    detail = validation_detail(e) if isinstance(e, ValidationError) else str(e)
+                    results[index] = BulkRowResult(row=index + 1, status_code=422, detail=detail)
+                    continue
+
+                if request.cpf in seen_cpfs:
+                    results[index] = BulkRowResult(row=index + 1, status_code=409, detail=ERROR_BULK_DUPLICATED_ROW)
+                    continue
+
+                seen_cpfs.add(request.cpf)
+                requests[index] = request
+
+            existing_children = existing_values(self.db_session, ChildModel.cpf, {r.cpf for r in requests.values()})
+            existing_parents = existing_values(self.db_session, UserModel.cpf, {r.parent_cpf for r in requests.values()})
+
+            class_ids = {normalize_uuid(r.class_id) for r in requests.values()} # Chaves iguais às lidas do banco
+            classes = {
+                class_.id: class_ 
+                for class_ in self.db_session.scalars(select(ClassModel).where(ClassModel.id.in_(class_ids))).all()
+            } if class_ids else {}
+
+            for index, request in list(requests.items()):
+
+                if request.cpf in existing_children:
+                    error = (409, ERROR_CHILD_ADD_CONFLICT_FIELD_CPF)
+
+                elif request.parent_cpf not in existing_parents:
+                    error = (404, ERROR_CHILD_ADD_NOT_FOUND_PARENT)
+
+                elif normalize_uuid(request.class_id) not in classes:
+                    error = (404, ERROR_CLASSES_GET_NOT_FOUND)
+
+                else:
+                    continue
+
+                results[index] = BulkRowResult(row=index + 1, status_code=error[0], detail=error[1])
+                del requests[index]
+
+            matriculations = iter(matriculations or matriculation_allocate(len(requests)))
+
+            children, class_students, child_parents = [], [], []
+
+            for index, request in requests.items():
+
+                child = map_StudentRequest_to_ChildModel(request, next(matriculations))
+
+                children.append(
+                    {column.key: getattr(child, column.key) for column in ChildModel.__table__.columns}
+                )
+
+                class_students.append(
+                    {"id": id_generate(), "class_id": request.class_id, "child_cpf": request.cpf}
+                )
+
+                child_parents.append(
+                    {"id": id_generate(), "kinship": request.kinship, "child_cpf": request.cpf, "parent_cpf": request.parent_cpf}
+                )
+
+                class_ = classes[normalize_uuid(request.class_id)]
+
+                results[index] = BulkRowResult(
+                    row=index + 1,
+                    status_code=201,
+                    item=StudentResponse(
+                        matriculation=child.matriculation,
+                        name=child.name,
+                        class_info=build_class_info(class_),
+                        shift=class_.shift
+                    )
+                )
+
+            if children:
+
+                self.db_session.execute(insert(ChildModel), children)
+                self.db_session.execute(insert(ClassStudentModel), class_students)
+                self.db_session.execute(insert(ChildParentsModel), child_parents)
+
+                self.db_session.commit()
+
+            return BulkResponse(
+                created=len(children),
+                failed=len(rows) - len(children),
+                results=results
+            )
+
+        except HTTPException:
+
+            raise
+
+        except Exception as e:
+
+            self.db_session.rollback()
+
+            raise Server(e)
+
+
     def get(self, cpf: str) -> StudentResponse:
         """
         Busca um estudante no sistema.
@@ -214,6 +377,46 @@ class StudentUseCases:
             raise Server(e)
         
 
+    def get_page(self, limit: int, cursor: str | None = None) -> Page[StudentResponse]:
+        """
+        Busca uma página de estudantes, ordenada pela chave primária
+
+        - Args:
+            - limit: Quantidade de itens por página.
+            - cursor: Cursor devolvido pela página anterior (None para a primeira página).
+
+        - Returns:
+            - Page[StudentResponse]: Itens da página e cursor da próxima página.
+
+        - Raises:
+            - BadRequest: Cursor inválido.
+            - NotFound: Estudantes não encontrados.
+            - Server: Caso ocorra algum erro no servidor.
+        """
+        try:
+
+            children = get_all_children(self.db_session, limit, cursor)
+
+            children, next_cursor = split_page(children, limit, ChildModel.cpf)
+
+            students = [
+                map_ChildModel_to_StudentResponse(
+                    self.db_session,
+                    child,
+                    child.class_student.class_
+                )
+                for child in children
+            ]
+
+            return Page(items=students, next_cursor=next_cursor)
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+        
+
     def update(self, request: ChildRequest) -> StudentResponse:
         """
         Atualiza os dados de um estudante no sistema.
@@ -502,4 +705,84 @@ class StudentUseCases:
         
         except Exception as e:
 
-            raise Server(e)
\ No newline at end of file
+            raise Server(e)
+
+
+class AsyncStudentUseCases:
+    """
+    Versão assíncrona de StudentUseCases, executando as mesmas regras de negócio sobre uma AsyncSession
+    """
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+
+    async def add(self, request: StudentRequest) -> StudentResponse:
+        matriculation, = await matriculation_allocate_async(1)
+
+        return await self.db_session.run_sync(
+            lambda session: StudentUseCases(session).add(request, matriculation)
+        )
+
+
+    async def bulk_add(self, rows: list[dict]) -> BulkResponse[StudentResponse]:
+        matriculations = await matriculation_allocate_async(len(rows))
+
+        return await self.db_session.run_sync(
+            lambda session: StudentUseCases(session).bulk_add(rows, matriculations)
+        )
+
+
+    async def get(self, cpf: str) -> StudentResponse:
+        return await self.db_session.run_sync(
+            lambda session: StudentUseCases(session).get(cpf)
+        )
+
+
+    async def get_all(self) -> list[StudentResponse]:
+        return await self.db_session.run_sync(
+            lambda session: StudentUseCases(session).get_all()
+        )
+
+
+    async def get_page(self, limit: int, cursor: str | None = None) -> Page[StudentResponse]:
+        return await self.db_session.run_sync(
+            lambda session: StudentUseCases(session).get_page(limit, cursor)
+        )
+
+
+    async def stream(self) -> AsyncIterator[StudentResponse]:
+        """
+        Percorre todos os estudantes, convertendo um por vez, para exportações
+        """
+        async for child in stream_children():
+            yield map_ChildModel_to_StudentResponse(None, child, child.class_student.class_)
+
+
+    async def update(self, request: ChildRequest) -> StudentResponse:
+        return await self.db_session.run_sync(
+            lambda session: StudentUseCases(session).update(request)
+        )
+
+
+    async def delete(self, cpf: str) -> BaseMessage:
+        return await self.db_session.run_sync(
+            lambda session: StudentUseCases(session).delete(cpf)
+        )
+
+
+    async def change_class(self, student_cpf: str, to_class_id: str, is_transfer: bool = True) -> StudentResponse:
+        return await self.db_session.run_sync(
+            lambda session: StudentUseCases(session).change_class(student_cpf, to_class_id, is_transfer)
+        )
+
+
+    async def add_parent(self, child_cpf: str, kinship: str, parent_cpf: str) -> BaseMessage:
+        return await self.db_session.run_sync(
+            lambda session: StudentUseCases(session).add_parent(child_cpf, kinship, parent_cpf)
+        )
+
+
+    async def delete_parent(self, child_cpf: str, parent_cpf: str) -> BaseMessage:
+        return await self.db_session.run_sync(
+            lambda session: StudentUseCases(session).delete_parent(child_cpf, parent_cpf)
+        )
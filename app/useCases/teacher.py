@@ -1,4 +1,6 @@
 from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
@@ -9,19 +11,19 @@ from constants.teacher import (
 from database.mapping.teacher import map_UserModel_to_TeacherResponse
 from database.models import (
     ClassTeacherModel, 
-    TeacherDisciplinesModel
-)
-from database.queries.existence import (
-    teacher_classes_exists, 
-    teacher_disciplines_exists
+    TeacherDisciplinesModel,
+    UserModel
 )
+from database.queries.existence import is_unique_violation
 from database.queries.get_all import (
     get_all_class_teacher_models_by_filter, 
     get_all_teacher_disciplines_by_filter, 
     get_all_teachers
 )
 from database.queries.get import get_teacher_by_cpf
+from database.queries.pagination import split_page
 from services.generator.ids import id_generate
+from schemas.pagination import Page
 from schemas.teacher import(
     ClassTeacherRequest,
     TeacherDisciplinesRequest,
@@ -51,11 +53,6 @@ class TeacherUseCases:
 
         try:
             user = get_teacher_by_cpf(self.db_session, request.user_cpf)
-
-
-            if teacher_classes_exists(self.db_session, request.user_cpf, request.classes_id):
-
-                raise Conflict(ERROR_TEACHER_ADD_CLASSES_CONFLICT)
             
             classes = [
                 ClassTeacherModel(
@@ -66,13 +63,21 @@ class TeacherUseCases:
             ]
         
             self.db_session.add_all(classes)
-            self.db_session.commit()
+            self.db_session.commit() # Turmas repetidas são barradas por uq_class_teacher_user_cpf_class_id
 
             return map_UserModel_to_TeacherResponse(self.db_session, user)
 
         except HTTPException:
             raise
 
+        except IntegrityError as e:
+            self.db_session.rollback()
+
+            if is_unique_violation(e):
+                raise Conflict(ERROR_TEACHER_ADD_CLASSES_CONFLICT)
+
+            raise Server(e)
+
         except Exception as e:
             raise Server(e)
 
@@ -91,10 +96,6 @@ class TeacherUseCases:
         try:
             user = get_teacher_by_cpf(self.db_session, request.user_cpf)
 
-            if teacher_disciplines_exists(self.db_session, request.user_cpf, request.disciplines_id):
-
-                raise Conflict(ERROR_TEACHER_ADD_DISCIPLINES_CONFLICT)
-
             disciplines = [
                 TeacherDisciplinesModel(
                     id=id_generate(),
@@ -105,13 +106,21 @@ class TeacherUseCases:
         
             self.db_session.add_all(disciplines)
 
-            self.db_session.commit()
+            self.db_session.commit() # Disciplinas repetidas são barradas por uq_teacher_disciplines_user_cpf_discipline_id
 
             return map_UserModel_to_TeacherResponse(self.db_session, user)
 
         except HTTPException:
             raise
 
+        except IntegrityError as e:
+            self.db_session.rollback()
+
+            if is_unique_violation(e):
+                raise Conflict(ERROR_TEACHER_ADD_DISCIPLINES_CONFLICT)
+
+            raise Server(e)
+
         except Exception as e:
             raise Server(e)
         
@@ -164,6 +173,40 @@ class TeacherUseCases:
             raise Server(e)
 
 
+    def get_page(self, limit: int, cursor: str | None = None) -> Page[TeacherResponse]:
+        """
+        Busca uma página de professores, ordenada pela chave primária
+
+        - Args:
+            - limit: Quantidade de itens por página.
+            - cursor: Cursor devolvido pela página anterior (None para a primeira página).
+
+        - Returns:
+            - Page[TeacherResponse]: Itens da página e cursor da próxima página.
+
+        - Raises:
+            - HTTPException: 400 - Cursor inválido
+            - HTTPException: 404 - Nenhum professor encontrado
+            - HTTPException: 500 - Erro no servidor
+        """
+        try:
+
+            teachers = get_all_teachers(self.db_session, limit, cursor)
+
+            teachers, next_cursor = split_page(teachers, limit, UserModel.cpf)
+
+            return Page(
+                items=[map_UserModel_to_TeacherResponse(self.db_session, teacher) for teacher in teachers],
+                next_cursor=next_cursor
+            )
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+
+
     def delete_classes(self, request: ClassTeacherRequest) -> TeacherResponse:
         """
         Remove turmas de um professor
@@ -227,4 +270,54 @@ class TeacherUseCases:
             raise
 
         except Exception as e:
-            raise Server(e)
\ No newline at end of file
+            raise Server(e)
+
+
+class AsyncTeacherUseCases:
+    """
+    Versão assíncrona de TeacherUseCases, executando as mesmas regras de negócio sobre uma AsyncSession
+    """
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+
+    async def add_classes(self, request: ClassTeacherRequest) -> TeacherResponse:
+        return await self.db_session.run_sync(
+            lambda session: TeacherUseCases(session).add_classes(request)
+        )
+
+
+    async def add_disciplines(self, request: TeacherDisciplinesRequest) -> TeacherResponse:
+        return await self.db_session.run_sync(
+            lambda session: TeacherUseCases(session).add_disciplines(request)
+        )
+
+
+    async def get(self, user_cpf: str) -> TeacherResponse:
+        return await self.db_session.run_sync(
+            lambda session: TeacherUseCases(session).get(user_cpf)
+        )
+
+
+    async def get_all(self) -> list[TeacherResponse]:
+        return await self.db_session.run_sync(
+            lambda session: TeacherUseCases(session).get_all()
+        )
+
+
+    async def get_page(self, limit: int, cursor: str | None = None) -> Page[TeacherResponse]:
+        return await self.db_session.run_sync(
+            lambda session: TeacherUseCases(session).get_page(limit, cursor)
+        )
+
+
+    async def delete_classes(self, request: ClassTeacherRequest) -> TeacherResponse:
+        return await self.db_session.run_sync(
+            lambda session: TeacherUseCases(session).delete_classes(request)
+        )
+
+
+    async def delete_disciplines(self, request: TeacherDisciplinesRequest) -> TeacherResponse:
+        return await self.db_session.run_sync(
+            lambda session: TeacherUseCases(session).delete_disciplines(request)
+        )
@@ -1,4 +1,5 @@
 from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
@@ -14,7 +15,9 @@ from database.models import UserModel
 from database.queries.existence import check_user_existence
 from database.queries.get import get_user_by_cpf
 from database.queries.get_all import get_all_users
+from database.queries.pagination import split_page
 from schemas.base import BaseMessage
+from schemas.pagination import Page
 from schemas.user import (
     AccessToken,
     UserDB,
@@ -25,7 +28,9 @@ from schemas.user import (
 )
 from services.security.password import (
     protect,
-    verify
+    protect_async,
+    verify_and_update,
+    verify_and_update_async
 )
 from services.security.tokens import encode_token
 from utils.messages.success import Success
@@ -51,12 +56,13 @@ class UserUseCases():
     def __init__(self, db_session: Session):
         self.db_session = db_session
 
-    def add(self, request: UserRequest) -> BaseMessage:
+    def add(self, request: UserRequest, password_hash: str | None = None) -> BaseMessage:
         """
         Adiciona um Usuário ao banco de dados
 
         - Args:
             - request: Objeto com os dados do usuário a ser adicionado.
+            - password_hash: Hash da senha já calculado. Caso não seja informado, é calculado aqui.
 
         - Returns:
             - dict: {"detail": "Usuário cadastrado com sucesso"}
@@ -71,7 +77,7 @@ class UserUseCases():
 
             check_user_existence(self.db_session, request.cpf, request.phone, request.email)
             
-            request.password = protect(request.password)
+            request.password = password_hash or protect(request.password)
 
             to_db = UserDB(**request.dict(), **request.address.dict())
             
@@ -141,13 +147,47 @@ class UserUseCases():
         except Exception as e:
             raise Server(e)
         
-    def update(self, id:str, request: UserUpdateRequest) -> BaseMessage:
+    def get_page(self, limit: int, cursor: str | None = None) -> Page[UserResponse]:
+        """
+        Busca uma página de usuários, ordenada pela chave primária
+
+        - Args:
+            - limit: Quantidade de itens por página.
+            - cursor: Cursor devolvido pela página anterior (None para a primeira página).
+
+        - Returns:
+            - Page[UserResponse]: Itens da página e cursor da próxima página.
+
+        - Raises:
+            - HTTPException: 400 - Cursor inválido
+            - HTTPException: 404 - Nenhum usuário encontrado
+            - HTTPException: 500 - Erro no servidor
+        """
+        try:
+
+            users = get_all_users(self.db_session, limit, cursor)
+
+            users, next_cursor = split_page(users, limit, UserModel.cpf)
+
+            return Page(
+                items=self._map_list_UserModel_to_list_UserResponse(users),
+                next_cursor=next_cursor
+            )
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+        
+    def update(self, id:str, request: UserUpdateRequest, password_hash: str | None = None) -> BaseMessage:
         """
         Atualiza os dados de um usuário
 
         - Args:
             - id: CPF do usuário a ser atualizado
             - request: Objeto com os dados a serem atualizados
+            - password_hash: Hash da nova senha já calculado. Caso não seja informado, é calculado aqui.
 
         - Returns:
             - dict: {"detail": "Usuário atualizado com sucesso"}
@@ -185,7 +225,7 @@ class UserUseCases():
 
                         if field == "password":
 
-                            value = protect(value)
+                            value = password_hash or protect(value)
 
                         value_in_field =  getattr(user, field)
 
@@ -255,9 +295,73 @@ class UserUseCases():
 
             user = get_user_by_cpf(self.db_session, access.cpf)
 
-            if not verify(access.password, user.password):
+            verified, new_hash = verify_and_update(access.password, user.password)
+
+            return self.authenticate(access.cpf, verified, new_hash)
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+
+
+    def get_password_hash(self, cpf: str) -> str:
+        """
+        Busca o hash da senha de um usuário, para ser verificado fora da sessão
+
+        - Args:
+            - cpf: CPF do usuário
+
+        - Returns:
+            - str: Hash da senha
+
+        - Raises:
+            - HTTPException: 404 - Usuário não encontrado
+            - HTTPException: 500 - Erro no servidor
+        """
+        try:
+
+            return get_user_by_cpf(self.db_session, cpf).password
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+
+
+    def authenticate(self, cpf: str, verified: bool, new_hash: str | None = None) -> AccessToken:
+        """
+        Conclui o login a partir do resultado da verificação da senha
+
+        Quando o hash salvo usa um esquema ou custo antigos, o novo hash é gravado antes de gerar o token.
+
+        - Args:
+            - cpf: CPF do usuário
+            - verified: Se a senha informada confere com o hash salvo
+            - new_hash: Novo hash da senha, quando ela precisa ser refeita
+
+        - Returns:
+            - AccessToken: Token de autenticação
+
+        - Raises:
+            - HTTPException: 401 - Senha inválida
+            - HTTPException: 500 - Erro no servidor
+        """
+        try:
+
+            if not verified:
 
                 raise Unauthorized(ERROR_USER_PASSWORD_WRONG)
+
+            user = get_user_by_cpf(self.db_session, cpf)
+
+            if new_hash:
+
+                user.password = new_hash
+                self.db_session.commit()
+                self.db_session.refresh(user)
             
             data = self._map_UserModel_to_UserResponse(user)
             
@@ -276,4 +380,67 @@ class UserUseCases():
         return map_UserModel_to_UserResponse(user)
     
     def _map_list_UserModel_to_list_UserResponse(self, users: list[UserModel]) -> list[UserResponse]:
-        return [self._map_UserModel_to_UserResponse(user) for user in users]
\ No newline at end of file
+        return [self._map_UserModel_to_UserResponse(user) for user in users]
+
+
+class AsyncUserUseCases:
+    """
+    Versão assíncrona de UserUseCases, executando as mesmas regras de negócio sobre uma AsyncSession
+    """
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+
+    async def add(self, request: UserRequest) -> BaseMessage:
+
+        password_hash = await protect_async(request.password)
+
+        return await self.db_session.run_sync(
+            lambda session: UserUseCases(session).add(request, password_hash)
+        )
+
+
+    async def get(self, id: str) -> UserResponse:
+        return await self.db_session.run_sync(
+            lambda session: UserUseCases(session).get(id)
+        )
+
+
+    async def get_all(self) -> list[UserResponse]:
+        return await self.db_session.run_sync(
+            lambda session: UserUseCases(session).get_all()
+        )
+
+
+    async def get_page(self, limit: int, cursor: str | None = None) -> Page[UserResponse]:
+        return await self.db_session.run_sync(
+            lambda session: UserUseCases(session).get_page(limit, cursor)
+        )
+
+
+    async def update(self, id: str, request: UserUpdateRequest) -> BaseMessage:
+
+        password_hash = await protect_async(request.password) if request.password else None
+
+        return await self.db_session.run_sync(
+            lambda session: UserUseCases(session).update(id, request, password_hash)
+        )
+
+
+    async def delete(self, id: str) -> BaseMessage:
+        return await self.db_session.run_sync(
+            lambda session: UserUseCases(session).delete(id)
+        )
+
+
+    async def login(self, access: UserLoginRequest) -> AccessToken:
+
+        hashed_password = await self.db_session.run_sync(
+            lambda session: UserUseCases(session).get_password_hash(access.cpf)
+        )
+
+        verified, new_hash = await verify_and_update_async(access.password, hashed_password)
+
+        return await self.db_session.run_sync(
+            lambda session: UserUseCases(session).authenticate(access.cpf, verified, new_hash)
+        )
@@ -0,0 +1,287 @@
+from logging import getLogger
+from os.path import (
+    isfile,
+    join
+)
+from fastapi import (
+    HTTPException,
+    UploadFile
+)
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+from constants.base import ERROR_INVALID_CPF
+from constants.warning import (
+    ERROR_WARNING_FILE_NOT_FOUND,
+    ERROR_WARNING_NOT_FOUND,
+    ERROR_WARNING_PARENT_NOT_FOUND,
+    MESSAGE_WARNING_DELETE_SUCCESS
+)
+from database.repositories.notification import NotificationRepository
+from database.repositories.warning import WarningRepository
+from schemas.base import (
+    BaseMessage,
+    EventAction,
+    EventKind,
+    NotificationKind
+)
+from schemas.warning import (
+    WarningRequest,
+    WarningResponse,
+    WarningSendRequest
+)
+from services.email.outbox import outbox_sender
+from services.events.broker import Event
+from services.events.bus import event_bus
+from services.storage.files import (
+    WARNING_FILES_DIR,
+    StoredFile,
+    store_file
+)
+from utils.format import unformat_cpf
+from utils.messages.error import (
+    NotFound,
+    Server,
+    UnprocessableEntity
+)
+from utils.messages.success import Success
+from utils.validate import validate_cpf
+
+
+logger = getLogger(__name__)
+
+
+class WarningUseCases:
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+        self.repository = WarningRepository(db_session)
+        self.notification_repository = NotificationRepository(db_session)
+
+
+    def add(self, request: WarningSendRequest, file: StoredFile | None = None) -> list[WarningResponse]:
+        """
+        Envia um aviso para vários responsáveis, em uma única transação
+
+        Cada responsável recebe o seu aviso; todos apontam para o mesmo anexo armazenado. A notificação de
+        cada responsável, enviada depois por email (services/email/digest.py), é gravada no mesmo commit.
+
+        - Args:
+            - request: Responsáveis, tema e texto do aviso.
+            - file: Anexo já armazenado (store_file), se houver.
+
+        - Returns:
+            - list[WarningResponse]: Avisos criados, um por responsável.
+
+        - Raises:
+            - NotFound: Responsável não encontrado.
+            - Server: Erro no servidor.
+        """
+        try:
+
+            if self.repository.get_existing_parents(request.parent_cpfs) != set(request.parent_cpfs):
+                raise NotFound(ERROR_WARNING_PARENT_NOT_FOUND)
+
+            models = [
+                self.repository.map_request_to_model(
+                    WarningRequest(parent_cpf=parent_cpf, theme=request.theme, text=request.text),
+                    file
+                )
+                for parent_cpf in request.parent_cpfs
+            ]
+
+            self.notification_repository.add_for_parents(
+                request.parent_cpfs, NotificationKind.WARNING, request.theme, request.text
+            )
+
+            self.repository.add_all(models) # Confirma os avisos e as notificações juntos
+
+            outbox_sender.notify()
+
+            responses = [self.repository.map_model_to_response(model) for model in models]
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            self.db_session.rollback()
+            raise Server(e)
+
+        self.publish_events(responses)
+
+        return responses
+
+
+    def publish_events(self, responses: list[WarningResponse]) -> None:
+        """
+        Publica, depois do commit, um evento por aviso para o seu responsável
+
+        A entrega é feita na medida do possível: falhas são registradas no log e não afetam a resposta, já
+        que os avisos foram confirmados.
+        """
+        try:
+
+            event_bus.publish_events([
+                Event(
+                    kind=EventKind.WARNING.value,
+                    action=EventAction.CREATED.value,
+                    data={"id": response.id, "theme": response.theme},
+                    recipients=frozenset({response.parent_cpf})
+                )
+                for response in responses
+            ])
+
+        except Exception:
+            logger.exception("Falha ao publicar os eventos dos avisos")
+
+
+    def get(self, warning_id: str) -> WarningResponse:
+        """
+        Busca um aviso pelo ID
+
+        - Raises:
+            - NotFound: Aviso não encontrado.
+            - Server: Erro no servidor.
+        """
+        try:
+
+            model = self.repository.get(warning_id)
+
+            if not model:
+                raise NotFound(ERROR_WARNING_NOT_FOUND)
+
+            return self.repository.map_model_to_response(model)
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+
+
+    def get_by_parent(self, parent_cpf: str) -> list[WarningResponse]:
+        """
+        Busca os avisos de um responsável, do mais recente para o mais antigo
+
+        - Raises:
+            - UnprocessableEntity: CPF inválido.
+            - Server: Erro no servidor.
+        """
+        try:
+
+            if not validate_cpf(parent_cpf):
+                raise UnprocessableEntity(ERROR_INVALID_CPF)
+
+            models = self.repository.get_by_parent_cpf(unformat_cpf(parent_cpf))
+
+            return [self.repository.map_model_to_response(model) for model in models]
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+
+
+    def get_file(self, warning_id: str) -> StoredFile:
+        """
+        Busca o anexo de um aviso
+
+        - Returns:
+            - StoredFile: Caminho relativo, nome, tipo e tamanho do anexo.
+
+        - Raises:
+            - NotFound: Aviso não encontrado ou sem anexo.
+            - Server: Erro no servidor.
+        """
+        try:
+
+            model = self.repository.get(warning_id)
+
+            if not model:
+                raise NotFound(ERROR_WARNING_NOT_FOUND)
+
+            if not model.file_path or not isfile(join(WARNING_FILES_DIR, model.file_path)):
+                raise NotFound(ERROR_WARNING_FILE_NOT_FOUND)
+
+            return StoredFile(model.file_path, model.file_name, model.file_type, model.file_size)
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+
+
+    def delete(self, warning_id: str) -> BaseMessage:
+        """
+        Deleta um aviso. O arquivo do anexo, se nenhum outro aviso o usar, é removido depois pela limpeza em
+        segundo plano (services/storage/sweeper.py)
+
+        - Raises:
+            - NotFound: Aviso não encontrado.
+            - Server: Erro no servidor.
+        """
+        try:
+
+            model = self.repository.get(warning_id)
+
+            if not model:
+                raise NotFound(ERROR_WARNING_NOT_FOUND)
+
+            self.repository.delete(model.id)
+
+            return Success(MESSAGE_WARNING_DELETE_SUCCESS)
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            raise Server(e)
+
+
+class AsyncWarningUseCases:
+    """
+    Versão assíncrona de WarningUseCases, executando as mesmas regras de negócio sobre uma AsyncSession
+    """
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+
+    async def add(self, request: WarningSendRequest, upload: UploadFile | None = None) -> list[WarningResponse]:
+        """
+        Armazena o anexo (em blocos, em uma thread, sem bloquear o loop de eventos) e envia os avisos
+        """
+        file = None
+
+        if upload is not None and upload.filename:
+            file = await run_in_threadpool(store_file, upload.file, upload.filename, upload.content_type)
+
+        return await self.db_session.run_sync(
+            lambda session: WarningUseCases(session).add(request, file)
+        )
+
+
+    async def get(self, warning_id: str) -> WarningResponse:
+        return await self.db_session.run_sync(
+            lambda session: WarningUseCases(session).get(warning_id)
+        )
+
+
+    async def get_by_parent(self, parent_cpf: str) -> list[WarningResponse]:
+        return await self.db_session.run_sync(
+            lambda session: WarningUseCases(session).get_by_parent(parent_cpf)
+        )
+
+
+    async def get_file(self, warning_id: str) -> StoredFile:
+        return await self.db_session.run_sync(
+            lambda session: WarningUseCases(session).get_file(warning_id)
+        )
+
+
+    async def delete(self, warning_id: str) -> BaseMessage:
+        return await self.db_session.run_sync(
+            lambda session: WarningUseCases(session).delete(warning_id)
+        )
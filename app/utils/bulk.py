@@ -0,0 +1,86 @@
+from csv import DictReader
+from io import StringIO
+from fastapi import Request
+from pydantic import ValidationError
+
+
+from constants.base import (
+    BULK_MAX_ROWS,
+    ERROR_BULK_INVALID_BODY,
+    ERROR_BULK_TOO_MANY_ROWS
+)
+from utils.messages.error import UnprocessableEntity
+
+
+def parse_csv(content: bytes | str) -> list[dict]:
+    """
+    Lê um CSV com cabeçalho e retorna uma lista de dicionários, um por linha
+
+    Células vazias viram None, para que campos opcionais sejam tratados como não informados.
+
+    - Args:
+        - content: Conteúdo do arquivo CSV (UTF-8, com ou sem BOM).
+
+    - Returns:
+        - list[dict]: Linhas do arquivo.
+    """
+    if isinstance(content, bytes):
+        content = content.decode("utf-8-sig")
+
+    return [
+        {key.strip(): (value.strip() or None) if value is not None else None for key, value in row.items() if key}
+        for row in DictReader(StringIO(content))
+    ]
+
+
+async def read_bulk_rows(request: Request) -> list[dict]:
+    """
+    Lê os registros de uma rota de cadastro em massa
+
+    Aceita uma lista JSON, um corpo text/csv ou um formulário multipart com o arquivo no campo `file`.
+
+    - Args:
+        - request: Requisição recebida.
+
+    - Returns:
+        - list[dict]: Registros enviados, ainda não validados.
+
+    - Raises:
+        - UnprocessableEntity: Corpo em formato não suportado ou com registros demais.
+    """
+    content_type = request.headers.get("content-type", "")
+
+    try:
+        if content_type.startswith("multipart/form-data"):
+
+            form = await request.form()
+
+            rows = parse_csv(await form["file"].read())
+
+        elif content_type.startswith("text/csv"):
+
+            rows = parse_csv(await request.body())
+
+        else:
+
+            rows = await request.json()
+
+    except (KeyError, AttributeError, ValueError, UnicodeDecodeError):
+        raise UnprocessableEntity(ERROR_BULK_INVALID_BODY)
+
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise UnprocessableEntity(ERROR_BULK_INVALID_BODY)
+
+    if len(rows) > BULK_MAX_ROWS:
+        raise UnprocessableEntity(ERROR_BULK_TOO_MANY_ROWS)
+
+    return rows
+
+
+def validation_detail(error: ValidationError) -> str:
+    """
+    Resume os erros de validação do Pydantic em uma mensagem por registro
+    """
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}" for e in error.errors()
+    )
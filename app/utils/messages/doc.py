@@ -44,4 +44,33 @@ def generate_responses_documentation(responses_list: list[Response]) -> dict:
             "value": dict_content
         }
 
-    return responses
\ No newline at end of file
+    return responses
+
+
+def generate_bulk_body(schema_name: str) -> dict:
+    """
+    Gera o corpo documentado de uma rota de cadastro em massa (lista JSON, text/csv ou arquivo multipart).
+
+    :param schema_name: Nome do schema de cada registro da lista JSON (ex: StudentRequest).
+    :return: Dicionário formatado para o parâmetro `openapi_extra` do FastAPI.
+    """
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"$ref": f"#/components/schemas/{schema_name}"}}
+                },
+                "text/csv": {
+                    "schema": {"type": "string"}
+                },
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {"file": {"type": "string", "format": "binary"}},
+                        "required": ["file"]
+                    }
+                }
+            }
+        }
+    }
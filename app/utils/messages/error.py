@@ -8,6 +8,8 @@
 - Forbidden
 - NotFound
 - Conflict
+- PayloadTooLarge
+- RangeNotSatisfiable
 - UnprocessableEntity
 - Server
 
@@ -38,6 +40,14 @@ def Conflict(detail:str) -> HTTPException:
     return HTTPException(status_code=409, detail=detail)
 
 
+def PayloadTooLarge(detail: str) -> HTTPException:
+    return HTTPException(status_code=413, detail=detail)
+
+
+def RangeNotSatisfiable(detail: str, size: int) -> HTTPException:
+    return HTTPException(status_code=416, detail=detail, headers={"Content-Range": f"bytes */{size}"})
+
+
 def UnprocessableEntity(errors: str) -> HTTPException:
     return HTTPException(status_code=422, detail=errors)
 
@@ -0,0 +1,124 @@
+"""
+Detecção de conflitos de horário entre aulas
+
+Cada recorrência de aula vira um Slot (turma, professor, dia da semana, intervalo de horário e período de
+datas). Os slots são indexados por recurso (turma e professor) e dia da semana e, em cada grupo, ordenados
+pelo início: uma varredura única compara cada slot apenas com os que ainda estão abertos quando ele começa.
+
+No banco, o dia da semana é gravado como número (1 = segunda ... 7 = domingo, como em date.isoweekday) e
+os horários como TIME; a API continua usando os nomes de DaysOfWeek e horários HH:MM.
+"""
+from collections import defaultdict
+from datetime import (
+    date,
+    time,
+    timedelta
+)
+from typing import NamedTuple
+
+
+from schemas.base import DaysOfWeek
+
+
+WEEKDAYS = list(DaysOfWeek)
+
+
+class Slot(NamedTuple):
+    class_event_id: str | None
+    class_id: str
+    teacher_cpf: str
+    day_of_week: int
+    start: time
+    end: time
+    start_date: date
+    end_date: date
+    new: bool # Se o slot está sendo cadastrado (os já cadastrados não são comparados entre si)
+
+
+def weekday_number(day: DaysOfWeek | str) -> int:
+    """
+    Converte um dia da semana (ex: "Segunda") para o número gravado no banco (1 = segunda ... 7 = domingo)
+    """
+    return WEEKDAYS.index(DaysOfWeek(day)) + 1
+
+
+def weekday_name(number: int) -> DaysOfWeek:
+    """
+    Converte o número do dia da semana gravado no banco para o dia da semana (ex: 1 -> DaysOfWeek.MONDAY)
+    """
+    return WEEKDAYS[number - 1]
+
+
+def expand_weekly(day_of_week: int, start_date: date, end_date: date, window_start: date, window_end: date) -> list[date]:
+    """
+    Datas em que uma recorrência semanal acontece dentro de uma janela
+
+    A primeira data é calculada diretamente (alinhando o início ao dia da semana) e as demais saltam de 7 em
+    7 dias, sem percorrer os dias da janela um a um.
+
+    - Args:
+        - day_of_week: Dia da semana da recorrência (1 = segunda ... 7 = domingo).
+        - start_date: Início do período da aula.
+        - end_date: Fim do período da aula.
+        - window_start: Primeiro dia da janela.
+        - window_end: Último dia da janela.
+
+    - Returns:
+        - list[date]: Datas das ocorrências, em ordem.
+    """
+    first = max(start_date, window_start)
+    last = min(end_date, window_end)
+
+    first += timedelta(days=(day_of_week - first.isoweekday()) % 7)
+
+    if first > last:
+        return []
+
+    return [first + timedelta(weeks=week) for week in range((last - first).days // 7 + 1)]
+
+
+def overlaps(first: Slot, second: Slot) -> bool:
+    """
+    Se dois slots do mesmo dia da semana se sobrepõem no horário e no período de datas
+
+    Intervalos são semiabertos: uma aula que termina às 09:00 não conflita com outra que começa às 09:00.
+    """
+    return (
+        first.start < second.end and second.start < first.end
+        and first.start_date <= second.end_date and second.start_date <= first.end_date
+    )
+
+
+def find_conflicts(slots: list[Slot]) -> list[tuple[Slot, Slot]]:
+    """
+    Encontra os pares de slots sobrepostos da mesma turma ou do mesmo professor
+
+    - Args:
+        - slots: Slots já cadastrados e novos. Apenas pares com ao menos um slot novo são reportados.
+
+    - Returns:
+        - list[tuple[Slot, Slot]]: Pares em conflito, sem repetição.
+    """
+    groups = defaultdict(list)
+
+    for slot in slots:
+        groups[("class", slot.class_id, slot.day_of_week)].append(slot)
+        groups[("teacher", slot.teacher_cpf, slot.day_of_week)].append(slot)
+
+    conflicts = {}
+
+    for group in groups.values():
+
+        open_slots: list[Slot] = []
+
+        for slot in sorted(group, key=lambda slot: slot.start):
+
+            open_slots = [other for other in open_slots if other.end > slot.start]
+
+            for other in open_slots:
+                if (slot.new or other.new) and overlaps(slot, other):
+                    conflicts.setdefault(frozenset((id(slot), id(other))), (other, slot))
+
+            open_slots.append(slot)
+
+    return list(conflicts.values())
@@ -0,0 +1,38 @@
+from typing import AsyncIterator
+from pydantic import BaseModel
+
+
+from constants.base import NDJSON_MEDIA_TYPE
+
+
+def accepts_ndjson(accept: str | None) -> bool:
+    """
+    Verifica se o cliente pediu a resposta em NDJSON pelo cabeçalho Accept
+
+    - Args:
+        - accept: Valor do cabeçalho Accept da requisição.
+
+    - Returns:
+        - bool: True caso application/x-ndjson esteja entre os tipos aceitos.
+    """
+    if not accept:
+        return False
+
+    return any(
+        media_type.split(";")[0].strip() == NDJSON_MEDIA_TYPE
+        for media_type in accept.split(",")
+    )
+
+
+async def to_ndjson(items: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+    """
+    Serializa cada item como uma linha JSON (NDJSON), assim que ele é produzido
+
+    - Args:
+        - items: Objetos a serem serializados.
+
+    - Returns:
+        - AsyncIterator[str]: Linhas JSON terminadas em quebra de linha.
+    """
+    async for item in items:
+        yield item.model_dump_json() + "\n"